@@ -2,6 +2,7 @@
 
 Usage:
     python benchmarks/unified_memory_benchmark.py --output benchmark_results/unified_benchmark.json
+    python benchmarks/unified_memory_benchmark.py --ann-curve --ann-rows 50000
 """
 
 from __future__ import annotations
@@ -10,13 +11,16 @@ import argparse
 import json
 import math
 import sys
+import tempfile
 import time
 import traceback
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -37,6 +41,10 @@ else:
     from adapters.vector_rag import VectorRAG
     from datasets_corpus.memory_corpus_large import build_large_memory_corpus
 
+from nested_memvid_agent.models import MemoryKind, MemoryLayer, MemoryRecord
+from nested_memvid_agent.vector_ann import VectorAnnSettings
+from nested_memvid_agent.vector_sidecar import VectorSidecar
+
 
 @dataclass(frozen=True, slots=True)
 class _QualityFloor:
@@ -341,6 +349,110 @@ def run_unified_benchmark(*, k: int = 5, seed: int = 42) -> dict[str, Any]:
     }
 
 
+class _ClusteredEmbedder:
+    """Serve synthetic clustered embeddings for ``vec<N>`` texts."""
+
+    model_name = "ann-curve-synthetic"
+
+    def __init__(self, vectors: np.ndarray) -> None:
+        self.vectors = vectors
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.vectors[int(text.rsplit("vec", 1)[1])]
+
+
+def run_ann_curves(
+    *,
+    rows: int = 20_000,
+    dimension: int = 64,
+    queries: int = 200,
+    k: int = 10,
+    probes: tuple[int, ...] = (1, 2, 4, 8, 16, 32),
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Measure recall@k against latency for exact and IVF vector-sidecar search."""
+
+    generator = np.random.default_rng(seed)
+    clusters = max(8, int(math.sqrt(rows)))
+    centers = generator.normal(size=(clusters, dimension)).astype(np.float32)
+    corpus = centers[generator.integers(0, clusters, size=rows + queries)]
+    corpus += 0.35 * generator.normal(size=corpus.shape).astype(np.float32)
+    settings = VectorAnnSettings(probes=max(probes), min_rows=min(rows, 4096))
+
+    with tempfile.TemporaryDirectory(prefix="kestrel-ann-curve-") as directory:
+        sidecar = VectorSidecar(
+            path=Path(directory) / "episodic.mv2.vector.sqlite",
+            layer=MemoryLayer.EPISODIC,
+            embedder=_ClusteredEmbedder(corpus),
+            mv2_path=Path(directory) / "episodic.mv2",
+            ann=settings,
+        )
+        sidecar.open()
+        try:
+            t0 = time.perf_counter()
+            for index in range(rows):
+                sidecar.upsert(
+                    MemoryRecord(
+                        id=f"vec-{index}",
+                        title="Synthetic vector",
+                        content=f"vec{index}",
+                        layer=MemoryLayer.EPISODIC,
+                        kind=MemoryKind.EVENT,
+                    )
+                )
+            ingest_time = time.perf_counter() - t0
+            print(f"ANN curve ingest: {rows} rows in {ingest_time:.2f}s", file=sys.stderr)
+            lists = sidecar.status().ann_lists
+            texts = [f"vec{rows + offset}" for offset in range(queries)]
+
+            def _measure(ann: VectorAnnSettings | None) -> tuple[list[set[str]], float]:
+                sidecar.ann = ann
+                started = time.perf_counter()
+                found = [{hit.record_id for hit in sidecar.search(text, k=k)} for text in texts]
+                return found, (time.perf_counter() - started) / len(texts) * 1000
+
+            truth, exact_latency = _measure(None)
+            curve = [
+                {
+                    "mode": "exact",
+                    "probes": None,
+                    "recall_at_k": 1.0,
+                    "avg_latency_ms": round(exact_latency, 3),
+                }
+            ]
+            for probe_count in probes:
+                found, latency = _measure(replace(settings, probes=probe_count))
+                recall = sum(
+                    len(approximate & expected) / max(1, len(expected))
+                    for approximate, expected in zip(found, truth, strict=True)
+                ) / len(texts)
+                curve.append(
+                    {
+                        "mode": "ivf",
+                        "probes": probe_count,
+                        "recall_at_k": round(recall, 4),
+                        "avg_latency_ms": round(latency, 3),
+                    }
+                )
+        finally:
+            sidecar.close()
+
+    return {
+        "schema": "kestrel.vector_ann_curve.v1",
+        "config": {
+            "rows": rows,
+            "dimension": dimension,
+            "queries": queries,
+            "k": k,
+            "seed": seed,
+            "ann_lists": lists,
+            "min_rows": settings.min_rows,
+        },
+        "ingest_time_s": round(ingest_time, 3),
+        "curve": curve,
+    }
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Run unified memory benchmark across all backends."
@@ -350,8 +462,28 @@ def main() -> int:
     parser.add_argument(
         "--output", type=Path, default=Path("benchmark_results/unified_benchmark.json")
     )
+    parser.add_argument(
+        "--ann-curve",
+        action="store_true",
+        help="Report exact vs IVF vector-sidecar recall@k/latency instead of backends",
+    )
+    parser.add_argument("--ann-rows", type=int, default=20_000)
     args = parser.parse_args()
 
+    if args.ann_curve:
+        curve = run_ann_curves(rows=args.ann_rows, k=args.k, seed=args.seed)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(curve, indent=2))
+        print(f"\nWrote results to {args.output}", file=sys.stderr)
+        print(f"{'Mode':<8} {'Probes':>7} {f'Recall@{args.k}':>10} {'Latency':>10}")
+        for point in curve["curve"]:
+            probes = "-" if point["probes"] is None else str(point["probes"])
+            print(
+                f"{point['mode']:<8} {probes:>7} {point['recall_at_k']:>10.3f} "
+                f"{point['avg_latency_ms']:>8.3f}ms"
+            )
+        return 0
+
     result = run_unified_benchmark(k=args.k, seed=args.seed)
     args.output.parent.mkdir(parents=True, exist_ok=True)
     args.output.write_text(json.dumps(result, indent=2))
@@ -84,6 +84,12 @@ class AgentDependencies:
     event_log: JsonlEventLog | None = None
     close_handler: Callable[[], None] | None = None
     turn_id_factory: Callable[[], str] | None = None
+    # Set for memory leased from a shared pool: closing the agent returns the
+    # lease instead of closing handles other agents are still using.
+    memory_release: Callable[[], None] | None = None
+    # The lease itself, so timed-out tools hold this run's lease rather than
+    # every agent sharing the pooled system.
+    memory_fence: object | None = None
 
 
 class NestedMV2Agent:
@@ -96,6 +102,10 @@ class NestedMV2Agent:
         self.config = deps.config
         self.event_log = deps.event_log
         self._close_handler = deps.close_handler
+        self._memory_release = deps.memory_release
+        self.memory_fence: object = (
+            deps.memory if deps.memory_fence is None else deps.memory_fence
+        )
         self._turn_id_factory = deps.turn_id_factory or (lambda: f"turn_{uuid4().hex}")
         self._close_lock = Lock()
         self._closed = False
@@ -650,6 +660,7 @@ class NestedMV2Agent:
                 approval_handler=approval_handler,
                 approved_tool_call_ids=approved_tool_call_ids,
                 approved_tool_call_arguments=approved_tool_call_arguments,
+                memory_fence=self.memory_fence,
             )
             approval_pending = False
             for call_index, call in enumerate(response.tool_calls):
@@ -1289,7 +1300,10 @@ class NestedMV2Agent:
         with self._close_lock:
             if self._closed:
                 return
-            self.memory.close_all()
+            if self._memory_release is not None:
+                self._memory_release()
+            else:
+                self.memory.close_all()
             if self._close_handler is not None:
                 self._close_handler()
             self._close_handler = None
@@ -1530,9 +1544,11 @@ def _recent_session_transcript(
     turns: dict[str, dict[str, MemoryRecord]] = {}
     expected_uri_prefix = f"agent_runtime://sessions/{session_id}/turns/"
     now = datetime.now(UTC)
-    records = sorted(
-        memory.iter_records(MemoryLayer.WORKING),
-        key=lambda record: (record.created_at, record.id),
+    records = memory.iter_session_records(
+        MemoryLayer.WORKING,
+        session_id,
+        transcript_scope=expected_transcript_scope,
+        turn_origin=expected_turn_origin,
     )
     for record in records:
         if memory_record_is_expired(
@@ -2010,6 +2026,7 @@ def _tool_context_with_preflight(
         tool_specs=tool_context.tool_specs,
         behavior_preflight=preflight.text,
         behavior_preflight_delta_ids=tuple(delta.id for delta in preflight.deltas),
+        memory_fence=tool_context.memory_fence,
     )
 
 
@@ -999,6 +999,7 @@ class AgentBackupManager:
         for mv2_file in layer_files.values():
             allowed.add(mv2_file)
             allowed.add(f"{mv2_file}.records.json")
+            allowed.add(f"{mv2_file}.records.log")
         if component_relative.as_posix() not in allowed:
             raise MemoryBackupError(f"Unexpected memory file: {component_relative.as_posix()}")
 
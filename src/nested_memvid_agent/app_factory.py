@@ -15,6 +15,7 @@ from .layers import (
     prepare_private_runs_root,
 )
 from .llm.factory import build_llm_provider
+from .memory_pool import MemoryLease
 from .orchestrator import build_memory_system
 from .promotion_ledger import PromotionLedger
 from .security_boundary import register_secret_env_names
@@ -23,6 +24,31 @@ from .tools.builtin import build_default_tools
 from .tools.registry import RetryingRegistry, ToolRegistry
 
 
+def build_agent_memory(
+    config: AgentConfig,
+    *,
+    state: AgentStateStore | None = None,
+) -> LayeredMemorySystem:
+    """Open the layered memory system ``config`` describes."""
+
+    specs = load_layer_specs(config.layer_config_path) if config.layer_config_path else None
+    prepare_private_memory_artifacts(
+        config.memory_dir,
+        specs=specs,
+        harden_existing=False,
+    )
+    active_state = state or AgentStateStore(config.state_path)
+    return build_memory_system(
+        config.backend,
+        config.memory_dir,
+        specs=specs,
+        ledger=PromotionLedger(active_state),
+        max_file_bytes=config.memory_max_layer_bytes,
+        retrieval_deadline_seconds=config.memory_retrieval_deadline_seconds,
+        memory_persistence=config.memory_persistence,
+    )
+
+
 def build_agent(
     config: AgentConfig,
     tools: ToolRegistry | None = None,
@@ -33,27 +59,16 @@ def build_agent(
     lan_runtime_utc_clock: Callable[[], datetime] | None = None,
     close_handler: Callable[[], None] | None = None,
     turn_id_factory: Callable[[], str] | None = None,
+    memory_lease: MemoryLease | None = None,
 ) -> NestedMV2Agent:
     register_secret_env_names(
         {config.api_key_env, config.fallback_api_key_env, config.api_auth_token_env}
     )
     memory: LayeredMemorySystem | None = None
     try:
-        specs = load_layer_specs(config.layer_config_path) if config.layer_config_path else None
-        prepare_private_memory_artifacts(
-            config.memory_dir,
-            specs=specs,
-            harden_existing=False,
-        )
+        if memory_lease is None:
+            memory = build_agent_memory(config, state=state)
         prepare_private_runs_root(config.memory_dir.parent / "runs")
-        active_state = state or AgentStateStore(config.state_path)
-        memory = build_memory_system(
-            config.backend,
-            config.memory_dir,
-            specs=specs,
-            ledger=PromotionLedger(active_state),
-            max_file_bytes=config.memory_max_layer_bytes,
-        )
         if lan_runtime_utc_clock is None:
             llm = build_llm_provider(
                 config,
@@ -81,13 +96,15 @@ def build_agent(
         event_log = JsonlEventLog(config.log_dir / "events.jsonl")
         return NestedMV2Agent(
             AgentDependencies(
-                memory=memory,
+                memory=memory if memory_lease is None else memory_lease.memory,
                 llm=llm,
                 tools=registry,
                 config=config,
                 event_log=event_log,
                 close_handler=close_handler,
                 turn_id_factory=turn_id_factory,
+                memory_release=None if memory_lease is None else memory_lease.release,
+                memory_fence=memory_lease,
             )
         )
     except MemoryCleanupIncompleteError:
@@ -95,6 +112,14 @@ def build_agent(
         # verified cleanup retry. Keep the external lifecycle slot reserved.
         raise
     except BaseException:
+        if memory_lease is not None:
+            try:
+                memory_lease.release()
+            except BaseException as exc:
+                raise MemoryCleanupIncompleteError(
+                    (memory_lease,),
+                    phase="agent_construction",
+                ) from exc
         if memory is not None:
             try:
                 memory.close_all()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Collection, Iterable, Iterator
+from collections.abc import Collection, Hashable, Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from threading import RLock
 
 from ..models import MemoryHit, MemoryLayer, MemoryRecord
+from .session_index import session_turn_key
 
 
 @dataclass(frozen=True)
@@ -103,6 +105,15 @@ class MemoryBackend(ABC):
             next_cursor=f"offset:{end}" if len(window) > end else None,
         )
 
+    def search_generation(self) -> Hashable | None:
+        """Return a token that changes whenever search results could change.
+
+        ``None`` means the backend cannot vouch for that, and its results are
+        then never served from the layered retrieval cache.
+        """
+
+        return None
+
     @abstractmethod
     def upsert(self, record: MemoryRecord) -> str:
         raise NotImplementedError
@@ -115,10 +126,92 @@ class MemoryBackend(ABC):
     def iter_records(self, *, include_inactive: bool = False) -> Iterable[MemoryRecord]:
         raise NotImplementedError
 
+    def iter_session_records(
+        self,
+        session_id: str,
+        *,
+        transcript_scope: str,
+        turn_origin: str,
+        since: datetime | None = None,
+        include_inactive: bool = False,
+    ) -> Iterable[MemoryRecord]:
+        """Return one conversation's turn frames in ``(created_at, id)`` order.
+
+        Built-in backends answer from a session index. This fallback keeps
+        custom backends working with a full layer scan.
+        """
+
+        key = (session_id, transcript_scope, turn_origin)
+        return tuple(
+            sorted(
+                (
+                    record
+                    for record in self.iter_records(include_inactive=include_inactive)
+                    if session_turn_key(record) == key
+                    and (since is None or record.created_at >= since)
+                ),
+                key=lambda record: (record.created_at, record.id),
+            )
+        )
+
     @abstractmethod
     def get_record(self, record_id: str, *, include_inactive: bool = True) -> MemoryRecord | None:
         raise NotImplementedError
 
+    def get_by_ids(
+        self,
+        record_ids: Iterable[str],
+        *,
+        include_inactive: bool = True,
+    ) -> dict[str, MemoryRecord]:
+        """Resolve logical record ids, omitting ids that are not present.
+
+        Built-in backends answer from a maintained id index. The fallback
+        filters :meth:`get_record`, which also accepts frame ids, down to exact
+        record id matches.
+        """
+
+        found: dict[str, MemoryRecord] = {}
+        for record_id in record_ids:
+            record = self.get_record(record_id, include_inactive=include_inactive)
+            if record is not None and record.id == record_id:
+                found[record_id] = record
+        return found
+
+    def find_by_frame_id(
+        self,
+        frame_id: str,
+        *,
+        include_inactive: bool = True,
+    ) -> MemoryRecord | None:
+        """Return the record stored under ``metadata["frame_id"]``, if any."""
+
+        return next(
+            (
+                record
+                for record in self.iter_records(include_inactive=include_inactive)
+                if str(record.metadata.get("frame_id", "")) == frame_id
+            ),
+            None,
+        )
+
+    def get_by_content_hash(
+        self,
+        content_hash: str,
+        *,
+        include_inactive: bool = True,
+    ) -> tuple[MemoryRecord, ...]:
+        """Return every record whose computed or ``metadata`` content hash matches."""
+
+        return tuple(
+            record
+            for record in self.iter_records(include_inactive=include_inactive)
+            if content_hash in (record.content_hash, record.metadata.get("content_hash"))
+        )
+
+    def has_content_hash(self, content_hash: str, *, include_inactive: bool = True) -> bool:
+        return bool(self.get_by_content_hash(content_hash, include_inactive=include_inactive))
+
     @abstractmethod
     def seal(self) -> None:
         raise NotImplementedError
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import os
 import re
-from collections import Counter
-from collections.abc import Collection, Iterable, Iterator
+import struct
+from collections import Counter, deque
+from collections.abc import Collection, Hashable, Iterable, Iterator, Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from hashlib import sha256
 from pathlib import Path
 from threading import Lock, RLock
 from typing import IO, Any, cast
@@ -15,16 +19,24 @@ from typing import IO, Any, cast
 import numpy as np
 
 from ..context_frames import MV2ContextFrame, to_memory_record
+from ..embedding_cache import EmbeddingCache
 from ..file_lock import lock_exclusive, lock_shared, unlock
 from ..models import EvidenceRef, MemoryHit, MemoryKind, MemoryLayer, MemoryRecord
 from ..private_artifacts import (
+    append_private_text,
     ensure_private_directory,
     harden_memory_artifact_files,
+    map_private_file,
     open_private_file_descriptor,
+    read_private_bytes,
     read_private_text,
+    write_private_bytes,
     write_private_text,
 )
+from ..vector_sidecar import embed_texts
 from .base import MemoryBackend
+from .record_index import RecordKeyIndex
+from .session_index import SessionTurnIndex
 
 _TOKEN_RE = re.compile(r"[a-zA-Z0-9_]+")
 
@@ -38,6 +50,29 @@ _RRF_K = 60
 # Normalization heuristics
 _BM25_SCORE_CAP = 10.0
 
+# Dense vector storage: row dtype per quantization mode, and the block size
+# used to widen quantized rows without a corpus-sized temporary.
+_VECTOR_QUANTIZATIONS: dict[str, type[np.generic]] = {
+    "float32": np.float32,
+    "float16": np.float16,
+    "int8": np.int8,
+}
+_VECTOR_DEQUANTIZE_BLOCK_ROWS = 4096
+
+# Persistence modes. "snapshot" rewrites one JSON document per seal;
+# "journal" appends the records touched since the last seal to a JSON-lines
+# log and compacts it into a binary snapshot once the log outgrows the layer.
+_PERSISTENCE_MODES = ("snapshot", "journal")
+_JOURNAL_MIN_COMPACTION_ENTRIES = 256
+# Binary snapshot: magic, record count and the SHA-256 of everything after the
+# header, then ``count + 1`` little-endian offsets and compact JSON records.
+_BINARY_SNAPSHOT_MAGIC = b"KMEMSNP1"
+_BINARY_SNAPSHOT_HEADER = struct.Struct("<8sQ32s")
+
+# Same-path instances replay each other's writes from a bounded per-path log of
+# ``(version, slot)`` entries; a reader that fell behind the log rebuilds.
+_MUTATION_LOG_LIMIT = 4096
+
 _EMBEDDING_MODEL_CACHE: dict[str, Any] = {}
 _EMBEDDING_MODEL_LOCK = Lock()
 
@@ -56,48 +91,104 @@ def _get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> Any:
 
 
 class _BM25Index:
-    """In-memory Okapi BM25 index for a single layer."""
+    """In-memory Okapi BM25 inverted index for a single layer.
+
+    Each token maps to a posting list of ``(slot, term frequency)`` pairs, so a
+    query only touches the postings of its own tokens. Removal tombstones the
+    document's slot; once dead postings or dead slots outnumber live ones the
+    index compacts, renumbering live slots in insertion order.
+    """
 
     def __init__(self) -> None:
-        self._doc_tokens: list[list[str]] = []
-        self._doc_ids: list[str] = []
-        self._doc_lens: list[int] = []
-        self._avg_doc_len: float = 0.0
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._slot_ids: list[str | None] = []
+        self._slot_lens: list[int] = []
+        self._slot_terms: list[tuple[str, ...]] = []
+        self._slots_by_id: dict[str, list[int]] = {}
         self._df: dict[str, int] = {}
         self._total_docs: int = 0
+        self._total_len: int = 0
+        self._live_postings: int = 0
+        self._dead_postings: int = 0
+        self._dead_slots: int = 0
+
+    @property
+    def _avg_doc_len(self) -> float:
+        return self._total_len / self._total_docs if self._total_docs > 0 else 0.0
 
     def add(self, doc_id: str, tokens: list[str]) -> None:
-        self._doc_ids.append(doc_id)
-        self._doc_tokens.append(tokens)
-        self._doc_lens.append(len(tokens))
+        slot = len(self._slot_ids)
+        term_counts = Counter(tokens)
+        self._slot_ids.append(doc_id)
+        self._slot_lens.append(len(tokens))
+        self._slot_terms.append(tuple(term_counts))
+        self._slots_by_id.setdefault(doc_id, []).append(slot)
+        for token, frequency in term_counts.items():
+            self._postings.setdefault(token, []).append((slot, frequency))
+            self._df[token] = self._df.get(token, 0) + 1
         self._total_docs += 1
-
-        seen = set()
-        for token in tokens:
-            if token not in seen:
-                self._df[token] = self._df.get(token, 0) + 1
-                seen.add(token)
-
-        self._avg_doc_len = sum(self._doc_lens) / self._total_docs if self._total_docs > 0 else 0.0
+        self._total_len += len(tokens)
+        self._live_postings += len(term_counts)
 
     def remove(self, doc_id: str) -> None:
-        try:
-            idx = self._doc_ids.index(doc_id)
-        except ValueError:
+        slots = self._slots_by_id.get(doc_id)
+        if not slots:
             return
+        slot = slots.pop(0)
+        if not slots:
+            del self._slots_by_id[doc_id]
 
-        tokens = self._doc_tokens[idx]
-        seen = set(tokens)
-        for token in seen:
-            self._df[token] = max(0, self._df.get(token, 0) - 1)
-            if self._df[token] == 0:
-                del self._df[token]
-
-        del self._doc_ids[idx]
-        del self._doc_tokens[idx]
-        del self._doc_lens[idx]
+        terms = self._slot_terms[slot]
+        for token in terms:
+            remaining = self._df.get(token, 0) - 1
+            if remaining > 0:
+                self._df[token] = remaining
+            else:
+                self._df.pop(token, None)
+        self._slot_ids[slot] = None
+        self._slot_terms[slot] = ()
         self._total_docs -= 1
-        self._avg_doc_len = sum(self._doc_lens) / self._total_docs if self._total_docs > 0 else 0.0
+        self._total_len -= self._slot_lens[slot]
+        self._live_postings -= len(terms)
+        self._dead_postings += len(terms)
+        self._dead_slots += 1
+        if self._dead_postings > max(self._live_postings, 1024) or self._dead_slots > max(
+            self._total_docs, 1024
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        renumbered: dict[int, int] = {}
+        slot_ids: list[str | None] = []
+        slot_lens: list[int] = []
+        slot_terms: list[tuple[str, ...]] = []
+        for slot, doc_id in enumerate(self._slot_ids):
+            if doc_id is None:
+                continue
+            renumbered[slot] = len(slot_ids)
+            slot_ids.append(doc_id)
+            slot_lens.append(self._slot_lens[slot])
+            slot_terms.append(self._slot_terms[slot])
+        self._postings = {
+            token: kept
+            for token, postings in self._postings.items()
+            if (
+                kept := [
+                    (renumbered[slot], frequency)
+                    for slot, frequency in postings
+                    if slot in renumbered
+                ]
+            )
+        }
+        self._slots_by_id = {
+            doc_id: [renumbered[slot] for slot in slots]
+            for doc_id, slots in self._slots_by_id.items()
+        }
+        self._slot_ids = slot_ids
+        self._slot_lens = slot_lens
+        self._slot_terms = slot_terms
+        self._dead_postings = 0
+        self._dead_slots = 0
 
     def _idf(self, token: str) -> float:
         df = self._df.get(token, 0)
@@ -105,83 +196,178 @@ class _BM25Index:
             return 0.0
         return math.log((self._total_docs - df + 0.5) / (df + 0.5) + 1.0)
 
-    def score(self, query_tokens: list[str], doc_idx: int) -> float:
-        if self._avg_doc_len == 0:
-            return 0.0
-        doc_tokens = self._doc_tokens[doc_idx]
-        doc_len = self._doc_lens[doc_idx]
-        token_counts = Counter(doc_tokens)
-
-        score = 0.0
-        for token in query_tokens:
-            f = token_counts.get(token, 0)
-            if f == 0:
-                continue
-            idf = self._idf(token)
-            denom = f + _K1 * (1 - _B + _B * (doc_len / self._avg_doc_len))
-            score += idf * (f * (_K1 + 1)) / denom
-        return score
-
     def search(self, query_tokens: list[str], k: int = 8) -> list[tuple[str, float]]:
         if not query_tokens or self._total_docs == 0 or k <= 0:
             return []
-        scores: list[tuple[str, float]] = []
-        for idx in range(self._total_docs):
-            s = self.score(query_tokens, idx)
-            if s > 0:
-                scores.append((self._doc_ids[idx], s))
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:k]
+        avg_doc_len = self._avg_doc_len
+        if avg_doc_len == 0:
+            return []
+        scores: dict[int, float] = {}
+        for token, query_frequency in Counter(query_tokens).items():
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = self._idf(token)
+            for slot, frequency in postings:
+                if self._slot_ids[slot] is None:
+                    continue
+                denom = frequency + _K1 * (1 - _B + _B * (self._slot_lens[slot] / avg_doc_len))
+                contribution = query_frequency * idf * (frequency * (_K1 + 1)) / denom
+                scores[slot] = scores.get(slot, 0.0) + contribution
+        # Ties keep insertion order, matching a stable sort over the corpus.
+        top = heapq.nlargest(
+            k,
+            ((score, -slot) for slot, score in scores.items() if score > 0),
+        )
+        return [(cast(str, self._slot_ids[-negated_slot]), score) for score, negated_slot in top]
 
 
 class _VectorIndex:
-    """In-memory dense vector index with cosine similarity."""
+    """In-memory dense vector index with cosine similarity.
+
+    Unit vectors live in the first ``len(self)`` rows of a preallocated matrix
+    that doubles when full; removal moves the last row into the freed slot, so
+    the live rows stay contiguous and a query is one matrix-vector product into
+    a reusable score buffer. ``quantization`` stores rows as ``float16`` or as
+    ``int8`` with a per-row scale; quantized rows are widened in fixed-size
+    blocks at query time.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, *, quantization: str = "float32", initial_capacity: int = 64) -> None:
+        if quantization not in _VECTOR_QUANTIZATIONS:
+            raise ValueError(f"Unsupported vector quantization: {quantization}")
+        self._quantization = quantization
+        self._capacity = max(1, initial_capacity)
+        self._matrix: np.ndarray | None = None
+        self._scales = np.ones(self._capacity, dtype=np.float32)
+        self._scores = np.empty(self._capacity, dtype=np.float32)
         self._doc_ids: list[str] = []
-        self._vectors: list[np.ndarray] = []
         self._id_to_idx: dict[str, int] = {}
 
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
     def add(self, doc_id: str, vector: np.ndarray) -> None:
         if doc_id in self._id_to_idx:
             self.remove(doc_id)
-        normed = vector / (np.linalg.norm(vector) + 1e-12)
+        normed = _unit_vector(vector)
+        if self._matrix is None:
+            self._matrix = np.zeros(
+                (self._capacity, normed.shape[0]),
+                dtype=_VECTOR_QUANTIZATIONS[self._quantization],
+            )
+        elif normed.shape[0] != self._matrix.shape[1]:
+            raise ValueError(
+                f"Vector dimension {normed.shape[0]} does not match index dimension "
+                f"{self._matrix.shape[1]}"
+            )
+        idx = len(self._doc_ids)
+        if idx == self._capacity:
+            self._grow()
+        self._store_row(idx, normed)
         self._doc_ids.append(doc_id)
-        self._vectors.append(normed)
-        self._id_to_idx[doc_id] = len(self._doc_ids) - 1
+        self._id_to_idx[doc_id] = idx
 
     def remove(self, doc_id: str) -> None:
-        if doc_id not in self._id_to_idx:
+        idx = self._id_to_idx.pop(doc_id, None)
+        if idx is None:
             return
-        idx = self._id_to_idx[doc_id]
-        del self._doc_ids[idx]
-        del self._vectors[idx]
-        del self._id_to_idx[doc_id]
-        # Rebuild indices after idx
-        for i, did in enumerate(self._doc_ids[idx:], start=idx):
-            self._id_to_idx[did] = i
+        last = len(self._doc_ids) - 1
+        if idx != last:
+            assert self._matrix is not None
+            moved_id = self._doc_ids[last]
+            self._matrix[idx] = self._matrix[last]
+            self._scales[idx] = self._scales[last]
+            self._doc_ids[idx] = moved_id
+            self._id_to_idx[moved_id] = idx
+        self._doc_ids.pop()
 
     def search(self, query_vector: np.ndarray, k: int = 8) -> list[tuple[str, float]]:
-        if not self._vectors or k <= 0:
+        if not self._doc_ids or k <= 0:
             return []
-        effective_k = min(k, len(self._vectors))
-        q_normed = query_vector / (np.linalg.norm(query_vector) + 1e-12)
-        # Stack and compute dot product (cosine because both are normalized)
-        matrix = np.stack(self._vectors)
-        similarities = matrix @ q_normed
+        count = len(self._doc_ids)
+        similarities = self._scores[:count]
+        self._score_rows(_unit_vector(query_vector), out=similarities)
+        return self._top_k(similarities, k)
+
+    def search_many(self, query_vectors: np.ndarray, k: int = 8) -> list[list[tuple[str, float]]]:
+        """Score a batch of queries with a single matrix product."""
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.ndim != 2:
+            raise ValueError("search_many expects a 2-D array of query vectors")
+        if not self._doc_ids or k <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True) + 1e-12
+        similarities = np.empty((len(self._doc_ids), queries.shape[0]), dtype=np.float32)
+        self._score_rows((queries / norms).T, out=similarities)
+        return [self._top_k(similarities[:, column], k) for column in range(queries.shape[0])]
+
+    def _score_rows(self, queries: np.ndarray, *, out: np.ndarray) -> None:
+        assert self._matrix is not None
+        count = out.shape[0]
+        if self._quantization == "float32":
+            np.matmul(self._matrix[:count], queries, out=out)
+            return
+        for start in range(0, count, _VECTOR_DEQUANTIZE_BLOCK_ROWS):
+            stop = min(start + _VECTOR_DEQUANTIZE_BLOCK_ROWS, count)
+            block = self._matrix[start:stop].astype(np.float32)
+            np.matmul(block, queries, out=out[start:stop])
+        if self._quantization == "int8":
+            scales = self._scales[:count]
+            out *= scales if out.ndim == 1 else scales[:, None]
+
+    def _top_k(self, similarities: np.ndarray, k: int) -> list[tuple[str, float]]:
+        effective_k = min(k, similarities.shape[0])
         top_k_idx = np.argpartition(similarities, -effective_k)[-effective_k:]
         top_k_idx = top_k_idx[np.argsort(similarities[top_k_idx])[::-1]]
         return [(self._doc_ids[i], float(similarities[i])) for i in top_k_idx if similarities[i] > 0]
 
+    def _store_row(self, idx: int, normed: np.ndarray) -> None:
+        assert self._matrix is not None
+        if self._quantization == "int8":
+            scale = float(np.max(np.abs(normed))) / 127.0 or 1.0
+            self._matrix[idx] = np.round(normed / scale).astype(np.int8)
+            self._scales[idx] = scale
+        else:
+            self._matrix[idx] = normed
+
+    def _grow(self) -> None:
+        assert self._matrix is not None
+        capacity = self._capacity * 2
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=self._matrix.dtype)
+        matrix[: self._capacity] = self._matrix
+        scales = np.ones(capacity, dtype=np.float32)
+        scales[: self._capacity] = self._scales
+        self._matrix = matrix
+        self._scales = scales
+        self._scores = np.empty(capacity, dtype=np.float32)
+        self._capacity = capacity
+
+
+@dataclass
+class _JournalState:
+    """Per-path progress through the binary snapshot and mutation journal."""
+
+    snapshot_digest: str | None = None
+    offset: int = 0
+    entries: int = 0
+    torn: bool = False
+    pending: dict[str, str] = field(default_factory=dict)
+
 
 class InMemoryBackend(MemoryBackend):
     """Deterministic backend for local tests and Codex-safe development.
 
-    Supports optional dense vector search via sentence-transformers.
+    Supports optional dense vector search via sentence-transformers. With
+    ``persistence="journal"`` each seal appends only the records written since
+    the previous seal, and startup maps a compact binary snapshot.
     """
 
     _global_records: dict[str, list[MemoryRecord]] = {}
     _global_versions: dict[str, int] = {}
+    _global_mutations: dict[str, deque[tuple[int, int | None]]] = {}
+    _global_journals: dict[str, _JournalState] = {}
     _global_locks: dict[str, RLock] = {}
     _global_locks_guard = Lock()
 
@@ -196,15 +382,30 @@ class InMemoryBackend(MemoryBackend):
         self._bm25 = _BM25Index()
         self._identity_counts: Counter[str] = Counter()
         self._identity_snapshots: list[frozenset[str]] = []
+        self._indexed_records: list[MemoryRecord] = []
+        self._session_index = SessionTurnIndex()
+        self._key_index: RecordKeyIndex[int] = RecordKeyIndex()
 
         self._enable_vec = bool(kwargs.get("enable_vec", False))
         self._embedding_model_name = str(kwargs.get("embedding_model", "all-MiniLM-L6-v2"))
-        self._vector_index: _VectorIndex | None = _VectorIndex() if self._enable_vec else None
+        self._vector_quantization = str(kwargs.get("vector_quantization", "float32"))
+        self._vector_index: _VectorIndex | None = (
+            _VectorIndex(quantization=self._vector_quantization) if self._enable_vec else None
+        )
         self._vector_cache: dict[str, np.ndarray] = {}
+        cache_path = kwargs.get("embedding_cache_path")
+        self._embedding_cache_path = None if cache_path is None else Path(str(cache_path))
+        self._embedding_cache: EmbeddingCache | None = None
+        self._embedder = _BackendEmbedder(self)
         self._path_key = os.path.abspath(self.path)
         self._state_lock = self._lock_for_path(self._path_key)
         self._indexed_version = -1
+        self._persistence = str(kwargs.get("persistence", "snapshot"))
+        if self._persistence not in _PERSISTENCE_MODES:
+            raise ValueError(f"Unsupported memory persistence mode: {self._persistence}")
         self._snapshot_path = self.path.with_suffix(".memory.json")
+        self._binary_snapshot_path = self.path.with_suffix(".memory.bin")
+        self._journal_path = self.path.with_suffix(".memory.log")
         self._snapshot_lock_path = self.path.parent / f".{self.path.name}.kestrel.lock"
 
     @classmethod
@@ -219,11 +420,26 @@ class InMemoryBackend(MemoryBackend):
         model = _get_embedding_model(self._embedding_model_name)
         return cast(np.ndarray, model.encode(text, convert_to_numpy=True, normalize_embeddings=False))
 
+    def _encode_batch(self, texts: Sequence[str]) -> np.ndarray:
+        model = _get_embedding_model(self._embedding_model_name)
+        return cast(
+            np.ndarray,
+            model.encode(
+                list(texts),
+                batch_size=max(1, len(texts)),
+                convert_to_numpy=True,
+                normalize_embeddings=False,
+            ),
+        )
+
+    def _encode_many(self, texts: Sequence[str]) -> list[np.ndarray]:
+        return embed_texts(self._embedder, texts, cache=self._embedding_cache)
+
     def _maybe_index_vector(self, record: MemoryRecord) -> None:
         if self._vector_index is None:
             return
         text = self._text_for_record(record)
-        vec = self._encode(text)
+        vec = self._encode_many([text])[0]
         self._vector_index.add(record.id, vec)
         self._vector_cache[record.id] = vec
 
@@ -235,25 +451,52 @@ class InMemoryBackend(MemoryBackend):
 
     def open(self) -> None:
         ensure_private_directory(self.path.parent)
+        if (
+            self._vector_index is not None
+            and self._embedding_cache_path is not None
+            and self._embedding_cache is None
+        ):
+            self._embedding_cache = EmbeddingCache.open_path(self._embedding_cache_path)
         with self._state_lock, self._snapshot_file_lock(exclusive=False):
             harden_memory_artifact_files(self.path)
+            if self._binary_snapshot_path.exists() or self._journal_path.exists():
+                # Once a layer has been journaled, every opener must read it
+                # that way; the legacy JSON snapshot is no longer current.
+                self._persistence = "journal"
+            if self._persistence == "journal":
+                self._open_journal()
+                return
             disk_records = self._load_snapshot_records()
             shared_records = self._global_records.get(self._path_key)
             if shared_records is None:
                 shared_records = disk_records or []
                 self._global_records[self._path_key] = shared_records
-                self._global_versions[self._path_key] = (
-                    self._global_versions.get(self._path_key, 0) + 1
-                )
+                self._record_mutation(None)
             elif disk_records is not None:
                 shared_records[:] = _merge_records(disk_records, shared_records)
-                self._global_versions[self._path_key] = (
-                    self._global_versions.get(self._path_key, 0) + 1
-                )
+                self._record_mutation(None)
             self.records = shared_records
             self._rebuild_indices()
             self._indexed_version = self._global_versions[self._path_key]
 
+    def _open_journal(self) -> None:
+        shared_records = self._global_records.get(self._path_key)
+        if shared_records is None:
+            state = _JournalState()
+            self._global_journals[self._path_key] = state
+            shared_records = self._load_journal_records(state)
+            self._global_records[self._path_key] = shared_records
+            self._record_mutation(None)
+        else:
+            state = self._global_journals.setdefault(self._path_key, _JournalState())
+            foreign = self._read_journal_tail(state)
+            if foreign:
+                shared_records[:] = _merge_records(foreign, shared_records)
+                self._record_mutation(None)
+        self.records = shared_records
+        self._rebuild_indices()
+        self._indexed_version = self._global_versions[self._path_key]
+
     @contextmanager
     def _snapshot_file_lock(self, *, exclusive: bool) -> Iterator[None]:
         descriptor = open_private_file_descriptor(self._snapshot_lock_path)
@@ -279,9 +522,138 @@ class InMemoryBackend(MemoryBackend):
             raise ValueError(f"Memory snapshot records must be JSON objects: {self._snapshot_path}")
         return [_record_from_snapshot(item, self.layer) for item in loaded]
 
-    def _mark_mutation(self, *, indices_current: bool) -> None:
+    def _load_journal_records(self, state: _JournalState) -> list[MemoryRecord]:
+        """Load the binary snapshot (or the legacy JSON one) and replay the journal."""
+
+        state.offset = 0
+        state.entries = 0
+        state.torn = False
+        records = self._load_binary_snapshot(state)
+        if records is None:
+            records = self._load_snapshot_records() or []
+        return _merge_records(records, self._read_journal_from(state))
+
+    def _load_binary_snapshot(self, state: _JournalState) -> list[MemoryRecord] | None:
+        mapped = map_private_file(self._binary_snapshot_path, missing_ok=True)
+        if mapped is None:
+            state.snapshot_digest = None
+            return None
+        with mapped:
+            count, digest = _binary_snapshot_header(mapped, self._binary_snapshot_path)
+            header_size = _BINARY_SNAPSHOT_HEADER.size
+            with memoryview(mapped) as view, view[header_size:] as body:
+                if sha256(body).digest() != digest:
+                    raise ValueError(
+                        f"Binary memory snapshot digest does not match: {self._binary_snapshot_path}"
+                    )
+            offsets = struct.unpack_from(f"<{count + 1}Q", mapped, header_size)
+            base = header_size + 8 * (count + 1)
+            records = [
+                _record_from_snapshot(json.loads(mapped[base + start : base + end]), self.layer)
+                for start, end in zip(offsets, offsets[1:], strict=False)
+            ]
+        state.snapshot_digest = digest.hex()
+        return records
+
+    def _binary_snapshot_digest(self) -> str | None:
+        mapped = map_private_file(self._binary_snapshot_path, missing_ok=True)
+        if mapped is None:
+            return None
+        with mapped:
+            return _binary_snapshot_header(mapped, self._binary_snapshot_path)[1].hex()
+
+    def _read_journal_tail(self, state: _JournalState) -> list[MemoryRecord]:
+        """Return journal records another writer appended since ``state`` last read.
+
+        If another writer compacted the journal into a new snapshot, the whole
+        persisted state is returned instead.
+        """
+
+        if self._binary_snapshot_digest() != state.snapshot_digest:
+            return self._load_journal_records(state)
+        return self._read_journal_from(state)
+
+    def _read_journal_from(self, state: _JournalState) -> list[MemoryRecord]:
+        raw = read_private_bytes(self._journal_path, missing_ok=True, offset=state.offset)
+        if not raw:
+            return []
+        # A line without its newline was torn by a crash mid-append. It was
+        # never acknowledged, so it is skipped and the next seal compacts it away.
+        complete, newline, tail = raw.rpartition(b"\n")
+        state.torn = state.torn or bool(tail)
+        if not newline:
+            return []
+        records: list[MemoryRecord] = []
+        for line in complete.split(b"\n"):
+            entry = json.loads(line)
+            if not isinstance(entry, dict) or not isinstance(entry.get("record"), dict):
+                raise ValueError(f"Memory journal entries must be JSON objects: {self._journal_path}")
+            records.append(_record_from_snapshot(entry["record"], self.layer))
+        state.offset += len(complete) + 1
+        state.entries += len(records)
+        return records
+
+    def _note_journal_write(self, record_id: str, op: str) -> None:
+        if self._persistence != "journal":
+            return
+        state = self._global_journals.setdefault(self._path_key, _JournalState())
+        state.pending[record_id] = op
+
+    def _seal_journal(self) -> None:
+        state = self._global_journals.setdefault(self._path_key, _JournalState())
+        self._sync_indices()
+        for record in self._read_journal_tail(state):
+            slots = self._key_index.by_id(record.id)
+            if slots and _aware_datetime(record.updated_at) <= _aware_datetime(
+                self.records[slots[0]].updated_at
+            ):
+                continue
+            self._upsert_unlocked(record)
+        lines: list[str] = []
+        for record_id, op in sorted(state.pending.items()):
+            slots = self._key_index.by_id(record_id)
+            if slots:
+                payload = _snapshot_payload([self.records[slots[0]]])[0]
+                lines.append(json.dumps({"op": op, "record": payload}, separators=(",", ":")) + "\n")
+        state.pending.clear()
+        if state.torn:
+            # Appending after a torn line would corrupt the next entry.
+            self._compact_journal(state)
+            return
+        if lines:
+            text = "".join(lines)
+            append_private_text(self._journal_path, text)
+            state.offset += len(text.encode("utf-8"))
+            state.entries += len(lines)
+        if state.entries >= max(_JOURNAL_MIN_COMPACTION_ENTRIES, len(self.records)):
+            self._compact_journal(state)
+
+    def _compact_journal(self, state: _JournalState) -> None:
+        """Fold the journal into a fresh binary snapshot and restart it."""
+
+        payload = _binary_snapshot_payload(_merge_records((), self.records))
+        write_private_bytes(self._binary_snapshot_path, payload)
+        # A crash before this unlink replays entries the snapshot already holds;
+        # replay keeps the newest copy of each record, so that is harmless.
+        self._journal_path.unlink(missing_ok=True)
+        state.snapshot_digest = _BINARY_SNAPSHOT_HEADER.unpack_from(payload)[2].hex()
+        state.offset = 0
+        state.entries = 0
+        state.torn = False
+
+    def _record_mutation(self, slot: int | None) -> int:
+        """Bump the path version and log which slot changed (``None``: all of them)."""
+
         version = self._global_versions.get(self._path_key, 0) + 1
         self._global_versions[self._path_key] = version
+        log = self._global_mutations.get(self._path_key)
+        if log is None:
+            log = self._global_mutations[self._path_key] = deque(maxlen=_MUTATION_LOG_LIMIT)
+        log.append((version, slot))
+        return version
+
+    def _mark_mutation(self, *, indices_current: bool, slot: int | None = None) -> None:
+        version = self._record_mutation(slot)
         self._global_records[self._path_key] = self.records
         if indices_current:
             self._indexed_version = version
@@ -290,25 +662,87 @@ class InMemoryBackend(MemoryBackend):
         version = self._global_versions.get(self._path_key, 0)
         if self._indexed_version == version:
             return
-        self._rebuild_indices()
+        slots = self._missed_slots()
+        if slots is None:
+            self._rebuild_indices()
+        else:
+            for slot in slots:
+                self._reindex_slot(slot)
         self._indexed_version = version
 
+    def _missed_slots(self) -> list[int] | None:
+        """Slots written by other same-path instances since this one last synced.
+
+        Returns ``None`` when only a full rebuild can catch up: the log no
+        longer reaches back far enough, or a missed write replaced every record.
+        """
+
+        log = self._global_mutations.get(self._path_key)
+        if self._indexed_version < 0 or not log or log[0][0] > self._indexed_version + 1:
+            return None
+        slots: set[int] = set()
+        for version, slot in reversed(log):
+            if version <= self._indexed_version:
+                break
+            if slot is None:
+                return None
+            slots.add(slot)
+        ordered = sorted(slots)
+        indexed = len(self._indexed_records)
+        appended = [slot for slot in ordered if slot >= indexed]
+        if appended != list(range(indexed, indexed + len(appended))):
+            return None
+        return ordered
+
+    def _reindex_slot(self, slot: int) -> None:
+        """Bring every index in line with ``self.records[slot]``."""
+
+        record = self.records[slot]
+        new_text = self._text_for_record(record)
+        if slot < len(self._indexed_records):
+            previous = self._indexed_records[slot]
+            self._remove_record_identities(self._identity_snapshots[slot])
+            if previous.id != record.id:
+                self._session_index.discard(previous.id)
+            if previous.id != record.id or self._text_for_record(previous) != new_text:
+                self._bm25.remove(previous.id)
+                self._bm25.add(record.id, _tokens(new_text))
+                self._maybe_remove_vector(previous.id)
+                self._maybe_index_vector(record)
+            self._indexed_records[slot] = record
+            identities = _record_identity_values(record)
+            self._identity_snapshots[slot] = identities
+        else:
+            self._indexed_records.append(record)
+            identities = _record_identity_values(record)
+            self._identity_snapshots.append(identities)
+            self._bm25.add(record.id, _tokens(new_text))
+            self._maybe_index_vector(record)
+        self._identity_counts.update(identities)
+        self._session_index.add(record)
+        self._key_index.add(slot, record)
+
     def _rebuild_indices(self) -> None:
         self._bm25 = _BM25Index()
         self._identity_counts = Counter()
         self._identity_snapshots = []
+        self._indexed_records = list(self.records)
+        self._session_index.rebuild(self.records)
+        self._key_index.rebuild(enumerate(self.records))
         if self._vector_index is not None:
-            self._vector_index = _VectorIndex()
+            self._vector_index = _VectorIndex(quantization=self._vector_quantization)
             self._vector_cache = {}
+        texts: list[str] = []
         for record in self.records:
             identities = _record_identity_values(record)
             self._identity_snapshots.append(identities)
             self._identity_counts.update(identities)
             text = self._text_for_record(record)
+            texts.append(text)
             tokens = _tokens(text)
             self._bm25.add(record.id, tokens)
-            if self._vector_index is not None:
-                vec = self._encode(text)
+        if self._vector_index is not None:
+            for record, vec in zip(self.records, self._encode_many(texts), strict=True):
                 self._vector_index.add(record.id, vec)
                 self._vector_cache[record.id] = vec
 
@@ -326,14 +760,9 @@ class InMemoryBackend(MemoryBackend):
         with self._state_lock:
             self._sync_indices()
             self.records.append(record)
-            identities = _record_identity_values(record)
-            self._identity_snapshots.append(identities)
-            self._identity_counts.update(identities)
-            text = self._text_for_record(record)
-            tokens = _tokens(text)
-            self._bm25.add(record.id, tokens)
-            self._maybe_index_vector(record)
-            self._mark_mutation(indices_current=True)
+            self._reindex_slot(len(self.records) - 1)
+            self._mark_mutation(indices_current=True, slot=len(self.records) - 1)
+            self._note_journal_write(record.id, "put")
         return record.id
 
     @contextmanager
@@ -351,64 +780,113 @@ class InMemoryBackend(MemoryBackend):
             raise ValueError(f"Cannot write {record.layer} record to {self.layer} backend")
         with self._state_lock:
             self._sync_indices()
-            for index, existing in enumerate(self.records):
-                if existing.id == record.id:
-                    self._remove_record_identities(self._identity_snapshots[index])
-                    old_text = self._text_for_record(existing)
-                    new_text = self._text_for_record(record)
-                    if old_text != new_text:
-                        self.records[index] = record
-                        self._bm25.remove(record.id)
-                        tokens = _tokens(new_text)
-                        self._bm25.add(record.id, tokens)
-                        self._maybe_remove_vector(record.id)
-                        self._maybe_index_vector(record)
-                    else:
-                        self.records[index] = record
-                    identities = _record_identity_values(record)
-                    self._identity_snapshots[index] = identities
-                    self._identity_counts.update(identities)
-                    self._mark_mutation(indices_current=True)
-                    return record.id
-            self.records.append(record)
-            identities = _record_identity_values(record)
-            self._identity_snapshots.append(identities)
-            self._identity_counts.update(identities)
-            text = self._text_for_record(record)
-            tokens = _tokens(text)
-            self._bm25.add(record.id, tokens)
-            self._maybe_index_vector(record)
-            self._mark_mutation(indices_current=True)
+            self._upsert_unlocked(record)
+            self._note_journal_write(record.id, "upsert")
         return record.id
 
+    def _upsert_unlocked(self, record: MemoryRecord) -> None:
+        slots = self._key_index.by_id(record.id)
+        if slots:
+            index = slots[0]
+            self.records[index] = record
+        else:
+            index = len(self.records)
+            self.records.append(record)
+        self._reindex_slot(index)
+        self._mark_mutation(indices_current=True, slot=index)
+
     def tombstone(self, record_id: str, *, reason: str, superseded_by: str | None = None) -> bool:
         with self._state_lock:
-            record = self.get_record(record_id, include_inactive=True)
-            if record is None:
+            self._sync_indices()
+            slot = self._key_index.first_identity(record_id)
+            if slot is None:
                 return False
+            record = self.records[slot]
             record.metadata["active"] = False
             record.metadata["tombstone_reason"] = reason
             record.metadata["tombstoned_at"] = datetime.now(UTC).isoformat()
             if superseded_by:
                 record.metadata["superseded_by"] = superseded_by
             record.updated_at = datetime.now(UTC)
-            self._mark_mutation(indices_current=True)
+            self._mark_mutation(indices_current=True, slot=slot)
+            self._note_journal_write(record.id, "tombstone")
             return True
 
     def iter_records(self, *, include_inactive: bool = False) -> Iterable[MemoryRecord]:
         with self._state_lock:
             return tuple(record for record in self.records if include_inactive or _is_active(record))
 
+    def iter_session_records(
+        self,
+        session_id: str,
+        *,
+        transcript_scope: str,
+        turn_origin: str,
+        since: datetime | None = None,
+        include_inactive: bool = False,
+    ) -> Iterable[MemoryRecord]:
+        with self._state_lock:
+            self._sync_indices()
+            return tuple(
+                record
+                for record in self._session_index.records(
+                    (session_id, transcript_scope, turn_origin), since=since
+                )
+                if include_inactive or _is_active(record)
+            )
+
     def get_record(self, record_id: str, *, include_inactive: bool = True) -> MemoryRecord | None:
         with self._state_lock:
-            for record in self.records:
-                metadata = record.metadata
-                if record.id == record_id or str(metadata.get("frame_id", "")) == record_id:
-                    if include_inactive or _is_active(record):
-                        return record
-                    return None
+            self._sync_indices()
+            slot = self._key_index.first_identity(record_id)
+            if slot is None:
+                return None
+            record = self.records[slot]
+            return record if include_inactive or _is_active(record) else None
+
+    def get_by_ids(
+        self,
+        record_ids: Iterable[str],
+        *,
+        include_inactive: bool = True,
+    ) -> dict[str, MemoryRecord]:
+        with self._state_lock:
+            self._sync_indices()
+            found: dict[str, MemoryRecord] = {}
+            for record_id in record_ids:
+                slots = self._key_index.by_id(record_id)
+                if slots and (include_inactive or _is_active(self.records[slots[0]])):
+                    found[record_id] = self.records[slots[0]]
+            return found
+
+    def find_by_frame_id(
+        self,
+        frame_id: str,
+        *,
+        include_inactive: bool = True,
+    ) -> MemoryRecord | None:
+        with self._state_lock:
+            self._sync_indices()
+            for slot in self._key_index.by_frame_id(frame_id):
+                record = self.records[slot]
+                if include_inactive or _is_active(record):
+                    return record
             return None
 
+    def get_by_content_hash(
+        self,
+        content_hash: str,
+        *,
+        include_inactive: bool = True,
+    ) -> tuple[MemoryRecord, ...]:
+        with self._state_lock:
+            self._sync_indices()
+            return tuple(
+                record
+                for record in (self.records[slot] for slot in self._key_index.by_content_hash(content_hash))
+                if include_inactive or _is_active(record)
+            )
+
     def put_frame(self, frame: MV2ContextFrame) -> str:
         return self.put(to_memory_record(frame))
 
@@ -438,7 +916,7 @@ class InMemoryBackend(MemoryBackend):
         return sorted(hits, key=lambda hit: hit.score, reverse=True)[:k]
 
     def _find_vector(self, query: str, k: int, min_relevancy: float, include_inactive: bool) -> list[MemoryHit]:
-        if self._vector_index is None or not self._vector_index._vectors:
+        if self._vector_index is None or not len(self._vector_index):
             return []
         query_vec = self._encode(query)
         results = self._vector_index.search(query_vec, k=k * 2)
@@ -507,6 +985,10 @@ class InMemoryBackend(MemoryBackend):
                 )
         return hits
 
+    def search_generation(self) -> Hashable | None:
+        with self._state_lock:
+            return self._global_versions.get(self._path_key, 0)
+
     def find(
         self,
         query: str,
@@ -547,10 +1029,21 @@ class InMemoryBackend(MemoryBackend):
     def seal(self) -> None:
         with self._state_lock, self._snapshot_file_lock(exclusive=True):
             harden_memory_artifact_files(self.path)
+            if self._persistence == "journal":
+                self._seal_journal()
+                return
             disk_records = self._load_snapshot_records() or []
-            self.records[:] = _merge_records(disk_records, self.records)
-            self._mark_mutation(indices_current=False)
             self._sync_indices()
+            merged = _merge_records(disk_records, self.records)
+            changed = _changed_slots(self.records, merged)
+            self.records[:] = merged
+            if changed is None:
+                self._mark_mutation(indices_current=False)
+                self._sync_indices()
+            else:
+                for slot in changed:
+                    self._reindex_slot(slot)
+                    self._mark_mutation(indices_current=True, slot=slot)
             write_private_text(
                 self._snapshot_path,
                 json.dumps(_snapshot_payload(self.records), indent=2),
@@ -562,13 +1055,37 @@ class InMemoryBackend(MemoryBackend):
             return all(record.layer == self.layer and bool(record.content.strip()) for record in self.records)
 
     def close(self) -> None:
-        return None
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
+            self._embedding_cache = None
+
+
+class _BackendEmbedder:
+    """Route the shared embedding scheduler through one backend's model hooks."""
+
+    def __init__(self, backend: InMemoryBackend) -> None:
+        self._backend = backend
+
+    @property
+    def model_name(self) -> str:
+        return self._backend._embedding_model_name
+
+    def embed(self, text: str) -> np.ndarray:
+        return self._backend._encode(text)
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        return self._backend._encode_batch(texts)
 
 
 def _tokens(text: str) -> list[str]:
     return [match.group(0).lower() for match in _TOKEN_RE.finditer(text)]
 
 
+def _unit_vector(vector: np.ndarray) -> np.ndarray:
+    values = np.asarray(vector, dtype=np.float32).reshape(-1)
+    return cast(np.ndarray, values / (np.linalg.norm(values) + 1e-12))
+
+
 def _snippet(text: str, query_tokens: set[str], window: int = 220) -> str:
     lower = text.lower()
     first_idx = min((lower.find(token) for token in query_tokens if token in lower), default=0)
@@ -608,6 +1125,46 @@ def _snapshot_payload(records: Iterable[MemoryRecord]) -> list[dict[str, object]
     ]
 
 
+def _binary_snapshot_payload(records: Sequence[MemoryRecord]) -> bytes:
+    blobs = [
+        json.dumps(item, separators=(",", ":")).encode("utf-8")
+        for item in _snapshot_payload(records)
+    ]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    body = struct.pack(f"<{len(offsets)}Q", *offsets) + b"".join(blobs)
+    header = _BINARY_SNAPSHOT_HEADER.pack(_BINARY_SNAPSHOT_MAGIC, len(blobs), sha256(body).digest())
+    return header + body
+
+
+def _binary_snapshot_header(mapped: Any, path: Path) -> tuple[int, bytes]:
+    if len(mapped) < _BINARY_SNAPSHOT_HEADER.size:
+        raise ValueError(f"Binary memory snapshot is truncated: {path}")
+    magic, count, digest = _BINARY_SNAPSHOT_HEADER.unpack_from(mapped, 0)
+    if magic != _BINARY_SNAPSHOT_MAGIC:
+        raise ValueError(f"Unsupported binary memory snapshot: {path}")
+    if len(mapped) < _BINARY_SNAPSHOT_HEADER.size + 8 * (count + 1):
+        raise ValueError(f"Binary memory snapshot is truncated: {path}")
+    return int(count), bytes(digest)
+
+
+def _changed_slots(current: Sequence[MemoryRecord], merged: Sequence[MemoryRecord]) -> list[int] | None:
+    """Slots that differ when ``merged`` only replaces or extends ``current``."""
+
+    if len(merged) < len(current):
+        return None
+    changed: list[int] = []
+    for slot, record in enumerate(current):
+        replacement = merged[slot]
+        if replacement.id != record.id:
+            return None
+        if replacement is not record:
+            changed.append(slot)
+    changed.extend(range(len(current), len(merged)))
+    return changed
+
+
 def _merge_records(
     persisted: Iterable[MemoryRecord],
     active: Iterable[MemoryRecord],
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import hmac
 import json
 import os
 import re
 from collections import Counter
-from collections.abc import Collection, Iterable, Iterator
+from collections.abc import Collection, Hashable, Iterable, Iterator
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from hashlib import sha256
@@ -18,13 +19,18 @@ from ..context_frames import MV2ContextFrame, default_frame_type_for_memory, to_
 from ..file_lock import lock_exclusive, lock_shared, unlock
 from ..models import EvidenceRef, MemoryHit, MemoryKind, MemoryLayer, MemoryRecord
 from ..private_artifacts import (
+    append_private_text,
     ensure_private_directory,
     harden_memory_artifact_files,
     harden_private_file,
     open_private_file_descriptor,
+    read_private_text,
     write_private_text,
 )
+from ..search_sessions import SearchSessionCache, format_search_cursor, parse_search_cursor
 from .base import MemoryBackend, MemorySearchPage
+from .record_index import RecordKeyIndex
+from .session_index import SessionTurnIndex
 
 _PATH_LOCKS: dict[Path, Lock] = {}
 _PATH_LOCKS_GUARD = Lock()
@@ -35,6 +41,8 @@ _CANONICAL_EVENT_METADATA_KEY = "kestrel_canonical_event"
 _CANONICAL_EVENT_DIGEST_KEY = "kestrel_canonical_event_sha256"
 _CANONICAL_EVENT_SCHEMA_KEY = "kestrel_canonical_event_schema"
 _CANONICAL_TIMELINE_BATCH_SIZE = 256
+_EXACT_JOURNAL_MIN_COMPACTION_ENTRIES = 256
+_REPLAY_CHECKPOINT_KEY_CONTEXT = b"kestrel-memvid-replay-checkpoint-v1"
 
 
 class MemvidLockError(RuntimeError):
@@ -79,11 +87,41 @@ class MemvidBackend(MemoryBackend):
         self._identity_counts: Counter[str] = Counter()
         self._identity_snapshots: dict[str, frozenset[str]] = {}
         self._inactive_ids: set[str] = set()
+        self._session_index = SessionTurnIndex()
+        self._key_index: RecordKeyIndex[str] = RecordKeyIndex()
         self._canonical_event_count = 0
         self._last_canonical_event_digest: str | None = None
         self._canonical_chain_started = False
         self._saw_unchained_canonical_event = False
         self._index_path = self.path.with_suffix(f"{self.path.suffix}.records.json")
+        # Per-write exact-state deltas are appended to a hash-chained journal
+        # rooted at the snapshot digest and folded back into the snapshot once
+        # the journal outgrows the record set, on seal(), and on close().
+        # Containers with the timeline/frame APIs rebuild from the signed
+        # checkpoint and the .mv2 tail instead, so for them the journal is
+        # never written and ``_journal_entries`` only counts unsnapshotted
+        # writes.
+        self._journal_path = self.path.with_suffix(f"{self.path.suffix}.records.log")
+        self._journal_head: str | None = None
+        self._journal_entries = 0
+        self._journal_replayed = True
+        self._replay_checkpoint_key: bytes | None = None
+        # Ranked exact-fallback results, paged through opaque cursors while
+        # the Memvid lexical index is disabled.
+        self._fallback_sessions = SearchSessionCache()
+        self._search_generation = 0
+
+    def bind_replay_checkpoint_key(self, integrity_key: bytes) -> None:
+        """Authenticate replay checkpoints with a key derived from the memory integrity key.
+
+        With a key bound, each snapshot records an HMAC-signed checkpoint of
+        the exact state at the newest logical frame, and a later open replays
+        only the canonical events committed after that frame.
+        """
+
+        self._replay_checkpoint_key = hmac.new(
+            integrity_key, _REPLAY_CHECKPOINT_KEY_CONTEXT, sha256
+        ).digest()
 
     def open(self) -> None:
         with self._operation_lock:
@@ -247,7 +285,11 @@ class MemvidBackend(MemoryBackend):
         if apply_event:
             self._apply_canonical_event(event)
         if persist_cache:
-            self._persist_exact_index()
+            touched_ids = [record.id]
+            target_id = str(event.get("target_id") or "")
+            if target_id:
+                touched_ids.append(target_id)
+            self._append_exact_journal(touched_ids)
         # The MemoryBackend contract returns the logical MemoryRecord ID.  The
         # Memvid SDK return value is a physical frame identifier and cannot be
         # used by get_record(), evidence binding, tombstones, or corrections.
@@ -305,28 +347,88 @@ class MemvidBackend(MemoryBackend):
                 if include_inactive or _record_active(record, inactive_ids=self._inactive_ids)
             )
 
+    def iter_session_records(
+        self,
+        session_id: str,
+        *,
+        transcript_scope: str,
+        turn_origin: str,
+        since: datetime | None = None,
+        include_inactive: bool = False,
+    ) -> Iterable[MemoryRecord]:
+        with self._operation_lock:
+            return tuple(
+                record
+                for record in self._session_index.records(
+                    (session_id, transcript_scope, turn_origin), since=since
+                )
+                if include_inactive or _record_active(record, inactive_ids=self._inactive_ids)
+            )
+
     def get_record(self, record_id: str, *, include_inactive: bool = True) -> MemoryRecord | None:
         with self._operation_lock:
             record = self._records.get(record_id)
-            if record is not None:
+            if record is None:
+                frame_slots = self._key_index.by_frame_id(record_id)
+                if not frame_slots:
+                    return None
+                record = self._records[frame_slots[0]]
+            if include_inactive or _record_active(record, inactive_ids=self._inactive_ids):
+                return record
+            return None
+
+    def get_by_ids(
+        self,
+        record_ids: Iterable[str],
+        *,
+        include_inactive: bool = True,
+    ) -> dict[str, MemoryRecord]:
+        with self._operation_lock:
+            return {
+                record_id: record
+                for record_id in record_ids
+                if (record := self._records.get(record_id)) is not None
+                and (include_inactive or _record_active(record, inactive_ids=self._inactive_ids))
+            }
+
+    def find_by_frame_id(
+        self,
+        frame_id: str,
+        *,
+        include_inactive: bool = True,
+    ) -> MemoryRecord | None:
+        with self._operation_lock:
+            for record_id in self._key_index.by_frame_id(frame_id):
+                record = self._records[record_id]
                 if include_inactive or _record_active(record, inactive_ids=self._inactive_ids):
                     return record
-                return None
-            for indexed_record in self._records.values():
-                if str(indexed_record.metadata.get("frame_id", "")) != record_id:
-                    continue
-                if include_inactive or _record_active(
-                    indexed_record, inactive_ids=self._inactive_ids
-                ):
-                    return indexed_record
-                return None
             return None
 
+    def get_by_content_hash(
+        self,
+        content_hash: str,
+        *,
+        include_inactive: bool = True,
+    ) -> tuple[MemoryRecord, ...]:
+        with self._operation_lock:
+            return tuple(
+                record
+                for record in (
+                    self._records[record_id]
+                    for record_id in self._key_index.by_content_hash(content_hash)
+                )
+                if include_inactive or _record_active(record, inactive_ids=self._inactive_ids)
+            )
+
     def put_frame(self, frame: MV2ContextFrame) -> str:
         """Store a structured context frame through the existing record path."""
 
         return self.put(to_memory_record(frame))
 
+    def search_generation(self) -> Hashable | None:
+        with self._operation_lock:
+            return self._search_generation
+
     def find(
         self,
         query: str,
@@ -393,17 +495,12 @@ class MemvidBackend(MemoryBackend):
             )
         except Exception as exc:
             if _is_index_disabled_error(exc):
-                offset = _exact_fallback_offset(cursor)
-                end = offset + k
-                fallback_hits = self._find_exact_index_fallback(
+                return self._find_exact_fallback_page(
                     query=query,
-                    k=end + 1,
+                    k=k,
                     min_relevancy=min_relevancy,
                     include_inactive=include_inactive,
-                )
-                return MemorySearchPage(
-                    hits=tuple(fallback_hits[offset:end]),
-                    next_cursor=(f"exact-offset:{end}" if len(fallback_hits) > end else None),
+                    cursor=cursor,
                 )
             raise
         hits = raw.get("hits", raw) if isinstance(raw, dict) else raw
@@ -442,13 +539,56 @@ class MemvidBackend(MemoryBackend):
             next_cursor=str(next_cursor) if next_cursor not in {None, ""} else None,
         )
 
-    def _find_exact_index_fallback(
+    def _find_exact_fallback_page(
         self,
         *,
         query: str,
         k: int,
         min_relevancy: float,
         include_inactive: bool,
+        cursor: str | None,
+    ) -> MemorySearchPage:
+        # The fallback scores every exact record anyway, so the full ranking
+        # is kept in a search session and each later page is a slice of it.
+        position = parse_search_cursor(
+            "exact", cursor, error="Invalid Memvid fallback search cursor"
+        )
+        end = position.offset + k
+        signature = (query, min_relevancy, include_inactive)
+        cached = (
+            self._fallback_sessions.lookup(position.token, scope=self.layer, signature=signature)
+            if position.token is not None
+            else None
+        )
+        token = position.token
+        if cached is not None:
+            ranked = cached[0]
+        else:
+            ranked = tuple(
+                self._find_exact_index_fallback(
+                    query=query,
+                    k=None,
+                    min_relevancy=min_relevancy,
+                    include_inactive=include_inactive,
+                )
+            )
+            token = None
+            if len(ranked) > end:
+                token = self._fallback_sessions.store(
+                    ranked, scope=self.layer, signature=signature, complete=True
+                )
+        return MemorySearchPage(
+            hits=ranked[position.offset : end],
+            next_cursor=format_search_cursor("exact", end, token) if len(ranked) > end else None,
+        )
+
+    def _find_exact_index_fallback(
+        self,
+        *,
+        query: str,
+        k: int | None,
+        min_relevancy: float,
+        include_inactive: bool,
     ) -> list[MemoryHit]:
         query_tokens = set(_tokens(query))
         if not query_tokens:
@@ -476,7 +616,8 @@ class MemvidBackend(MemoryBackend):
                     snippet=_snippet(record.content, overlap),
                 )
             )
-        return sorted(scored, key=lambda hit: hit.score, reverse=True)[:k]
+        ranked = sorted(scored, key=lambda hit: hit.score, reverse=True)
+        return ranked if k is None else ranked[:k]
 
     def find_frames(
         self,
@@ -572,6 +713,12 @@ class MemvidBackend(MemoryBackend):
 
     def close(self) -> None:
         with self._operation_lock:
+            if self._journal_entries and self.mem is not None:
+                try:
+                    self._persist_exact_index()
+                except (OSError, ValueError):
+                    # The verified journal stays authoritative until compacted.
+                    pass
             # Do not release exclusivity until the SDK confirms that its live
             # handle closed. A failed close remains retryable and fail-closed.
             self._close_live_handle_unlocked()
@@ -675,6 +822,7 @@ class MemvidBackend(MemoryBackend):
             lock.release()
 
     def _remember_record(self, record: MemoryRecord) -> None:
+        self._exact_state_changed()
         previous_identities = self._identity_snapshots.get(record.id)
         if previous_identities is not None:
             self._remove_record_identities(previous_identities)
@@ -682,11 +830,17 @@ class MemvidBackend(MemoryBackend):
         identities = _record_identity_values(record)
         self._identity_snapshots[record.id] = identities
         self._identity_counts.update(identities)
+        self._session_index.add(record)
+        self._key_index.add(record.id, record)
         if record.metadata.get("active", True) is False:
             self._inactive_ids.add(record.id)
         else:
             self._inactive_ids.discard(record.id)
 
+    def _exact_state_changed(self) -> None:
+        self._search_generation += 1
+        self._fallback_sessions.invalidate()
+
     def _remove_record_identities(self, identities: frozenset[str]) -> None:
         for identity in identities:
             remaining = self._identity_counts.get(identity, 0) - 1
@@ -698,6 +852,8 @@ class MemvidBackend(MemoryBackend):
     def _rebuild_identity_index(self) -> None:
         self._identity_counts = Counter()
         self._identity_snapshots = {}
+        self._session_index.rebuild(self._records.values())
+        self._key_index.rebuild(self._records.items())
         for record in self._records.values():
             identities = _record_identity_values(record)
             self._identity_snapshots[record.id] = identities
@@ -721,24 +877,35 @@ class MemvidBackend(MemoryBackend):
             indexed = self._records.get(candidate_id)
             if indexed is not None:
                 return indexed
-        for indexed_record in self._records.values():
-            indexed_frame_id = str(indexed_record.metadata.get("frame_id", ""))
-            if indexed_frame_id and indexed_frame_id in candidate_ids:
-                return indexed_record
+        for candidate_id in candidate_ids:
+            frame_slots = self._key_index.by_frame_id(candidate_id)
+            if frame_slots:
+                return self._records[frame_slots[0]]
         return None
 
     def _load_exact_index(self) -> None:
+        self._exact_state_changed()
         self._records = {}
         self._identity_counts = Counter()
         self._identity_snapshots = {}
+        self._key_index = RecordKeyIndex()
         self._inactive_ids = set()
         self._canonical_event_count = 0
         self._last_canonical_event_digest = None
         self._canonical_chain_started = False
         self._saw_unchained_canonical_event = False
+        self._journal_head = None
+        self._journal_entries = 0
         cache_payload: dict[str, Any] | list[Any] | None = None
         cache_state: tuple[dict[str, MemoryRecord], set[str]] | None = None
         cache_error: Exception | None = None
+        journal_head: str | None = None
+        journal_entries = 0
+        mem = self._require_mem()
+        replay_supported = callable(getattr(mem, "timeline", None)) and callable(
+            getattr(mem, "frame", None)
+        )
+        self._journal_replayed = not replay_supported
         if harden_private_file(self._index_path, missing_ok=True):
             try:
                 loaded = json.loads(self._index_path.read_text(encoding="utf-8"))
@@ -746,8 +913,24 @@ class MemvidBackend(MemoryBackend):
                     raise ValueError("exact-record cache must be an object or legacy list")
                 cache_payload = loaded
                 cache_state = _exact_cache_state(loaded, self.layer)
+                if (
+                    not replay_supported
+                    and isinstance(loaded, dict)
+                    and _exact_cache_integrity_valid(loaded)
+                ):
+                    journal_head = str(loaded["cache_sha256"])
+                    journal_text = read_private_text(self._journal_path, missing_ok=True)
+                    if journal_text:
+                        journal_head, journal_entries = _replay_exact_journal(
+                            journal_text,
+                            root_sha256=journal_head,
+                            backend_layer=self.layer,
+                            records=cache_state[0],
+                            inactive_ids=cache_state[1],
+                        )
             except Exception as exc:  # noqa: BLE001 - disposable cache is rebuilt from .mv2 below
                 cache_error = exc
+                cache_state = None
 
         fingerprint = self._mv2_fingerprint_unlocked()
         try:
@@ -761,10 +944,6 @@ class MemvidBackend(MemoryBackend):
             cache_state = None
             cache_schema = 0
 
-        mem = self._require_mem()
-        replay_supported = callable(getattr(mem, "timeline", None)) and callable(
-            getattr(mem, "frame", None)
-        )
         # Production Memvid opens always replay the digest-verified envelopes.
         # A cache-local checksum and a container fingerprint detect ordinary
         # staleness but cannot make JSON authoritative: both could be edited
@@ -779,6 +958,8 @@ class MemvidBackend(MemoryBackend):
             and _exact_cache_integrity_valid(cache_payload)
         ):
             self._records, self._inactive_ids = cache_state
+            self._journal_head = journal_head
+            self._journal_entries = journal_entries
             return
 
         # Version-one sidecars predate canonical envelopes. On the first
@@ -793,19 +974,34 @@ class MemvidBackend(MemoryBackend):
             self._persist_exact_index()
             return
 
+        # A checkpoint signed with the memory integrity key makes the snapshot
+        # authoritative up to its frame, so only later events are replayed.
+        # Any mismatch silently falls back to the full replay below.
+        checkpoint = (
+            self._verified_replay_checkpoint_unlocked(cache_payload)
+            if cache_state is not None and cache_schema == _EXACT_CACHE_SCHEMA_VERSION
+            else None
+        )
+        if checkpoint is not None and cache_state is not None:
+            tail = self._canonical_events_from_mv2_unlocked(checkpoint=checkpoint)
+            if tail is not None:
+                self._records, self._inactive_ids = cache_state
+                self._canonical_event_count = int(checkpoint["commit_sequence"])
+                self._last_canonical_event_digest = checkpoint["last_event_sha256"]
+                self._canonical_chain_started = bool(checkpoint["chain_started"])
+                self._saw_unchained_canonical_event = bool(checkpoint["saw_unchained_event"])
+                self._journal_head = str(checkpoint["cache_sha256"])
+                self._replay_canonical_events_unlocked(
+                    tail,
+                    persist=bool(tail) or self._journal_path.exists(),
+                )
+                return
+
         events = self._canonical_events_from_mv2_unlocked()
         if events:
             self._records = {}
             self._inactive_ids = set()
-            for event in events:
-                self._apply_canonical_event(event)
-            if (
-                self._saw_unchained_canonical_event
-                and not self._canonical_chain_started
-                and not self.read_only
-            ):
-                self._append_canonical_chain_anchor_unlocked()
-            self._persist_exact_index()
+            self._replay_canonical_events_unlocked(events, persist=True)
             return
 
         frame_count = _fingerprint_frame_count(fingerprint)
@@ -822,12 +1018,42 @@ class MemvidBackend(MemoryBackend):
             ) from cache_error
         self._persist_exact_index()
 
-    def _canonical_events_from_mv2_unlocked(self) -> list[dict[str, Any]]:
+    def _replay_canonical_events_unlocked(
+        self,
+        events: list[dict[str, Any]],
+        *,
+        persist: bool,
+    ) -> None:
+        for event in events:
+            self._apply_canonical_event(event)
+        if (
+            self._saw_unchained_canonical_event
+            and not self._canonical_chain_started
+            and not self.read_only
+        ):
+            self._append_canonical_chain_anchor_unlocked()
+            persist = True
+        if persist:
+            self._persist_exact_index()
+
+    def _canonical_events_from_mv2_unlocked(
+        self,
+        *,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Return canonical events in frame order, optionally only those after ``checkpoint``.
+
+        With a checkpoint the timeline is paged back only to its frame, and
+        ``None`` is returned when that frame no longer carries the checkpointed
+        URI, so the caller can fall back to a full replay.
+        """
+
         mem = self._require_mem()
         timeline = getattr(mem, "timeline", None)
         frame = getattr(mem, "frame", None)
         if not callable(timeline) or not callable(frame):
             return []
+        checkpoint_frame = int(checkpoint["frame_id"]) if checkpoint is not None else -1
         fingerprint = self._mv2_fingerprint_unlocked()
         physical_frame_count = _fingerprint_frame_count(fingerprint)
         if fingerprint is not None and physical_frame_count == 0:
@@ -862,7 +1088,7 @@ class MemvidBackend(MemoryBackend):
                     raise RuntimeError(
                         "Memvid reports physical frames but returned no logical timeline commits"
                     )
-                return []
+                return [] if checkpoint is None else None
             frame_ids: list[int] = []
             for item in batch:
                 if not isinstance(item, dict):
@@ -897,7 +1123,7 @@ class MemvidBackend(MemoryBackend):
                 )
             entries.update(zip(frame_ids, batch, strict=True))
             lowest = min(frame_ids)
-            if lowest == 0:
+            if lowest == 0 or lowest <= checkpoint_frame:
                 reached_origin = True
                 continue
             if used_one_shot_fallback:
@@ -907,8 +1133,14 @@ class MemvidBackend(MemoryBackend):
                 )
             as_of_frame = lowest - 1
 
+        if checkpoint is not None:
+            anchor = entries.get(checkpoint_frame)
+            if anchor is None or anchor.get("uri") != checkpoint["frame_uri"]:
+                return None
         events: list[dict[str, Any]] = []
         for frame_id in sorted(entries):
+            if frame_id <= checkpoint_frame:
+                continue
             uri = entries[frame_id].get("uri")
             if not isinstance(uri, str) or not uri:
                 raise RuntimeError(f"Memvid frame {frame_id} is missing its URI")
@@ -942,6 +1174,7 @@ class MemvidBackend(MemoryBackend):
         target_id = str(event.get("target_id") or "").strip()
         if not target_id:
             raise RuntimeError("Canonical tombstone event is missing target_id")
+        self._exact_state_changed()
         self._inactive_ids.add(target_id)
         target = self._records.get(target_id)
         if target is None:
@@ -1055,12 +1288,56 @@ class MemvidBackend(MemoryBackend):
             persist_cache=False,
         )
 
+    def _append_exact_journal(self, record_ids: Iterable[str]) -> None:
+        """Append the exact state of ``record_ids`` as one hash-chained journal entry."""
+
+        if self.read_only:
+            return
+        compaction_threshold = max(_EXACT_JOURNAL_MIN_COMPACTION_ENTRIES, len(self._records))
+        if self._journal_head is None or self._journal_entries + 1 >= compaction_threshold:
+            self._persist_exact_index()
+            return
+        if not self._journal_replayed:
+            self._journal_entries += 1
+            return
+        touched_ids = sorted(set(record_ids))
+        entry: dict[str, Any] = {
+            "layer": self.layer.value,
+            "sequence": self._journal_entries + 1,
+            "previous_sha256": self._journal_head,
+            "records": [
+                _record_to_index_payload(self._records[record_id])
+                for record_id in touched_ids
+                if record_id in self._records
+            ],
+            "active_ids": [
+                record_id for record_id in touched_ids if record_id not in self._inactive_ids
+            ],
+            "inactive_ids": [
+                record_id for record_id in touched_ids if record_id in self._inactive_ids
+            ],
+        }
+        entry["entry_sha256"] = _exact_journal_entry_digest(entry)
+        append_private_text(
+            self._journal_path,
+            json.dumps(entry, sort_keys=True, separators=(",", ":"), ensure_ascii=True) + "\n",
+        )
+        self._journal_head = entry["entry_sha256"]
+        self._journal_entries += 1
+
     def _persist_exact_index(self) -> None:
+        """Compact the exact-record state into a snapshot and restart the journal."""
+
         if self.read_only:
             return
         ensure_private_directory(self._index_path.parent)
         records_payload = [_record_to_index_payload(record) for record in self._records.values()]
         inactive_payload = sorted(self._inactive_ids)
+        cache_sha256 = _exact_cache_digest(
+            layer=self.layer.value,
+            records=records_payload,
+            inactive_ids=inactive_payload,
+        )
         payload = {
             "schema_version": _EXACT_CACHE_SCHEMA_VERSION,
             "mv2_path": str(self.path),
@@ -1068,17 +1345,75 @@ class MemvidBackend(MemoryBackend):
             "mv2_fingerprint": self._mv2_fingerprint_unlocked(),
             "inactive_ids": inactive_payload,
             "records": records_payload,
-            "cache_sha256": _exact_cache_digest(
-                layer=self.layer.value,
-                records=records_payload,
-                inactive_ids=inactive_payload,
-            ),
+            "cache_sha256": cache_sha256,
         }
+        checkpoint = self._replay_checkpoint_unlocked(cache_sha256)
+        if checkpoint is not None:
+            payload["replay_checkpoint"] = checkpoint
         write_private_text(
             self._index_path,
             json.dumps(payload, indent=2, sort_keys=True),
             encoding="utf-8",
         )
+        # Entries chained to the previous snapshot no longer verify, so a crash
+        # before this unlink fails closed on the next open instead of replaying
+        # them twice.
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_head = str(payload["cache_sha256"])
+        self._journal_entries = 0
+
+    def _replay_checkpoint_unlocked(self, cache_sha256: str) -> dict[str, Any] | None:
+        """Sign the current exact state as of the newest logical frame, if possible."""
+
+        key = self._replay_checkpoint_key
+        timeline = getattr(self.mem, "timeline", None)
+        if key is None or not callable(timeline):
+            return None
+        try:
+            newest = timeline(limit=1, reverse=True)
+            frame_id = int(newest[0]["frame_id"])
+            frame_uri = newest[0]["uri"]
+        except Exception:  # noqa: BLE001 - checkpoints are an optional open-time shortcut
+            return None
+        if not isinstance(frame_uri, str) or not frame_uri:
+            return None
+        checkpoint: dict[str, Any] = {
+            "layer": self.layer.value,
+            "frame_id": frame_id,
+            "frame_uri": frame_uri,
+            "commit_sequence": self._canonical_event_count,
+            "last_event_sha256": self._last_canonical_event_digest,
+            "chain_started": self._canonical_chain_started,
+            "saw_unchained_event": self._saw_unchained_canonical_event,
+            "cache_sha256": cache_sha256,
+        }
+        checkpoint["signature"] = _replay_checkpoint_signature(checkpoint, key=key)
+        return checkpoint
+
+    def _verified_replay_checkpoint_unlocked(
+        self,
+        cache_payload: dict[str, Any] | list[Any] | None,
+    ) -> dict[str, Any] | None:
+        key = self._replay_checkpoint_key
+        if key is None or not isinstance(cache_payload, dict):
+            return None
+        checkpoint = cache_payload.get("replay_checkpoint")
+        if not isinstance(checkpoint, dict) or not _exact_cache_integrity_valid(cache_payload):
+            return None
+        signature = checkpoint.get("signature")
+        if not isinstance(signature, str) or not hmac.compare_digest(
+            signature, _replay_checkpoint_signature(checkpoint, key=key)
+        ):
+            return None
+        if (
+            checkpoint.get("layer") != self.layer.value
+            or checkpoint.get("cache_sha256") != cache_payload.get("cache_sha256")
+            or isinstance(checkpoint.get("frame_id"), bool)
+            or not isinstance(checkpoint.get("frame_id"), int)
+            or not isinstance(checkpoint.get("commit_sequence"), int)
+        ):
+            return None
+        return checkpoint
 
     def _mv2_fingerprint_unlocked(self) -> dict[str, int] | None:
         try:
@@ -1263,6 +1598,70 @@ def _exact_cache_integrity_valid(payload: dict[str, Any]) -> bool:
     )
 
 
+def _replay_checkpoint_signature(checkpoint: dict[str, Any], *, key: bytes) -> str:
+    body = {name: value for name, value in checkpoint.items() if name != "signature"}
+    serialized = json.dumps(
+        _json_safe(body), sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    )
+    return hmac.new(key, serialized.encode("utf-8"), sha256).hexdigest()
+
+
+def _exact_journal_entry_digest(entry: dict[str, Any]) -> str:
+    body = {key: value for key, value in entry.items() if key != "entry_sha256"}
+    serialized = json.dumps(
+        _json_safe(body), sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    )
+    return sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _replay_exact_journal(
+    text: str,
+    *,
+    root_sha256: str,
+    backend_layer: MemoryLayer,
+    records: dict[str, MemoryRecord],
+    inactive_ids: set[str],
+) -> tuple[str, int]:
+    """Fold verified journal entries into a snapshot state; return the chain head and length.
+
+    Any torn, reordered, foreign, or edited entry invalidates the whole cache.
+    """
+
+    if not text.endswith("\n"):
+        raise ValueError("exact-record journal ends with a torn entry")
+    head = root_sha256
+    sequence = 0
+    for line in text.splitlines():
+        entry = json.loads(line)
+        if not isinstance(entry, dict):
+            raise ValueError("exact-record journal entries must be objects")
+        sequence += 1
+        if entry.get("sequence") != sequence or entry.get("previous_sha256") != head:
+            raise ValueError(f"exact-record journal chain is broken at entry {sequence}")
+        if entry.get("layer") != backend_layer.value:
+            raise ValueError("exact-record journal layer does not match backend layer")
+        if entry.get("entry_sha256") != _exact_journal_entry_digest(entry):
+            raise ValueError(f"exact-record journal entry {sequence} digest does not match")
+        records_payload = entry.get("records")
+        active_payload = entry.get("active_ids")
+        inactive_payload = entry.get("inactive_ids")
+        if (
+            not isinstance(records_payload, list)
+            or not isinstance(active_payload, list)
+            or not isinstance(inactive_payload, list)
+        ):
+            raise ValueError(f"exact-record journal entry {sequence} is malformed")
+        for item in records_payload:
+            if not isinstance(item, dict):
+                raise ValueError("exact-record journal records must be objects")
+            record = _record_from_index_payload(item, backend_layer)
+            records[record.id] = record
+        inactive_ids.difference_update(str(item) for item in active_payload)
+        inactive_ids.update(str(item) for item in inactive_payload)
+        head = str(entry["entry_sha256"])
+    return head, sequence
+
+
 def _fingerprint_frame_count(fingerprint: dict[str, int] | None) -> int:
     if fingerprint is None:
         return 0
@@ -1439,21 +1838,6 @@ def _record_identity_values(record: MemoryRecord) -> frozenset[str]:
     return frozenset({record.id, frame_id} if frame_id else {record.id})
 
 
-def _exact_fallback_offset(cursor: str | None) -> int:
-    if cursor is None:
-        return 0
-    prefix = "exact-offset:"
-    if not cursor.startswith(prefix):
-        raise ValueError("Invalid Memvid fallback search cursor")
-    try:
-        offset = int(cursor.removeprefix(prefix))
-    except ValueError as exc:
-        raise ValueError("Invalid Memvid fallback search cursor") from exc
-    if offset < 0:
-        raise ValueError("Invalid Memvid fallback search cursor")
-    return offset
-
-
 def _metadata_from_embedded_text(text: str) -> dict[str, Any]:
     """Recover metadata from SDKs that index metadata into result text only."""
 
@@ -0,0 +1,106 @@
+"""Maintained keyed lookups for backend record stores."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Hashable, Iterable
+from typing import Generic, Protocol, TypeVar
+
+from ..models import MemoryRecord
+
+
+class _Ordered(Hashable, Protocol):
+    def __lt__(self, other: object, /) -> bool: ...
+
+
+SlotT = TypeVar("SlotT", bound=_Ordered)
+
+
+def record_frame_id(record: MemoryRecord) -> str:
+    frame_value = record.metadata.get("frame_id")
+    return "" if frame_value is None else str(frame_value)
+
+
+def record_metadata_content_hash(record: MemoryRecord) -> str:
+    recorded = record.metadata.get("content_hash")
+    return recorded if isinstance(recorded, str) else ""
+
+
+class RecordKeyIndex(Generic[SlotT]):
+    """Map record id, frame id and content hash to the slots holding them.
+
+    A slot is whatever the owning backend uses to address a record: a list
+    position or a record id. Slots for one key are kept sorted, so the first
+    slot is the one a front-to-back scan of the store would have found.
+
+    A record is found under both its computed :attr:`MemoryRecord.content_hash`
+    and the ``content_hash`` recorded in its metadata, which Memvid frames
+    carry from the writer. Keys are captured when a slot is added: stored
+    records are treated as immutable, and a changed record must be re-added
+    (as every backend upsert does) before lookups see its new keys.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, list[SlotT]] = {}
+        self._by_frame: dict[str, list[SlotT]] = {}
+        self._by_hash: dict[str, list[SlotT]] = {}
+        self._keys: dict[SlotT, tuple[str, str, str, str]] = {}
+
+    def rebuild(self, items: Iterable[tuple[SlotT, MemoryRecord]]) -> None:
+        self._by_id = {}
+        self._by_frame = {}
+        self._by_hash = {}
+        self._keys = {}
+        for slot, record in items:
+            self.add(slot, record)
+
+    def add(self, slot: SlotT, record: MemoryRecord) -> None:
+        self.discard(slot)
+        content_hash = record.content_hash
+        recorded_hash = record_metadata_content_hash(record)
+        keys = (
+            record.id,
+            record_frame_id(record),
+            content_hash,
+            "" if recorded_hash == content_hash else recorded_hash,
+        )
+        self._keys[slot] = keys
+        for mapping, key in zip(self._mappings(), keys, strict=True):
+            if key:
+                insort(mapping.setdefault(key, []), slot)
+
+    def discard(self, slot: SlotT) -> None:
+        keys = self._keys.pop(slot, None)
+        if keys is None:
+            return
+        for mapping, key in zip(self._mappings(), keys, strict=True):
+            slots = mapping.get(key)
+            if not slots:
+                continue
+            position = bisect_left(slots, slot)
+            if position < len(slots) and slots[position] == slot:
+                del slots[position]
+            if not slots:
+                del mapping[key]
+
+    def _mappings(self) -> tuple[dict[str, list[SlotT]], ...]:
+        return (self._by_id, self._by_frame, self._by_hash, self._by_hash)
+
+    def by_id(self, record_id: str) -> tuple[SlotT, ...]:
+        return tuple(self._by_id.get(record_id, ()))
+
+    def by_frame_id(self, frame_id: str) -> tuple[SlotT, ...]:
+        return tuple(self._by_frame.get(frame_id, ()))
+
+    def by_content_hash(self, content_hash: str) -> tuple[SlotT, ...]:
+        return tuple(self._by_hash.get(content_hash, ()))
+
+    def first_identity(self, identity: str) -> SlotT | None:
+        """First slot whose record id or frame id equals ``identity``."""
+
+        candidates = [
+            slots[0]
+            for slots in (self._by_id.get(identity), self._by_frame.get(identity))
+            if slots
+        ]
+        return min(candidates) if candidates else None
@@ -0,0 +1,82 @@
+"""Secondary index from conversation turn identity to ordered turn frames."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import datetime
+
+from ..models import MemoryRecord
+
+SessionTurnKey = tuple[str, str, str]
+
+
+def session_turn_key(record: MemoryRecord) -> SessionTurnKey | None:
+    """Return ``(session_id, transcript_scope, turn_origin)`` for turn frames."""
+
+    metadata = record.metadata
+    session_id = str(metadata.get("session_id") or "")
+    if not session_id:
+        return None
+    return (
+        session_id,
+        str(metadata.get("transcript_scope") or ""),
+        str(metadata.get("turn_origin") or ""),
+    )
+
+
+class SessionTurnIndex:
+    """Per-session turn frames kept in ``(created_at, id)`` order.
+
+    Backends feed every remembered record through :meth:`add` and call
+    :meth:`rebuild` whenever they replace their record set wholesale, so a
+    transcript lookup costs O(turns in the session) instead of a layer scan.
+    Activity and expiry are not indexed; callers filter those at read time.
+    """
+
+    def __init__(self) -> None:
+        self._order: dict[SessionTurnKey, list[tuple[datetime, str]]] = {}
+        self._records: dict[SessionTurnKey, dict[str, MemoryRecord]] = {}
+        self._placement: dict[str, tuple[SessionTurnKey, tuple[datetime, str]]] = {}
+
+    def rebuild(self, records: Iterable[MemoryRecord]) -> None:
+        self._order = {}
+        self._records = {}
+        self._placement = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: MemoryRecord) -> None:
+        self.discard(record.id)
+        key = session_turn_key(record)
+        if key is None:
+            return
+        position = (record.created_at, record.id)
+        insort(self._order.setdefault(key, []), position)
+        self._records.setdefault(key, {})[record.id] = record
+        self._placement[record.id] = (key, position)
+
+    def discard(self, record_id: str) -> None:
+        placement = self._placement.pop(record_id, None)
+        if placement is None:
+            return
+        key, position = placement
+        order = self._order[key]
+        del order[bisect_left(order, position)]
+        del self._records[key][record_id]
+        if not order:
+            del self._order[key]
+            del self._records[key]
+
+    def records(
+        self,
+        key: SessionTurnKey,
+        *,
+        since: datetime | None = None,
+    ) -> tuple[MemoryRecord, ...]:
+        order = self._order.get(key)
+        if not order:
+            return ()
+        start = 0 if since is None else bisect_left(order, (since, ""))
+        by_id = self._records[key]
+        return tuple(by_id[record_id] for _created_at, record_id in order[start:])
@@ -10,6 +10,7 @@ from typing import Any
 from urllib.parse import urlsplit
 
 from .lan_runtime_authority import LanRuntimeAuthority
+from .models import bounded_retrieval_deadline
 from .routine_limits import (
     validate_routine_claim_ttl,
     validate_routine_poll_interval,
@@ -166,6 +167,8 @@ class AgentConfig:
     stream: bool = False
     log_dir: Path = Path(".nest/logs")
     state_path: Path = Path(".nest/state/agent.db")
+    state_connection_pool: bool = False
+    run_step_retention_days: int = 0
     secret_store_path: Path = Path(".nest/secrets/local_vault.json")
     secret_backend: str = "json"
     skills_dir: Path = Path(".nest/skills")
@@ -189,6 +192,9 @@ class AgentConfig:
     llm_turn_summaries: bool = False
     memory_seal_write_threshold: int = 50
     memory_seal_interval_seconds: float = 10.0
+    memory_retrieval_deadline_seconds: float | None = None
+    memory_persistence: str = "snapshot"
+    memory_pool: bool = False
     enabled_tools: tuple[str, ...] = ()
     lan_runtime_authority: LanRuntimeAuthority | None = field(
         default=None,
@@ -204,6 +210,8 @@ class AgentConfig:
             object.__setattr__(self, "require_approval_for_high_risk_tools", True)
         if self.approval_ttl_seconds <= 0:
             raise ValueError("approval_ttl_seconds must be greater than zero")
+        if self.memory_persistence not in {"snapshot", "journal"}:
+            raise ValueError("memory_persistence must be 'snapshot' or 'journal'")
         object.__setattr__(
             self,
             "tool_timeout_seconds",
@@ -224,6 +232,15 @@ class AgentConfig:
                 maximum=MAX_TOOL_RETRY_BACKOFF_SECONDS,
             ),
         )
+        if self.memory_retrieval_deadline_seconds is not None:
+            object.__setattr__(
+                self,
+                "memory_retrieval_deadline_seconds",
+                bounded_retrieval_deadline(
+                    "memory_retrieval_deadline_seconds",
+                    self.memory_retrieval_deadline_seconds,
+                ),
+            )
         if (
             isinstance(self.task_capsule_retention_count, bool)
             or self.task_capsule_retention_count < 1
@@ -231,6 +248,8 @@ class AgentConfig:
             raise ValueError(
                 "task_capsule_retention_count must be an integer greater than or equal to 1"
             )
+        if isinstance(self.run_step_retention_days, bool) or self.run_step_retention_days < 0:
+            raise ValueError("run_step_retention_days must be an integer greater than or equal to 0")
         object.__setattr__(
             self,
             "routine_poll_interval_seconds",
@@ -302,6 +321,8 @@ class AgentConfig:
             context_budget_chars=environment.as_int("NEST_AGENT_CONTEXT_BUDGET_CHARS", 18_000),
             log_dir=Path(environment.get("NEST_AGENT_LOG_DIR", ".nest/logs")),
             state_path=Path(environment.get("NEST_AGENT_STATE_PATH", ".nest/state/agent.db")),
+            state_connection_pool=environment.as_bool("NEST_AGENT_STATE_CONNECTION_POOL"),
+            run_step_retention_days=environment.as_int("NEST_AGENT_RUN_STEP_RETENTION_DAYS", 0),
             secret_store_path=Path(
                 environment.get("NEST_AGENT_SECRET_STORE_PATH", ".nest/secrets/local_vault.json")
             ),
@@ -405,6 +426,11 @@ class AgentConfig:
             memory_seal_interval_seconds=environment.as_float(
                 "NEST_AGENT_MEMORY_SEAL_INTERVAL_SECONDS", 10.0
             ),
+            memory_retrieval_deadline_seconds=environment.as_float_or_none(
+                "NEST_AGENT_MEMORY_RETRIEVAL_DEADLINE_SECONDS"
+            ),
+            memory_persistence=environment.get("NEST_AGENT_MEMORY_PERSISTENCE", "snapshot"),
+            memory_pool=environment.as_bool("NEST_AGENT_MEMORY_POOL"),
             enabled_tools=environment.as_csv("NEST_AGENT_ENABLED_TOOLS", ()),
         )
 
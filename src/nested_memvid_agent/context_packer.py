@@ -81,15 +81,21 @@ class ContextPacker:
             raise ValueError("ContextPackRequest.query cannot be empty")
 
         layers = request.allowed_layers or PACK_LAYER_ORDER
-        retrieved_hits = self.memory.retrieve(
-            RetrievalQuery(
-                query=query,
-                layers=tuple(layers),
-                k_per_layer=request.k_per_layer,
-                objective=request.objective,
-                project_id=request.project_id,
-            )
+        retrieval_query = RetrievalQuery(
+            query=query,
+            layers=tuple(layers),
+            k_per_layer=request.k_per_layer,
+            objective=request.objective,
+            project_id=request.project_id,
         )
+        degraded_layers: dict[MemoryLayer, str] = {}
+        retrieve_layers = getattr(self.memory, "retrieve_layers", None)
+        if callable(retrieve_layers):
+            retrieval = retrieve_layers(retrieval_query)
+            retrieved_hits = retrieval.hits
+            degraded_layers = retrieval.degraded_layers
+        else:
+            retrieved_hits = self.memory.retrieve(retrieval_query)
         hits = [
             hit
             for hit in retrieved_hits
@@ -113,6 +119,9 @@ class ContextPacker:
             "layers": sorted({item.frame.layer.value for item in selected}),
             "summary_first": True,
             "expand_raw": request.expand_raw,
+            "degraded_layers": {
+                layer.value: reason for layer, reason in sorted(degraded_layers.items())
+            },
         }
         if not request.include_telemetry:
             telemetry = {}
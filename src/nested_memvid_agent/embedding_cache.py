@@ -0,0 +1,134 @@
+"""Persistent, content-addressed embedding cache.
+
+Embeddings are a pure function of the embedding model and the exact text, so
+they are keyed by ``(model, sha256(text))`` and shared by every index built
+from the same canonical memory. The cache is disposable: losing it only costs
+re-embedding, never correctness.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from threading import RLock
+
+import numpy as np
+
+from .private_artifacts import harden_private_sqlite_files, prepare_private_sqlite_file
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed ``(model, text digest) -> float32 vector`` store.
+
+    The cache either owns a private SQLite file (:meth:`open_path`) or lives as
+    one table inside a database the caller already manages, such as a vector
+    sidecar, in which case the caller's connection and lock are reused.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, *, path: Path | None = None) -> None:
+        self._conn = conn
+        self._path = path
+        self._lock = RLock()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_sha256 TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, text_sha256)
+            )
+            """
+        )
+        conn.commit()
+
+    @classmethod
+    def open_path(cls, path: Path) -> EmbeddingCache:
+        resolved = Path(path)
+        prepare_private_sqlite_file(resolved)
+        conn = sqlite3.connect(resolved, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            cache = cls(conn, path=resolved)
+        except Exception:
+            conn.close()
+            raise
+        harden_private_sqlite_files(resolved)
+        return cache
+
+    def get_many(self, model: str, digests: Sequence[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        unique = tuple(dict.fromkeys(digests))
+        with self._lock:
+            for start in range(0, len(unique), _SQLITE_MAX_VARIABLES):
+                chunk = unique[start : start + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" for _ in chunk)
+                for digest, dimension, blob in self._conn.execute(
+                    "SELECT text_sha256, dimension, vector FROM embedding_cache "
+                    f"WHERE model = ? AND text_sha256 IN ({placeholders})",
+                    (model, *chunk),
+                ):
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    if vector.shape == (int(dimension),):
+                        found[str(digest)] = vector
+        return found
+
+    def put_many(self, model: str, items: Iterable[tuple[str, np.ndarray]]) -> None:
+        rows = [
+            (model, digest, int(vector.shape[0]), vector.astype(np.float32).tobytes())
+            for digest, vector in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO embedding_cache (model, text_sha256, dimension, vector)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(model, text_sha256) DO UPDATE SET
+                    dimension=excluded.dimension,
+                    vector=excluded.vector
+                """,
+                rows,
+            )
+            self._conn.commit()
+            self._harden()
+
+    def retain(self, model: str, digests: Iterable[str]) -> None:
+        """Drop ``model`` entries whose text is no longer indexed anywhere."""
+
+        keep = set(digests)
+        with self._lock:
+            stale = [
+                (model, str(digest))
+                for (digest,) in self._conn.execute(
+                    "SELECT text_sha256 FROM embedding_cache WHERE model = ?", (model,)
+                )
+                if str(digest) not in keep
+            ]
+            if stale:
+                self._conn.executemany(
+                    "DELETE FROM embedding_cache WHERE model = ? AND text_sha256 = ?", stale
+                )
+                self._conn.commit()
+                self._harden()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._path is None:
+                return
+            self._conn.close()
+            self._harden()
+
+    def _harden(self) -> None:
+        if self._path is not None:
+            harden_private_sqlite_files(self._path)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import queue
-from collections import defaultdict
-from dataclasses import dataclass
-from threading import Lock
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from threading import Condition, Lock, Thread
+from time import monotonic
 from typing import Any
 
 from .event_log import redact_secrets
-from .state_store import AgentStateStore
+from .state_store import ASSISTANT_TOKEN_STEP, AgentStateStore, utc_now
+
+WRITE_BEHIND_EVENT_TYPES = frozenset({ASSISTANT_TOKEN_STEP})
+_DEFAULT_FLUSH_INTERVAL_SECONDS = 0.05
+_DEFAULT_FLUSH_BATCH_SIZE = 256
+_DEFAULT_JOURNAL_CAPACITY = 4096
+_DEFAULT_ASYNC_SUBSCRIBER_BUFFER = 1024
+_DEFAULT_REPLAY_PAGE_SIZE = 200
 
 
 @dataclass(frozen=True)
@@ -17,6 +27,7 @@ class RunEvent:
     run_id: str
     type: str
     payload: dict[str, Any]
+    created_at: str = field(default="", compare=False)
 
     def to_sse(self) -> str:
         data = json.dumps(
@@ -30,45 +41,565 @@ class RunEvent:
         return f"id: {self.id}\nevent: {self.type}\ndata: {data}\n\n"
 
 
-class RunEventBus:
-    """Small in-process fan-out bus backed by the persistent run step log."""
+class _CatchUpCursor:
+    """Lazy, bounded pager over persisted steps up to a fixed high-water id.
+
+    Every event numbered at or below ``through_id`` was committed before the
+    subscriber registered, so it is read back from ``run_steps``; later events
+    arrive live.  Memory use is one page regardless of run length.
+    """
 
-    def __init__(self, state: AgentStateStore) -> None:
+    def __init__(
+        self,
+        state: AgentStateStore,
+        run_id: str,
+        *,
+        after_id: int,
+        through_id: int,
+        page_size: int,
+    ) -> None:
         self.state = state
-        self._lock = Lock()
-        self._subscribers: dict[str, list[queue.Queue[RunEvent]]] = defaultdict(list)
+        self.run_id = run_id
+        self.position = after_id
+        self.through_id = through_id
+        self.page_size = max(1, page_size)
+        self.exhausted = after_id >= through_id
 
-    def publish(self, run_id: str, type: str, payload: dict[str, Any]) -> RunEvent:
-        safe_payload = redact_secrets(payload)
-        event_id = self.state.append_run_step(run_id, type, safe_payload)
-        event = RunEvent(id=event_id, run_id=run_id, type=type, payload=safe_payload)
-        with self._lock:
-            subscribers = list(self._subscribers.get(run_id, []))
-        for subscriber in subscribers:
-            subscriber.put(event)
+    def next_page(self) -> list[RunEvent]:
+        if self.exhausted:
+            return []
+        rows = self.state.list_run_steps(
+            self.run_id,
+            after_id=self.position,
+            limit=self.page_size,
+        )
+        page = [_event_from_row(row) for row in rows if int(row["id"]) <= self.through_id]
+        if page:
+            self.position = page[-1].id
+        if len(page) < self.page_size or self.position >= self.through_id:
+            self.exhausted = True
+        return page
+
+
+class RunSubscription:
+    """Thread-side run stream: a lazy backlog cursor followed by live events.
+
+    ``get`` and ``get_nowait`` follow :class:`queue.Queue`, including raising
+    :class:`queue.Empty` when no event arrives in time.
+    """
+
+    def __init__(self, bus: RunEventBus, run_id: str, cursor: _CatchUpCursor) -> None:
+        self.run_id = run_id
+        self._bus = bus
+        self._cursor: _CatchUpCursor | None = cursor
+        self._page: deque[RunEvent] = deque()
+        self._live: queue.Queue[RunEvent] = queue.Queue()
+
+    @property
+    def catching_up(self) -> bool:
+        return self._cursor is not None
+
+    def put(self, event: RunEvent) -> None:
+        self._live.put(event)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> RunEvent:
+        while self._cursor is not None and not self._page:
+            page = self._cursor.next_page()
+            self._page.extend(page)
+            if self._cursor.exhausted:
+                self._cursor = None
+                self._bus._finish_catch_up(self.run_id)
+        if self._page:
+            return self._page.popleft()
+        return self._live.get(block=block, timeout=timeout)
+
+    def get_nowait(self) -> RunEvent:
+        return self.get(block=False)
+
+
+class AsyncRunSubscription:
+    """Bounded, event-loop-owned view of one run's event stream.
+
+    The persisted backlog is paged lazily on a worker thread; live events are
+    handed over with a single ``call_soon_threadsafe`` per publish and loop,
+    and only the owning loop touches the live buffer.  A subscriber that falls
+    ``max_buffer`` live events behind is marked lagged and its buffer dropped;
+    it should resume from :attr:`last_id` against the persisted step log.
+    """
+
+    def __init__(
+        self,
+        bus: RunEventBus,
+        run_id: str,
+        *,
+        loop: asyncio.AbstractEventLoop,
+        max_buffer: int,
+        after_id: int,
+    ) -> None:
+        self.run_id = run_id
+        self.loop = loop
+        self.max_buffer = max(1, max_buffer)
+        self.last_id = after_id
+        self.lagged = False
+        self.dropped = 0
+        self._bus = bus
+        self._cursor: _CatchUpCursor | None = None
+        self._pending_page: asyncio.Future[list[RunEvent]] | None = None
+        self._page: deque[RunEvent] = deque()
+        self._buffer: deque[RunEvent] = deque()
+        self._ready = asyncio.Event()
+
+    @property
+    def catching_up(self) -> bool:
+        return self._cursor is not None
+
+    async def get(self) -> RunEvent | None:
+        """Return the next event, or ``None`` once the subscriber has lagged."""
+
+        while self._cursor is not None and not self._page and not self.lagged:
+            cursor = self._cursor
+            # The cursor advances as soon as its page is read, so a caller's
+            # timeout must not discard the page: the fetch outlives a cancelled
+            # ``get`` and the next call collects it.
+            if self._pending_page is None:
+                self._pending_page = asyncio.ensure_future(asyncio.to_thread(cursor.next_page))
+            page = await asyncio.shield(self._pending_page)
+            self._pending_page = None
+            self._page.extend(page)
+            if cursor.exhausted:
+                self._cursor = None
+                self._bus._finish_async_catch_up(self)
+        while not self._page and not self._buffer and not self.lagged:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.lagged:
+            return None
+        event = self._page.popleft() if self._page else self._buffer.popleft()
+        self.last_id = event.id
         return event
 
-    def subscribe(self, run_id: str, after_id: int = 0) -> queue.Queue[RunEvent]:
-        subscriber: queue.Queue[RunEvent] = queue.Queue()
-        for row in self.state.list_run_steps(run_id, after_id=after_id):
-            subscriber.put(
-                RunEvent(
-                    id=int(row["id"]),
-                    run_id=str(row["run_id"]),
-                    type=str(row["type"]),
-                    payload=dict(row["payload"]),
+    def _offer(self, event: RunEvent) -> None:
+        if self.lagged:
+            self.dropped += 1
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self.lagged = True
+            self.dropped += len(self._buffer) + 1
+            self._buffer.clear()
+        else:
+            self._buffer.append(event)
+        self._ready.set()
+
+
+def _deliver_to_async_subscriptions(
+    subscriptions: tuple[AsyncRunSubscription, ...],
+    events: tuple[RunEvent, ...],
+) -> None:
+    for subscription in subscriptions:
+        for event in events:
+            subscription._offer(event)
+
+
+class _PendingStep:
+    """A published step waiting for the commit that numbers it."""
+
+    __slots__ = ("run_id", "type", "payload", "created_at", "event")
+
+    def __init__(self, run_id: str, type: str, payload: dict[str, Any], created_at: str) -> None:
+        self.run_id = run_id
+        self.type = type
+        self.payload = payload
+        self.created_at = created_at
+        self.event: RunEvent | None = None
+
+
+class _RunStepJournal:
+    """Write-behind run step buffer that group-commits steps and numbers them on commit.
+
+    Ids are assigned inside the commit transaction, so ``run_steps`` ids follow
+    commit order across every bus and process sharing the store and an
+    ``after_id`` resume never skips a step committed later with a lower id.
+    Committed events are handed to ``on_commit`` in id order while the commit
+    lock is still held.
+    """
+
+    def __init__(
+        self,
+        state: AgentStateStore,
+        *,
+        flush_interval_seconds: float,
+        flush_batch_size: int,
+        capacity: int,
+        on_commit: Callable[[tuple[RunEvent, ...]], None],
+    ) -> None:
+        self.state = state
+        self._flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self._flush_batch_size = max(1, flush_batch_size)
+        self._capacity = max(self._flush_batch_size, capacity)
+        self._on_commit = on_commit
+        self._condition = Condition()
+        self.commit_lock = Lock()
+        self._pending: deque[_PendingStep] = deque()
+        self._inflight: tuple[_PendingStep, ...] = ()
+        self._thread: Thread | None = None
+        self._closed = False
+        self._last_error: str | None = None
+        self._counters = {"commits": 0, "committed_steps": 0, "max_batch": 0, "flush_errors": 0}
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def append(self, step: _PendingStep) -> bool:
+        """Queue ``step`` and return whether the caller must flush synchronously."""
+
+        with self._condition:
+            self._pending.append(step)
+            depth = len(self._pending)
+            if self._closed or depth >= self._capacity:
+                return True
+            if depth == 1 or depth >= self._flush_batch_size:
+                # Wake an idle flusher to open its window, or a waiting one to commit early.
+                self._condition.notify_all()
+            self._ensure_flusher_locked()
+        return False
+
+    def flush(self) -> None:
+        """Commit every event queued before this call; raise if the commit fails."""
+
+        with self.commit_lock:
+            with self._condition:
+                batch = tuple(self._pending)
+                self._pending.clear()
+                self._inflight = batch
+            if not batch:
+                return
+            try:
+                first_id = self.state.append_run_steps(
+                    [(step.run_id, step.type, step.payload, step.created_at) for step in batch]
                 )
-            )
+            except BaseException as exc:
+                with self._condition:
+                    self._pending.extendleft(reversed(batch))
+                    self._inflight = ()
+                    self._counters["flush_errors"] += 1
+                    self._last_error = type(exc).__name__
+                raise
+            with self._condition:
+                self._inflight = ()
+                self._counters["commits"] += 1
+                self._counters["committed_steps"] += len(batch)
+                self._counters["max_batch"] = max(self._counters["max_batch"], len(batch))
+                self._last_error = None
+            for offset, step in enumerate(batch):
+                step.event = RunEvent(
+                    id=first_id + offset,
+                    run_id=step.run_id,
+                    type=step.type,
+                    payload=step.payload,
+                    created_at=step.created_at,
+                )
+            self._on_commit(tuple(step.event for step in batch if step.event is not None))
+
+    def close(self, *, timeout_seconds: float) -> bool:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=max(0.0, timeout_seconds))
+        try:
+            self.flush()
+        except Exception:  # noqa: BLE001 - report undrained journals to the lifecycle owner
+            return False
+        return thread is None or not thread.is_alive()
+
+    def snapshot(self) -> dict[str, object]:
+        with self._condition:
+            return {
+                "pending": len(self._pending) + len(self._inflight),
+                "capacity": self._capacity,
+                "flush_batch_size": self._flush_batch_size,
+                "flush_interval_seconds": self._flush_interval_seconds,
+                "closed": self._closed,
+                "last_error": self._last_error,
+                **self._counters,
+            }
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = Thread(
+            target=self._run_flusher,
+            name="kestrel-run-step-journal",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run_flusher(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                window_ends = monotonic() + self._flush_interval_seconds
+                while (
+                    not self._closed
+                    and len(self._pending) < self._flush_batch_size
+                    and (remaining := window_ends - monotonic()) > 0
+                ):
+                    self._condition.wait(timeout=remaining)
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001 - retained events are retried after a backoff
+                with self._condition:
+                    if not self._closed:
+                        self._condition.wait(timeout=max(self._flush_interval_seconds, 0.05))
+
+
+class RunEventBus:
+    """Small in-process fan-out bus backed by the persistent run step log.
+
+    High-frequency event types (``assistant.token``) are written behind and
+    group-committed; every other event first drains the journal and is durable
+    before ``publish`` returns, so run-terminal events flush the whole run.
+    Events are numbered by the commit that persists them and only then handed
+    to live subscribers, so the ids a subscriber sees are the ids it can
+    resume from.  The first non-token event after a token segment also
+    completes that streamed message: live subscribers have already seen the
+    tokens, and the persisted segment is rewritten into a single
+    ``assistant.message`` step numbered with the segment's last id.
+
+    Subscribers register under the commit lock, at the highest committed id,
+    and page the backlog up to it, so replay never gaps or duplicates.  Token
+    compaction for a run is deferred while any of its subscribers catches up.
+    """
+
+    def __init__(
+        self,
+        state: AgentStateStore,
+        *,
+        flush_interval_seconds: float = _DEFAULT_FLUSH_INTERVAL_SECONDS,
+        flush_batch_size: int = _DEFAULT_FLUSH_BATCH_SIZE,
+        journal_capacity: int = _DEFAULT_JOURNAL_CAPACITY,
+        write_behind_types: frozenset[str] = WRITE_BEHIND_EVENT_TYPES,
+        replay_page_size: int = _DEFAULT_REPLAY_PAGE_SIZE,
+    ) -> None:
+        self.state = state
+        self._lock = Lock()
+        self._subscribers: dict[str, list[RunSubscription]] = defaultdict(list)
+        self._async_subscribers: dict[str, list[AsyncRunSubscription]] = defaultdict(list)
+        self._write_behind_types = write_behind_types
+        self._replay_page_size = max(1, replay_page_size)
+        self._open_token_segments: dict[str, tuple[int, int]] = {}
+        self._catching_up: dict[str, int] = {}
+        self._deferred_segments: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self._journal = _RunStepJournal(
+            state,
+            flush_interval_seconds=flush_interval_seconds,
+            flush_batch_size=flush_batch_size,
+            capacity=journal_capacity,
+            on_commit=self._deliver_committed,
+        )
+
+    def publish(self, run_id: str, type: str, payload: dict[str, Any]) -> RunEvent | None:
+        """Queue an event and return it once committed.
+
+        Write-behind events return ``None`` unless the journal had to flush;
+        they are numbered and delivered when their batch commits.
+        """
+
+        step = _PendingStep(run_id, type, redact_secrets(payload), utc_now())
+        must_flush = self._journal.append(step)
+        if must_flush or type not in self._write_behind_types:
+            self._journal.flush()
+        return step.event
+
+    def _deliver_committed(self, events: tuple[RunEvent, ...]) -> None:
+        by_run: dict[str, list[RunEvent]] = defaultdict(list)
+        for event in events:
+            by_run[event.run_id].append(event)
+        deliveries = []
+        completed: dict[str, list[tuple[int, int]]] = defaultdict(list)
         with self._lock:
-            self._subscribers[run_id].append(subscriber)
+            for run_id, run_events in by_run.items():
+                for event in run_events:
+                    if event.type == ASSISTANT_TOKEN_STEP:
+                        first_id, _ = self._open_token_segments.get(run_id, (event.id, 0))
+                        self._open_token_segments[run_id] = (first_id, event.id)
+                    elif (segment := self._open_token_segments.pop(run_id, None)) is not None:
+                        if self._catching_up.get(run_id):
+                            self._deferred_segments[run_id].append(segment)
+                        else:
+                            completed[run_id].append(segment)
+                deliveries.append(
+                    (
+                        tuple(run_events),
+                        list(self._subscribers.get(run_id, [])),
+                        _async_channels(self._async_subscribers.get(run_id, ())),
+                    )
+                )
+        for run_id, segments in completed.items():
+            self._coalesce_tokens(run_id, segments)
+        for run_events, subscribers, async_channels in deliveries:
+            for subscriber in subscribers:
+                for event in run_events:
+                    subscriber.put(event)
+            for loop, channel in async_channels.items():
+                try:
+                    loop.call_soon_threadsafe(_deliver_to_async_subscriptions, channel, run_events)
+                except RuntimeError:
+                    # The subscriber's loop already closed; its route cleanup unsubscribes it.
+                    continue
+
+    def flush(self) -> None:
+        """Make every event published so far durable in ``run_steps``."""
+
+        self._journal.flush()
+
+    def close(self, *, timeout_seconds: float = 5.0) -> bool:
+        """Drain the write-behind journal; later publishes are written synchronously."""
+
+        return self._journal.close(timeout_seconds=timeout_seconds)
+
+    def journal_snapshot(self) -> dict[str, object]:
+        return self._journal.snapshot()
+
+    def subscribe(self, run_id: str, after_id: int = 0) -> RunSubscription:
+        with self._journal.commit_lock:
+            through_id = self.state.last_run_step_id()
+            with self._lock:
+                cursor = self._catch_up_cursor_locked(run_id, after_id, through_id)
+                subscriber = RunSubscription(self, run_id, cursor)
+                self._subscribers[run_id].append(subscriber)
         return subscriber
 
-    def unsubscribe(self, run_id: str, subscriber: queue.Queue[RunEvent]) -> None:
+    def unsubscribe(self, run_id: str, subscriber: RunSubscription) -> None:
         with self._lock:
             subscribers = self._subscribers.get(run_id)
-            if not subscribers:
+            if not subscribers or subscriber not in subscribers:
                 return
-            if subscriber in subscribers:
-                subscribers.remove(subscriber)
+            subscribers.remove(subscriber)
             if not subscribers:
                 self._subscribers.pop(run_id, None)
+        if subscriber.catching_up:
+            self._finish_catch_up(run_id)
+
+    async def subscribe_async(
+        self,
+        run_id: str,
+        after_id: int = 0,
+        *,
+        max_buffer: int = _DEFAULT_ASYNC_SUBSCRIBER_BUFFER,
+    ) -> AsyncRunSubscription:
+        """Subscribe the running event loop without parking a worker thread on the stream."""
+
+        subscription = AsyncRunSubscription(
+            self,
+            run_id,
+            loop=asyncio.get_running_loop(),
+            max_buffer=max_buffer,
+            after_id=after_id,
+        )
+        await asyncio.to_thread(self._register_async_subscription, subscription, after_id)
+        return subscription
+
+    def unsubscribe_async(self, subscription: AsyncRunSubscription) -> None:
+        """Detach ``subscription``; call from its loop, which is never blocked on SQLite."""
+
+        with self._lock:
+            subscriptions = self._async_subscribers.get(subscription.run_id)
+            if not subscriptions or subscription not in subscriptions:
+                return
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                self._async_subscribers.pop(subscription.run_id, None)
+        if subscription.catching_up:
+            self._finish_async_catch_up(subscription)
+
+    def _register_async_subscription(
+        self,
+        subscription: AsyncRunSubscription,
+        after_id: int,
+    ) -> None:
+        with self._journal.commit_lock:
+            through_id = self.state.last_run_step_id()
+            with self._lock:
+                subscription._cursor = self._catch_up_cursor_locked(
+                    subscription.run_id, after_id, through_id
+                )
+                self._async_subscribers[subscription.run_id].append(subscription)
+
+    def _catch_up_cursor_locked(
+        self,
+        run_id: str,
+        after_id: int,
+        through_id: int,
+    ) -> _CatchUpCursor:
+        self._catching_up[run_id] = self._catching_up.get(run_id, 0) + 1
+        return _CatchUpCursor(
+            self.state,
+            run_id,
+            after_id=after_id,
+            through_id=through_id,
+            page_size=self._replay_page_size,
+        )
+
+    def _finish_catch_up(self, run_id: str) -> None:
+        segments = self._release_catch_up(run_id)
+        if segments:
+            self._coalesce_tokens(run_id, segments)
+
+    def _finish_async_catch_up(self, subscription: AsyncRunSubscription) -> None:
+        # Deferred compaction is a write transaction with a busy timeout; run it
+        # on the loop's executor so one contended write never stalls the loop.
+        segments = self._release_catch_up(subscription.run_id)
+        if not segments:
+            return
+        try:
+            subscription.loop.run_in_executor(
+                None, self._coalesce_tokens, subscription.run_id, segments
+            )
+        except RuntimeError:
+            # The loop already closed, so nothing else is waiting on this thread.
+            self._coalesce_tokens(subscription.run_id, segments)
+
+    def _release_catch_up(self, run_id: str) -> list[tuple[int, int]]:
+        with self._lock:
+            remaining = self._catching_up.get(run_id, 0) - 1
+            if remaining > 0:
+                self._catching_up[run_id] = remaining
+                return []
+            self._catching_up.pop(run_id, None)
+            return self._deferred_segments.pop(run_id, [])
+
+    def _coalesce_tokens(self, run_id: str, segments: list[tuple[int, int]]) -> None:
+        for first_id, through_id in segments:
+            try:
+                self.state.coalesce_run_tokens(
+                    run_id,
+                    after_id=first_id - 1,
+                    through_id=through_id,
+                )
+            except Exception:  # noqa: BLE001 - leftover tokens are compacted on the next start
+                continue
+
+
+def _event_from_row(row: dict[str, Any]) -> RunEvent:
+    return RunEvent(
+        id=int(row["id"]),
+        run_id=str(row["run_id"]),
+        type=str(row["type"]),
+        payload=dict(row["payload"]),
+        created_at=str(row["created_at"]),
+    )
+
+
+def _async_channels(
+    subscriptions: Iterable[AsyncRunSubscription],
+) -> dict[asyncio.AbstractEventLoop, tuple[AsyncRunSubscription, ...]]:
+    channels: dict[asyncio.AbstractEventLoop, list[AsyncRunSubscription]] = {}
+    for subscription in subscriptions:
+        channels.setdefault(subscription.loop, []).append(subscription)
+    return {loop: tuple(members) for loop, members in channels.items()}
@@ -9,18 +9,27 @@ import stat
 import time
 import unicodedata
 from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from contextlib import ExitStack, contextmanager
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from difflib import SequenceMatcher
 from hashlib import sha256
 from pathlib import Path
-from threading import Lock
+from threading import Lock, RLock
 
 from .backends.base import MemoryBackend, MemorySearchPage
 from .context_frames import MV2ContextFrame, make_conflict_set_frame, to_memory_record
 from .file_lock import lock_exclusive, unlock
-from .models import EvidenceRef, MemoryHit, MemoryKind, MemoryLayer, MemoryRecord, RetrievalQuery
+from .models import (
+    EvidenceRef,
+    MemoryHit,
+    MemoryKind,
+    MemoryLayer,
+    MemoryRecord,
+    RetrievalQuery,
+    bounded_retrieval_deadline,
+)
 from .private_artifacts import (
     ensure_owner_only_directory,
     ensure_private_directory,
@@ -31,11 +40,15 @@ from .private_artifacts import (
     write_private_text_exclusive,
 )
 from .promotion_ledger import PromotionEntry, PromotionLedger, make_outcome
+from .retrieval_cache import DEFAULT_RETRIEVAL_CACHE_ENTRIES, RetrievalCache
+from .search_sessions import SearchSessionCache, format_search_cursor, parse_search_cursor
 from .security_boundary import sanitize_memory_record
+from .vector_ann import VectorAnnSettings
 from .vector_sidecar import TextEmbedder, VectorSidecar, VectorSidecarStatus, make_local_embedder
 
 _RETRIEVAL_CANDIDATE_PAGE_SIZE = 64
 _RETRIEVAL_MAX_CANDIDATES_PER_LAYER = 4_096
+_RETRIEVAL_MAX_WORKERS = 4
 _STABLE_LAYERS = frozenset(
     {
         MemoryLayer.SEMANTIC,
@@ -75,6 +88,10 @@ class LayerSpec:
     vector_embedding_model: str | None = None
     vector_index_path: str | None = None
     hybrid_search_enabled: bool = False
+    vector_ann_enabled: bool = False
+    vector_ann_lists: int = 0
+    vector_ann_probes: int = 8
+    vector_ann_min_rows: int = 4096
 
 
 DEFAULT_LAYER_SPECS: dict[MemoryLayer, LayerSpec] = {
@@ -227,7 +244,10 @@ def validate_layer_artifact_paths(specs: dict[MemoryLayer, LayerSpec]) -> None:
             for candidate in {
                 name,
                 path.with_suffix(".memory.json").name,
+                path.with_suffix(".memory.bin").name,
+                path.with_suffix(".memory.log").name,
                 path.with_suffix(f"{path.suffix}.records.json").name,
+                path.with_suffix(f"{path.suffix}.records.log").name,
                 f".{name}.kestrel.lock",
             }
         )
@@ -240,7 +260,14 @@ def validate_layer_artifact_paths(specs: dict[MemoryLayer, LayerSpec]) -> None:
             spec.vector_index_path,
             label=f"{layer.value} vector index_path",
         )
-        names = {name, f"{name}-wal", f"{name}-shm", f"{name}-journal"}
+        names = {
+            name,
+            f"{name}-wal",
+            f"{name}-shm",
+            f"{name}-journal",
+            f"{name}-matrix",
+            f"{name}-ann",
+        }
         collision_keys = {_artifact_collision_key(candidate) for candidate in names}
         conflicts = collision_keys & (reserved_names | vector_artifact_names)
         if conflicts:
@@ -396,6 +423,14 @@ def _stable_claim_digest(record: MemoryRecord) -> str:
     return "sha256:" + sha256(encoded).hexdigest()
 
 
+@dataclass(frozen=True)
+class LayeredRetrieval:
+    """Merged retrieval hits plus the layers that could not answer in time."""
+
+    hits: list[MemoryHit]
+    degraded_layers: dict[MemoryLayer, str] = field(default_factory=dict)
+
+
 class MemoryCleanupIncompleteError(RuntimeError):
     """Retain memory owners whose close could not be verified for a later retry."""
 
@@ -438,7 +473,16 @@ class LayeredMemorySystem:
         vector_sidecars: dict[MemoryLayer, VectorSidecar] | None = None,
         enforce_stable_write_integrity: bool = True,
         integrity_key: bytes | None = None,
+        retrieval_max_workers: int = _RETRIEVAL_MAX_WORKERS,
+        retrieval_deadline_seconds: float | None = None,
+        retrieval_cache_entries: int = DEFAULT_RETRIEVAL_CACHE_ENTRIES,
     ) -> None:
+        if retrieval_max_workers < 1:
+            raise ValueError("retrieval_max_workers must be >= 1")
+        if retrieval_deadline_seconds is not None:
+            retrieval_deadline_seconds = bounded_retrieval_deadline(
+                "retrieval_deadline_seconds", retrieval_deadline_seconds
+            )
         self.specs = specs or DEFAULT_LAYER_SPECS
         missing = set(self.specs) - set(backends)
         if missing:
@@ -454,8 +498,22 @@ class LayeredMemorySystem:
         self._writes_since_seal = 0
         self._dirty_layers: set[MemoryLayer] = set()
         self._last_seal_monotonic = time.monotonic()
+        # Agents leased from a shared pool write concurrently. Writers hold
+        # their layers' locks (always taken in ``_layer_write_order``) across
+        # read-modify-write sequences and seals; the seal bookkeeping has its
+        # own leaf lock.
+        self._layer_write_locks = {layer: RLock() for layer in backends}
+        self._write_state_lock = Lock()
         self._unsettled_tool_execution_lock = Lock()
         self._unsettled_tool_execution_ids: set[str] = set()
+        self.retrieval_max_workers = retrieval_max_workers
+        self.retrieval_deadline_seconds = retrieval_deadline_seconds
+        self._retrieval_executor: ThreadPoolExecutor | None = None
+        self._retrieval_executor_lock = Lock()
+        self._overdue_searches: dict[MemoryLayer, Future[list[MemoryHit]]] = {}
+        self._search_sessions = SearchSessionCache()
+        self._layer_generations: dict[MemoryLayer, int] = {}
+        self._retrieval_cache = RetrievalCache(max_entries=retrieval_cache_entries)
 
     @classmethod
     def from_backend_factory(
@@ -466,6 +524,7 @@ class LayeredMemorySystem:
         ledger: PromotionLedger | None = None,
         vector_embedder: TextEmbedder | None = None,
         enforce_stable_write_integrity: bool = True,
+        retrieval_deadline_seconds: float | None = None,
         **backend_kwargs: object,
     ) -> LayeredMemorySystem:
         layer_specs = specs or DEFAULT_LAYER_SPECS
@@ -483,6 +542,9 @@ class LayeredMemorySystem:
                 layer_backend_kwargs = dict(backend_kwargs)
                 backend = backend_factory(path=path, layer=layer, **layer_backend_kwargs)
                 backends[layer] = backend
+                bind_replay_checkpoint_key = getattr(backend, "bind_replay_checkpoint_key", None)
+                if callable(bind_replay_checkpoint_key):
+                    bind_replay_checkpoint_key(integrity_key)
                 backend.open()
                 sidecar = _make_vector_sidecar(
                     memory_dir=memory_dir,
@@ -524,6 +586,7 @@ class LayeredMemorySystem:
             vector_sidecars=vector_sidecars,
             enforce_stable_write_integrity=enforce_stable_write_integrity,
             integrity_key=integrity_key,
+            retrieval_deadline_seconds=retrieval_deadline_seconds,
         )
 
     def put_runtime_validation_receipt(
@@ -791,6 +854,11 @@ class LayeredMemorySystem:
         return self._put(prepared)
 
     def _put(self, record: MemoryRecord) -> str:
+        # Conflict audit frames always land in episodic memory.
+        with self._layer_writes(record.layer, MemoryLayer.EPISODIC):
+            return self._put_locked(record)
+
+    def _put_locked(self, record: MemoryRecord) -> str:
         record = sanitize_memory_record(record)
         spec = self.specs[record.layer]
         record = _with_default_retention(record, spec)
@@ -907,6 +975,11 @@ class LayeredMemorySystem:
         return self._upsert(prepared)
 
     def _upsert(self, record: MemoryRecord) -> str:
+        # Conflict audit frames always land in episodic memory.
+        with self._layer_writes(record.layer, MemoryLayer.EPISODIC):
+            return self._upsert_locked(record)
+
+    def _upsert_locked(self, record: MemoryRecord) -> str:
         record = sanitize_memory_record(record)
         spec = self.specs[record.layer]
         record = _with_default_retention(record, spec)
@@ -956,10 +1029,11 @@ class LayeredMemorySystem:
         reason: str,
         superseded_by: str | None = None,
     ) -> bool:
-        record = self.backends[layer].get_record(record_id, include_inactive=True)
-        changed = self.backends[layer].tombstone(
-            record_id, reason=reason, superseded_by=superseded_by
-        )
+        with self._layer_writes(layer):
+            record = self.backends[layer].get_record(record_id, include_inactive=True)
+            changed = self.backends[layer].tombstone(
+                record_id, reason=reason, superseded_by=superseded_by
+            )
         if changed:
             self._note_write(layer)
             self._tombstone_vector_sidecar(layer, record_id)
@@ -994,6 +1068,28 @@ class LayeredMemorySystem:
         for selected in layers:
             yield from self.backends[selected].iter_records(include_inactive=include_inactive)
 
+    def iter_session_records(
+        self,
+        layer: MemoryLayer,
+        session_id: str,
+        *,
+        transcript_scope: str,
+        turn_origin: str,
+        since: datetime | None = None,
+        include_inactive: bool = False,
+    ) -> tuple[MemoryRecord, ...]:
+        """Range-query one conversation's turn frames in ``(created_at, id)`` order."""
+
+        return tuple(
+            self.backends[layer].iter_session_records(
+                session_id,
+                transcript_scope=transcript_scope,
+                turn_origin=turn_origin,
+                since=since,
+                include_inactive=include_inactive,
+            )
+        )
+
     def get_record(
         self,
         layer: MemoryLayer | None,
@@ -1028,6 +1124,9 @@ class LayeredMemorySystem:
         candidate_ids = frozenset(record_ids)
         ordered_layers = tuple(sorted(self.backends, key=lambda item: item.value))
         with ExitStack() as reservations:
+            # Layer write locks come before backend locks everywhere, so the
+            # caller's first write re-enters them instead of inverting order.
+            reservations.enter_context(self._layer_writes(*ordered_layers))
             for layer in ordered_layers:
                 reservations.enter_context(self.backends[layer].identity_reservation())
             available = not any(
@@ -1037,29 +1136,151 @@ class LayeredMemorySystem:
             yield available
 
     def retrieve(self, query: RetrievalQuery) -> list[MemoryHit]:
-        hits: list[MemoryHit] = []
+        return self.retrieve_layers(query).hits
+
+    def retrieve_layers(self, query: RetrievalQuery) -> LayeredRetrieval:
+        """Search every requested layer concurrently and merge in layer order.
+
+        Each backend serializes its own operations, so layers are searched in
+        parallel on a bounded pool. A layer still running when the query
+        deadline expires is reported in ``degraded_layers`` and its hits are
+        dropped; the merge never depends on completion order. Until that
+        overdue search finishes, later queries report the layer as degraded
+        without queuing another search behind it.
+        """
+
         now = datetime.now(UTC)
-        for layer in query.layers:
-            spec = self.specs[layer]
-            k = min(query.k_per_layer, spec.retrieval_k)
-            mode = _resolved_search_mode(spec, query.mode)
-            eligible_by_id = self._eligible_layer_hits(
-                layer=layer,
-                query=query,
-                k=k,
-                mode=mode,
-                now=now,
-            )
-            hits.extend(
-                sorted(
-                    eligible_by_id.values(),
-                    key=lambda hit: (hit.score, hit.record.importance),
-                    reverse=True,
-                )[:k]
-            )
+        layers = tuple(dict.fromkeys(query.layers))
+        deadline = (
+            query.deadline_seconds
+            if query.deadline_seconds is not None
+            else self.retrieval_deadline_seconds
+        )
+        per_layer: dict[MemoryLayer, list[MemoryHit]] = {}
+        degraded: dict[MemoryLayer, str] = {}
+        if len(layers) <= 1 and deadline is None:
+            for layer in layers:
+                per_layer[layer] = self._layer_retrieval_hits(layer, query, now)
+        else:
+            executor = self._retrieval_pool()
+            futures: dict[MemoryLayer, Future[list[MemoryHit]]] = {}
+            for layer in layers:
+                if self._search_overdue(layer):
+                    degraded[layer] = "previous search still running past its deadline"
+                    continue
+                futures[layer] = executor.submit(self._layer_retrieval_hits, layer, query, now)
+            wait(futures.values(), timeout=deadline)
+            for layer, future in futures.items():
+                if not future.done():
+                    # A running search cannot be cancelled; remember it so it
+                    # holds at most one pool thread for its layer.
+                    if not future.cancel():
+                        self._mark_search_overdue(layer, future)
+                    degraded[layer] = f"deadline of {deadline:g}s exceeded"
+                    continue
+                # Re-raise in query layer order so failures are deterministic.
+                per_layer[layer] = future.result()
+        hits = [hit for layer in layers for hit in per_layer.get(layer, ())]
         ordered = sorted(hits, key=lambda hit: (hit.score, hit.record.importance), reverse=True)
         self._write_back_retrieval_hits(ordered)
-        return ordered
+        return LayeredRetrieval(hits=ordered, degraded_layers=degraded)
+
+    def _layer_retrieval_hits(
+        self,
+        layer: MemoryLayer,
+        query: RetrievalQuery,
+        now: datetime,
+    ) -> list[MemoryHit]:
+        spec = self.specs[layer]
+        k = min(query.k_per_layer, spec.retrieval_k)
+        mode = _resolved_search_mode(spec, query.mode)
+        cache_key = (
+            " ".join(query.query.split()),
+            k,
+            mode,
+            query.min_relevancy,
+            query.project_id,
+            query.include_inactive,
+            query.include_retrieval_artifacts,
+        )
+        # Captured before searching: a write that races this search bumps the
+        # generation, so the entry stored below can never be served.
+        generation = self._retrieval_generation(layer)
+        if generation is not None:
+            cached = self._retrieval_cache.get(layer, cache_key, generation)
+            if cached is not None and (
+                query.include_inactive
+                or not any(memory_record_is_expired(hit.record, now=now) for hit in cached)
+            ):
+                return list(cached)
+        started = time.perf_counter()
+        eligible_by_id = self._eligible_layer_hits(
+            layer=layer,
+            query=query,
+            k=k,
+            mode=mode,
+            now=now,
+        )
+        hits = sorted(
+            eligible_by_id.values(),
+            key=lambda hit: (hit.score, hit.record.importance),
+            reverse=True,
+        )[:k]
+        if generation is not None:
+            self._retrieval_cache.put(
+                layer,
+                cache_key,
+                generation,
+                hits,
+                elapsed_seconds=time.perf_counter() - started,
+            )
+        return hits
+
+    def _retrieval_generation(self, layer: MemoryLayer) -> tuple[int, object] | None:
+        if not self._retrieval_cache.enabled:
+            return None
+        backend_generation = self.backends[layer].search_generation()
+        if backend_generation is None:
+            return None
+        return self._layer_generations.get(layer, 0), backend_generation
+
+    def retrieval_cache_stats(self) -> dict[str, object]:
+        return self._retrieval_cache.stats()
+
+    def _retrieval_pool(self) -> ThreadPoolExecutor:
+        with self._retrieval_executor_lock:
+            if self._retrieval_executor is None:
+                # One extra thread per layer: an overdue search holds at most
+                # one thread for its layer, so stuck layers never starve the
+                # searches of healthy ones.
+                self._retrieval_executor = ThreadPoolExecutor(
+                    max_workers=self.retrieval_max_workers + len(self.backends),
+                    thread_name_prefix="kestrel-memory-retrieve",
+                )
+            return self._retrieval_executor
+
+    def _search_overdue(self, layer: MemoryLayer) -> bool:
+        with self._retrieval_executor_lock:
+            future = self._overdue_searches.get(layer)
+        return future is not None and not future.done()
+
+    def _mark_search_overdue(
+        self,
+        layer: MemoryLayer,
+        future: Future[list[MemoryHit]],
+    ) -> None:
+        with self._retrieval_executor_lock:
+            self._overdue_searches[layer] = future
+        future.add_done_callback(lambda done: self._clear_overdue_search(layer, done))
+
+    def _clear_overdue_search(
+        self,
+        layer: MemoryLayer,
+        future: Future[list[MemoryHit]],
+    ) -> None:
+        with self._retrieval_executor_lock:
+            if self._overdue_searches.get(layer) is future:
+                del self._overdue_searches[layer]
 
     def _eligible_layer_hits(
         self,
@@ -1166,8 +1387,9 @@ class LayeredMemorySystem:
         record.metadata["confirmation_evidence_record_id"] = evidence.record_id
         record.expires_at = None
         record.updated_at = datetime.now(UTC)
-        self.backends[record.layer].upsert(record)
-        self._note_write(record.layer)
+        with self._layer_writes(record.layer):
+            self.backends[record.layer].upsert(record)
+            self._note_write(record.layer)
         old_promotion_id = _promotion_id(record)
         if old_promotion_id:
             self.record_promotion_outcome(
@@ -1182,16 +1404,22 @@ class LayeredMemorySystem:
         self._seal_layers(tuple(self.backends))
 
     def _seal_dirty_layers(self) -> None:
-        self._seal_layers(tuple(self._dirty_layers))
+        with self._write_state_lock:
+            dirty = tuple(self._dirty_layers)
+        self._seal_layers(dirty)
 
     def _seal_layers(self, layers: tuple[MemoryLayer, ...]) -> None:
         selected = set(layers)
-        for layer, backend in self.backends.items():
-            if layer in selected:
-                backend.seal()
-        self._writes_since_seal = 0
-        self._dirty_layers.difference_update(selected)
-        self._last_seal_monotonic = time.monotonic()
+        # Holding the layer locks keeps a concurrent write from being marked
+        # clean by this seal before the backend has made it durable.
+        with self._layer_writes(*selected):
+            for layer, backend in self.backends.items():
+                if layer in selected:
+                    backend.seal()
+            with self._write_state_lock:
+                self._writes_since_seal = 0
+                self._dirty_layers.difference_update(selected)
+                self._last_seal_monotonic = time.monotonic()
 
     def maybe_seal_all(
         self,
@@ -1200,7 +1428,11 @@ class LayeredMemorySystem:
         interval_seconds: float = 10.0,
         force: bool = False,
     ) -> bool:
-        if not self._dirty_layers:
+        with self._write_state_lock:
+            dirty = set(self._dirty_layers)
+            writes_since_seal = self._writes_since_seal
+            last_seal_monotonic = self._last_seal_monotonic
+        if not dirty:
             return False
         if force or self._requires_eager_seal():
             self._seal_dirty_layers()
@@ -1211,11 +1443,11 @@ class LayeredMemorySystem:
             MemoryLayer.SELF,
             MemoryLayer.POLICY,
         }
-        if self._dirty_layers & durable_layers:
+        if dirty & durable_layers:
             self._seal_dirty_layers()
             return True
-        elapsed = time.monotonic() - self._last_seal_monotonic
-        if self._writes_since_seal >= max(write_threshold, 1) or elapsed >= max(
+        elapsed = time.monotonic() - last_seal_monotonic
+        if writes_since_seal >= max(write_threshold, 1) or elapsed >= max(
             interval_seconds, 0.001
         ):
             self._seal_dirty_layers()
@@ -1255,6 +1487,12 @@ class LayeredMemorySystem:
         # retried; releasing them here would allow another writer to observe a
         # partially durable layer.
         self.maybe_seal_all(force=True)
+        # Layer searches that missed a retrieval deadline may still be running;
+        # let them finish before their backends are closed underneath them.
+        with self._retrieval_executor_lock:
+            executor, self._retrieval_executor = self._retrieval_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         first_error: Exception | None = None
         for backend in self.backends.values():
             try:
@@ -1311,6 +1549,8 @@ class LayeredMemorySystem:
             except Exception as exc:  # noqa: BLE001 - canonical memory stays available
                 sidecar.record_error(exc)
                 rebuilt[layer] = sidecar.status()
+            finally:
+                self._invalidate_layer_searches(layer)
         return rebuilt
 
     def _with_conflict_metadata(
@@ -1339,6 +1579,7 @@ class LayeredMemorySystem:
                 continue
             existing.metadata["conflict_group_id"] = group_id
             self.backends[existing.layer].upsert(existing)
+            self._invalidate_layer_searches(existing.layer)
         conflict_frame = make_conflict_set_frame(
             layer=MemoryLayer.EPISODIC,
             conflict_group_id=group_id,
@@ -1348,8 +1589,27 @@ class LayeredMemorySystem:
         return record, conflict_frame, conflicts
 
     def _note_write(self, layer: MemoryLayer) -> None:
-        self._writes_since_seal += 1
-        self._dirty_layers.add(layer)
+        with self._write_state_lock:
+            self._writes_since_seal += 1
+            self._dirty_layers.add(layer)
+        self._invalidate_layer_searches(layer)
+
+    @contextmanager
+    def _layer_writes(self, *layers: MemoryLayer) -> Iterator[None]:
+        """Serialize writers of ``layers`` against each other and against seals."""
+
+        with ExitStack() as held:
+            for layer in _layer_write_order(layers):
+                lock = self._layer_write_locks.get(layer)
+                if lock is not None:
+                    held.enter_context(lock)
+            yield
+
+    def _invalidate_layer_searches(self, layer: MemoryLayer) -> None:
+        with self._write_state_lock:
+            self._layer_generations[layer] = self._layer_generations.get(layer, 0) + 1
+        self._search_sessions.invalidate(layer)
+        self._retrieval_cache.invalidate(layer)
 
     def _update_vector_sidecar(self, record: MemoryRecord) -> None:
         sidecar = self.vector_sidecars.get(record.layer)
@@ -1437,19 +1697,53 @@ class LayeredMemorySystem:
                 cursor=cursor,
             )
 
-        offset = _layer_page_offset(cursor)
+        # Fused rankings have no native continuation, so the ranked window is
+        # kept in a search session and later pages are slices of it. The
+        # window only grows (geometrically) when a page runs past its end.
+        position = parse_search_cursor(
+            "layer", cursor, error="Invalid layered memory search cursor"
+        )
+        offset = position.offset
         end = offset + k
-        window = self._find_layer_hits(
-            layer=layer,
-            query=query,
-            k=end + 1,
-            mode=mode,
-            min_relevancy=min_relevancy,
-            include_inactive=include_inactive,
+        # The layer's write generation is part of the signature, so a session
+        # stored by a search that raced a write can never be served later.
+        signature = (
+            query,
+            mode,
+            min_relevancy,
+            include_inactive,
+            self._layer_generations.get(layer, 0),
         )
+        cached = (
+            self._search_sessions.lookup(position.token, scope=layer, signature=signature)
+            if position.token is not None
+            else None
+        )
+        if cached is not None and (cached[1] or len(cached[0]) > end):
+            window = list(cached[0])
+            token = position.token
+        else:
+            size = max(end + 1, 2 * len(cached[0])) if cached is not None else end + 1
+            window = self._find_layer_hits(
+                layer=layer,
+                query=query,
+                k=size,
+                mode=mode,
+                min_relevancy=min_relevancy,
+                include_inactive=include_inactive,
+            )
+            token = None
+            if len(window) > end:
+                token = self._search_sessions.store(
+                    window,
+                    scope=layer,
+                    signature=signature,
+                    complete=len(window) < size,
+                    token=position.token,
+                )
         return MemorySearchPage(
             hits=tuple(window[offset:end]),
-            next_cursor=f"layer-offset:{end}" if len(window) > end else None,
+            next_cursor=format_search_cursor("layer", end, token) if len(window) > end else None,
         )
 
     def _find_vector_sidecar_hits(
@@ -1519,6 +1813,7 @@ class LayeredMemorySystem:
 
     def _write_back_retrieval_hits(self, hits: list[MemoryHit]) -> None:
         now = datetime.now(UTC)
+        stamped: dict[MemoryLayer, dict[str, MemoryRecord]] = {}
         for hit in hits:
             record = hit.record
             previous = _metadata_datetime(record.metadata.get("last_retrieved_at"))
@@ -1528,8 +1823,33 @@ class LayeredMemorySystem:
             record.updated_at = now
             if record.layer in _STABLE_LAYERS and not _stable_record_has_valid_envelope(record):
                 continue
-            self.backends[record.layer].upsert(record)
-            self._note_write(record.layer)
+            stamped.setdefault(record.layer, {})[record.id] = record
+        for layer, records in stamped.items():
+            with self._layer_writes(layer):
+                before = self._retrieval_generation(layer)
+                for record in records.values():
+                    self.backends[layer].upsert(record)
+                self._note_retrieval_bookkeeping(layer, before, records)
+
+    def _note_retrieval_bookkeeping(
+        self,
+        layer: MemoryLayer,
+        before: tuple[int, object] | None,
+        records: dict[str, MemoryRecord],
+    ) -> None:
+        # Stamping ``last_retrieved_at`` changes neither which records match a
+        # query nor how they rank, so the layer's cached results move to the new
+        # backend generation instead of being invalidated. The caller holds the
+        # layer's write lock, so no other write of this system lands in between.
+        with self._write_state_lock:
+            self._writes_since_seal += len(records)
+            self._dirty_layers.add(layer)
+        self._search_sessions.invalidate(layer)
+        after = self._retrieval_generation(layer)
+        if before is None or after is None:
+            self._retrieval_cache.invalidate(layer)
+            return
+        self._retrieval_cache.restamp(layer, before, after, records)
 
     def _confirmed_record_matches_provisional(self, record: MemoryRecord) -> MemoryRecord | None:
         if record.layer in _STABLE_LAYERS and not _stable_record_has_valid_envelope(record):
@@ -1550,6 +1870,10 @@ class LayeredMemorySystem:
         return None
 
 
+def _layer_write_order(layers: Iterable[MemoryLayer]) -> tuple[MemoryLayer, ...]:
+    return tuple(sorted(set(layers), key=lambda item: item.value))
+
+
 def load_layer_specs(path: Path) -> dict[MemoryLayer, LayerSpec]:
     raw = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(raw, dict):
@@ -1571,6 +1895,15 @@ def load_layer_specs(path: Path) -> dict[MemoryLayer, LayerSpec]:
         )
         index_path = _optional_str(vector.get("index_path", payload.get("vector_index_path")))
         local_vector_enabled = bool(vector_enabled and provider == "local" and index_path)
+        ann_payload = vector.get("ann")
+        ann: dict[str, object] = ann_payload if isinstance(ann_payload, dict) else {}
+        ann_settings = VectorAnnSettings(
+            lists=_config_int(ann.get("lists", base.vector_ann_lists), label="vector.ann.lists"),
+            probes=_config_int(ann.get("probes", base.vector_ann_probes), label="vector.ann.probes"),
+            min_rows=_config_int(
+                ann.get("min_rows", base.vector_ann_min_rows), label="vector.ann.min_rows"
+            ),
+        )
         search_mode = str(payload.get("search_mode", base.search_mode))
         if (
             layer == MemoryLayer.PROCEDURAL
@@ -1612,6 +1945,10 @@ def load_layer_specs(path: Path) -> dict[MemoryLayer, LayerSpec]:
             vector_embedding_model=embedding_model if local_vector_enabled else None,
             vector_index_path=index_path if local_vector_enabled else None,
             hybrid_search_enabled=local_vector_enabled and search_mode == "hybrid",
+            vector_ann_enabled=local_vector_enabled and bool(ann.get("enabled", False)),
+            vector_ann_lists=ann_settings.lists,
+            vector_ann_probes=ann_settings.probes,
+            vector_ann_min_rows=ann_settings.min_rows,
         )
     validate_layer_artifact_paths(specs)
     return specs
@@ -1633,6 +1970,13 @@ def _make_vector_sidecar(
         embedder=embedder or make_local_embedder(spec.vector_embedding_model),
         mv2_path=mv2_path,
         provider="local",
+        ann=VectorAnnSettings(
+            lists=spec.vector_ann_lists,
+            probes=spec.vector_ann_probes,
+            min_rows=spec.vector_ann_min_rows,
+        )
+        if spec.vector_ann_enabled
+        else None,
     )
 
 
@@ -1685,21 +2029,6 @@ def _best_hits_by_record_id(hits: Iterable[MemoryHit]) -> dict[str, MemoryHit]:
     return best
 
 
-def _layer_page_offset(cursor: str | None) -> int:
-    if cursor is None:
-        return 0
-    prefix = "layer-offset:"
-    if not cursor.startswith(prefix):
-        raise ValueError("Invalid layered memory search cursor")
-    try:
-        offset = int(cursor.removeprefix(prefix))
-    except ValueError as exc:
-        raise ValueError("Invalid layered memory search cursor") from exc
-    if offset < 0:
-        raise ValueError("Invalid layered memory search cursor")
-    return offset
-
-
 def _with_default_retention(record: MemoryRecord, spec: LayerSpec) -> MemoryRecord:
     if record.layer in {MemoryLayer.WORKING, MemoryLayer.EPISODIC} and record.expires_at is None:
         record.expires_at = datetime.now(UTC) + timedelta(days=max(spec.retention_days, 0))
@@ -2040,6 +2369,15 @@ def _polarity(text: str) -> str:
     )
 
 
+def _config_int(value: object, *, label: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        raise ValueError(f"{label} must be an integer")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{label} must be an integer") from None
+
+
 def _optional_str(value: object) -> str | None:
     if value is None:
         return None
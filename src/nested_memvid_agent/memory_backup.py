@@ -340,13 +340,16 @@ class MemoryBackupManager:
                         f"Memvid layer cannot be hard-linked: {layer_path.name}"
                     )
                 files.append(layer_path)
-            sidecar = layer_path.with_suffix(f"{layer_path.suffix}.records.json")
-            if sidecar.is_symlink():
-                raise MemoryBackupError(f"Memvid sidecar cannot be a symlink: {sidecar.name}")
-            if sidecar.is_file():
-                if sidecar.stat().st_nlink != 1:
-                    raise MemoryBackupError(f"Memvid sidecar cannot be hard-linked: {sidecar.name}")
-                files.append(sidecar)
+            for sidecar_suffix in (".records.json", ".records.log"):
+                sidecar = layer_path.with_suffix(f"{layer_path.suffix}{sidecar_suffix}")
+                if sidecar.is_symlink():
+                    raise MemoryBackupError(f"Memvid sidecar cannot be a symlink: {sidecar.name}")
+                if sidecar.is_file():
+                    if sidecar.stat().st_nlink != 1:
+                        raise MemoryBackupError(
+                            f"Memvid sidecar cannot be hard-linked: {sidecar.name}"
+                        )
+                    files.append(sidecar)
         layer_config = self.memory_dir / "layers.json"
         if layer_config.is_symlink():
             raise MemoryBackupError("Memvid layer configuration cannot be a symlink")
@@ -373,6 +376,7 @@ class MemoryBackupManager:
         for spec in self.specs.values():
             allowed.add(f"memory/{spec.mv2_file}")
             allowed.add(f"memory/{spec.mv2_file}.records.json")
+            allowed.add(f"memory/{spec.mv2_file}.records.log")
         return allowed
 
     def _backup_dir(self, backup_id: str) -> Path:
@@ -0,0 +1,307 @@
+"""Process-wide pool of warm layered memory systems shared by concurrent agents.
+
+Without the pool every run opens its own :class:`LayeredMemorySystem` and, for
+Memvid, the run manager admits a single agent at a time because each system
+owns exclusive handles on its ``.mv2`` files. The pool is the only owner of
+those handles instead: agents borrow a system through a :class:`MemoryLease`,
+writes are serialized per layer inside the system, and a released system stays
+open for the next run.
+
+Ownership is tracked per memory directory. A system built for a different
+configuration of the same directory is only opened after the previous one has
+drained its leases and been closed, so two pooled systems never hold the same
+files.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from threading import Condition, Lock
+from time import monotonic
+
+from .config import AgentConfig
+from .layers import LayeredMemorySystem, MemoryCleanupIncompleteError
+
+DEFAULT_MEMORY_POOL_MAX_SYSTEMS = 4
+
+
+def memory_pool_key(config: AgentConfig) -> tuple[Hashable, ...]:
+    """Every configuration input that shapes a built memory system."""
+
+    return (
+        config.backend,
+        str(config.memory_dir.resolve()),
+        None if config.layer_config_path is None else str(config.layer_config_path.resolve()),
+        config.memory_max_layer_bytes,
+        config.memory_retrieval_deadline_seconds,
+        config.memory_persistence,
+    )
+
+
+@dataclass(eq=False)
+class _PooledSystem:
+    key: tuple[Hashable, ...]
+    owner: str
+    memory: LayeredMemorySystem
+    leases: int = 0
+    # Leases held only because a timed-out tool may still resume on them.
+    stuck_leases: int = 0
+    last_released: float = field(default_factory=monotonic)
+    retired: bool = False
+
+
+class MemoryLease:
+    """One agent's borrowed reference to a pooled memory system."""
+
+    def __init__(self, pool: MemorySystemPool, pooled: _PooledSystem) -> None:
+        self._pool = pool
+        self._pooled = pooled
+        self._release_lock = Lock()
+        self._released = False
+        self._stuck = False
+        self._unsettled_lock = Lock()
+        self._unsettled_tool_executions: set[str] = set()
+
+    @property
+    def memory(self) -> LayeredMemorySystem:
+        return self._pooled.memory
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def retain_for_unsettled_tool_execution(self, execution_id: str) -> None:
+        """Fence this lease, and the shared system's close, behind one tool."""
+
+        with self._unsettled_lock:
+            self._unsettled_tool_executions.add(execution_id)
+        self._pooled.memory.retain_for_unsettled_tool_execution(execution_id)
+
+    def release_unsettled_tool_execution(self, execution_id: str) -> None:
+        self._pooled.memory.release_unsettled_tool_execution(execution_id)
+        with self._unsettled_lock:
+            self._unsettled_tool_executions.discard(execution_id)
+
+    def has_unsettled_tool_executions(self) -> bool:
+        """Only tools started through this lease; other agents' tools don't count."""
+
+        with self._unsettled_lock:
+            return bool(self._unsettled_tool_executions)
+
+    def release(self) -> None:
+        """Seal the run's writes and return the system to the pool.
+
+        A failed seal leaves the lease held so the release can be retried;
+        the warm system is never handed out again with an unverified
+        durability boundary attributed to a finished run. A timed-out tool
+        this lease started that may still resume against the system's
+        handles also keeps the lease held. Other leases on the same system
+        release normally; the system is retired, so it is closed rather
+        than reused, only once every lease still holding it is stuck.
+        """
+
+        with self._release_lock:
+            if self._released:
+                return
+            if self.has_unsettled_tool_executions():
+                if not self._stuck:
+                    self._stuck = True
+                    self._pool._hold_stuck(self._pooled)
+                raise MemoryCleanupIncompleteError((self,), phase="unsettled_tool_execution")
+            self._pooled.memory.maybe_seal_all(force=True)
+            self._released = True
+        self._pool._release(self._pooled, stuck=self._stuck)
+
+    # ``MemoryCleanupIncompleteError.retry_cleanup`` closes what it retains.
+    close = release
+
+
+class MemorySystemPool:
+    """Reference-counted, capacity-bounded owner of layered memory systems."""
+
+    def __init__(self, *, max_systems: int = DEFAULT_MEMORY_POOL_MAX_SYSTEMS) -> None:
+        if max_systems < 1:
+            raise ValueError("max_systems must be >= 1")
+        self._max_systems = max_systems
+        self._condition = Condition(Lock())
+        self._systems: dict[tuple[Hashable, ...], _PooledSystem] = {}
+        self._building: set[str] = set()
+        self._closed = False
+        self._counters = {
+            "acquisitions": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "waits": 0,
+        }
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def acquire(
+        self,
+        config: AgentConfig,
+        build: Callable[[AgentConfig], LayeredMemorySystem],
+    ) -> MemoryLease:
+        """Lease the warm system for ``config``, building it on first use.
+
+        Blocks while the memory directory is leased under another
+        configuration, or while every slot holds a leased system. Raises
+        ``RuntimeError("memory_pool_closed")`` once admission has stopped.
+        """
+
+        key = memory_pool_key(config)
+        owner = str(key[1])
+        started = monotonic()
+        waited = False
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("memory_pool_closed")
+                pooled = self._systems.get(key)
+                if pooled is not None and not pooled.retired:
+                    pooled.leases += 1
+                    self._note_admission_locked(started, waited=waited, hit=True)
+                    return MemoryLease(self, pooled)
+                evicted = self._claim_slot_locked(owner)
+                if evicted is not None:
+                    break
+                waited = True
+                self._condition.wait()
+            self._building.add(owner)
+            self._note_admission_locked(started, waited=waited, hit=False)
+        still_open = list(evicted)
+        try:
+            for stale in evicted:
+                stale.memory.close_all()
+                still_open.remove(stale)
+            memory = build(config)
+        except BaseException:
+            with self._condition:
+                self._building.discard(owner)
+                self._counters["evictions"] += len(evicted) - len(still_open)
+                for stale in still_open:
+                    self._systems.setdefault(stale.key, stale)
+                self._condition.notify_all()
+            raise
+        with self._condition:
+            self._building.discard(owner)
+            self._counters["evictions"] += len(evicted)
+            pooled = _PooledSystem(key=key, owner=owner, memory=memory, leases=1)
+            self._systems[key] = pooled
+            self._condition.notify_all()
+        return MemoryLease(self, pooled)
+
+    def stop_admission(self) -> None:
+        """Fail pending and future acquisitions; leased systems stay open."""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def shutdown(self, *, timeout_seconds: float) -> bool:
+        """Stop admission, wait for leases to drain, then close every system.
+
+        Systems whose close fails stay pooled so a later shutdown can retry.
+        """
+
+        deadline = monotonic() + max(0.0, timeout_seconds)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            while self._building or any(item.leases for item in self._systems.values()):
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+            systems = tuple(self._systems.values())
+        closed_all = True
+        for pooled in systems:
+            try:
+                pooled.memory.close_all()
+            except Exception:  # noqa: BLE001 - retained for the next shutdown attempt
+                closed_all = False
+                continue
+            with self._condition:
+                if self._systems.get(pooled.key) is pooled:
+                    del self._systems[pooled.key]
+        return closed_all
+
+    def snapshot(self) -> dict[str, object]:
+        with self._condition:
+            systems = tuple(self._systems.values())
+            acquisitions = self._counters["acquisitions"]
+            return {
+                "enabled": True,
+                "max_systems": self._max_systems,
+                "warm_systems": len(systems),
+                "idle_systems": sum(1 for item in systems if not item.leases),
+                "active_leases": sum(item.leases for item in systems),
+                "building": len(self._building),
+                "accepting": not self._closed,
+                **self._counters,
+                "wait_seconds_total": round(self._wait_seconds_total, 6),
+                "wait_seconds_max": round(self._wait_seconds_max, 6),
+                "wait_seconds_mean": (
+                    round(self._wait_seconds_total / acquisitions, 6) if acquisitions else 0.0
+                ),
+            }
+
+    def _release(self, pooled: _PooledSystem, *, stuck: bool = False) -> None:
+        with self._condition:
+            pooled.leases -= 1
+            if stuck:
+                pooled.stuck_leases -= 1
+            pooled.last_released = monotonic()
+            self._retire_if_stuck_locked(pooled)
+            self._condition.notify_all()
+
+    def _hold_stuck(self, pooled: _PooledSystem) -> None:
+        with self._condition:
+            pooled.stuck_leases += 1
+            self._retire_if_stuck_locked(pooled)
+
+    @staticmethod
+    def _retire_if_stuck_locked(pooled: _PooledSystem) -> None:
+        """Stop handing out a system once no lease on it can finish cleanly.
+
+        Retirement is permanent: after the stuck leases drain, the next
+        acquisition closes the system and builds a fresh one.
+        """
+
+        if pooled.stuck_leases and pooled.stuck_leases >= pooled.leases:
+            pooled.retired = True
+
+    def _claim_slot_locked(self, owner: str) -> tuple[_PooledSystem, ...] | None:
+        """Pick the idle systems to close before ``owner`` can build, or wait.
+
+        Systems over the same directory must go first; beyond that the least
+        recently released idle system makes room when the pool is full.
+        """
+
+        if owner in self._building:
+            return None
+        same_owner = [item for item in self._systems.values() if item.owner == owner]
+        if any(item.leases for item in same_owner):
+            return None
+        others = [item for item in self._systems.values() if item.owner != owner]
+        overflow = len(others) + len(self._building) + 1 - self._max_systems
+        idle_others = sorted(
+            (item for item in others if not item.leases),
+            key=lambda item: item.last_released,
+        )
+        if overflow > len(idle_others):
+            return None
+        evicted = (*same_owner, *idle_others[: max(0, overflow)])
+        for item in evicted:
+            del self._systems[item.key]
+        return evicted
+
+    def _note_admission_locked(self, started: float, *, waited: bool, hit: bool) -> None:
+        elapsed = monotonic() - started
+        self._counters["acquisitions"] += 1
+        self._counters["hits" if hit else "misses"] += 1
+        if waited:
+            self._counters["waits"] += 1
+        self._wait_seconds_total += elapsed
+        self._wait_seconds_max = max(self._wait_seconds_max, elapsed)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -7,6 +8,9 @@ from hashlib import sha256
 from typing import Any
 from uuid import uuid4
 
+# Longest a layered retrieval waits for slow layers before degrading them.
+MAX_RETRIEVAL_DEADLINE_SECONDS = 60.0
+
 
 class MemoryLayer(StrEnum):
     WORKING = "working"
@@ -68,11 +72,23 @@ class MemoryRecord:
             raise ValueError("MemoryRecord.title cannot be empty")
         self.confidence = _bounded(self.confidence, "confidence")
         self.importance = _bounded(self.importance, "importance")
+        self._content_hash_cache: tuple[tuple[object, ...], str] | None = None
 
     @property
     def content_hash(self) -> str:
-        payload = f"{self.layer}:{self.kind}:{self.title}:{self.content}".encode()
-        return sha256(payload).hexdigest()
+        # Dedup checks and backend indexes read this on every write, so the
+        # digest is memoized. The cache is not a dataclass field (equality,
+        # ``asdict`` and ``replace`` ignore it) and is keyed by the identity
+        # of the hashed attributes, so reassigning any of them recomputes it.
+        inputs = (self.layer, self.kind, self.title, self.content)
+        cached = self._content_hash_cache
+        if cached is not None and all(
+            old is new for old, new in zip(cached[0], inputs, strict=True)
+        ):
+            return cached[1]
+        digest = sha256(f"{self.layer}:{self.kind}:{self.title}:{self.content}".encode()).hexdigest()
+        self._content_hash_cache = (inputs, digest)
+        return digest
 
     def to_text_block(self) -> str:
         evidence_lines = []
@@ -117,12 +133,34 @@ class RetrievalQuery:
     project_id: str | None = None
     include_inactive: bool = False
     include_retrieval_artifacts: bool = False
+    deadline_seconds: float | None = None
 
     def __post_init__(self) -> None:
         if not self.query.strip():
             raise ValueError("RetrievalQuery.query cannot be empty")
         if self.k_per_layer < 1:
             raise ValueError("RetrievalQuery.k_per_layer must be >= 1")
+        if self.deadline_seconds is not None:
+            object.__setattr__(
+                self,
+                "deadline_seconds",
+                bounded_retrieval_deadline(
+                    "RetrievalQuery.deadline_seconds", self.deadline_seconds
+                ),
+            )
+
+
+def bounded_retrieval_deadline(name: str, value: object) -> float:
+    """Reject non-finite or non-positive deadlines and clamp to the maximum."""
+
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or not math.isfinite(value)
+        or value <= 0
+    ):
+        raise ValueError(f"{name} must be a positive number")
+    return min(float(value), MAX_RETRIEVAL_DEADLINE_SECONDS)
 
 
 @dataclass(frozen=True)
@@ -16,6 +16,7 @@ from .layers import DEFAULT_LAYER_SPECS
 from .llm.factory import provider_health_id
 from .llm.resilience import global_provider_health_registry
 from .process_liveness import process_is_alive
+from .retrieval_cache import retrieval_cache_metrics
 
 _PROCESS_STARTED = monotonic()
 _MEMORY_HEALTH_LOCK = Lock()
@@ -68,7 +69,18 @@ def operational_snapshot(
         "telegram_poller": poller,
         "proactive_routines": routines,
         "memory": memory,
+        "memory_retrieval_cache": retrieval_cache_metrics(),
+        "memory_pool": (
+            runs.memory_pool_snapshot()
+            if hasattr(runs, "memory_pool_snapshot")
+            else {"enabled": False}
+        ),
         "state": state_health,
+        "state_connection_pool": (
+            state.connection_pool_snapshot()
+            if hasattr(state, "connection_pool_snapshot")
+            else {"enabled": False}
+        ),
         "state_schema_version": (
             state_health.get("schema_version")
             if "schema_version" in state_health
@@ -374,6 +386,31 @@ def prometheus_snapshot(snapshot: dict[str, Any]) -> str:
             f"kestrel_memory_writable {1 if memory.get('writable') else 0}",
         ]
     )
+    retrieval_cache = _metric_mapping(snapshot.get("memory_retrieval_cache"))
+    for name in ("hits", "misses", "stale", "evictions", "invalidations"):
+        lines.append(
+            f'kestrel_memory_retrieval_cache{{kind="{name}"}} {_metric_number(retrieval_cache.get(name))}'
+        )
+    lines.append(
+        "kestrel_memory_retrieval_cache_saved_seconds "
+        f"{_metric_number(retrieval_cache.get('saved_seconds'))}"
+    )
+    memory_pool = _metric_mapping(snapshot.get("memory_pool"))
+    for name in (
+        "max_systems",
+        "warm_systems",
+        "idle_systems",
+        "active_leases",
+        "hits",
+        "misses",
+        "evictions",
+        "waits",
+    ):
+        lines.append(f'kestrel_memory_pool{{kind="{name}"}} {_metric_number(memory_pool.get(name))}')
+    lines.append(
+        "kestrel_memory_pool_wait_seconds_total "
+        f"{_metric_number(memory_pool.get('wait_seconds_total'))}"
+    )
     poller = _metric_mapping(snapshot.get("telegram_poller"))
     routines = _metric_mapping(snapshot.get("proactive_routines"))
     lines.extend(
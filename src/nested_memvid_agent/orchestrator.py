@@ -21,6 +21,8 @@ def build_memory_system(
     ledger: PromotionLedger | None = None,
     max_file_bytes: int = 1_073_741_824,
     enforce_stable_write_integrity: bool = True,
+    retrieval_deadline_seconds: float | None = None,
+    memory_persistence: str = "snapshot",
 ) -> LayeredMemorySystem:
     if backend == "memory":
         return LayeredMemorySystem.from_backend_factory(
@@ -29,6 +31,8 @@ def build_memory_system(
             specs=specs,
             ledger=ledger,
             enforce_stable_write_integrity=enforce_stable_write_integrity,
+            retrieval_deadline_seconds=retrieval_deadline_seconds,
+            persistence=memory_persistence,
         )
     if backend == "memvid":
         return LayeredMemorySystem.from_backend_factory(
@@ -38,6 +42,7 @@ def build_memory_system(
             ledger=ledger,
             max_file_bytes=max_file_bytes,
             enforce_stable_write_integrity=enforce_stable_write_integrity,
+            retrieval_deadline_seconds=retrieval_deadline_seconds,
         )
     raise ValueError(f"Unknown backend: {backend}")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import mmap
 import os
 import stat
 from pathlib import Path
@@ -13,6 +14,7 @@ _TASK_CAPSULE_ARTIFACT_NAMES = (
     "complete.mv2",
     "complete.memory.json",
     "complete.mv2.records.json",
+    "complete.mv2.records.log",
 )
 
 
@@ -93,7 +95,45 @@ def read_private_text(
 ) -> str | None:
     """Read a sensitive file through the same verified descriptor that is hardened."""
 
-    resolved = Path(path)
+    descriptor = _open_verified_private_file(Path(path), missing_ok=missing_ok)
+    if descriptor is None:
+        return None
+    with os.fdopen(descriptor, "r", encoding=encoding) as handle:
+        return handle.read()
+
+
+def read_private_bytes(
+    path: Path,
+    *,
+    missing_ok: bool = False,
+    offset: int = 0,
+) -> bytes | None:
+    """Binary counterpart of :func:`read_private_text`, optionally from ``offset``."""
+
+    descriptor = _open_verified_private_file(Path(path), missing_ok=missing_ok)
+    if descriptor is None:
+        return None
+    with os.fdopen(descriptor, "rb") as handle:
+        if offset:
+            handle.seek(offset)
+        return handle.read()
+
+
+def map_private_file(path: Path, *, missing_ok: bool = False) -> mmap.mmap | None:
+    """Map a verified sensitive file read-only; empty files map to ``None``."""
+
+    descriptor = _open_verified_private_file(Path(path), missing_ok=missing_ok)
+    if descriptor is None:
+        return None
+    try:
+        if os.fstat(descriptor).st_size == 0:
+            return None
+        return mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(descriptor)
+
+
+def _open_verified_private_file(resolved: Path, *, missing_ok: bool) -> int | None:
     try:
         before_open = os.lstat(resolved)
     except FileNotFoundError:
@@ -113,12 +153,10 @@ def read_private_text(
             raise ValueError(f"Sensitive artifact changed during validation: {resolved}")
         if os.name != "nt":
             chmod_descriptor(descriptor, PRIVATE_FILE_MODE)
-        with os.fdopen(descriptor, "r", encoding=encoding) as handle:
-            descriptor = -1
-            return handle.read()
-    finally:
-        if descriptor >= 0:
-            os.close(descriptor)
+    except BaseException:
+        os.close(descriptor)
+        raise
+    return descriptor
 
 
 def create_private_empty_file(path: Path) -> None:
@@ -179,6 +217,22 @@ def open_private_file_descriptor(path: Path) -> int:
 def write_private_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
     """Atomically replace a sensitive text artifact from an owner-only temp file."""
 
+    _replace_private_file(path, text, mode="w", encoding=encoding)
+
+
+def write_private_bytes(path: Path, payload: bytes) -> None:
+    """Binary counterpart of :func:`write_private_text`."""
+
+    _replace_private_file(path, payload, mode="wb", encoding=None)
+
+
+def _replace_private_file(
+    path: Path,
+    payload: str | bytes,
+    *,
+    mode: str,
+    encoding: str | None,
+) -> None:
     resolved = Path(path)
     ensure_private_directory(resolved.parent)
     harden_private_file(resolved, missing_ok=True)
@@ -191,9 +245,9 @@ def write_private_text(path: Path, text: str, *, encoding: str = "utf-8") -> Non
         _validate_file(metadata, temporary)
         if os.name != "nt":
             chmod_descriptor(descriptor, PRIVATE_FILE_MODE)
-        with os.fdopen(descriptor, "w", encoding=encoding) as handle:
+        with os.fdopen(descriptor, mode, encoding=encoding) as handle:
             descriptor = -1
-            handle.write(text)
+            handle.write(payload)
             handle.flush()
             os.fsync(handle.fileno())
         harden_private_file(resolved, missing_ok=True)
@@ -209,6 +263,18 @@ def write_private_text(path: Path, text: str, *, encoding: str = "utf-8") -> Non
             pass
 
 
+def append_private_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    """Durably append to a sensitive log without following or mutating aliases."""
+
+    descriptor = open_private_file_descriptor(Path(path))
+    try:
+        os.lseek(descriptor, 0, os.SEEK_END)
+        _write_private_bytes(descriptor, text.encode(encoding))
+        _sync_private_file(descriptor)
+    finally:
+        os.close(descriptor)
+
+
 def write_private_text_exclusive(
     path: Path,
     text: str,
@@ -291,26 +357,32 @@ def harden_private_sqlite_files(path: Path) -> None:
         harden_private_file(candidate, missing_ok=True)
 
 
-def reset_disposable_private_sqlite_files(path: Path) -> None:
+def reset_disposable_private_sqlite_files(
+    path: Path,
+    *,
+    companions: tuple[Path, ...] = (),
+) -> None:
     """Remove one disposable SQLite database and its exact transient siblings.
 
     This helper is intentionally narrower than a generic recursive cleanup.  It
     validates every existing artifact as a current-user-owned, single-link
-    regular file before unlinking any of them.  The caller can then recreate the
-    index from its canonical source of truth.
+    regular file before unlinking any of them.  ``companions`` names extra
+    derived files in the same directory, such as a vector matrix, that are
+    removed under the same rules.  The caller can then recreate the index from
+    its canonical source of truth.
     """
 
     resolved = Path(path)
     if resolved.suffix.lower() == ".mv2":
         raise ValueError("Refusing to reset a Memvid .mv2 path as SQLite storage")
     ensure_private_directory(resolved.parent)
-    candidates = sqlite_artifact_paths(resolved)
+    candidates = sqlite_artifact_paths(resolved) + tuple(Path(item) for item in companions)
     if any(candidate.parent != resolved.parent for candidate in candidates):
         raise ValueError("SQLite cleanup candidates must share one direct parent")
 
     if os.name == "nt":
         # Windows cannot unlink an open file. Validate the complete set first,
-        # then remove only the four exact SQLite artifact names.
+        # then remove only the exact SQLite and companion artifact names.
         for candidate in candidates:
             harden_private_file(candidate, missing_ok=True)
         for candidate in candidates:
@@ -414,7 +486,10 @@ def memory_artifact_paths(path: Path) -> tuple[Path, ...]:
     return (
         path,
         path.with_suffix(".memory.json"),
+        path.with_suffix(".memory.bin"),
+        path.with_suffix(".memory.log"),
         path.with_suffix(f"{path.suffix}.records.json"),
+        path.with_suffix(f"{path.suffix}.records.log"),
     )
 
 
@@ -1,4 +1,4 @@
-from .indexer import RepositoryIndex
+from .indexer import RepositoryIndex, RepositoryRebuild
 from .models import (
     DEFAULT_QUERY_LIMIT,
     MAX_QUERY_LIMIT,
@@ -10,8 +10,10 @@ from .models import (
     IndexLimits,
     IndexQueryResult,
     IndexStatus,
+    RebuildProgress,
     ReferenceRecord,
     RepositoryChangedDuringIndexingError,
+    RepositoryIndexCancelledError,
     RepositoryIndexError,
     RepositoryRootMismatchError,
     SymbolRecord,
@@ -29,10 +31,13 @@ __all__ = [
     "IndexStatus",
     "MAX_QUERY_LIMIT",
     "MAX_QUERY_OFFSET",
+    "RebuildProgress",
     "ReferenceRecord",
     "RepositoryChangedDuringIndexingError",
     "RepositoryIndex",
+    "RepositoryIndexCancelledError",
     "RepositoryIndexError",
+    "RepositoryRebuild",
     "RepositoryRootMismatchError",
     "SymbolRecord",
     "TestRelationshipRecord",
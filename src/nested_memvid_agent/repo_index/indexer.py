@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
 import os
 import re
 import stat
 import subprocess
+import threading
+from collections import deque
 from collections.abc import Callable, Iterator, Sequence
-from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager
 from datetime import UTC, datetime
+from multiprocessing.context import BaseContext
 from pathlib import Path, PurePosixPath
 from typing import Any, TypeVar
 
@@ -25,8 +31,11 @@ from .models import (
     IndexLimits,
     IndexQueryResult,
     IndexStatus,
+    ParsedFile,
+    RebuildProgress,
     ReferenceRecord,
     RepositoryChangedDuringIndexingError,
+    RepositoryIndexCancelledError,
     RepositoryIndexError,
     RepositoryRootMismatchError,
     RepositorySnapshot,
@@ -34,7 +43,13 @@ from .models import (
     SymbolRecord,
     TestRelationshipRecord,
 )
-from .parsers import PARSER_VERSIONS, language_for_path, parse_file, parser_version
+from .parsers import (
+    PARSER_VERSIONS,
+    language_for_path,
+    parse_chunk,
+    parse_file,
+    parser_version,
+)
 from .store import (
     SCHEMA_VERSION,
     RepoIndexStore,
@@ -44,6 +59,12 @@ from .store import (
 )
 
 _PLATFORM_OS: Any = os
+_MAX_PARSE_WORKERS = 8
+# Below this many changed files, starting parse workers costs more than it saves.
+_PARALLEL_PARSE_MIN_FILES = 64
+_PARSE_CHUNK_FILES = 32
+_PARSE_CHUNK_BYTES = 1_048_576
+_PARSE_CHUNKS_PER_WORKER = 2
 
 _VALID_PROJECT_ID = re.compile(r"\A[A-Za-z0-9][A-Za-z0-9._-]{0,127}\Z")
 _GIT_OBJECT_ID = re.compile(r"\A[0-9a-fA-F]{40,64}\Z")
@@ -92,13 +113,21 @@ class RepositoryIndex:
         index_path: Path | None = None,
         limits: IndexLimits | None = None,
         create: bool = True,
+        parse_workers: int | None = None,
     ) -> None:
         if _VALID_PROJECT_ID.fullmatch(project_id) is None:
             raise ValueError(
                 "project_id must start with a letter or digit and contain only "
                 "letters, digits, dots, underscores, and hyphens"
             )
+        if parse_workers is not None and (
+            isinstance(parse_workers, bool) or parse_workers < 1
+        ):
+            raise ValueError("parse_workers must be positive")
         self.project_id = project_id
+        self.parse_workers = (
+            parse_workers if parse_workers is not None else _default_parse_workers()
+        )
         self._read_only = not create
         self.limits = limits or IndexLimits()
         self.repository_root = _canonical_root(repository_root)
@@ -143,20 +172,48 @@ class RepositoryIndex:
             allow_migration=create,
         )
 
-    def rebuild(self) -> BuildReport:
+    def rebuild(
+        self,
+        *,
+        progress: Callable[[RebuildProgress], None] | None = None,
+        cancel: threading.Event | None = None,
+        checkpoint_files: int | None = None,
+    ) -> BuildReport:
+        """Bring the index up to date with the repository.
+
+        Changed files are read and hashed on this thread and parsed in chunks
+        on up to ``parse_workers`` processes. Results are applied in scan
+        order, so the published rows match a sequential build. ``progress`` is
+        called on this thread as files complete. Setting ``cancel`` stops the
+        rebuild with :class:`RepositoryIndexCancelledError` before the next
+        work unit. With ``checkpoint_files``, every that many parsed files are
+        published early as a stale generation that queries expose through
+        ``include_stale_diagnostics``; the next rebuild reuses them.
+        """
+
         if self._read_only:
             raise RepositoryIndexError(
                 "repository index was opened read-only and cannot be rebuilt"
             )
+        if checkpoint_files is not None and (
+            isinstance(checkpoint_files, bool) or checkpoint_files < 1
+        ):
+            raise ValueError("checkpoint_files must be positive")
         with self._root_descriptor() as (root_descriptor, root_identity):
             self._store.assert_root_identity(root_identity)
             before = self._snapshot(root_descriptor)
-            force_reparse = self._store.metadata().parser_versions != self._parser_versions
+            indexed_parser_versions = self._store.metadata().parser_versions
+            force_reparse = indexed_parser_versions != self._parser_versions
             stored = self._store.stored_files()
+            pending: list[CandidateFile] = []
             changed: list[IndexedCandidate] = []
+            unpublished: list[IndexedCandidate] = []
             reused_digests: dict[str, str] = {}
+            checkpoint_digests = {path: state.digest for path, state in stored.items()}
             skipped = before.skipped_files
             coverage_complete = before.coverage_complete
+            processed = 0
+            checkpoints = 0
 
             for candidate in before.candidates:
                 previous = stored.get(candidate.relative_path)
@@ -171,12 +228,58 @@ class RepositoryIndex:
                 ):
                     reused_digests[candidate.relative_path] = previous.digest
                     continue
-                indexed = self._index_candidate(candidate, root_descriptor)
-                if indexed is None:
-                    skipped += 1
-                    coverage_complete = False
-                    continue
-                changed.append(indexed)
+                pending.append(candidate)
+
+            def report(*, complete: bool = False) -> None:
+                if progress is None:
+                    return
+                progress(
+                    RebuildProgress(
+                        candidate_files=len(before.candidates),
+                        reused_files=len(reused_digests),
+                        parse_files=len(pending),
+                        parsed_files=processed,
+                        skipped_files=skipped,
+                        published_files=len(changed) - len(unpublished),
+                        checkpoints=checkpoints,
+                        complete=complete,
+                    )
+                )
+
+            report()
+            with closing(
+                self._index_candidates(pending, root_descriptor, cancel=cancel)
+            ) as results:
+                for indexed in results:
+                    processed += 1
+                    if indexed is None:
+                        skipped += 1
+                        coverage_complete = False
+                    else:
+                        changed.append(indexed)
+                        unpublished.append(indexed)
+                    if checkpoint_files is not None and len(unpublished) >= checkpoint_files:
+                        checkpoint_digests.update(
+                            (item.candidate.relative_path, item.digest) for item in unpublished
+                        )
+                        # Checkpoints keep the indexed parser versions so an
+                        # interrupted reparse is still forced on the next rebuild.
+                        self._store.apply_rebuild(
+                            observed_root=root_identity,
+                            changed=unpublished,
+                            deleted_paths=(),
+                            aggregate_digest=_aggregate_digest(checkpoint_digests),
+                            freshness_fingerprint="",
+                            coverage_complete=False,
+                            indexed_at=datetime.now(UTC).isoformat(),
+                            parser_versions=indexed_parser_versions,
+                            git_head=before.git_head,
+                            git_tree=before.git_tree,
+                        )
+                        unpublished = []
+                        checkpoints += 1
+                    report()
+            _raise_if_cancelled(cancel)
 
             current_digests = dict(reused_digests)
             current_digests.update((item.candidate.relative_path, item.digest) for item in changed)
@@ -193,7 +296,7 @@ class RepositoryIndex:
                 )
             self._store.apply_rebuild(
                 observed_root=root_identity,
-                changed=changed,
+                changed=unpublished,
                 deleted_paths=deleted,
                 aggregate_digest=aggregate_digest,
                 freshness_fingerprint=after.fingerprint,
@@ -203,6 +306,8 @@ class RepositoryIndex:
                 git_head=after.git_head,
                 git_tree=after.git_tree,
             )
+            unpublished = []
+            report(complete=True)
             return BuildReport(
                 aggregate_digest=aggregate_digest,
                 changed_files=len(changed),
@@ -214,6 +319,11 @@ class RepositoryIndex:
                 git_tree=after.git_tree,
             )
 
+    def start_rebuild(self, *, checkpoint_files: int | None = None) -> RepositoryRebuild:
+        """Run :meth:`rebuild` on a background thread and return its handle."""
+
+        return RepositoryRebuild(self, checkpoint_files=checkpoint_files)
+
     def status(self) -> IndexStatus:
         with self._root_descriptor() as (root_descriptor, observed_root):
             metadata = self._store.metadata()
@@ -248,16 +358,19 @@ class RepositoryIndex:
         *,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        cursor: str | None = None,
         include_stale_diagnostics: bool = False,
         path_prefixes: Sequence[str] = (),
     ) -> IndexQueryResult[FileRecord]:
         bounded_limit = _validate_query_limit(limit)
         bounded_offset = _validate_query_offset(offset)
+        bounded_cursor = _validate_query_cursor(cursor, offset=bounded_offset)
         bounded_prefixes = _validate_path_prefixes(path_prefixes)
         return self._query(
             lambda: self._store.files(
                 limit=bounded_limit,
                 offset=bounded_offset,
+                cursor=bounded_cursor,
                 path_prefixes=bounded_prefixes,
             ),
             include_stale_diagnostics=include_stale_diagnostics,
@@ -269,17 +382,20 @@ class RepositoryIndex:
         *,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        cursor: str | None = None,
         include_stale_diagnostics: bool = False,
         path_prefixes: Sequence[str] = (),
     ) -> IndexQueryResult[SymbolRecord]:
         bounded_limit = _validate_query_limit(limit)
         bounded_offset = _validate_query_offset(offset)
+        bounded_cursor = _validate_query_cursor(cursor, offset=bounded_offset)
         bounded_prefixes = _validate_path_prefixes(path_prefixes)
         return self._query(
             lambda: self._store.symbols(
                 query,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                cursor=bounded_cursor,
                 path_prefixes=bounded_prefixes,
             ),
             include_stale_diagnostics=include_stale_diagnostics,
@@ -291,17 +407,20 @@ class RepositoryIndex:
         *,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        cursor: str | None = None,
         include_stale_diagnostics: bool = False,
         path_prefixes: Sequence[str] = (),
     ) -> IndexQueryResult[ImportRecord]:
         bounded_limit = _validate_query_limit(limit)
         bounded_offset = _validate_query_offset(offset)
+        bounded_cursor = _validate_query_cursor(cursor, offset=bounded_offset)
         bounded_prefixes = _validate_path_prefixes(path_prefixes)
         return self._query(
             lambda: self._store.imports(
                 query,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                cursor=bounded_cursor,
                 path_prefixes=bounded_prefixes,
             ),
             include_stale_diagnostics=include_stale_diagnostics,
@@ -313,17 +432,20 @@ class RepositoryIndex:
         *,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        cursor: str | None = None,
         include_stale_diagnostics: bool = False,
         path_prefixes: Sequence[str] = (),
     ) -> IndexQueryResult[ReferenceRecord]:
         bounded_limit = _validate_query_limit(limit)
         bounded_offset = _validate_query_offset(offset)
+        bounded_cursor = _validate_query_cursor(cursor, offset=bounded_offset)
         bounded_prefixes = _validate_path_prefixes(path_prefixes)
         return self._query(
             lambda: self._store.references(
                 name,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                cursor=bounded_cursor,
                 path_prefixes=bounded_prefixes,
             ),
             include_stale_diagnostics=include_stale_diagnostics,
@@ -335,17 +457,20 @@ class RepositoryIndex:
         *,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        cursor: str | None = None,
         include_stale_diagnostics: bool = False,
         path_prefixes: Sequence[str] = (),
     ) -> IndexQueryResult[TestRelationshipRecord]:
         bounded_limit = _validate_query_limit(limit)
         bounded_offset = _validate_query_offset(offset)
+        bounded_cursor = _validate_query_cursor(cursor, offset=bounded_offset)
         bounded_prefixes = _validate_path_prefixes(path_prefixes)
         return self._query(
             lambda: self._store.tests_for(
                 symbol_name,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                cursor=bounded_cursor,
                 path_prefixes=bounded_prefixes,
             ),
             include_stale_diagnostics=include_stale_diagnostics,
@@ -393,6 +518,7 @@ class RepositoryIndex:
             index_digest=metadata.aggregate_digest,
             truncated=page.truncated,
             next_offset=page.next_offset,
+            next_cursor=page.next_cursor,
         )
 
     @staticmethod
@@ -439,6 +565,77 @@ class RepositoryIndex:
             inode=int(info.st_ino),
         )
 
+    def _index_candidates(
+        self,
+        candidates: Sequence[CandidateFile],
+        root_descriptor: int | None,
+        *,
+        cancel: threading.Event | None,
+    ) -> Iterator[IndexedCandidate | None]:
+        """Read, hash and parse ``candidates``, yielding results in input order.
+
+        At most ``_PARSE_CHUNKS_PER_WORKER`` chunks per worker are read ahead,
+        which bounds the file contents held while workers parse.
+        """
+
+        workers = min(self.parse_workers, -(-len(candidates) // _PARSE_CHUNK_FILES))
+        if workers <= 1 or len(candidates) < _PARALLEL_PARSE_MIN_FILES:
+            for candidate in candidates:
+                _raise_if_cancelled(cancel)
+                yield self._index_candidate(candidate, root_descriptor)
+            return
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_parse_process_context(),
+        )
+        in_flight: deque[
+            tuple[list[tuple[CandidateFile, str | None]], Future[tuple[ParsedFile, ...]]]
+        ] = deque()
+        try:
+            for chunk in self._read_chunks(candidates, root_descriptor, cancel=cancel):
+                work = [
+                    (candidate.path, content, language_for_path(candidate.path))
+                    for candidate, content in chunk
+                    if content is not None
+                ]
+                in_flight.append((chunk, executor.submit(parse_chunk, work)))
+                if len(in_flight) >= workers * _PARSE_CHUNKS_PER_WORKER:
+                    yield from _indexed_chunk(*in_flight.popleft())
+            while in_flight:
+                _raise_if_cancelled(cancel)
+                yield from _indexed_chunk(*in_flight.popleft())
+        except BrokenProcessPool as exc:
+            raise RepositoryIndexError(
+                "repository index parse workers stopped unexpectedly"
+            ) from exc
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _read_chunks(
+        self,
+        candidates: Sequence[CandidateFile],
+        root_descriptor: int | None,
+        *,
+        cancel: threading.Event | None,
+    ) -> Iterator[list[tuple[CandidateFile, str | None]]]:
+        chunk: list[tuple[CandidateFile, str | None]] = []
+        chunk_bytes = 0
+        for candidate in candidates:
+            _raise_if_cancelled(cancel)
+            content = _read_stable_text(
+                candidate,
+                self.limits.max_file_bytes,
+                root_descriptor=root_descriptor,
+            )
+            chunk.append((candidate, content))
+            chunk_bytes += candidate.size
+            if len(chunk) >= _PARSE_CHUNK_FILES or chunk_bytes >= _PARSE_CHUNK_BYTES:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+        if chunk:
+            yield chunk
+
     def _index_candidate(
         self, candidate: CandidateFile, root_descriptor: int | None
     ) -> IndexedCandidate | None:
@@ -449,15 +646,10 @@ class RepositoryIndex:
         )
         if content is None:
             return None
-        language = language_for_path(candidate.path)
-        raw = content.encode("utf-8")
-        return IndexedCandidate(
-            candidate=candidate,
-            digest=hashlib.sha256(raw).hexdigest(),
-            language=language,
-            parser_version=parser_version(language),
-            is_test=_is_test_path(Path(candidate.relative_path)),
-            parsed=parse_file(candidate.path, content, language),
+        return _indexed_candidate(
+            candidate,
+            content,
+            parse_file(candidate.path, content, language_for_path(candidate.path)),
         )
 
     @contextmanager
@@ -495,6 +687,109 @@ class RepositoryIndex:
                 os.close(descriptor)
 
 
+class RepositoryRebuild:
+    """A :meth:`RepositoryIndex.rebuild` running on a background thread.
+
+    Queries on the same index keep answering from the last published
+    generation while it runs, including checkpoints as stale diagnostics.
+    """
+
+    def __init__(self, index: RepositoryIndex, *, checkpoint_files: int | None) -> None:
+        self._cancel = threading.Event()
+        self._progress_lock = threading.Lock()
+        self._progress: RebuildProgress | None = None
+        self._future: Future[BuildReport] = Future()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(index, checkpoint_files),
+            name=f"repo-index-rebuild-{index.project_id}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def progress(self) -> RebuildProgress | None:
+        with self._progress_lock:
+            return self._progress
+
+    def cancel(self) -> None:
+        """Ask the rebuild to stop before its next work unit."""
+
+        self._cancel.set()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> BuildReport:
+        """Wait for the report, re-raising the rebuild's error if it failed."""
+
+        return self._future.result(timeout=timeout)
+
+    def _record(self, progress: RebuildProgress) -> None:
+        with self._progress_lock:
+            self._progress = progress
+
+    def _run(self, index: RepositoryIndex, checkpoint_files: int | None) -> None:
+        self._future.set_running_or_notify_cancel()
+        try:
+            report = index.rebuild(
+                progress=self._record,
+                cancel=self._cancel,
+                checkpoint_files=checkpoint_files,
+            )
+        except BaseException as exc:  # noqa: BLE001 - delivered through result()
+            self._future.set_exception(exc)
+        else:
+            self._future.set_result(report)
+
+
+def _default_parse_workers() -> int:
+    sched_getaffinity = getattr(os, "sched_getaffinity", None)
+    available = len(sched_getaffinity(0)) if sched_getaffinity else os.cpu_count() or 1
+    return max(1, min(_MAX_PARSE_WORKERS, available))
+
+
+def _parse_process_context() -> BaseContext:
+    # Forking a threaded server can copy held locks into the child. The fork
+    # server starts from a clean interpreter and keeps the parsers preloaded
+    # for later rebuilds in the same process.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([parse_chunk.__module__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _indexed_chunk(
+    chunk: list[tuple[CandidateFile, str | None]],
+    future: Future[tuple[ParsedFile, ...]],
+) -> Iterator[IndexedCandidate | None]:
+    parsed = iter(future.result())
+    for candidate, content in chunk:
+        yield None if content is None else _indexed_candidate(candidate, content, next(parsed))
+
+
+def _indexed_candidate(
+    candidate: CandidateFile,
+    content: str,
+    parsed: ParsedFile,
+) -> IndexedCandidate:
+    language = language_for_path(candidate.path)
+    return IndexedCandidate(
+        candidate=candidate,
+        digest=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        language=language,
+        parser_version=parser_version(language),
+        is_test=_is_test_path(Path(candidate.relative_path)),
+        parsed=parsed,
+    )
+
+
+def _raise_if_cancelled(cancel: threading.Event | None) -> None:
+    if cancel is not None and cancel.is_set():
+        raise RepositoryIndexCancelledError("repository index rebuild was cancelled")
+
+
 def _canonical_root(path: Path) -> Path:
     expanded = path.expanduser().absolute()
     try:
@@ -1003,6 +1298,16 @@ def _validate_query_offset(offset: int) -> int:
     return offset
 
 
+def _validate_query_cursor(cursor: str | None, *, offset: int) -> str | None:
+    if cursor is None:
+        return None
+    if not isinstance(cursor, str) or not cursor:
+        raise ValueError("cursor must be a non-empty string")
+    if offset:
+        raise ValueError("cursor and offset cannot be combined")
+    return cursor
+
+
 def _validate_path_prefixes(prefixes: Sequence[str]) -> tuple[str, ...]:
     normalized: set[str] = set()
     for raw in prefixes:
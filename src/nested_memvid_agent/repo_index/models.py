@@ -27,6 +27,10 @@ class RepositoryChangedDuringIndexingError(RepositoryIndexError):
     """The repository changed while a candidate snapshot was being indexed."""
 
 
+class RepositoryIndexCancelledError(RepositoryIndexError):
+    """A rebuild stopped on request; checkpoints it already published remain."""
+
+
 @dataclass(frozen=True)
 class IndexLimits:
     max_file_bytes: int = 1_000_000
@@ -85,6 +89,24 @@ class BuildReport:
     git_tree: str | None
 
 
+@dataclass(frozen=True)
+class RebuildProgress:
+    """How far a running rebuild has got.
+
+    ``published_files`` counts parsed files already visible, as stale
+    diagnostics, through a checkpoint generation.
+    """
+
+    candidate_files: int
+    reused_files: int
+    parse_files: int
+    parsed_files: int
+    skipped_files: int
+    published_files: int
+    checkpoints: int
+    complete: bool = False
+
+
 @dataclass(frozen=True)
 class FileRecord:
     id: int
@@ -150,6 +172,7 @@ class IndexQueryResult(Generic[RecordT]):
     index_digest: str
     truncated: bool = False
     next_offset: int | None = None
+    next_cursor: str | None = None
 
 
 @dataclass(frozen=True)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import ast
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 from .models import ParsedFile, ParsedImport, ParsedReference, ParsedSymbol
@@ -118,6 +118,16 @@ def parse_file(path: Path, content: str, language: str) -> ParsedFile:
     return parser(content)
 
 
+def parse_chunk(work: Sequence[tuple[Path, str, str]]) -> tuple[ParsedFile, ...]:
+    """Parse one ``(path, content, language)`` work unit in order.
+
+    This is the entry point parse workers run, so it must stay importable at
+    module level and return only picklable values.
+    """
+
+    return tuple(parse_file(path, content, language) for path, content, language in work)
+
+
 class _PythonVisitor(ast.NodeVisitor):
     def __init__(self) -> None:
         self._scope: list[tuple[str, str]] = []
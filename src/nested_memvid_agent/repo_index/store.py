@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
 import json
@@ -9,7 +10,7 @@ import sqlite3
 import stat
 import threading
 from collections import OrderedDict
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, replace
 from pathlib import Path
@@ -30,7 +31,10 @@ from .models import (
     TestRelationshipRecord,
 )
 
-SCHEMA_VERSION = 5
+SCHEMA_VERSION = 6
+# Version 5 sidecars carry the same authenticated generation checkpoint as the
+# current schema and differ only by the derived search indexes.
+_CHECKPOINT_SCHEMA_VERSIONS = frozenset({5, SCHEMA_VERSION})
 _PLATFORM_OS: Any = os
 _APPLICATION_ID = 0x4B535452
 _GENERATION_HISTORY_LIMIT = 64
@@ -46,6 +50,13 @@ _VERIFIED_CONTENT_CACHE: OrderedDict[
     None,
 ] = OrderedDict()
 _VERIFIED_CONTENT_CACHE_LOCK = threading.Lock()
+_READ_HANDLE_LIMIT = 16
+_READ_HANDLE_IDLE_CONNECTIONS = 4
+_READ_HANDLES: OrderedDict[str, _PinnedReadHandle] = OrderedDict()
+_READ_HANDLES_LOCK = threading.Lock()
+_SEARCH_MIN_QUERY_CHARS = 3
+_SEARCH_INDEX_SUPPORT: bool | None = None
+_QUERY_CURSOR_MAX_CHARS = 4096
 StoreRecordT = TypeVar("StoreRecordT")
 
 
@@ -144,11 +155,93 @@ class _LockAuthority:
     authorization_tag: str
 
 
+class _PinnedReadHandle:
+    """Open descriptors and idle connections for one verified generation.
+
+    Handles are shared by every store over the same sidecar path. The lock
+    descriptor is a private open file description, so concurrent readers of a
+    handle share one ``flock`` and a publication still waits for all of them.
+    """
+
+    def __init__(
+        self,
+        *,
+        generation_id: str,
+        database_descriptor: int,
+        database_binding: _FileBinding,
+        parent_descriptor: int,
+        parent_snapshot: _DirectorySnapshot,
+        lock_descriptor: int,
+        lock_binding: _FileBinding,
+        witnesses: tuple[tuple[str, _FileBinding], ...],
+    ) -> None:
+        self.generation_id = generation_id
+        self.database_descriptor = database_descriptor
+        self.database_binding = database_binding
+        self.parent_descriptor = parent_descriptor
+        self.parent_snapshot = parent_snapshot
+        self.lock_descriptor = lock_descriptor
+        self.lock_binding = lock_binding
+        self.witnesses = witnesses
+        self.users = 0
+        self.retired = False
+        self._lock_handle = cast(IO[str], os.fdopen(lock_descriptor, "rb", closefd=False))
+        self._share_lock = threading.Lock()
+        self._sharers = 0
+        self._idle_lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the sidecar's shared lock for as long as any reader needs it."""
+
+        with self._share_lock:
+            if not self._sharers:
+                lock_shared(self._lock_handle)
+            self._sharers += 1
+        try:
+            yield
+        finally:
+            with self._share_lock:
+                self._sharers -= 1
+                if not self._sharers:
+                    unlock(self._lock_handle)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._idle_lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is None:
+            connection = _connect_pinned_descriptor(self.database_descriptor)
+        try:
+            yield connection
+        finally:
+            self.adopt(connection)
+
+    def adopt(self, connection: sqlite3.Connection) -> None:
+        with self._idle_lock:
+            if len(self._idle) < _READ_HANDLE_IDLE_CONNECTIONS:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        self._lock_handle.close()
+        os.close(self.lock_descriptor)
+        os.close(self.database_descriptor)
+        os.close(self.parent_descriptor)
+
+
 @dataclass(frozen=True)
 class StoreQueryPage(Generic[StoreRecordT]):
     records: tuple[StoreRecordT, ...]
     truncated: bool
     next_offset: int | None
+    next_cursor: str | None = None
 
 
 @dataclass(frozen=True)
@@ -200,7 +293,7 @@ class RepoIndexStore:
             )
         with self._connection(write=True, integrity_check=True) as connection:
             version = int(connection.execute("PRAGMA user_version").fetchone()[0])
-            if version not in {0, 1, 2, 3, 4, SCHEMA_VERSION}:
+            if version not in {0, 1, 2, 3, 4, 5, SCHEMA_VERSION}:
                 raise RepositoryIndexError(f"unsupported repository index schema version {version}")
             if version == 0:
                 self._create_schema(connection)
@@ -209,15 +302,21 @@ class RepoIndexStore:
                 self._migrate_schema_v2(connection)
                 self._migrate_schema_v3(connection)
                 self._migrate_schema_v4(connection)
+                self._migrate_schema_v5(connection)
             elif version == 2:
                 self._migrate_schema_v2(connection)
                 self._migrate_schema_v3(connection)
                 self._migrate_schema_v4(connection)
+                self._migrate_schema_v5(connection)
             elif version == 3:
                 self._migrate_schema_v3(connection)
                 self._migrate_schema_v4(connection)
+                self._migrate_schema_v5(connection)
             elif version == 4:
                 self._migrate_schema_v4(connection)
+                self._migrate_schema_v5(connection)
+            elif version == 5:
+                self._migrate_schema_v5(connection)
             application_id = int(connection.execute("PRAGMA application_id").fetchone()[0])
             if application_id != _APPLICATION_ID:
                 raise RepositoryIndexError("repository index database identity marker is invalid")
@@ -262,6 +361,7 @@ class RepoIndexStore:
                 return False
             descriptor, opened_binding = self._open_database_descriptor(parent_descriptor)
             connection: sqlite3.Connection | None = None
+            pinned_handle = False
             try:
                 if opened_binding != binding:
                     raise RepositoryIndexError(
@@ -295,6 +395,13 @@ class RepoIndexStore:
                         raise RepositoryIndexError(
                             "repository index database changed during initialization"
                         )
+                    pinned_handle = self._pin_read_handle(
+                        parent_descriptor,
+                        descriptor=descriptor,
+                        binding=binding,
+                        parent_snapshot=parent_snapshot,
+                        connection=connection,
+                    )
                     return True
                 self._validate_legacy_admission(
                     connection,
@@ -318,9 +425,10 @@ class RepoIndexStore:
                     "repository index database could not be inspected"
                 ) from exc
             finally:
-                if connection is not None:
-                    connection.close()
-                os.close(descriptor)
+                if not pinned_handle:
+                    if connection is not None:
+                        connection.close()
+                    os.close(descriptor)
 
     def _assert_project_id(
         self,
@@ -533,27 +641,38 @@ class RepoIndexStore:
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: Sequence[str] = (),
     ) -> StoreQuerySnapshot[FileRecord]:
         bounded_limit = _validated_query_limit(limit)
         bounded_offset = _validated_query_offset(offset)
+        scope = _query_scope("files", None, path_prefixes)
+        after = _decoded_query_cursor(cursor, scope=scope)
         parameters: list[object] = []
         path_predicate = _path_scope_predicate(
             "path",
             path_prefixes,
             parameters,
         )
-        where = f"WHERE {path_predicate}" if path_predicate else ""
-        parameters.extend((bounded_limit + 1, bounded_offset))
         metadata, rows = self._select_records(
-            f"""
-            SELECT id, path, digest, size, language, parser_version, is_test
-            FROM files
-            {where}
-            ORDER BY path, id
-            LIMIT ? OFFSET ?
-            """,
-            tuple(parameters),
+            *_keyset_query(
+                columns=(
+                    "id",
+                    "path",
+                    "digest",
+                    "size",
+                    "language",
+                    "parser_version",
+                    "is_test",
+                ),
+                source="files",
+                predicates=(path_predicate,) if path_predicate else (),
+                order=("path", "id"),
+                parameters=parameters,
+                after=after,
+                limit=bounded_limit,
+                offset=bounded_offset,
+            )
         )
         records = tuple(
             FileRecord(
@@ -571,9 +690,11 @@ class RepoIndexStore:
             metadata=metadata,
             page=_query_page(
                 records,
-                row_count=len(rows),
+                rows,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                scope=scope,
+                resumed=after is not None,
             ),
         )
 
@@ -583,40 +704,73 @@ class RepoIndexStore:
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: Sequence[str] = (),
     ) -> StoreQuerySnapshot[SymbolRecord]:
+        """Definitions whose name or qualified name contains ``query``.
+
+        Matches rank exact names first, then name prefixes, then name
+        substrings, then qualified-name-only matches; ties keep path order.
+        """
+
         bounded_limit = _validated_query_limit(limit)
         bounded_offset = _validated_query_offset(offset)
-        predicates: list[str] = []
-        parameters: list[object] = []
-        if query is not None:
-            predicates.append(
-                "(instr(lower(s.name), lower(?)) > 0 "
-                "OR instr(lower(s.qualified_name), lower(?)) > 0)"
+        scope = _query_scope("symbols", query, path_prefixes)
+        after = _decoded_query_cursor(cursor, scope=scope)
+
+        def compose(search_indexes: bool) -> tuple[str, tuple[object, ...]]:
+            parameters: list[object] = []
+            order = [
+                "f.path",
+                "s.line",
+                "s.column_number",
+                "lower(s.name)",
+                "s.name",
+                "s.kind",
+                "lower(s.qualified_name)",
+                "s.qualified_name",
+                "s.id",
+            ]
+            predicates: list[str] = []
+            if query is not None:
+                order.insert(0, _match_rank_expression("s.name", query, parameters))
+                predicates.append(
+                    _substring_predicate(
+                        ("s.name", "s.qualified_name"),
+                        query,
+                        parameters,
+                        search_table="symbol_search" if search_indexes else None,
+                        row_id="s.id",
+                    )
+                )
+            path_predicate = _path_scope_predicate(
+                "f.path",
+                path_prefixes,
+                parameters,
+            )
+            if path_predicate:
+                predicates.append(path_predicate)
+            return _keyset_query(
+                columns=(
+                    "s.id",
+                    "f.path",
+                    "f.digest",
+                    "s.name",
+                    "s.qualified_name",
+                    "s.kind",
+                    "s.line",
+                    "s.column_number",
+                ),
+                source="symbols AS s JOIN files AS f ON f.id = s.file_id",
+                predicates=predicates,
+                order=order,
+                parameters=parameters,
+                after=after,
+                limit=bounded_limit,
+                offset=bounded_offset,
             )
-            parameters.extend((query, query))
-        path_predicate = _path_scope_predicate(
-            "f.path",
-            path_prefixes,
-            parameters,
-        )
-        if path_predicate:
-            predicates.append(path_predicate)
-        where = f"WHERE {' AND '.join(predicates)}" if predicates else ""
-        parameters.extend((bounded_limit + 1, bounded_offset))
-        metadata, rows = self._select_records(
-            f"""
-            SELECT s.id, f.path, f.digest, s.name, s.qualified_name, s.kind,
-                   s.line, s.column_number
-            FROM symbols AS s
-            JOIN files AS f ON f.id = s.file_id
-            {where}
-            ORDER BY f.path, s.line, s.column_number, lower(s.name), s.name,
-                     s.kind, lower(s.qualified_name), s.qualified_name, s.id
-            LIMIT ? OFFSET ?
-            """,
-            tuple(parameters),
-        )
+
+        metadata, rows = self._select_search_records(compose)
         records = tuple(
             SymbolRecord(
                 id=int(row["id"]),
@@ -634,9 +788,11 @@ class RepoIndexStore:
             metadata=metadata,
             page=_query_page(
                 records,
-                row_count=len(rows),
+                rows,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                scope=scope,
+                resumed=after is not None,
             ),
         )
 
@@ -646,38 +802,67 @@ class RepoIndexStore:
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: Sequence[str] = (),
     ) -> StoreQuerySnapshot[ImportRecord]:
+        """Imports whose module contains ``query``, ranked like :meth:`symbols`."""
+
         bounded_limit = _validated_query_limit(limit)
         bounded_offset = _validated_query_offset(offset)
-        predicates: list[str] = []
-        parameters: list[object] = []
-        if query is not None:
-            predicates.append("instr(lower(i.module), lower(?)) > 0")
-            parameters.append(query)
-        path_predicate = _path_scope_predicate(
-            "f.path",
-            path_prefixes,
-            parameters,
-        )
-        if path_predicate:
-            predicates.append(path_predicate)
-        where = f"WHERE {' AND '.join(predicates)}" if predicates else ""
-        parameters.extend((bounded_limit + 1, bounded_offset))
-        metadata, rows = self._select_records(
-            f"""
-            SELECT i.id, f.path, f.digest, i.module, i.imported_name,
-                   i.line, i.column_number
-            FROM imports AS i
-            JOIN files AS f ON f.id = i.file_id
-            {where}
-            ORDER BY f.path, i.line, i.column_number, lower(i.module), i.module,
-                     lower(coalesce(i.imported_name, '')),
-                     coalesce(i.imported_name, ''), i.id
-            LIMIT ? OFFSET ?
-            """,
-            tuple(parameters),
-        )
+        scope = _query_scope("imports", query, path_prefixes)
+        after = _decoded_query_cursor(cursor, scope=scope)
+
+        def compose(search_indexes: bool) -> tuple[str, tuple[object, ...]]:
+            parameters: list[object] = []
+            order = [
+                "f.path",
+                "i.line",
+                "i.column_number",
+                "lower(i.module)",
+                "i.module",
+                "lower(coalesce(i.imported_name, ''))",
+                "coalesce(i.imported_name, '')",
+                "i.id",
+            ]
+            predicates: list[str] = []
+            if query is not None:
+                order.insert(0, _match_rank_expression("i.module", query, parameters))
+                predicates.append(
+                    _substring_predicate(
+                        ("i.module",),
+                        query,
+                        parameters,
+                        search_table="import_search" if search_indexes else None,
+                        row_id="i.id",
+                    )
+                )
+            path_predicate = _path_scope_predicate(
+                "f.path",
+                path_prefixes,
+                parameters,
+            )
+            if path_predicate:
+                predicates.append(path_predicate)
+            return _keyset_query(
+                columns=(
+                    "i.id",
+                    "f.path",
+                    "f.digest",
+                    "i.module",
+                    "i.imported_name",
+                    "i.line",
+                    "i.column_number",
+                ),
+                source="imports AS i JOIN files AS f ON f.id = i.file_id",
+                predicates=predicates,
+                order=order,
+                parameters=parameters,
+                after=after,
+                limit=bounded_limit,
+                offset=bounded_offset,
+            )
+
+        metadata, rows = self._select_search_records(compose)
         records = tuple(
             ImportRecord(
                 id=int(row["id"]),
@@ -694,9 +879,11 @@ class RepoIndexStore:
             metadata=metadata,
             page=_query_page(
                 records,
-                row_count=len(rows),
+                rows,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                scope=scope,
+                resumed=after is not None,
             ),
         )
 
@@ -706,10 +893,13 @@ class RepoIndexStore:
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: Sequence[str] = (),
     ) -> StoreQuerySnapshot[ReferenceRecord]:
         bounded_limit = _validated_query_limit(limit)
         bounded_offset = _validated_query_offset(offset)
+        scope = _query_scope("references", name, path_prefixes)
+        after = _decoded_query_cursor(cursor, scope=scope)
         predicates: list[str] = []
         parameters: list[object] = []
         if name is not None:
@@ -722,18 +912,31 @@ class RepoIndexStore:
         )
         if path_predicate:
             predicates.append(path_predicate)
-        where = f"WHERE {' AND '.join(predicates)}" if predicates else ""
-        parameters.extend((bounded_limit + 1, bounded_offset))
         metadata, rows = self._select_records(
-            f"""
-            SELECT r.id, f.path, f.digest, r.name, r.line, r.column_number
-            FROM lexical_references AS r
-            JOIN files AS f ON f.id = r.file_id
-            {where}
-            ORDER BY f.path, r.line, r.column_number, lower(r.name), r.name, r.id
-            LIMIT ? OFFSET ?
-            """,
-            tuple(parameters),
+            *_keyset_query(
+                columns=(
+                    "r.id",
+                    "f.path",
+                    "f.digest",
+                    "r.name",
+                    "r.line",
+                    "r.column_number",
+                ),
+                source="lexical_references AS r JOIN files AS f ON f.id = r.file_id",
+                predicates=predicates,
+                order=(
+                    "f.path",
+                    "r.line",
+                    "r.column_number",
+                    "lower(r.name)",
+                    "r.name",
+                    "r.id",
+                ),
+                parameters=parameters,
+                after=after,
+                limit=bounded_limit,
+                offset=bounded_offset,
+            )
         )
         records = tuple(
             ReferenceRecord(
@@ -750,9 +953,11 @@ class RepoIndexStore:
             metadata=metadata,
             page=_query_page(
                 records,
-                row_count=len(rows),
+                rows,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                scope=scope,
+                resumed=after is not None,
             ),
         )
 
@@ -762,12 +967,15 @@ class RepoIndexStore:
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: Sequence[str] = (),
     ) -> StoreQuerySnapshot[TestRelationshipRecord]:
         bounded_limit = _validated_query_limit(limit)
         bounded_offset = _validated_query_offset(offset)
+        scope = _query_scope("tests_for", symbol_name, path_prefixes)
+        after = _decoded_query_cursor(cursor, scope=scope)
         parameters: list[object] = [symbol_name]
-        predicates = ["lower(s.name) = lower(?)"]
+        predicates = ["s.name = ? COLLATE NOCASE"]
         symbol_scope = _path_scope_predicate(
             "sf.path",
             path_prefixes,
@@ -780,21 +988,37 @@ class RepoIndexStore:
         )
         if symbol_scope:
             predicates.extend((symbol_scope, test_scope))
-        parameters.extend((bounded_limit + 1, bounded_offset))
         metadata, rows = self._select_records(
-            f"""
-            SELECT tr.id, s.name AS symbol_name, sf.path AS symbol_path,
-                   tf.path AS test_path, tr.relationship, tr.evidence_line
-            FROM test_relationships AS tr
-            JOIN symbols AS s ON s.id = tr.symbol_id
-            JOIN files AS sf ON sf.id = s.file_id
-            JOIN files AS tf ON tf.id = tr.test_file_id
-            WHERE {' AND '.join(predicates)}
-            ORDER BY tf.path, sf.path, s.line, tr.evidence_line,
-                     lower(s.name), s.name, tr.id
-            LIMIT ? OFFSET ?
-            """,
-            tuple(parameters),
+            *_keyset_query(
+                columns=(
+                    "tr.id",
+                    "s.name AS symbol_name",
+                    "sf.path AS symbol_path",
+                    "tf.path AS test_path",
+                    "tr.relationship",
+                    "tr.evidence_line",
+                ),
+                source=(
+                    "test_relationships AS tr "
+                    "JOIN symbols AS s ON s.id = tr.symbol_id "
+                    "JOIN files AS sf ON sf.id = s.file_id "
+                    "JOIN files AS tf ON tf.id = tr.test_file_id"
+                ),
+                predicates=predicates,
+                order=(
+                    "tf.path",
+                    "sf.path",
+                    "s.line",
+                    "tr.evidence_line",
+                    "lower(s.name)",
+                    "s.name",
+                    "tr.id",
+                ),
+                parameters=parameters,
+                after=after,
+                limit=bounded_limit,
+                offset=bounded_offset,
+            )
         )
         records = tuple(
             TestRelationshipRecord(
@@ -811,9 +1035,11 @@ class RepoIndexStore:
             metadata=metadata,
             page=_query_page(
                 records,
-                row_count=len(rows),
+                rows,
                 limit=bounded_limit,
                 offset=bounded_offset,
+                scope=scope,
+                resumed=after is not None,
             ),
         )
 
@@ -827,6 +1053,26 @@ class RepoIndexStore:
             rows = connection.execute(statement, parameters).fetchall()
         return metadata, rows
 
+    def _select_search_records(
+        self,
+        compose: Callable[[bool], tuple[str, tuple[object, ...]]],
+    ) -> tuple[StoredMetadata, list[sqlite3.Row]]:
+        """Run ``compose(search_indexes)`` against the pinned generation.
+
+        Sidecars written by an SQLite build without FTS5 trigram support have
+        no search tables; their queries fall back to scanning.
+        """
+
+        with self._connection() as connection:
+            metadata = self._metadata_from_connection(connection)
+            search_indexes = _search_indexes_supported() and self._table_exists(
+                connection,
+                "symbol_search",
+            )
+            statement, parameters = compose(search_indexes)
+            rows = connection.execute(statement, parameters).fetchall()
+        return metadata, rows
+
     def _create_schema(self, connection: sqlite3.Connection) -> None:
         connection.executescript(
             """
@@ -922,6 +1168,79 @@ class RepoIndexStore:
             CREATE INDEX files_test_idx ON files(is_test);
             """
         )
+        self._create_search_indexes(connection)
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.execute(f"PRAGMA application_id = {_APPLICATION_ID}")
+
+    def _create_search_indexes(self, connection: sqlite3.Connection) -> None:
+        """Create the name and path indexes behind ranked lookups.
+
+        The trigram tables are external-content FTS5 indexes kept in step with
+        their source rows by triggers, including foreign-key cascades, so the
+        rebuild path needs no extra bookkeeping. They are derived data: the
+        existing rows are re-tokenized on creation.
+        """
+
+        connection.executescript(
+            """
+            CREATE INDEX IF NOT EXISTS symbols_name_nocase_idx
+                ON symbols(name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS files_path_nocase_idx
+                ON files(path COLLATE NOCASE);
+            """
+        )
+        if not _search_indexes_supported():
+            return
+        connection.executescript(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS symbol_search USING fts5(
+                name, qualified_name,
+                content = 'symbols', content_rowid = 'id', tokenize = 'trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS symbols_search_insert
+            AFTER INSERT ON symbols BEGIN
+                INSERT INTO symbol_search (rowid, name, qualified_name)
+                VALUES (new.id, new.name, new.qualified_name);
+            END;
+            CREATE TRIGGER IF NOT EXISTS symbols_search_delete
+            AFTER DELETE ON symbols BEGIN
+                INSERT INTO symbol_search (symbol_search, rowid, name, qualified_name)
+                VALUES ('delete', old.id, old.name, old.qualified_name);
+            END;
+            CREATE TRIGGER IF NOT EXISTS symbols_search_update
+            AFTER UPDATE ON symbols BEGIN
+                INSERT INTO symbol_search (symbol_search, rowid, name, qualified_name)
+                VALUES ('delete', old.id, old.name, old.qualified_name);
+                INSERT INTO symbol_search (rowid, name, qualified_name)
+                VALUES (new.id, new.name, new.qualified_name);
+            END;
+            INSERT INTO symbol_search (symbol_search) VALUES ('rebuild');
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS import_search USING fts5(
+                module,
+                content = 'imports', content_rowid = 'id', tokenize = 'trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS imports_search_insert
+            AFTER INSERT ON imports BEGIN
+                INSERT INTO import_search (rowid, module) VALUES (new.id, new.module);
+            END;
+            CREATE TRIGGER IF NOT EXISTS imports_search_delete
+            AFTER DELETE ON imports BEGIN
+                INSERT INTO import_search (import_search, rowid, module)
+                VALUES ('delete', old.id, old.module);
+            END;
+            CREATE TRIGGER IF NOT EXISTS imports_search_update
+            AFTER UPDATE ON imports BEGIN
+                INSERT INTO import_search (import_search, rowid, module)
+                VALUES ('delete', old.id, old.module);
+                INSERT INTO import_search (rowid, module) VALUES (new.id, new.module);
+            END;
+            INSERT INTO import_search (import_search) VALUES ('rebuild');
+            """
+        )
+
+    def _migrate_schema_v5(self, connection: sqlite3.Connection) -> None:
+        self._create_search_indexes(connection)
         connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         connection.execute(f"PRAGMA application_id = {_APPLICATION_ID}")
 
@@ -982,7 +1301,7 @@ class RepoIndexStore:
                 (lineage_id, sequence, generation_id, authorization_tag),
             )
             self._compact_generation_history(connection, current_sequence=sequence)
-        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.execute("PRAGMA user_version = 5")
         connection.execute(f"PRAGMA application_id = {_APPLICATION_ID}")
 
     def _migrate_schema_v1(self, connection: sqlite3.Connection) -> None:
@@ -1699,11 +2018,130 @@ class RepoIndexStore:
         return descriptor, _file_binding(info)
 
     def _connect_pinned_read(self, descriptor: int) -> sqlite3.Connection:
-        if os.name == "posix" and Path("/dev/fd").is_dir():
+        if _read_handles_supported():
             database_uri = f"file:/dev/fd/{descriptor}?mode=ro&immutable=1"
         else:
             database_uri = f"{self.path.as_uri()}?mode=ro&immutable=1"
-        return sqlite3.connect(database_uri, timeout=5.0, uri=True)
+        return sqlite3.connect(
+            database_uri,
+            timeout=5.0,
+            uri=True,
+            check_same_thread=False,
+        )
+
+    def _pin_read_handle(
+        self,
+        parent_descriptor: int | None,
+        *,
+        descriptor: int,
+        binding: _FileBinding,
+        parent_snapshot: _DirectorySnapshot,
+        connection: sqlite3.Connection,
+    ) -> bool:
+        """Keep a just-validated read open for later reads of the same generation.
+
+        Returns whether ``descriptor`` and ``connection`` now belong to the
+        shared handle. Only the bindings observed under the sidecar lock are
+        recorded, so any later change to the canonical database, the lock, a
+        receipt or an immutable artifact sends the next read back through full
+        validation.
+        """
+
+        generation = self._generation
+        verified = self._verified_content
+        lock_binding = self._lock_binding
+        if (
+            not _read_handles_supported()
+            or parent_descriptor is None
+            or generation is None
+            or generation.binding != binding
+            or verified is None
+            or verified.generation_id != generation.generation_id
+            or verified.canonical_binding != binding
+            or lock_binding is None
+        ):
+            return False
+        witnesses: list[tuple[str, _FileBinding]] = []
+        for name in (
+            self._generation_filename(verified.generation_id),
+            self._generation_receipt_filename(verified.generation_id),
+        ):
+            witness = self._relative_file_binding(
+                name,
+                parent_descriptor=parent_descriptor,
+                allow_missing=False,
+            )
+            if witness is None:
+                return False
+            witnesses.append((name, witness))
+        lock_descriptor, _ = self._open_lock_descriptor(parent_descriptor, allow_create=False)
+        try:
+            lock_info = os.fstat(lock_descriptor)
+            if (int(lock_info.st_dev), int(lock_info.st_ino)) != (
+                lock_binding.device,
+                lock_binding.inode,
+            ):
+                raise RepositoryIndexError("repository index lock identity changed")
+            pinned_parent = os.dup(parent_descriptor)
+        except BaseException:
+            os.close(lock_descriptor)
+            raise
+        handle = _PinnedReadHandle(
+            generation_id=generation.generation_id,
+            database_descriptor=descriptor,
+            database_binding=binding,
+            parent_descriptor=pinned_parent,
+            parent_snapshot=parent_snapshot,
+            lock_descriptor=lock_descriptor,
+            lock_binding=_file_binding(lock_info),
+            witnesses=tuple(witnesses),
+        )
+        handle.adopt(connection)
+        _install_read_handle(str(self.path), handle)
+        return True
+
+    def _read_handle_current(self, handle: _PinnedReadHandle) -> bool:
+        """Cheaply confirm nothing the handle was validated against has moved.
+
+        Parent identity changes still fail closed here. Any other difference
+        retires the handle and the caller falls back to full validation.
+        """
+
+        self._verify_parent_bindings()
+        generation = self._generation
+        lock_binding = self._lock_binding
+        if (
+            generation is None
+            or generation.generation_id != handle.generation_id
+            or generation.binding != handle.database_binding
+            or lock_binding is None
+            or (lock_binding.device, lock_binding.inode)
+            != (handle.lock_binding.device, handle.lock_binding.inode)
+        ):
+            return False
+        if (
+            self._directory_snapshot(handle.parent_descriptor) == handle.parent_snapshot
+            and _file_binding(os.fstat(handle.lock_descriptor)) == handle.lock_binding
+            and _file_binding(os.fstat(handle.database_descriptor)) == handle.database_binding
+            and self._relative_file_binding(
+                self.path.name,
+                parent_descriptor=handle.parent_descriptor,
+                allow_missing=True,
+            )
+            == handle.database_binding
+            and all(
+                self._relative_file_binding(
+                    name,
+                    parent_descriptor=handle.parent_descriptor,
+                    allow_missing=True,
+                )
+                == binding
+                for name, binding in handle.witnesses
+            )
+        ):
+            return True
+        _retire_read_handle(str(self.path), handle)
+        return False
 
     def _read_generation_state(
         self,
@@ -1832,10 +2270,11 @@ class RepoIndexStore:
         *,
         binding: _FileBinding,
         parent_descriptor: int | None,
+        accepted_versions: frozenset[int] = frozenset({SCHEMA_VERSION}),
     ) -> _GenerationState:
         application_id = int(connection.execute("PRAGMA application_id").fetchone()[0])
         version = int(connection.execute("PRAGMA user_version").fetchone()[0])
-        if application_id != _APPLICATION_ID or version != SCHEMA_VERSION:
+        if application_id != _APPLICATION_ID or version not in accepted_versions:
             raise RepositoryIndexError("repository index database identity marker is invalid")
         observed = self._read_generation_state(
             connection,
@@ -1880,6 +2319,13 @@ class RepoIndexStore:
         binding: _FileBinding,
         parent_descriptor: int | None,
     ) -> _GenerationState | None:
+        if version in _CHECKPOINT_SCHEMA_VERSIONS:
+            return self._validate_and_bind_generation(
+                connection,
+                binding=binding,
+                parent_descriptor=parent_descriptor,
+                accepted_versions=_CHECKPOINT_SCHEMA_VERSIONS,
+            )
         application_id = int(connection.execute("PRAGMA application_id").fetchone()[0])
         if version == 4:
             if application_id != _APPLICATION_ID:
@@ -3029,10 +3475,32 @@ class RepoIndexStore:
 
     @contextmanager
     def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        handle = _lease_read_handle(str(self.path))
+        if handle is not None:
+            try:
+                with handle.shared():
+                    if self._read_handle_current(handle):
+                        with handle.connection() as pinned:
+                            yield pinned
+                            if _file_binding(
+                                os.fstat(handle.database_descriptor)
+                            ) != handle.database_binding or self._relative_file_binding(
+                                self.path.name,
+                                parent_descriptor=handle.parent_descriptor,
+                                allow_missing=True,
+                            ) != handle.database_binding:
+                                _retire_read_handle(str(self.path), handle)
+                                raise RepositoryIndexError(
+                                    "repository index database changed during read"
+                                )
+                        return
+            finally:
+                _release_read_handle(handle)
         with self._locked_parent(allow_create=False) as parent_descriptor:
             parent_snapshot = self._directory_snapshot(parent_descriptor)
             descriptor, database_binding = self._open_database_descriptor(parent_descriptor)
             connection: sqlite3.Connection | None = None
+            pinned_handle = False
             try:
                 connection = self._connect_pinned_read(descriptor)
                 connection.row_factory = sqlite3.Row
@@ -3058,10 +3526,18 @@ class RepoIndexStore:
                 )
                 if _file_binding(os.fstat(descriptor)) != database_binding:
                     raise RepositoryIndexError("repository index database changed during read")
+                pinned_handle = self._pin_read_handle(
+                    parent_descriptor,
+                    descriptor=descriptor,
+                    binding=database_binding,
+                    parent_snapshot=parent_snapshot,
+                    connection=connection,
+                )
             finally:
-                if connection is not None:
-                    connection.close()
-                os.close(descriptor)
+                if not pinned_handle:
+                    if connection is not None:
+                        connection.close()
+                    os.close(descriptor)
 
     @contextmanager
     def _connection(
@@ -3078,6 +3554,9 @@ class RepoIndexStore:
             raise RepositoryIndexError(
                 "repository index was opened read-only and cannot publish changes"
             )
+        # New readers must not join the pinned generation's shared lock while a
+        # publication is waiting to patch the canonical database in place.
+        _retire_read_handle(str(self.path))
         with self._locked_parent() as parent_descriptor:
             parent_snapshot = self._directory_snapshot(parent_descriptor)
             payload, database_binding = self._read_database_snapshot(
@@ -3219,6 +3698,72 @@ def _verified_content_cache_add(
             _VERIFIED_CONTENT_CACHE.popitem(last=False)
 
 
+def _read_handles_supported() -> bool:
+    # Pinned handles reopen the verified inode through its descriptor. Without
+    # /dev/fd a new connection would resolve the path again.
+    return os.name == "posix" and Path("/dev/fd").is_dir()
+
+
+def _connect_pinned_descriptor(descriptor: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(
+        f"file:/dev/fd/{descriptor}?mode=ro&immutable=1",
+        timeout=5.0,
+        uri=True,
+        check_same_thread=False,
+    )
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA query_only = ON")
+    connection.execute("PRAGMA foreign_keys = ON")
+    return connection
+
+
+def _lease_read_handle(key: str) -> _PinnedReadHandle | None:
+    with _READ_HANDLES_LOCK:
+        handle = _READ_HANDLES.get(key)
+        if handle is None:
+            return None
+        _READ_HANDLES.move_to_end(key)
+        handle.users += 1
+        return handle
+
+
+def _release_read_handle(handle: _PinnedReadHandle) -> None:
+    with _READ_HANDLES_LOCK:
+        handle.users -= 1
+        closing = handle.retired and not handle.users
+    if closing:
+        handle.close()
+
+
+def _install_read_handle(key: str, handle: _PinnedReadHandle) -> None:
+    closing: list[_PinnedReadHandle] = []
+    with _READ_HANDLES_LOCK:
+        previous = _READ_HANDLES.pop(key, None)
+        _READ_HANDLES[key] = handle
+        if previous is not None:
+            previous.retired = True
+            closing.append(previous)
+        while len(_READ_HANDLES) > _READ_HANDLE_LIMIT:
+            _, evicted = _READ_HANDLES.popitem(last=False)
+            evicted.retired = True
+            closing.append(evicted)
+        closing = [item for item in closing if not item.users]
+    for item in closing:
+        item.close()
+
+
+def _retire_read_handle(key: str, handle: _PinnedReadHandle | None = None) -> None:
+    with _READ_HANDLES_LOCK:
+        current = _READ_HANDLES.get(key)
+        if current is None or (handle is not None and current is not handle):
+            return
+        del _READ_HANDLES[key]
+        current.retired = True
+        closing = not current.users
+    if closing:
+        current.close()
+
+
 def _optional_str(value: object) -> str | None:
     if value is None:
         return None
@@ -3256,18 +3801,176 @@ def _path_scope_predicate(
     return f"({' OR '.join(clauses)})"
 
 
+def _search_indexes_supported() -> bool:
+    global _SEARCH_INDEX_SUPPORT
+    if _SEARCH_INDEX_SUPPORT is None:
+        probe = sqlite3.connect(":memory:")
+        try:
+            probe.execute("CREATE VIRTUAL TABLE probe USING fts5(value, tokenize = 'trigram')")
+        except sqlite3.OperationalError:
+            _SEARCH_INDEX_SUPPORT = False
+        else:
+            _SEARCH_INDEX_SUPPORT = True
+        finally:
+            probe.close()
+    return _SEARCH_INDEX_SUPPORT
+
+
+def _match_rank_expression(
+    column: str,
+    query: str,
+    parameters: list[object],
+) -> str:
+    parameters.extend((query, query, query))
+    return (
+        f"CASE WHEN lower({column}) = lower(?) THEN 0 "
+        f"WHEN instr(lower({column}), lower(?)) = 1 THEN 1 "
+        f"WHEN instr(lower({column}), lower(?)) > 0 THEN 2 "
+        "ELSE 3 END"
+    )
+
+
+def _substring_predicate(
+    columns: Sequence[str],
+    query: str,
+    parameters: list[object],
+    *,
+    search_table: str | None,
+    row_id: str,
+) -> str:
+    """Case-insensitive substring filter, seeded from a trigram index when possible.
+
+    Trigram case folding is a superset of SQLite's ASCII ``lower``, so the
+    ``instr`` clauses still decide membership; the index only bounds the rows
+    they are evaluated against. Queries shorter than one trigram scan.
+    """
+
+    clauses = " OR ".join(f"instr(lower({column}), lower(?)) > 0" for column in columns)
+    if search_table is None or len(query) < _SEARCH_MIN_QUERY_CHARS:
+        parameters.extend(query for _ in columns)
+        return f"({clauses})"
+    parameters.append('"' + query.replace('"', '""') + '"')
+    parameters.extend(query for _ in columns)
+    return (
+        f"({row_id} IN (SELECT rowid FROM {search_table} WHERE {search_table} MATCH ?) "
+        f"AND ({clauses}))"
+    )
+
+
+def _keyset_query(
+    *,
+    columns: Sequence[str],
+    source: str,
+    predicates: Sequence[str],
+    order: Sequence[str],
+    parameters: Sequence[object],
+    after: tuple[object, ...] | None,
+    limit: int,
+    offset: int,
+) -> tuple[str, tuple[object, ...]]:
+    """Compose one page ordered by ``order``, resuming strictly after ``after``.
+
+    ``parameters`` bind the placeholders of ``order`` and then ``predicates``.
+    Each sort expression is also selected as ``sort_key_<n>`` so the last
+    row of a page can become the next cursor.
+    """
+
+    keys = ", ".join(f"sort_key_{position}" for position in range(len(order)))
+    selected = ", ".join(
+        (
+            *columns,
+            *(f"{expression} AS sort_key_{position}" for position, expression in enumerate(order)),
+        )
+    )
+    where = f"WHERE {' AND '.join(predicates)}" if predicates else ""
+    bound = list(parameters)
+    resume = ""
+    if after is not None:
+        if len(after) != len(order):
+            raise ValueError("cursor does not match this query")
+        resume = f"WHERE ({keys}) > ({', '.join('?' for _ in order)})"
+        bound.extend(after)
+    bound.extend((limit + 1, offset))
+    statement = f"""
+        WITH candidates AS (
+            SELECT {selected}
+            FROM {source}
+            {where}
+        )
+        SELECT *
+        FROM candidates
+        {resume}
+        ORDER BY {keys}
+        LIMIT ? OFFSET ?
+    """
+    return statement, tuple(bound)
+
+
+def _query_scope(
+    kind: str,
+    query: str | None,
+    path_prefixes: Sequence[str],
+) -> str:
+    payload = json.dumps(
+        [kind, query, sorted(path_prefixes)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _encoded_query_cursor(scope: str, key: tuple[object, ...]) -> str:
+    payload = json.dumps([scope, list(key)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decoded_query_cursor(
+    cursor: str | None,
+    *,
+    scope: str,
+) -> tuple[object, ...] | None:
+    if cursor is None:
+        return None
+    if not isinstance(cursor, str) or not 0 < len(cursor) <= _QUERY_CURSOR_MAX_CHARS:
+        raise ValueError("cursor is invalid")
+    try:
+        payload = base64.urlsafe_b64decode(
+            (cursor + "=" * (-len(cursor) % 4)).encode("ascii")
+        )
+        decoded = json.loads(payload.decode("utf-8"))
+    except (UnicodeError, ValueError) as exc:
+        raise ValueError("cursor is invalid") from exc
+    if (
+        not isinstance(decoded, list)
+        or len(decoded) != 2
+        or not isinstance(decoded[1], list)
+        or not decoded[1]
+        or any(isinstance(value, bool) or not isinstance(value, (int, str)) for value in decoded[1])
+    ):
+        raise ValueError("cursor is invalid")
+    if decoded[0] != scope:
+        raise ValueError("cursor does not match this query")
+    return tuple(decoded[1])
+
+
 def _query_page(
     records: tuple[StoreRecordT, ...],
+    rows: Sequence[sqlite3.Row],
     *,
-    row_count: int,
     limit: int,
     offset: int,
+    scope: str,
+    resumed: bool,
 ) -> StoreQueryPage[StoreRecordT]:
-    truncated = row_count > limit
+    truncated = len(rows) > limit
+    if not truncated:
+        return StoreQueryPage(records=records, truncated=False, next_offset=None)
+    last = rows[len(records) - 1]
+    key = tuple(last[name] for name in last.keys() if name.startswith("sort_key_"))
     return StoreQueryPage(
         records=records,
-        truncated=truncated,
-        next_offset=offset + len(records) if truncated else None,
+        truncated=True,
+        next_offset=None if resumed else offset + len(records),
+        next_cursor=_encoded_query_cursor(scope, key),
     )
 
 
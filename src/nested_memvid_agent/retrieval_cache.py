@@ -0,0 +1,211 @@
+"""Per-layer retrieval result cache validated by write generations.
+
+One agent turn issues the same layer search many times (context packing,
+lesson preflight, policy lookups, tool searches). Entries are keyed by the
+normalized query shape and tagged with the layer's write generation at the time
+the search started; an entry is only served while that generation is unchanged,
+so a write to a layer invalidates exactly that layer's results.
+
+Entries hold private copies of their hits, and every lookup returns fresh
+copies, so callers and retrieval bookkeeping can mutate the records they get
+back without touching the cache.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from threading import Lock
+
+from .models import MemoryHit, MemoryLayer, MemoryRecord
+
+DEFAULT_RETRIEVAL_CACHE_ENTRIES = 512
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    generation: Hashable
+    hits: tuple[MemoryHit, ...]
+    elapsed_seconds: float
+
+
+class _RetrievalCacheMetrics:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.saved_seconds = 0.0
+
+    def record(
+        self,
+        *,
+        hits: int = 0,
+        misses: int = 0,
+        stale: int = 0,
+        evictions: int = 0,
+        invalidations: int = 0,
+        saved_seconds: float = 0.0,
+    ) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.stale += stale
+            self.evictions += evictions
+            self.invalidations += invalidations
+            self.saved_seconds += saved_seconds
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 6) if lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 6),
+            }
+
+
+_PROCESS_METRICS = _RetrievalCacheMetrics()
+
+
+def retrieval_cache_metrics() -> dict[str, object]:
+    """Process-wide retrieval cache counters across every memory system."""
+
+    return _PROCESS_METRICS.snapshot()
+
+
+class RetrievalCache:
+    """Bounded LRU of per-layer ranked hits, safe to share across threads."""
+
+    def __init__(self, *, max_entries: int = DEFAULT_RETRIEVAL_CACHE_ENTRIES) -> None:
+        if max_entries < 0:
+            raise ValueError("retrieval cache max_entries must be >= 0")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[MemoryLayer, Hashable], _CacheEntry] = OrderedDict()
+        self._lock = Lock()
+        self._metrics = _RetrievalCacheMetrics()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(
+        self,
+        layer: MemoryLayer,
+        key: Hashable,
+        generation: Hashable,
+    ) -> tuple[MemoryHit, ...] | None:
+        with self._lock:
+            entry = self._entries.get((layer, key))
+            if entry is not None and entry.generation != generation:
+                del self._entries[(layer, key)]
+                self._record(misses=1, stale=1)
+                return None
+            if entry is None:
+                self._record(misses=1)
+                return None
+            self._entries.move_to_end((layer, key))
+            self._record(hits=1, saved_seconds=entry.elapsed_seconds)
+            hits = entry.hits
+        return copy.deepcopy(hits)
+
+    def put(
+        self,
+        layer: MemoryLayer,
+        key: Hashable,
+        generation: Hashable,
+        hits: Sequence[MemoryHit],
+        *,
+        elapsed_seconds: float,
+    ) -> None:
+        if not self.enabled:
+            return
+        snapshot = copy.deepcopy(tuple(hits))
+        with self._lock:
+            self._entries[(layer, key)] = _CacheEntry(
+                generation=generation,
+                hits=snapshot,
+                elapsed_seconds=max(0.0, elapsed_seconds),
+            )
+            self._entries.move_to_end((layer, key))
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            if evicted:
+                self._record(evictions=evicted)
+
+    def restamp(
+        self,
+        layer: MemoryLayer,
+        before: Hashable,
+        after: Hashable,
+        records: Mapping[str, MemoryRecord],
+    ) -> None:
+        """Carry ``layer`` entries from ``before`` to ``after`` with ``records`` swapped in.
+
+        For bookkeeping writes that cannot change which records match a query or
+        how they rank; entries tagged with any other generation are left stale.
+        """
+
+        snapshots = {record_id: copy.deepcopy(record) for record_id, record in records.items()}
+        with self._lock:
+            for entry_key, entry in list(self._entries.items()):
+                if entry_key[0] != layer or entry.generation != before:
+                    continue
+                self._entries[entry_key] = _CacheEntry(
+                    generation=after,
+                    hits=tuple(
+                        replace(hit, record=copy.deepcopy(snapshots[hit.record.id]))
+                        if hit.record.id in snapshots
+                        else hit
+                        for hit in entry.hits
+                    ),
+                    elapsed_seconds=entry.elapsed_seconds,
+                )
+
+    def invalidate(self, layer: MemoryLayer | None = None) -> None:
+        with self._lock:
+            if layer is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key for key in self._entries if key[0] == layer]
+                for key in keys:
+                    del self._entries[key]
+                dropped = len(keys)
+            if dropped:
+                self._record(invalidations=dropped)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            entries = len(self._entries)
+        return {**self._metrics.snapshot(), "entries": entries, "max_entries": self.max_entries}
+
+    def _record(
+        self,
+        *,
+        hits: int = 0,
+        misses: int = 0,
+        stale: int = 0,
+        evictions: int = 0,
+        invalidations: int = 0,
+        saved_seconds: float = 0.0,
+    ) -> None:
+        for metrics in (self._metrics, _PROCESS_METRICS):
+            metrics.record(
+                hits=hits,
+                misses=misses,
+                stale=stale,
+                evictions=evictions,
+                invalidations=invalidations,
+                saved_seconds=saved_seconds,
+            )
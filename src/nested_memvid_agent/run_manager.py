@@ -18,7 +18,7 @@ from typing import Any
 from uuid import uuid4
 
 from .agent import NestedMV2Agent, _is_validation_success, _sanitize_tool_execution
-from .app_factory import build_agent
+from .app_factory import build_agent, build_agent_memory
 from .capability_policy import CapabilityPolicy, parent_resource_digest, tool_spec_digest
 from .config import AgentConfig
 from .diagnosis import classify_failure
@@ -54,6 +54,7 @@ from .graph_runtime import (
 from .lan_runtime_authority import LanRuntimeAuthorityResolver
 from .layers import MemoryCleanupIncompleteError
 from .mcp_manager import MCPManager
+from .memory_pool import MemorySystemPool
 from .models import MemoryLayer
 from .nested_learning import STABLE_MEMORY_LAYERS, NestedLearningKernel
 from .plugin_manager import PluginManager
@@ -121,8 +122,10 @@ _MISSION_RISK_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
 def _agent_has_unsettled_tool_executions(agent: Any) -> bool:
     """Capability-safe check for real agents and lifecycle test doubles."""
 
-    memory = getattr(agent, "memory", None)
-    checker = getattr(memory, "has_unsettled_tool_executions", None)
+    fence = getattr(agent, "memory_fence", None)
+    if fence is None:
+        fence = getattr(agent, "memory", None)
+    checker = getattr(fence, "has_unsettled_tool_executions", None)
     return bool(checker()) if callable(checker) else False
 
 
@@ -191,6 +194,7 @@ class RunManager:
             self._approval_lock = Lock()
             self._memvid_agent_condition = Condition(Lock())
             self._memvid_agent_active = False
+            self._memory_pool = MemorySystemPool() if config.memory_pool else None
             self._memory_close_observer: Callable[[], None] | None = None
             self._shutdown_event = Event()
             self._lifecycle_dependencies: dict[str, Any] = {}
@@ -345,6 +349,7 @@ class RunManager:
                     self._raise_if_startup_shutdown_requested()
                     self._resume_startup_queued_runs()
                     self._raise_if_startup_shutdown_requested()
+                    self._compact_finished_run_steps()
                 with self._lock:
                     if self._shutting_down:
                         raise RuntimeError("runtime_manager_shut_down")
@@ -927,6 +932,19 @@ class RunManager:
             run.session_id,
         )
 
+    def _compact_finished_run_steps(self) -> None:
+        """Coalesce token steps left behind by interrupted runs and apply step retention."""
+
+        now = datetime.now(UTC)
+        retention_days = self.config.run_step_retention_days
+        try:
+            self.state.compact_run_steps(
+                finished_before=now,
+                prune_before=now - timedelta(days=retention_days) if retention_days > 0 else None,
+            )
+        except Exception:  # noqa: BLE001 - compaction is best effort and retried next start
+            pass
+
     def _reconcile_startup_workers(self) -> dict[str, list[str]]:
         report: dict[str, list[str]] = {"failed": [], "preserved": []}
         live_claim_runs: set[str] = getattr(self, "_startup_live_claim_run_ids", set())
@@ -2659,6 +2677,7 @@ class RunManager:
                             execution_origin="manual",
                             approval_handler=self._approval_handler if run_id else None,
                             trusted_request_origin=trusted_request_origin,
+                            memory_fence=getattr(agent, "memory_fence", None),
                         ),
                     )
             else:
@@ -2678,6 +2697,7 @@ class RunManager:
                         execution_origin="manual",
                         approval_handler=self._approval_handler if run_id else None,
                         trusted_request_origin=trusted_request_origin,
+                        memory_fence=getattr(agent, "memory_fence", None),
                     ),
                 )
             execution = _sanitize_tool_execution(execution)
@@ -4749,6 +4769,7 @@ class RunManager:
                     approved_tool_call_ids=frozenset({call.id}),
                     approved_tool_call_arguments={call.id: arguments},
                     approval_receipts={call.id: claimed},
+                    memory_fence=getattr(agent, "memory_fence", None),
                 ),
             )
         except Exception as exc:
@@ -6017,6 +6038,8 @@ class RunManager:
     def _build_agent(self, config: AgentConfig) -> NestedMV2Agent:
         if self._shutdown_event.is_set():
             raise RuntimeError("run_manager_shutting_down")
+        if self._memory_pool is not None:
+            return self._build_pooled_agent(config, self._memory_pool)
         release_memvid_slot: Callable[[], None] | None = None
         close_handler: Callable[[], None] | None = None
         agent_constructed = False
@@ -6062,6 +6085,56 @@ class RunManager:
                 release_memvid_slot()
             raise
 
+    def _build_pooled_agent(
+        self,
+        config: AgentConfig,
+        pool: MemorySystemPool,
+    ) -> NestedMV2Agent:
+        """Build an agent on a leased warm memory system shared with other runs."""
+
+        if not self._retry_failed_memory_cleanup(pooled=True):
+            raise RuntimeError("memory_cleanup_incomplete")
+        agent_constructed = False
+
+        def memory_released() -> None:
+            if not agent_constructed:
+                return
+            with self._memvid_agent_condition:
+                observer = self._memory_close_observer
+            if observer is not None:
+                try:
+                    observer()
+                except Exception:
+                    # Readiness fails closed; the lease is already returned.
+                    return
+
+        try:
+            lease = pool.acquire(
+                config,
+                lambda active: build_agent_memory(active, state=self.state),
+            )
+            agent = build_agent(
+                config,
+                tools=self.build_registry(config),
+                state=self.state,
+                secret_resolver=self.secret_resolver,
+                lan_runtime_authority_resolver=self.lan_runtime_authority_resolver,
+                lan_runtime_utc_clock=self.lan_runtime_utc_clock,
+                close_handler=memory_released if config.backend == "memvid" else None,
+                memory_lease=lease,
+            )
+            agent_constructed = True
+            return agent
+        except MemoryCleanupIncompleteError as exc:
+            with self._lock:
+                self._quarantined_memory_cleanups.append((exc, lambda: None))
+            raise
+
+    def memory_pool_snapshot(self) -> dict[str, object]:
+        if self._memory_pool is None:
+            return {"enabled": False}
+        return self._memory_pool.snapshot()
+
     def _close_agent_for_run(self, run_id: str, agent: NestedMV2Agent) -> None:
         """Close one run-owned agent and retain cancellation durability failures."""
 
@@ -6097,8 +6170,13 @@ class RunManager:
                 self._failed_agent_closures.pop(id(agent), None)
                 self._unsettled_tool_agents.pop(id(agent), None)
 
-    def _retry_failed_memory_cleanup(self) -> bool:
-        """Retry quarantined owners without dropping their lock-bearing references."""
+    def _retry_failed_memory_cleanup(self, *, pooled: bool = False) -> bool:
+        """Retry quarantined owners without dropping their lock-bearing references.
+
+        A pooled agent stuck behind a timed-out tool only holds its own lease,
+        so it does not block pooled builds; the pool retires the shared system
+        once every lease on it is stuck.
+        """
 
         with self._lock:
             failed_agents = tuple(self._failed_agent_closures.items())
@@ -6147,7 +6225,7 @@ class RunManager:
         with self._lock:
             return (
                 not self._failed_agent_closures
-                and not self._unsettled_tool_agents
+                and (pooled or not self._unsettled_tool_agents)
                 and not self._quarantined_memory_cleanups
             )
 
@@ -6687,8 +6765,9 @@ class RunManager:
         # complete lifetime. Keep extra primary runs in the cancellable durable
         # queue instead of starting threads that block while opening the same
         # files. The manager-level agent fence also covers subagents and manual
-        # tool/memory endpoints that do not consume a primary slot.
-        if active_config.backend == "memvid":
+        # tool/memory endpoints that do not consume a primary slot. A memory
+        # pool owns those handles once and shares them between runs instead.
+        if active_config.backend == "memvid" and self._memory_pool is None:
             return 1
         return max(1, active_config.max_concurrent_runs)
 
@@ -6722,6 +6801,8 @@ class RunManager:
 
     def _signal_shutdown(self) -> None:
         self._shutdown_event.set()
+        if self._memory_pool is not None:
+            self._memory_pool.stop_admission()
         with self._memvid_agent_condition:
             self._memvid_agent_condition.notify_all()
 
@@ -6910,14 +6991,20 @@ class RunManager:
                     mcp_stopped = False
                 if not self._wait_for_startup_failure_cleanup(deadline=deadline):
                     return False
+                memory_pool_closed = self._memory_pool is None or self._memory_pool.shutdown(
+                    timeout_seconds=max(0.0, deadline - monotonic())
+                )
+                events_flushed = self._close_event_journal(deadline=deadline)
                 completed = (
                     not cancellation_failed
+                    and memory_pool_closed
                     and not durability_failed
                     and not admission_reconciliation_pending
                     and not startup_in_progress
                     and lifecycle_dependencies_stopped
                     and skills_stopped
                     and mcp_stopped
+                    and events_flushed
                 )
                 if completed:
                     self._release_runtime_ownership()
@@ -6936,6 +7023,17 @@ class RunManager:
                     if self._memvid_agent_active:
                         self._memvid_agent_condition.wait(timeout=min(remaining, 0.05))
 
+    def _close_event_journal(self, *, deadline: float) -> bool:
+        """Drain write-behind run steps once no run thread can publish more."""
+
+        close = getattr(self.events, "close", None)
+        if close is None:
+            return True
+        try:
+            return bool(close(timeout_seconds=max(0.0, deadline - monotonic())))
+        except Exception:  # noqa: BLE001 - undrained steps keep shutdown fail-closed
+            return False
+
     def _release_runtime_ownership(self) -> None:
         ownership = self._runtime_ownership
         if ownership is not None:
@@ -0,0 +1,187 @@
+"""Short-lived ranked result sessions behind opaque search cursors.
+
+Offset cursors force every page to recompute the ranked window that precedes
+it. A search session instead keeps the ranked hits of one query in memory and
+hands out cursors that point into it, so the next page is a slice. Sessions are
+pure caches: they expire after a TTL, are evicted least-recently-used under a
+hit budget, and are dropped whenever the searched data changes. A cursor whose
+session is gone simply falls back to recomputing its window.
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from threading import Lock
+
+from .models import MemoryHit
+
+DEFAULT_SEARCH_SESSION_TTL_SECONDS = 60.0
+DEFAULT_SEARCH_SESSION_MAX_SESSIONS = 128
+DEFAULT_SEARCH_SESSION_MAX_HITS = 32_768
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """Decoded ``<prefix>:<session token>:<offset>`` continuation cursor."""
+
+    offset: int
+    token: str | None = None
+
+
+@dataclass
+class _Session:
+    scope: Hashable
+    signature: Hashable
+    hits: tuple[MemoryHit, ...]
+    complete: bool
+    expires_at: float
+
+
+class SearchSessionCache:
+    """Bounded, thread-safe store of ranked hit lists keyed by random tokens.
+
+    ``scope`` groups sessions for invalidation (for example one memory layer)
+    and ``signature`` pins a session to the exact query that produced it, so a
+    cursor replayed against a different query can never read foreign hits.
+    ``complete`` records whether the ranked list is exhaustive or only a
+    prefix that may be extended by a larger search.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_SEARCH_SESSION_TTL_SECONDS,
+        max_sessions: int = DEFAULT_SEARCH_SESSION_MAX_SESSIONS,
+        max_hits: int = DEFAULT_SEARCH_SESSION_MAX_HITS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("search session ttl_seconds must be positive")
+        if max_sessions < 1 or max_hits < 1:
+            raise ValueError("search session limits must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_hits = max_hits
+        self._clock = clock
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._held_hits = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def store(
+        self,
+        hits: Sequence[MemoryHit],
+        *,
+        scope: Hashable,
+        signature: Hashable,
+        complete: bool,
+        token: str | None = None,
+    ) -> str | None:
+        """Cache ``hits`` and return the session token, or ``None`` if too large.
+
+        Passing an existing ``token`` replaces that session's hits in place so
+        cursors already handed out keep resolving.
+        """
+
+        ranked = tuple(hits)
+        if len(ranked) > self.max_hits:
+            return None
+        with self._lock:
+            now = self._clock()
+            if token is not None:
+                self._discard(token)
+            else:
+                token = secrets.token_urlsafe(12)
+            self._sessions[token] = _Session(
+                scope=scope,
+                signature=signature,
+                hits=ranked,
+                complete=complete,
+                expires_at=now + self.ttl_seconds,
+            )
+            self._held_hits += len(ranked)
+            self._evict(now)
+            return token if token in self._sessions else None
+
+    def lookup(
+        self,
+        token: str,
+        *,
+        scope: Hashable,
+        signature: Hashable,
+    ) -> tuple[tuple[MemoryHit, ...], bool] | None:
+        """Return ``(hits, complete)`` for a live session matching the query."""
+
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            now = self._clock()
+            if session.expires_at <= now:
+                self._discard(token)
+                return None
+            if session.scope != scope or session.signature != signature:
+                return None
+            session.expires_at = now + self.ttl_seconds
+            self._sessions.move_to_end(token)
+            return session.hits, session.complete
+
+    def invalidate(self, scope: Hashable | None = None) -> None:
+        """Drop every session, or only the sessions of one ``scope``."""
+
+        with self._lock:
+            if scope is None:
+                self._sessions.clear()
+                self._held_hits = 0
+                return
+            for token in [key for key, item in self._sessions.items() if item.scope == scope]:
+                self._discard(token)
+
+    def _discard(self, token: str) -> None:
+        session = self._sessions.pop(token, None)
+        if session is not None:
+            self._held_hits -= len(session.hits)
+
+    def _evict(self, now: float) -> None:
+        for token in [key for key, item in self._sessions.items() if item.expires_at <= now]:
+            self._discard(token)
+        while self._sessions and (
+            len(self._sessions) > self.max_sessions or self._held_hits > self.max_hits
+        ):
+            self._discard(next(iter(self._sessions)))
+
+
+def format_search_cursor(prefix: str, offset: int, token: str | None) -> str:
+    if token is None:
+        return f"{prefix}-offset:{offset}"
+    return f"{prefix}-session:{token}:{offset}"
+
+
+def parse_search_cursor(prefix: str, cursor: str | None, *, error: str) -> SearchCursor:
+    """Decode a session cursor, or a legacy ``<prefix>-offset:<n>`` cursor."""
+
+    if cursor is None:
+        return SearchCursor(offset=0)
+    token: str | None = None
+    if cursor.startswith(f"{prefix}-offset:"):
+        raw_offset = cursor.removeprefix(f"{prefix}-offset:")
+    elif cursor.startswith(f"{prefix}-session:"):
+        token, separator, raw_offset = cursor.removeprefix(f"{prefix}-session:").rpartition(":")
+        if not separator or not token:
+            raise ValueError(error)
+    else:
+        raise ValueError(error)
+    try:
+        offset = int(raw_offset)
+    except ValueError as exc:
+        raise ValueError(error) from exc
+    if offset < 0:
+        raise ValueError(error)
+    return SearchCursor(offset=offset, token=token)
@@ -17,6 +17,9 @@ _MAX_REGISTERED_SECRET_VALUES = 2048
 _REGISTERED_SECRET_VALUES: dict[str, None] = {}
 _REGISTERED_SECRET_ENV_NAMES: set[str] = set()
 _SECRET_REGISTRY_LOCK = RLock()
+# Bumped whenever the registered value set or env-name set changes, so the
+# compiled redaction engine knows to rebuild.
+_SECRET_REGISTRY_GENERATION = 0
 _ENV_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
 
 _SENSITIVE_DIRECTORY_NAMES = frozenset(
@@ -135,6 +138,41 @@ _KNOWN_TOKEN_PATTERNS = (
     re.compile(r"\b\d{6,12}:[A-Za-z0-9_-]{20,}\b"),
     re.compile(r"\beyJ[A-Za-z0-9_-]{8,}\.[A-Za-z0-9_-]{8,}\.[A-Za-z0-9_-]{8,}\b"),
 )
+# Applied in order; later rules may see the output of earlier ones.
+_REDACTION_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (_PEM_BLOCK_RE, REDACTED),
+    (_AUTHORIZATION_RE, r"\1<redacted>"),
+    (_BEARER_CREDENTIAL_RE, r"\1<redacted>"),
+    (_ASSIGNMENT_RE, r"\1<redacted>"),
+    (_KEY_VALUE_RE, r"\1<redacted>"),
+    (_URI_USERINFO_RE, r"\1<redacted>:<redacted>@"),
+    *((pattern, REDACTED) for pattern in _KNOWN_TOKEN_PATTERNS),
+)
+# Each rule needs one of these ASCII fragments, compared case-insensitively,
+# or six digits and a colon. ASCII text containing none of them is left alone
+# by every rule, so it skips the rule passes entirely.
+_REDACTION_RULE_FRAGMENTS = (
+    "-----begin",
+    "bearer",
+    "basic",
+    "key",
+    "token",
+    "secret",
+    "credential",
+    "passw",
+    "://",
+    "sk-",
+    "ghp_",
+    "gho_",
+    "ghu_",
+    "ghs_",
+    "ghr_",
+    "github_pat_",
+    "xox",
+    "akia",
+    "eyj",
+)
+_NUMERIC_TOKEN_PREFIX_RE = re.compile(r"\d{6}:")
 
 _EXACT_CREDENTIAL_ENV_NAMES = frozenset(
     {
@@ -193,7 +231,10 @@ def register_secret_value(value: str | None) -> None:
         or _is_secret_ref(candidate)
     ):
         return
+    global _SECRET_REGISTRY_GENERATION
     with _SECRET_REGISTRY_LOCK:
+        if candidate not in _REGISTERED_SECRET_VALUES:
+            _SECRET_REGISTRY_GENERATION += 1
         # Refresh insertion order so values used recently survive bounded eviction.
         _REGISTERED_SECRET_VALUES.pop(candidate, None)
         _REGISTERED_SECRET_VALUES[candidate] = None
@@ -216,7 +257,10 @@ def register_secret_env_names(
     }
     if not registered:
         return
+    global _SECRET_REGISTRY_GENERATION
     with _SECRET_REGISTRY_LOCK:
+        if not registered <= _REGISTERED_SECRET_ENV_NAMES:
+            _SECRET_REGISTRY_GENERATION += 1
         _REGISTERED_SECRET_ENV_NAMES.update(registered)
     environment = os.environ if environ is None else environ
     for name in registered:
@@ -260,54 +304,158 @@ def is_sensitive_path(
 def redact_secrets(value: Any, *, environ: Mapping[str, str] | None = None) -> Any:
     """Recursively remove raw credential material from an untrusted payload."""
 
+    return _redact_value(value, _redaction_engine(environ))
+
+
+def redact_text(text: str, *, environ: Mapping[str, str] | None = None) -> str:
+    return _redaction_engine(environ).redact(text)
+
+
+class _RedactionEngine:
+    """Secret matchers compiled for one environment and registry generation.
+
+    Known secret values are kept longest first. Each text is screened with a
+    substring test per secret, and only the secrets it contains are folded
+    into one alternation; a match is probed again for a secret that overlaps
+    its end, so overlapping secrets are redacted as one span. The pattern rules keep their sequential semantics
+    but only run when the text contains a fragment one of them requires.
+    """
+
+    __slots__ = ("environment", "generation", "_secrets")
+
+    def __init__(
+        self,
+        *,
+        environment: Mapping[Any, Any],
+        generation: int,
+        secret_values: Iterable[str],
+    ) -> None:
+        self.environment = environment
+        self.generation = generation
+        ordered = sorted(set(secret_values), key=lambda value: (-len(value), value))
+        self._secrets = tuple(ordered)
+
+    def is_current(self, environment: Mapping[str, str]) -> bool:
+        return (
+            self.generation == _SECRET_REGISTRY_GENERATION
+            and _environment_state(environment) == self.environment
+        )
+
+    def redact(self, text: str) -> str:
+        redacted = self._redact_secret_values(text)
+        if not _may_match_redaction_rule(redacted):
+            return redacted
+        for pattern, replacement in _REDACTION_RULES:
+            redacted = pattern.sub(replacement, redacted)
+        return redacted
+
+    def _redact_secret_values(self, text: str) -> str:
+        # An alternation over every secret is tried at every offset; a C-level
+        # substring scan per secret is far cheaper at the registry cap.
+        present = [value for value in self._secrets if value in text]
+        if not present:
+            return text
+        secrets = re.compile("|".join(re.escape(value) for value in present))
+        spans: list[tuple[int, int]] = []
+        for match in secrets.finditer(text):
+            start, end = match.span()
+            if spans and end <= spans[-1][1]:
+                continue
+            # A secret that starts inside this one may run past its end.
+            probe = start + 1
+            while probe < end:
+                overlap = secrets.match(text, probe)
+                if overlap is not None and overlap.end() > end:
+                    end = overlap.end()
+                probe += 1
+            if spans and start < spans[-1][1]:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+            else:
+                spans.append((start, end))
+        pieces: list[str] = []
+        cursor = 0
+        for start, end in spans:
+            pieces.append(text[cursor:start])
+            pieces.append(REDACTED)
+            cursor = end
+        pieces.append(text[cursor:])
+        return "".join(pieces)
+
+
+def _may_match_redaction_rule(text: str) -> bool:
+    # Case-insensitive regex matching treats some non-ASCII letters as ASCII
+    # ones, which lowercasing does not, so only ASCII text is prefiltered.
+    if not text.isascii():
+        return True
+    lowered = text.lower()
+    return (
+        any(fragment in lowered for fragment in _REDACTION_RULE_FRAGMENTS)
+        or _NUMERIC_TOKEN_PREFIX_RE.search(text) is not None
+    )
+
+
+_REDACTION_ENGINE: _RedactionEngine | None = None
+
+
+def _environment_state(environment: Mapping[str, str]) -> Mapping[Any, Any]:
+    # ``os.environ`` decodes every entry in Python; its backing dict compares
+    # and copies in C.
+    data = getattr(environment, "_data", None)
+    return data if isinstance(data, dict) else environment
+
+
+def _redaction_engine(environ: Mapping[str, str] | None) -> _RedactionEngine:
+    global _REDACTION_ENGINE
+    environment = os.environ if environ is None else environ
+    engine = _REDACTION_ENGINE
+    if engine is not None and engine.is_current(environment):
+        return engine
+    # Snapshot before reading values: a concurrent change then only forces
+    # another rebuild, never a stale engine.
+    snapshot = dict(_environment_state(environment))
+    with _SECRET_REGISTRY_LOCK:
+        generation = _SECRET_REGISTRY_GENERATION
+        credential_values = set(_REGISTERED_SECRET_VALUES)
+        registered_env_names = tuple(_REGISTERED_SECRET_ENV_NAMES)
+    credential_values.update(
+        value
+        for name, value in environment.items()
+        if is_credential_env_name(name) and isinstance(value, str) and len(value) >= 8
+    )
+    for name in registered_env_names:
+        value = environment.get(name)
+        if isinstance(value, str) and len(value.strip()) >= _MIN_REGISTERED_SECRET_LENGTH:
+            credential_values.add(value.strip())
+    engine = _RedactionEngine(
+        environment=snapshot,
+        generation=generation,
+        secret_values=credential_values,
+    )
+    _REDACTION_ENGINE = engine
+    return engine
+
+
+def _redact_value(value: Any, engine: _RedactionEngine) -> Any:
     if isinstance(value, dict):
         redacted: dict[Any, Any] = {}
         for key, item in value.items():
-            safe_key = redact_text(key, environ=environ) if isinstance(key, str) else key
+            safe_key = engine.redact(key) if isinstance(key, str) else key
             if _should_redact_secret_item(str(key), item):
                 redacted[safe_key] = REDACTED
             elif _is_safe_secret_env_descriptor(str(key), item):
-                redacted[safe_key] = _redact_public_metadata(item, environ=environ)
+                redacted[safe_key] = _redact_public_metadata(item, engine)
             else:
-                redacted[safe_key] = redact_secrets(item, environ=environ)
+                redacted[safe_key] = _redact_value(item, engine)
         return redacted
     if isinstance(value, list):
-        return [redact_secrets(item, environ=environ) for item in value]
+        return [_redact_value(item, engine) for item in value]
     if isinstance(value, tuple):
-        return tuple(redact_secrets(item, environ=environ) for item in value)
+        return tuple(_redact_value(item, engine) for item in value)
     if isinstance(value, str):
-        return redact_text(value, environ=environ)
+        return engine.redact(value)
     return value
 
 
-def redact_text(text: str, *, environ: Mapping[str, str] | None = None) -> str:
-    redacted = text
-    environment = os.environ if environ is None else environ
-    credential_values = {
-        value
-        for name, value in environment.items()
-        if is_credential_env_name(name) and isinstance(value, str) and len(value) >= 8
-    }
-    with _SECRET_REGISTRY_LOCK:
-        credential_values.update(_REGISTERED_SECRET_VALUES)
-        registered_env_names = tuple(_REGISTERED_SECRET_ENV_NAMES)
-    for name in registered_env_names:
-        value = environment.get(name)
-        if isinstance(value, str) and len(value.strip()) >= _MIN_REGISTERED_SECRET_LENGTH:
-            credential_values.add(value.strip())
-    for secret_value in sorted(credential_values, key=len, reverse=True):
-        redacted = redacted.replace(secret_value, REDACTED)
-    redacted = _PEM_BLOCK_RE.sub(REDACTED, redacted)
-    redacted = _AUTHORIZATION_RE.sub(r"\1<redacted>", redacted)
-    redacted = _BEARER_CREDENTIAL_RE.sub(r"\1<redacted>", redacted)
-    redacted = _ASSIGNMENT_RE.sub(r"\1<redacted>", redacted)
-    redacted = _KEY_VALUE_RE.sub(r"\1<redacted>", redacted)
-    redacted = _URI_USERINFO_RE.sub(r"\1<redacted>:<redacted>@", redacted)
-    for pattern in _KNOWN_TOKEN_PATTERNS:
-        redacted = pattern.sub(REDACTED, redacted)
-    return redacted
-
-
 def sanitize_memory_record(record: MemoryRecord) -> MemoryRecord:
     """Return a copy safe for permanent or run-scoped memory storage."""
 
@@ -477,26 +625,22 @@ def _is_safe_secret_env_descriptor(key: str, value: Any) -> bool:
     return suffix == "_env" and _safe_secret_metadata_value(suffix, value)
 
 
-def _redact_public_metadata(
-    value: Any,
-    *,
-    environ: Mapping[str, str] | None,
-) -> Any:
+def _redact_public_metadata(value: Any, engine: _RedactionEngine) -> Any:
     """Redact registered values without reclassifying descriptor field names."""
 
     if isinstance(value, Mapping):
         return {
-            redact_text(key, environ=environ) if isinstance(key, str) else key: (
-                _redact_public_metadata(item, environ=environ)
+            engine.redact(key) if isinstance(key, str) else key: (
+                _redact_public_metadata(item, engine)
             )
             for key, item in value.items()
         }
     if isinstance(value, list):
-        return [_redact_public_metadata(item, environ=environ) for item in value]
+        return [_redact_public_metadata(item, engine) for item in value]
     if isinstance(value, tuple):
-        return tuple(_redact_public_metadata(item, environ=environ) for item in value)
+        return tuple(_redact_public_metadata(item, engine) for item in value)
     if isinstance(value, str):
-        return redact_text(value, environ=environ)
+        return engine.redact(value)
     return value
 
 
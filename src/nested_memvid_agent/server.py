@@ -295,7 +295,10 @@ def _create_app(
         secret_store_path = workspace / secret_store_path
     secret_store_path = secret_store_path.resolve()
     secret_broker = build_secret_broker(secret_store_path, backend=active_config.secret_backend)
-    state = AgentStateStore(active_config.state_path)
+    state = AgentStateStore(
+        active_config.state_path,
+        connection_pool=active_config.state_connection_pool,
+    )
     events = RunEventBus(state)
     mcp = MCPManager(
         state,
@@ -572,6 +575,10 @@ def _create_app(
                 shutdown_incomplete = shutdown_incomplete or not mcp_stopped
             except Exception:  # noqa: BLE001 - report a fixed, non-secret lifecycle error
                 shutdown_incomplete = True
+            try:
+                state.close()
+            except Exception:  # noqa: BLE001 - pooled handles fall back to unpooled use
+                shutdown_incomplete = True
             if shutdown_incomplete:
                 raise RuntimeError("runtime_shutdown_incomplete") from None
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import queue
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from dataclasses import asdict
 from importlib import import_module
 from typing import Any, cast
@@ -9,6 +11,15 @@ from .event_log import JsonlEventLog
 from .operational_metrics import operational_snapshot, prometheus_snapshot
 from .server_support import bounded_limit
 
+_KEEPALIVE_SECONDS = 15.0
+
+
+def _last_event_id(value: object) -> int | None:
+    if not isinstance(value, str) or not value.strip():
+        return 0
+    value = value.strip()
+    return int(value) if value.isascii() and value.isdigit() else None
+
 
 def register_observability_routes(
     app: Any,
@@ -22,28 +33,48 @@ def register_observability_routes(
     routine_loop: Any | None = None,
 ) -> None:
     plain_text_response = import_module("fastapi.responses").PlainTextResponse
+    header = import_module("fastapi").Header
 
     def config() -> Any:
         return active_config() if callable(active_config) else active_config
 
     @app.get("/api/runs/{run_id}/events")  # type: ignore[untyped-decorator]
-    def run_events(run_id: str, after_id: int = 0) -> Any:
+    async def run_events(
+        run_id: str,
+        after_id: int | None = None,
+        last_event_id: str | None = header(default=None),
+    ) -> Any:
+        if after_id is None:
+            # EventSource reconnects carry the last delivered id in a header only.
+            after_id = _last_event_id(last_event_id)
+            if after_id is None:
+                raise http_exception(status_code=400, detail="invalid Last-Event-ID")
         try:
-            state.get_run(run_id)
+            await asyncio.to_thread(state.get_run, run_id)
         except KeyError as exc:
             raise http_exception(status_code=404, detail=str(exc)) from exc
 
-        def stream() -> Any:
-            subscriber = events.subscribe(run_id, after_id=after_id)
+        async def stream() -> AsyncIterator[str]:
+            subscription = await events.subscribe_async(run_id, after_id=after_id)
             try:
                 while True:
                     try:
-                        event = subscriber.get(timeout=15)
-                        yield event.to_sse()
-                    except queue.Empty:
+                        event = await asyncio.wait_for(
+                            subscription.get(),
+                            timeout=_KEEPALIVE_SECONDS,
+                        )
+                    except TimeoutError:
                         yield ": keepalive\n\n"
+                        continue
+                    if event is None:
+                        # Slow consumers are cut loose instead of buffering without
+                        # bound; the client resumes from the persisted step log.
+                        lag = json.dumps({"run_id": run_id, "after_id": subscription.last_id})
+                        yield f"event: stream.lagged\ndata: {lag}\n\n"
+                        return
+                    yield event.to_sse()
             finally:
-                events.unsubscribe(run_id, subscriber)
+                events.unsubscribe_async(subscription)
 
         return streaming_response(stream(), media_type="text/event-stream")
 
@@ -5,14 +5,15 @@ import json
 import os
 import sqlite3
 import stat
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from math import isfinite
 from pathlib import Path
-from threading import RLock
-from time import sleep
+from threading import Lock, RLock, get_ident, local
+from threading import enumerate as enumerate_threads
+from time import monotonic, sleep
 from typing import Any, cast
 
 from .file_lock import lock_exclusive, unlock
@@ -43,7 +44,7 @@ from .routine_schedule import (
 )
 from .security_boundary import redact_secrets, redact_text
 
-SCHEMA_VERSION = 21
+SCHEMA_VERSION = 22
 DEFAULT_APPROVAL_TTL_SECONDS = 900.0
 CAPABILITY_KINDS = frozenset({"tool", "mcp_server", "skill"})
 _STATE_DIRECTORY_MODE = 0o700
@@ -51,8 +52,11 @@ _SQLITE_FILE_MODE = 0o600
 _SQLITE_PRIVATE_SUFFIXES = ("", "-wal", "-shm", "-journal")
 _SQLITE_CONNECTION_SETUP_ATTEMPTS = 5
 _SQLITE_CONNECTION_SETUP_RETRY_BASE_SECONDS = 0.05
+_SQLITE_POOL_MAX_READERS = 32
 _TERMINAL_RUN_STATUSES = {"completed", "failed", "cancelled"}
 _ABORTED_RUN_STATUSES = {"failed", "cancelled"}
+ASSISTANT_TOKEN_STEP = "assistant.token"
+ASSISTANT_MESSAGE_STEP = "assistant.message"
 _SCHEMA_MIGRATION_LOCK = RLock()
 
 
@@ -278,16 +282,35 @@ class AgentStateStore:
         path: Path,
         *,
         routine_admission_clock: Callable[[], datetime] | None = None,
+        connection_pool: bool = False,
     ) -> None:
         self.path = path
         self._routine_admission_clock = routine_admission_clock or (lambda: datetime.now(UTC))
         self._lock = RLock()
+        self._pool: _SQLiteConnectionPool | None = None
         with _SCHEMA_MIGRATION_LOCK:
             with _state_initialization_lock(self.path):
                 _prepare_private_sqlite_storage(self.path)
                 self._migrate_schema()
                 self._enable_wal_mode()
                 _harden_private_sqlite_files(self.path)
+        if connection_pool:
+            self._pool = _SQLiteConnectionPool(
+                self._open_configured_connection,
+                max_readers=_SQLITE_POOL_MAX_READERS,
+            )
+
+    def close(self) -> None:
+        """Close pooled handles; unpooled stores hold no connections between calls."""
+
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    def connection_pool_snapshot(self) -> dict[str, object]:
+        if self._pool is None:
+            return {"enabled": False}
+        return self._pool.snapshot()
 
     def create_run(
         self,
@@ -979,7 +1002,7 @@ class AgentStateStore:
         return cursor.rowcount == 1
 
     def run_lease_matches(self, run_id: str, *, owner: str, generation: int) -> bool:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 """
                 SELECT 1 FROM runs WHERE run_id = ? AND lease_owner = ? AND lease_generation = ?
@@ -991,7 +1014,7 @@ class AgentStateStore:
         return row is not None
 
     def list_nonterminal_runs(self) -> list[RunRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """SELECT * FROM runs WHERE status NOT IN ('completed', 'failed', 'cancelled')
                 ORDER BY created_at ASC, run_id ASC"""
@@ -999,21 +1022,21 @@ class AgentStateStore:
         return [_run_from_row(row) for row in rows]
 
     def run_status_counts(self) -> dict[str, int]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT status, COUNT(*) AS count FROM runs GROUP BY status ORDER BY status"
             ).fetchall()
         return {str(row["status"]): int(row["count"]) for row in rows}
 
     def get_run(self, run_id: str) -> RunRecord:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
         if row is None:
             raise KeyError(f"Unknown run: {run_id}")
         return _run_from_row(row)
 
     def list_runs(self, limit: int = 50) -> list[RunRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM runs ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -1021,7 +1044,7 @@ class AgentStateStore:
         return [_run_from_row(row) for row in rows]
 
     def list_runs_for_session(self, session_id: str) -> list[RunRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM runs
@@ -2161,7 +2184,7 @@ class AgentStateStore:
         return self.get_routine_delivery(delivery_id)
 
     def list_sessions(self, limit: int = 100) -> list[dict[str, Any]]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM runs ORDER BY updated_at DESC LIMIT ?",
                 (max(limit * 20, limit),),
@@ -2201,10 +2224,122 @@ class AgentStateStore:
             )
             return int(cursor.lastrowid or 0)
 
+    def last_run_step_id(self) -> int:
+        """Return the highest run step id handed out so far; later ids are larger."""
+
+        with self._read_connection() as conn:
+            return _last_run_step_id(conn)
+
+    def append_run_steps(
+        self,
+        steps: Sequence[tuple[str, str, dict[str, Any], str]],
+    ) -> int:
+        """Persist ``(run_id, type, payload, created_at)`` steps atomically.
+
+        The steps take consecutive ids in the order given, numbered inside the
+        write transaction so ids follow commit order across writers. Returns
+        the first id, or 0 when ``steps`` is empty.
+        """
+
+        if not steps:
+            return 0
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            first_id = _last_run_step_id(conn) + 1
+            conn.executemany(
+                """
+                INSERT INTO run_steps (id, run_id, type, payload_json, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (first_id + offset, run_id, step_type, json.dumps(payload), created_at)
+                    for offset, (run_id, step_type, payload, created_at) in enumerate(steps)
+                ],
+            )
+        return first_id
+
+    def coalesce_run_tokens(
+        self,
+        run_id: str,
+        *,
+        after_id: int = 0,
+        through_id: int | None = None,
+    ) -> int:
+        """Rewrite contiguous ``assistant.token`` steps into ``assistant.message`` steps.
+
+        Only steps with ids in ``(after_id, through_id]`` are considered. Returns
+        the number of token rows replaced.
+        """
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            return _coalesce_run_token_steps(
+                conn,
+                run_id,
+                after_id=after_id,
+                through_id=through_id,
+            )
+
+    def compact_run_steps(
+        self,
+        *,
+        finished_before: datetime,
+        prune_before: datetime | None = None,
+        max_runs: int = 100,
+    ) -> dict[str, int]:
+        """Coalesce leftover tokens of finished runs and prune expired step history.
+
+        Token segments of terminal runs last updated before ``finished_before``
+        are coalesced, at most ``max_runs`` runs per call. When ``prune_before``
+        is given, every step of terminal runs last updated before it is deleted.
+        """
+
+        if max_runs < 1:
+            raise ValueError("max_runs must be positive")
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            run_ids = [
+                str(row["run_id"])
+                for row in conn.execute(
+                    """
+                    SELECT DISTINCT steps.run_id
+                    FROM run_steps AS steps
+                    JOIN runs ON runs.run_id = steps.run_id
+                    WHERE steps.type = 'assistant.token'
+                      AND runs.status IN ('completed', 'failed', 'cancelled')
+                      AND runs.updated_at < ?
+                    LIMIT ?
+                    """,
+                    (finished_before.isoformat(), max_runs),
+                ).fetchall()
+            ]
+            coalesced = sum(
+                _coalesce_run_token_steps(conn, run_id, after_id=0, through_id=None)
+                for run_id in run_ids
+            )
+            pruned = 0
+            if prune_before is not None:
+                pruned = conn.execute(
+                    """
+                    DELETE FROM run_steps
+                    WHERE run_id IN (
+                        SELECT run_id FROM runs
+                        WHERE status IN ('completed', 'failed', 'cancelled')
+                          AND updated_at < ?
+                    )
+                    """,
+                    (prune_before.isoformat(),),
+                ).rowcount
+        return {
+            "runs_compacted": len(run_ids),
+            "tokens_coalesced": coalesced,
+            "steps_pruned": max(0, pruned),
+        }
+
     def list_run_steps(
         self, run_id: str, after_id: int = 0, limit: int = 200
     ) -> list[dict[str, Any]]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT id, run_id, type, payload_json, created_at
@@ -2407,7 +2542,7 @@ class AgentStateStore:
     def get_approval(self, approval_id: str, *, expire: bool = True) -> dict[str, Any]:
         if expire:
             self.expire_pending_approvals(approval_id=approval_id)
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM approval_requests WHERE approval_id = ?",
                 (approval_id,),
@@ -4418,7 +4553,7 @@ class AgentStateStore:
         )
 
     def get_task_node(self, task_id: str) -> TaskNodeRecord:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute("SELECT * FROM task_nodes WHERE task_id = ?", (task_id,)).fetchone()
         if row is None:
             raise KeyError(f"Unknown task: {task_id}")
@@ -4431,7 +4566,7 @@ class AgentStateStore:
         return task, self.get_run(task.run_id)
 
     def list_task_nodes(self, run_id: str) -> list[TaskNodeRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM task_nodes WHERE run_id = ? ORDER BY created_at ASC",
                 (run_id,),
@@ -4592,7 +4727,7 @@ class AgentStateStore:
             return subagent_ids
 
     def get_subagent_run(self, subagent_id: str) -> SubagentRunRecord:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM subagent_runs WHERE subagent_id = ?", (subagent_id,)
             ).fetchone()
@@ -4601,7 +4736,7 @@ class AgentStateStore:
         return _subagent_from_row(row)
 
     def list_subagent_runs(self, run_id: str) -> list[SubagentRunRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM subagent_runs WHERE run_id = ? ORDER BY created_at ASC",
                 (run_id,),
@@ -4609,7 +4744,7 @@ class AgentStateStore:
         return [_subagent_from_row(row) for row in rows]
 
     def list_nonterminal_subagent_runs(self) -> list[SubagentRunRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM subagent_runs
@@ -4742,7 +4877,7 @@ class AgentStateStore:
             return _subagent_from_row(updated), cursor.rowcount == 1
 
     def subagent_status_counts(self) -> dict[str, int]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT status, COUNT(*) AS count FROM subagent_runs GROUP BY status ORDER BY status"
             ).fetchall()
@@ -4791,14 +4926,14 @@ class AgentStateStore:
         return self.get_trace_span(span_id)
 
     def get_trace_span(self, span_id: str) -> TraceSpanRecord:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute("SELECT * FROM trace_spans WHERE span_id = ?", (span_id,)).fetchone()
         if row is None:
             raise KeyError(f"Unknown trace span: {span_id}")
         return _trace_span_from_row(row)
 
     def list_trace_spans(self, run_id: str) -> list[TraceSpanRecord]:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM trace_spans
@@ -4878,7 +5013,7 @@ class AgentStateStore:
         return self.get_project(str(fields["project_id"]))
 
     def get_project(self, project_id: str) -> ProjectRecord:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 "SELECT * FROM projects WHERE project_id = ?",
                 (project_id,),
@@ -4892,7 +5027,7 @@ class AgentStateStore:
         if not include_archived:
             query += " WHERE archived_at IS NULL"
         query += " ORDER BY project_id ASC"
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(query).fetchall()
         return [_project_from_row(row) for row in rows]
 
@@ -5092,7 +5227,7 @@ class AgentStateStore:
             return _project_from_row(archived)
 
     def schema_version(self) -> int:
-        with self._connect() as conn:
+        with self._read_connection() as conn:
             row = conn.execute("SELECT version FROM schema_version WHERE id = 1").fetchone()
         return 0 if row is None else int(row["version"])
 
@@ -5198,6 +5333,9 @@ class AgentStateStore:
             if current < 21:
                 _apply_schema_v21(conn)
                 current = 21
+            if current < 22:
+                _apply_schema_v22(conn)
+                current = 22
             if current < SCHEMA_VERSION:
                 raise RuntimeError(
                     f"Unsupported schema migration target: {current} -> {SCHEMA_VERSION}"
@@ -5235,6 +5373,11 @@ class AgentStateStore:
 
     @contextmanager
     def _connect(self) -> Iterator[sqlite3.Connection]:
+        pool = self._pool
+        if pool is not None:
+            with pool.writer() as pooled:
+                yield pooled
+            return
         conn = self._open_configured_connection()
         try:
             yield conn
@@ -5246,6 +5389,18 @@ class AgentStateStore:
         finally:
             conn.close()
 
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a handle for SELECT-only work; pooled stores reuse a per-thread reader."""
+
+        pool = self._pool
+        if pool is None:
+            with self._connect() as conn:
+                yield conn
+            return
+        with pool.reader() as conn:
+            yield conn
+
     def _open_configured_connection(self) -> sqlite3.Connection:
         """Open a fresh handle, retrying only transient setup-time BUSY errors."""
 
@@ -6004,6 +6159,94 @@ def _apply_schema_v21(conn: sqlite3.Connection) -> None:
     )
 
 
+def _apply_schema_v22(conn: sqlite3.Connection) -> None:
+    if not _columns(conn, "run_steps"):
+        return
+    _execute_schema_script(
+        conn,
+        """
+        CREATE INDEX IF NOT EXISTS idx_run_steps_uncompacted_tokens
+            ON run_steps(run_id, id) WHERE type = 'assistant.token';
+        """,
+    )
+
+
+def _last_run_step_id(conn: sqlite3.Connection) -> int:
+    # ``sqlite_sequence`` keeps ids of deleted or coalesced steps from being reused.
+    sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'run_steps'").fetchone()
+    highest = conn.execute("SELECT COALESCE(MAX(id), 0) FROM run_steps").fetchone()
+    return max(int(sequence[0]) if sequence is not None else 0, int(highest[0]))
+
+
+def _coalesce_run_token_steps(
+    conn: sqlite3.Connection,
+    run_id: str,
+    *,
+    after_id: int,
+    through_id: int | None,
+) -> int:
+    """Replace each contiguous token segment with one ``assistant.message`` step.
+
+    The message keeps the id of the segment's last token, so a client resuming
+    after any token of the segment still receives the complete message; the
+    payload records the replaced id range for de-duplication.
+    """
+
+    rows = conn.execute(
+        """
+        SELECT id, type, payload_json, created_at
+        FROM run_steps
+        WHERE run_id = ? AND id > ? AND (? IS NULL OR id <= ?)
+        ORDER BY id ASC
+        """,
+        (run_id, after_id, through_id, through_id),
+    )
+    segments: list[list[sqlite3.Row]] = []
+    current: list[sqlite3.Row] = []
+    for row in rows:
+        if str(row["type"]) == ASSISTANT_TOKEN_STEP:
+            current.append(row)
+            continue
+        if current:
+            segments.append(current)
+            current = []
+    if current:
+        segments.append(current)
+    replaced = 0
+    for segment in segments:
+        first_id = int(segment[0]["id"])
+        last_id = int(segment[-1]["id"])
+        content = "".join(
+            str(json.loads(str(row["payload_json"])).get("content") or "") for row in segment
+        )
+        conn.execute(
+            "DELETE FROM run_steps WHERE run_id = ? AND type = ? AND id BETWEEN ? AND ?",
+            (run_id, ASSISTANT_TOKEN_STEP, first_id, last_id),
+        )
+        conn.execute(
+            """
+            INSERT INTO run_steps (id, run_id, type, payload_json, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                last_id,
+                run_id,
+                ASSISTANT_MESSAGE_STEP,
+                json.dumps(
+                    {
+                        "content": content,
+                        "token_count": len(segment),
+                        "first_step_id": first_id,
+                        "last_step_id": last_id,
+                    }
+                ),
+                str(segment[-1]["created_at"]),
+            ),
+        )
+        replaced += len(segment)
+    return replaced
+
+
 def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
     return {str(row[1]) for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
 
@@ -6192,6 +6435,185 @@ def _apply_connection_pragmas(conn: sqlite3.Connection) -> None:
     conn.execute("PRAGMA recursive_triggers=ON")
 
 
+class _SQLiteConnectionPool:
+    """Long-lived state handles: one reader per thread plus a single serialized writer.
+
+    Pragmas are applied once when a handle is opened.  Nested writer use on the
+    owning thread falls back to a fresh handle so transaction boundaries match
+    the unpooled store exactly.
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[], sqlite3.Connection],
+        *,
+        max_readers: int,
+    ) -> None:
+        self._opener = opener
+        self._max_readers = max(1, max_readers)
+        self._guard = Lock()
+        self._writer_lock = Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._readers: dict[int, sqlite3.Connection] = {}
+        self._local = local()
+        self._closed = False
+        self._counters = {
+            "reader_hits": 0,
+            "reader_misses": 0,
+            "writer_hits": 0,
+            "writer_misses": 0,
+            "writer_acquisitions": 0,
+            "unpooled_fallbacks": 0,
+            "discarded": 0,
+        }
+        self._writer_wait_seconds_total = 0.0
+        self._writer_wait_seconds_max = 0.0
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        if self._closed or getattr(self._local, "writer_depth", 0) > 0:
+            with self._unpooled() as conn:
+                yield conn
+            return
+        started = monotonic()
+        with self._writer_lock:
+            waited = monotonic() - started
+            with self._guard:
+                self._counters["writer_acquisitions"] += 1
+                self._writer_wait_seconds_total += waited
+                self._writer_wait_seconds_max = max(self._writer_wait_seconds_max, waited)
+                self._counters["writer_hits" if self._writer is not None else "writer_misses"] += 1
+            if self._writer is None:
+                self._writer = self._opener()
+            conn = self._writer
+            self._local.writer_depth = 1
+            try:
+                yield conn
+            except BaseException:
+                if not self._rollback(conn):
+                    self._writer = None
+                raise
+            else:
+                self._commit(conn, on_failure=self._drop_writer)
+            finally:
+                self._local.writer_depth = 0
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        ident = get_ident()
+        with self._guard:
+            conn = None if self._closed else self._readers.get(ident)
+            self._counters["reader_hits" if conn is not None else "reader_misses"] += 1
+        if conn is not None and getattr(self._local, "reader_depth", 0) > 0:
+            yield conn
+            return
+        if conn is None:
+            if self._closed or not self._reserve_reader_slot():
+                with self._unpooled() as unpooled:
+                    yield unpooled
+                return
+            conn = self._opener()
+            with self._guard:
+                self._readers[ident] = conn
+        self._local.reader_depth = 1
+        try:
+            yield conn
+        except BaseException:
+            if not self._rollback(conn):
+                self._forget_reader(ident, conn)
+            raise
+        else:
+            self._commit(conn, on_failure=lambda: self._forget_reader(ident, conn))
+        finally:
+            self._local.reader_depth = 0
+
+    def snapshot(self) -> dict[str, object]:
+        with self._guard:
+            acquisitions = self._counters["writer_acquisitions"]
+            return {
+                "enabled": True,
+                "reader_connections": len(self._readers),
+                "max_readers": self._max_readers,
+                "writer_open": self._writer is not None,
+                **self._counters,
+                "writer_wait_seconds_total": round(self._writer_wait_seconds_total, 6),
+                "writer_wait_seconds_max": round(self._writer_wait_seconds_max, 6),
+                "writer_wait_seconds_mean": (
+                    round(self._writer_wait_seconds_total / acquisitions, 6)
+                    if acquisitions
+                    else 0.0
+                ),
+            }
+
+    def close(self) -> None:
+        with self._writer_lock:
+            with self._guard:
+                self._closed = True
+                handles = list(self._readers.values())
+                self._readers.clear()
+                if self._writer is not None:
+                    handles.append(self._writer)
+                    self._writer = None
+        for conn in handles:
+            conn.close()
+
+    def _reserve_reader_slot(self) -> bool:
+        stale: list[sqlite3.Connection] = []
+        with self._guard:
+            if len(self._readers) >= self._max_readers:
+                live = {thread.ident for thread in enumerate_threads()}
+                for ident in [key for key in self._readers if key not in live]:
+                    stale.append(self._readers.pop(ident))
+                self._counters["discarded"] += len(stale)
+            available = len(self._readers) < self._max_readers
+        for conn in stale:
+            conn.close()
+        return available
+
+    def _forget_reader(self, ident: int, conn: sqlite3.Connection) -> None:
+        with self._guard:
+            if self._readers.get(ident) is conn:
+                del self._readers[ident]
+
+    def _drop_writer(self) -> None:
+        self._writer = None
+
+    def _commit(self, conn: sqlite3.Connection, *, on_failure: Callable[[], None]) -> None:
+        try:
+            conn.commit()
+        except BaseException:
+            if not self._rollback(conn):
+                on_failure()
+            raise
+
+    def _rollback(self, conn: sqlite3.Connection) -> bool:
+        """Return whether ``conn`` is still reusable after abandoning its transaction."""
+
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            with self._guard:
+                self._counters["discarded"] += 1
+            conn.close()
+            return False
+        return True
+
+    @contextmanager
+    def _unpooled(self) -> Iterator[sqlite3.Connection]:
+        with self._guard:
+            self._counters["unpooled_fallbacks"] += 1
+        conn = self._opener()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            conn.close()
+
+
 def _is_sqlite_busy(exc: sqlite3.OperationalError) -> bool:
     code = getattr(exc, "sqlite_errorcode", None)
     return isinstance(code, int) and (code & 0xFF) == sqlite3.SQLITE_BUSY
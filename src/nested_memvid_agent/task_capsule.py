@@ -44,6 +44,7 @@ _CAPSULE_DATA_ARTIFACTS = frozenset(
         "complete.mv2",
         "complete.memory.json",
         "complete.mv2.records.json",
+        "complete.mv2.records.log",
     }
 )
 _CAPSULE_KNOWN_ARTIFACTS = _CAPSULE_DATA_ARTIFACTS | {
@@ -35,6 +35,9 @@ class ToolContext:
     tool_specs: tuple[ToolSpec, ...] = ()
     behavior_preflight: str = ""
     behavior_preflight_delta_ids: tuple[str, ...] = ()
+    # Owner fenced by tools that time out but may still resume; defaults to
+    # ``memory``. Pooled agents pass their lease so only that run is held.
+    memory_fence: object | None = None
 
 
 class AgentTool(ABC):
@@ -2696,18 +2696,16 @@ def _layers_arg(value: object) -> tuple[MemoryLayer, ...] | None:
 
 def _find_memory_by_id(context: ToolContext, lookup_id: str) -> Any | None:
     for backend in context.memory.backends.values():
-        records = getattr(backend, "records", None)
-        if isinstance(records, list):
-            for record in records:
-                metadata = getattr(record, "metadata", {})
-                if (
-                    record.id == lookup_id
-                    or str(metadata.get("frame_id", "")) == lookup_id
-                ) and memory_record_matches_project_scope(
-                    record,
-                    project_id=context.project_id,
-                ):
-                    return type("_Hit", (), {"record": record})()
+        candidates = (
+            backend.get_by_ids((lookup_id,)).get(lookup_id),
+            backend.find_by_frame_id(lookup_id),
+        )
+        for record in candidates:
+            if record is not None and memory_record_matches_project_scope(
+                record,
+                project_id=context.project_id,
+            ):
+                return type("_Hit", (), {"record": record})()
     hits = context.memory.retrieve(
         RetrievalQuery(
             query=lookup_id,
@@ -3102,28 +3100,11 @@ def _capsule_apply_plan(
 
 def _memory_has_content_hash(context: ToolContext, layer: MemoryLayer, content_hash: str) -> bool:
     backend = context.memory.backends.get(layer)
-    records = getattr(backend, "records", None)
-    if isinstance(records, list):
-        return any(
-            getattr(record, "content_hash", None) == content_hash
-            and memory_record_matches_project_scope(
-                record,
-                project_id=context.project_id,
-            )
-            for record in records
-        )
-    hits = context.memory.retrieve(
-        RetrievalQuery(
-            query=content_hash,
-            layers=(layer,),
-            k_per_layer=3,
-            project_id=context.project_id,
-        )
-    )
+    if backend is None:
+        return False
     return any(
-        hit.record.content_hash == content_hash
-        or hit.record.metadata.get("content_hash") == content_hash
-        for hit in hits
+        memory_record_matches_project_scope(record, project_id=context.project_id)
+        for record in backend.get_by_content_hash(content_hash)
     )
 
 
@@ -711,8 +711,9 @@ def _retain_context_resources_until_settled(
 ) -> None:
     """Keep agent-owned resources live until indeterminate tool code is quiescent."""
 
-    retain = getattr(context.memory, "retain_for_unsettled_tool_execution", None)
-    release = getattr(context.memory, "release_unsettled_tool_execution", None)
+    fence = context.memory if context.memory_fence is None else context.memory_fence
+    retain = getattr(fence, "retain_for_unsettled_tool_execution", None)
+    release = getattr(fence, "release_unsettled_tool_execution", None)
     if not callable(retain) or not callable(release):
         return
     retain(execution_id)
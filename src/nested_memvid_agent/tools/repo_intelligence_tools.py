@@ -23,6 +23,7 @@ from .workspace_tools import (
 )
 
 _MAX_TOOL_QUERY_LIMIT = 100
+_MAX_CURSOR_CHARS = 4_096
 _PLATFORM_OS: Any = os
 _MAX_CONTEXT_CHARS = 50_000
 _MAX_CONTEXT_FILE_BYTES = 1_000_000
@@ -134,6 +135,7 @@ class RepoSymbolsTool(AgentTool):
                 "query": {"type": "string", "maxLength": 512},
                 "limit": {"type": "integer", "minimum": 1, "maximum": _MAX_TOOL_QUERY_LIMIT},
                 "offset": {"type": "integer", "minimum": 0},
+                "cursor": {"type": "string", "minLength": 1, "maxLength": _MAX_CURSOR_CHARS},
             },
         },
     )
@@ -143,11 +145,13 @@ class RepoSymbolsTool(AgentTool):
         try:
             index = _existing_project_index(context)
             limit, offset = _pagination(arguments)
+            cursor = _cursor(arguments, offset=offset)
             query = _optional_query(arguments.get("query"))
             result = index.symbols(
                 query,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
                 path_prefixes=_allowed_index_prefixes(context),
             )
             rows = [
@@ -193,6 +197,7 @@ class RepoReferencesTool(AgentTool):
                 "name": {"type": "string", "minLength": 1, "maxLength": 512},
                 "limit": {"type": "integer", "minimum": 1, "maximum": _MAX_TOOL_QUERY_LIMIT},
                 "offset": {"type": "integer", "minimum": 0},
+                "cursor": {"type": "string", "minLength": 1, "maxLength": _MAX_CURSOR_CHARS},
             },
             "required": ["name"],
         },
@@ -204,10 +209,12 @@ class RepoReferencesTool(AgentTool):
             name = _required_query(arguments.get("name"), field="name")
             index = _existing_project_index(context)
             limit, offset = _pagination(arguments)
+            cursor = _cursor(arguments, offset=offset)
             result = index.references(
                 name,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
                 path_prefixes=_allowed_index_prefixes(context),
             )
             rows = [
@@ -251,6 +258,7 @@ class RepoDependenciesTool(AgentTool):
                 "query": {"type": "string", "maxLength": 512},
                 "limit": {"type": "integer", "minimum": 1, "maximum": _MAX_TOOL_QUERY_LIMIT},
                 "offset": {"type": "integer", "minimum": 0},
+                "cursor": {"type": "string", "minLength": 1, "maxLength": _MAX_CURSOR_CHARS},
             },
         },
     )
@@ -260,11 +268,13 @@ class RepoDependenciesTool(AgentTool):
         try:
             index = _existing_project_index(context)
             limit, offset = _pagination(arguments)
+            cursor = _cursor(arguments, offset=offset)
             query = _optional_query(arguments.get("query"))
             result = index.imports(
                 query,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
                 path_prefixes=_allowed_index_prefixes(context),
             )
             rows = [
@@ -310,6 +320,7 @@ class RepoTestsForTool(AgentTool):
                 "symbol": {"type": "string", "minLength": 1, "maxLength": 512},
                 "limit": {"type": "integer", "minimum": 1, "maximum": _MAX_TOOL_QUERY_LIMIT},
                 "offset": {"type": "integer", "minimum": 0},
+                "cursor": {"type": "string", "minLength": 1, "maxLength": _MAX_CURSOR_CHARS},
             },
             "required": ["symbol"],
         },
@@ -321,10 +332,12 @@ class RepoTestsForTool(AgentTool):
             symbol = _required_query(arguments.get("symbol"), field="symbol")
             index = _existing_project_index(context)
             limit, offset = _pagination(arguments)
+            cursor = _cursor(arguments, offset=offset)
             result = index.tests_for(
                 symbol,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
                 path_prefixes=_allowed_index_prefixes(context),
             )
             rows = [
@@ -454,6 +467,7 @@ class RepoImpactTool(AgentTool):
                     or tests.truncated
                 ),
                 "next_offset": None,
+                "next_cursor": None,
             }
             return self._result(
                 call,
@@ -883,6 +897,20 @@ def _pagination(arguments: dict[str, Any]) -> tuple[int, int]:
     )
 
 
+def _cursor(arguments: dict[str, Any], *, offset: int) -> str | None:
+    value = arguments.get("cursor")
+    if value is None:
+        return None
+    if not isinstance(value, str) or not 0 < len(value) <= _MAX_CURSOR_CHARS:
+        raise _RepoToolFailure(
+            "invalid_tool_arguments",
+            f"cursor must be a string of 1 to {_MAX_CURSOR_CHARS} characters",
+        )
+    if offset:
+        raise _RepoToolFailure("invalid_tool_arguments", "cursor and offset cannot be combined")
+    return value
+
+
 def _bounded_int(value: object, *, minimum: int, maximum: int, field: str) -> int:
     if isinstance(value, bool) or not isinstance(value, int):
         raise _RepoToolFailure("invalid_tool_arguments", f"{field} must be an integer")
@@ -968,6 +996,7 @@ def _query_execution(
         "index_digest": result.index_digest,
         "truncated": result.truncated or len(safe_records) != len(result.records),
         "next_offset": result.next_offset,
+        "next_cursor": result.next_cursor,
     }
     return ToolExecution(
         call=call,
@@ -0,0 +1,167 @@
+"""Inverted-file (IVF-flat) partitioning for approximate vector search.
+
+The partition never owns vectors. It maps the row slots of a caller-owned
+unit-vector matrix to the centroid lists they belong to, so a query scores only
+the rows of the few lists whose centroids are closest to it. Everything here is
+derived state: centroids can be retrained or discarded at any time without
+changing which records exist, only which ones an approximate query can reach.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+
+import numpy as np
+
+_TRAINING_ROWS_PER_LIST = 40
+_MIN_TRAINING_ROWS = 10_000
+_ASSIGN_BLOCK_ROWS = 4096
+
+
+@dataclass(frozen=True)
+class VectorAnnSettings:
+    """Recall/latency knobs for one layer's approximate vector index.
+
+    ``lists`` is the number of k-means partitions (``0`` picks ``sqrt(rows)``
+    at training time), ``probes`` is how many of the nearest lists a query
+    scans, and below ``min_rows`` indexed vectors search stays exact.
+    """
+
+    lists: int = 0
+    probes: int = 8
+    min_rows: int = 4096
+
+    def __post_init__(self) -> None:
+        if self.lists < 0:
+            raise ValueError("vector ANN lists must be zero (automatic) or positive")
+        if self.probes < 1:
+            raise ValueError("vector ANN probes must be positive")
+        if self.min_rows < 1:
+            raise ValueError("vector ANN min_rows must be positive")
+
+    def list_count(self, rows: int) -> int:
+        if self.lists:
+            return max(1, min(self.lists, rows))
+        return max(1, int(round(float(np.sqrt(rows)))))
+
+
+class IVFPartition:
+    """Incrementally maintained assignment of matrix slots to centroid lists."""
+
+    def __init__(self, centroids: np.ndarray) -> None:
+        matrix = np.ascontiguousarray(centroids, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] == 0 or matrix.shape[1] == 0:
+            raise ValueError("IVF centroids must be a non-empty 2-D matrix")
+        if not np.isfinite(matrix).all():
+            raise ValueError("IVF centroids must be finite")
+        self.centroids = matrix
+        self._members: list[list[int]] = [[] for _ in range(matrix.shape[0])]
+        self._list_of: dict[int, int] = {}
+        self._position: dict[int, int] = {}
+
+    @property
+    def dimension(self) -> int:
+        return int(self.centroids.shape[1])
+
+    @property
+    def list_count(self) -> int:
+        return int(self.centroids.shape[0])
+
+    def add(self, slot: int, vector: np.ndarray) -> None:
+        self._append(slot, int(np.argmax(self.centroids @ vector)))
+
+    def add_rows(self, rows: np.ndarray) -> None:
+        """Assign slots ``0..len(rows)-1`` in blocks of one matrix product each."""
+
+        for start in range(0, rows.shape[0], _ASSIGN_BLOCK_ROWS):
+            block = rows[start : start + _ASSIGN_BLOCK_ROWS]
+            for offset, list_id in enumerate(np.argmax(block @ self.centroids.T, axis=1)):
+                self._append(start + offset, int(list_id))
+
+    def discard(self, slot: int) -> None:
+        list_id = self._list_of.pop(slot, None)
+        if list_id is None:
+            return
+        position = self._position.pop(slot)
+        members = self._members[list_id]
+        last = members.pop()
+        if last != slot:
+            members[position] = last
+            self._position[last] = position
+
+    def move(self, source: int, target: int) -> None:
+        """Record that the row at ``source`` now lives at the free ``target`` slot."""
+
+        list_id = self._list_of.pop(source)
+        position = self._position.pop(source)
+        self._members[list_id][position] = target
+        self._list_of[target] = list_id
+        self._position[target] = position
+
+    def candidates(self, query: np.ndarray, probes: int) -> np.ndarray:
+        similarities = self.centroids @ query
+        count = min(max(1, probes), self.list_count)
+        if count < self.list_count:
+            nearest = np.argpartition(-similarities, count - 1)[:count]
+        else:
+            nearest = np.arange(self.list_count)
+        slots = [self._members[int(list_id)] for list_id in nearest]
+        if not any(slots):
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([np.asarray(members, dtype=np.intp) for members in slots])
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, self.centroids, allow_pickle=False)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> IVFPartition:
+        centroids = np.load(io.BytesIO(payload), allow_pickle=False)
+        if centroids.dtype != np.float32:
+            raise ValueError("IVF centroids must be stored as float32")
+        return cls(centroids)
+
+    def _append(self, slot: int, list_id: int) -> None:
+        members = self._members[list_id]
+        self._list_of[slot] = list_id
+        self._position[slot] = len(members)
+        members.append(slot)
+
+
+def train_centroids(
+    rows: np.ndarray,
+    lists: int,
+    *,
+    iterations: int = 8,
+    seed: int = 0,
+) -> np.ndarray:
+    """Spherical k-means over a bounded, deterministic sample of unit rows."""
+
+    count = int(rows.shape[0])
+    if count == 0:
+        raise ValueError("Cannot train IVF centroids without rows")
+    lists = max(1, min(lists, count))
+    generator = np.random.default_rng(seed)
+    sample_size = min(count, max(lists * _TRAINING_ROWS_PER_LIST, _MIN_TRAINING_ROWS))
+    if sample_size < count:
+        sample = rows[np.sort(generator.choice(count, size=sample_size, replace=False))]
+    else:
+        sample = rows[:count]
+    sample = np.asarray(sample, dtype=np.float32)
+    centroids = sample[generator.choice(sample.shape[0], size=lists, replace=False)].copy()
+    for _ in range(iterations):
+        similarities = sample @ centroids.T
+        assignment = np.argmax(similarities, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        sizes = np.bincount(assignment, minlength=lists)
+        empty = np.flatnonzero(sizes == 0)
+        if empty.size:
+            # Re-seed empty lists with the rows the current centroids fit worst.
+            worst = np.argsort(similarities[np.arange(sample.shape[0]), assignment])
+            sums[empty] = sample[worst[: empty.size]]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = np.where(norms > 1e-12, sums / np.maximum(norms, 1e-12), centroids)
+    return np.ascontiguousarray(centroids, dtype=np.float32)
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
+import mmap
+import os
 import sqlite3
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from threading import RLock
-from typing import Any, Protocol, runtime_checkable
+from typing import IO, Any, Protocol, cast, runtime_checkable
 
 import numpy as np
 
+from .embedding_cache import EmbeddingCache, text_digest
+from .file_lock import lock_exclusive, unlock
 from .models import MemoryLayer, MemoryRecord
 from .private_artifacts import (
+    harden_private_file,
     harden_private_sqlite_files,
+    open_private_file_descriptor,
     prepare_private_sqlite_file,
+    read_private_bytes,
     reset_disposable_private_sqlite_files,
+    write_private_bytes,
 )
+from .vector_ann import IVFPartition, VectorAnnSettings, train_centroids
 
 SCHEMA_VERSION = 1
 DEFAULT_LOCAL_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+_MATRIX_INITIAL_ROWS = 64
+DEFAULT_EMBED_BATCH_SIZE = 64
+_FLOAT32_BYTES = np.dtype(np.float32).itemsize
 
 
 @runtime_checkable
@@ -29,6 +41,14 @@ class TextEmbedder(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class BatchTextEmbedder(TextEmbedder, Protocol):
+    """Optional extension for embedders with a native batch path."""
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
 class VectorSidecarUnavailable(RuntimeError):
     """Raised when an explicitly configured vector sidecar cannot embed text."""
 
@@ -52,6 +72,7 @@ class VectorSidecarStatus:
     missing_count: int = 0
     dimension: int | None = None
     disabled_reason: str | None = None
+    ann_lists: int | None = None
 
     @classmethod
     def disabled(cls, layer: MemoryLayer, reason: str) -> VectorSidecarStatus:
@@ -78,6 +99,7 @@ class VectorSidecarStatus:
             "missing_count": self.missing_count,
             "dimension": self.dimension,
             "disabled_reason": self.disabled_reason,
+            "ann_lists": self.ann_lists,
         }
 
 
@@ -91,6 +113,16 @@ class SentenceTransformerEmbedder:
         encoded = model.encode(text, convert_to_numpy=True, normalize_embeddings=False)
         return np.asarray(encoded, dtype=np.float32)
 
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        model = self._load_model()
+        encoded = model.encode(
+            list(texts),
+            batch_size=max(1, len(texts)),
+            convert_to_numpy=True,
+            normalize_embeddings=False,
+        )
+        return np.asarray(encoded, dtype=np.float32)
+
     def _load_model(self) -> Any:
         if self._model is not None:
             return self._model
@@ -106,6 +138,295 @@ def make_local_embedder(model_name: str | None = None) -> TextEmbedder:
     return SentenceTransformerEmbedder(model_name or DEFAULT_LOCAL_EMBEDDING_MODEL)
 
 
+def embed_texts(
+    embedder: TextEmbedder,
+    texts: Sequence[str],
+    *,
+    cache: EmbeddingCache | None = None,
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+) -> list[np.ndarray]:
+    """Embed ``texts`` in order, reusing cached vectors and batching the rest.
+
+    Texts are addressed by content, so duplicates are embedded once and any
+    text already cached for ``embedder.model_name`` is never sent to the model.
+    Misses go to ``embed_many`` in chunks of at most ``batch_size`` when the
+    embedder provides it, and to ``embed`` one at a time otherwise.
+    """
+
+    digests = [text_digest(text) for text in texts]
+    model = embedder.model_name
+    vectors = {} if cache is None else cache.get_many(model, digests)
+    pending = {
+        digest: text for digest, text in zip(digests, texts, strict=True) if digest not in vectors
+    }
+    pending_items = list(pending.items())
+    for start in range(0, len(pending_items), max(1, batch_size)):
+        chunk = pending_items[start : start + max(1, batch_size)]
+        if len(chunk) > 1 and isinstance(embedder, BatchTextEmbedder):
+            embedded = np.asarray(embedder.embed_many([text for _, text in chunk]), dtype=np.float32)
+            if embedded.ndim != 2 or embedded.shape[0] != len(chunk):
+                raise ValueError("embed_many must return one row per input text")
+            fresh = [(digest, embedded[index]) for index, (digest, _) in enumerate(chunk)]
+        else:
+            fresh = [
+                (digest, np.asarray(embedder.embed(text), dtype=np.float32).reshape(-1))
+                for digest, text in chunk
+            ]
+        vectors.update(fresh)
+        if cache is not None:
+            cache.put_many(model, fresh)
+    return [vectors[digest] for digest in digests]
+
+
+def vector_matrix_path(path: Path) -> Path:
+    """Return the memory-mapped matrix file kept beside one sidecar database."""
+
+    return Path(f"{path}-matrix")
+
+
+def vector_ann_path(path: Path) -> Path:
+    """Return the IVF centroid file kept beside one sidecar database."""
+
+    return Path(f"{path}-ann")
+
+
+class _VectorMatrix:
+    """Memory-mapped float32 mirror of the vectors stored in SQLite.
+
+    Rows of the dominant dimension live contiguously in an owner-only file that
+    grows by doubling; removal moves the last row into the freed slot. Rows
+    whose dimension differs are tracked only by id so search can keep the
+    sidecar's rebuild-on-mismatch contract. SQLite stays the source of truth:
+    the file is rewritten from it on every open and never trusted across runs.
+    An attached :class:`IVFPartition` follows every row move so approximate
+    search can score only the probed lists.
+
+    The file is shared and truncated on open, so one matrix owns it through an
+    exclusive lock held until close. Another sidecar over the same path, in
+    this process or another, maps anonymous private memory instead and never
+    touches the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._descriptor = -1
+        self._lock_handle: IO[str] | None = None
+        self._open = False
+        self._mapping: mmap.mmap | None = None
+        self._rows: np.ndarray | None = None
+        self._active = np.zeros(0, dtype=bool)
+        self._dimension: int | None = None
+        self._ids: list[str] = []
+        self._slots: dict[str, int] = {}
+        self._foreign: dict[str, tuple[int, bool]] = {}
+        self.partition: IVFPartition | None = None
+        self.partition_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def file_backed(self) -> bool:
+        return self._descriptor >= 0
+
+    def open(self) -> None:
+        self.close()
+        descriptor = open_private_file_descriptor(self.path)
+        lock_handle = cast(IO[str], os.fdopen(descriptor, "r+b", closefd=False))
+        try:
+            lock_exclusive(lock_handle, blocking=False)
+            os.ftruncate(descriptor, 0)
+        except BlockingIOError:
+            owned = False
+        except BaseException:
+            lock_handle.close()
+            os.close(descriptor)
+            raise
+        else:
+            owned = True
+        if owned:
+            self._descriptor = descriptor
+            self._lock_handle = lock_handle
+        else:
+            lock_handle.close()
+            os.close(descriptor)
+        self._open = True
+
+    def close(self) -> None:
+        self._unmap()
+        if self._lock_handle is not None:
+            unlock(self._lock_handle)
+            self._lock_handle.close()
+        self._lock_handle = None
+        if self._descriptor >= 0:
+            os.close(self._descriptor)
+        self._descriptor = -1
+        self._open = False
+        self._active = np.zeros(0, dtype=bool)
+        self._dimension = None
+        self._ids = []
+        self._slots = {}
+        self._foreign = {}
+        self.partition = None
+        self.partition_rows = 0
+
+    @property
+    def dimension(self) -> int | None:
+        return self._dimension
+
+    def rows(self) -> np.ndarray:
+        if self._rows is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._rows[: len(self._ids)]
+
+    def attach_partition(self, partition: IVFPartition) -> None:
+        if partition.dimension != self._dimension:
+            raise ValueError("IVF centroid dimension does not match the vector matrix")
+        partition.add_rows(self.rows())
+        self.partition = partition
+        self.partition_rows = len(self._ids)
+
+    def put(self, record_id: str, vector: np.ndarray, *, active: bool) -> None:
+        self.remove(record_id)
+        dimension = int(vector.shape[0])
+        if self._dimension is None or (not self._ids and dimension != self._dimension):
+            self._remap(dimension, _MATRIX_INITIAL_ROWS)
+        if dimension != self._dimension:
+            self._foreign[record_id] = (dimension, active)
+            return
+        assert self._rows is not None
+        slot = len(self._ids)
+        if slot == self._rows.shape[0]:
+            self._remap(dimension, slot * 2)
+            assert self._rows is not None
+        self._rows[slot] = vector
+        self._active[slot] = active
+        self._ids.append(record_id)
+        self._slots[record_id] = slot
+        if self.partition is not None:
+            self.partition.add(slot, self._rows[slot])
+
+    def mark_incompatible(self, record_id: str, *, active: bool) -> None:
+        """Track a row whose stored bytes disagree with its declared dimension."""
+
+        self.remove(record_id)
+        self._foreign[record_id] = (0, active)
+
+    def deactivate(self, record_id: str) -> None:
+        slot = self._slots.get(record_id)
+        if slot is not None:
+            self._active[slot] = False
+            return
+        foreign = self._foreign.get(record_id)
+        if foreign is not None:
+            self._foreign[record_id] = (foreign[0], False)
+
+    def remove(self, record_id: str) -> None:
+        self._foreign.pop(record_id, None)
+        slot = self._slots.pop(record_id, None)
+        if slot is None:
+            return
+        assert self._rows is not None
+        last = len(self._ids) - 1
+        if self.partition is not None:
+            self.partition.discard(slot)
+            if slot != last:
+                self.partition.move(last, slot)
+        if slot != last:
+            moved = self._ids[last]
+            self._rows[slot] = self._rows[last]
+            self._active[slot] = self._active[last]
+            self._ids[slot] = moved
+            self._slots[moved] = slot
+        self._ids.pop()
+
+    def search(
+        self,
+        query: np.ndarray,
+        *,
+        k: int,
+        min_score: float,
+        include_inactive: bool,
+        probes: int | None = None,
+    ) -> list[tuple[str, float]] | None:
+        """Return ranked ``(id, score)`` pairs, or ``None`` on a dimension mismatch.
+
+        With ``probes`` and an attached partition only the rows of the nearest
+        ``probes`` lists are scored; otherwise every row is.
+        """
+
+        dimension = int(query.shape[0])
+        if any(
+            foreign_dimension != dimension and (include_inactive or active)
+            for foreign_dimension, active in self._foreign.values()
+        ):
+            return None
+        count = len(self._ids)
+        if count == 0:
+            return []
+        active = self._active[:count]
+        if dimension != self._dimension:
+            return None if include_inactive or bool(active.any()) else []
+        if k <= 0:
+            return []
+        assert self._rows is not None
+        query = query.astype(np.float32, copy=False)
+        if probes is not None and self.partition is not None:
+            slots = self.partition.candidates(query, probes)
+            scores = self._rows[slots] @ query
+            active = active[slots]
+        else:
+            slots = None
+            scores = self._rows[:count] @ query
+        eligible = (scores >= min_score) & (scores > 0)
+        if not include_inactive:
+            eligible &= active
+        candidates = np.flatnonzero(eligible)
+        if candidates.size > k:
+            top = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[top]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            (self._ids[int(position if slots is None else slots[position])], float(scores[position]))
+            for position in ranked
+        ]
+
+    def _remap(self, dimension: int, capacity: int) -> None:
+        if not self._open:
+            raise RuntimeError("Vector matrix is not open")
+        length = capacity * dimension * _FLOAT32_BYTES
+        if self._descriptor >= 0:
+            self._unmap()
+            os.ftruncate(self._descriptor, length)
+            self._mapping = mmap.mmap(self._descriptor, length)
+            self._rows = np.ndarray((capacity, dimension), dtype=np.float32, buffer=self._mapping)
+        else:
+            # Anonymous memory does not survive the remap; carry the live rows.
+            mapping = mmap.mmap(-1, length)
+            rows = np.ndarray((capacity, dimension), dtype=np.float32, buffer=mapping)
+            if self._rows is not None and self._dimension == dimension:
+                rows[: len(self._ids)] = self._rows[: len(self._ids)]
+            self._unmap()
+            self._mapping = mapping
+            self._rows = rows
+        active = np.zeros(capacity, dtype=bool)
+        if self._dimension == dimension:
+            active[: len(self._ids)] = self._active[: len(self._ids)]
+        elif self.partition is not None:
+            self.partition = None
+            self.partition_rows = 0
+        self._active = active
+        self._dimension = dimension
+
+    def _unmap(self) -> None:
+        # Drop the array view first: mmap refuses to close while a buffer
+        # export is still alive.
+        self._rows = None
+        if self._mapping is not None:
+            self._mapping.close()
+        self._mapping = None
+
+
 class VectorSidecar:
     """Disposable SQLite vector index keyed to canonical `.mv2` record IDs."""
 
@@ -117,13 +438,19 @@ class VectorSidecar:
         embedder: TextEmbedder,
         mv2_path: Path,
         provider: str = "local",
+        ann: VectorAnnSettings | None = None,
     ) -> None:
         self.path = Path(path)
         self.layer = layer
         self.embedder = embedder
         self.mv2_path = Path(mv2_path)
         self.provider = provider
+        self.ann = ann
+        self.matrix_path = vector_matrix_path(self.path)
+        self.ann_path = vector_ann_path(self.path)
         self._conn: sqlite3.Connection | None = None
+        self._embedding_cache: EmbeddingCache | None = None
+        self._matrix = _VectorMatrix(self.matrix_path)
         self._last_error: str | None = None
         self._requires_rebuild: str | None = None
         self._lock = RLock()
@@ -137,12 +464,16 @@ class VectorSidecar:
                 conn.execute("PRAGMA synchronous=NORMAL")
                 self._conn = conn
                 self._ensure_schema()
+                self._embedding_cache = EmbeddingCache(conn)
+                self._load_matrix()
                 if self._requires_rebuild is None:
                     self._last_error = None
                 harden_private_sqlite_files(self.path)
             except Exception:
                 conn.close()
                 self._conn = None
+                self._embedding_cache = None
+                self._matrix.close()
                 raise
 
     def upsert(self, record: MemoryRecord) -> bool:
@@ -151,35 +482,19 @@ class VectorSidecar:
                 raise ValueError(
                     f"Cannot index {record.layer} record in {self.layer} vector sidecar"
                 )
-            vector = self._embed_record(record)
-            if vector is None:
-                return False
             conn = self._require_conn()
-            normalized = _normalized(vector)
+            vectors = self._embed_records((record,))
+            if vectors is None:
+                return False
+            normalized = _normalized(vectors[0])
             if normalized is None:
                 return False
-            conn.execute(
-                """
-                INSERT INTO vector_records
-                    (record_id, content_hash, active, dimension, vector, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(record_id) DO UPDATE SET
-                    content_hash=excluded.content_hash,
-                    active=excluded.active,
-                    dimension=excluded.dimension,
-                    vector=excluded.vector,
-                    updated_at=excluded.updated_at
-                """,
-                (
-                    record.id,
-                    record.content_hash,
-                    1 if _record_active(record) else 0,
-                    int(normalized.shape[0]),
-                    normalized.astype(np.float32).tobytes(),
-                    datetime.now(UTC).isoformat(),
-                ),
-            )
+            conn.execute(_UPSERT_VECTOR_SQL, _vector_row(record, normalized))
             conn.commit()
+            self._sync_matrix(
+                lambda: self._matrix.put(record.id, normalized, active=_record_active(record))
+            )
+            self._maybe_train_partition()
             self._last_error = None
             harden_private_sqlite_files(self.path)
             return True
@@ -192,6 +507,7 @@ class VectorSidecar:
                 (datetime.now(UTC).isoformat(), record_id),
             )
             conn.commit()
+            self._sync_matrix(lambda: self._matrix.deactivate(record_id))
             self._last_error = None
             harden_private_sqlite_files(self.path)
 
@@ -201,27 +517,48 @@ class VectorSidecar:
                 if self._requires_rebuild is None:
                     raise RuntimeError("VectorSidecar.open() must be called before rebuild")
                 try:
-                    reset_disposable_private_sqlite_files(self.path)
+                    reset_disposable_private_sqlite_files(
+                        self.path, companions=(self.matrix_path, self.ann_path)
+                    )
                     self.open()
                 except Exception as exc:
                     self.record_open_error(exc)
                     raise
             rows = tuple(records)
-            seen: set[str] = set()
-            complete = True
             for record in rows:
-                seen.add(record.id)
-                complete = self.upsert(record) and complete
+                if record.layer != self.layer:
+                    raise ValueError(
+                        f"Cannot index {record.layer} record in {self.layer} vector sidecar"
+                    )
             conn = self._require_conn()
-            if seen:
-                placeholders = ",".join("?" for _ in seen)
-                conn.execute(
-                    f"DELETE FROM vector_records WHERE record_id NOT IN ({placeholders})",
-                    tuple(seen),
-                )
-            else:
-                conn.execute("DELETE FROM vector_records")
+            vectors = self._embed_records(rows)
+            complete = vectors is not None
+            if vectors is not None:
+                self._last_error = None
+                params = []
+                for record, vector in zip(rows, vectors, strict=True):
+                    normalized = _normalized(vector)
+                    if normalized is None:
+                        complete = False
+                        continue
+                    params.append(_vector_row(record, normalized))
+                conn.executemany(_UPSERT_VECTOR_SQL, params)
+                if self._embedding_cache is not None:
+                    self._embedding_cache.retain(
+                        self.embedder.model_name,
+                        (text_digest(_record_text(record)) for record in rows),
+                    )
+            seen = {record.id for record in rows}
+            conn.executemany(
+                "DELETE FROM vector_records WHERE record_id = ?",
+                [
+                    (record_id,)
+                    for (record_id,) in conn.execute("SELECT record_id FROM vector_records")
+                    if record_id not in seen
+                ],
+            )
             conn.commit()
+            self._load_matrix()
             harden_private_sqlite_files(self.path)
             if complete:
                 self._requires_rebuild = None
@@ -245,31 +582,26 @@ class VectorSidecar:
             normalized_query = _normalized(query_vector)
             if normalized_query is None:
                 return []
-            conn = self._require_conn()
-            sql = "SELECT record_id, dimension, vector FROM vector_records"
-            params: tuple[object, ...] = ()
-            if not include_inactive:
-                sql += " WHERE active = 1"
-            hits: list[VectorSidecarHit] = []
-            incompatible_dimension = False
-            for record_id, dimension, blob in conn.execute(sql, params):
-                vector = np.frombuffer(blob, dtype=np.float32)
-                if (
-                    int(dimension) != int(normalized_query.shape[0])
-                    or vector.shape != normalized_query.shape
-                ):
-                    incompatible_dimension = True
-                    continue
-                score = float(vector @ normalized_query)
-                if score >= min_score and score > 0:
-                    hits.append(
-                        VectorSidecarHit(record_id=str(record_id), score=min(score, 1.0))
-                    )
-            if incompatible_dimension:
+            self._require_conn()
+            ranked = self._matrix.search(
+                normalized_query,
+                k=k,
+                min_score=min_score,
+                include_inactive=include_inactive,
+                probes=self.ann.probes if self.ann is not None and self._ann_active() else None,
+            )
+            if ranked is None:
                 self._requires_rebuild = "vector dimension changed; rebuild required"
+                if self._embedding_cache is not None:
+                    # The embedder now disagrees with vectors cached under its
+                    # model name, so none of them may seed the rebuild.
+                    self._embedding_cache.retain(self.embedder.model_name, ())
                 return []
             self._last_error = None
-            return sorted(hits, key=lambda hit: hit.score, reverse=True)[:k]
+            return [
+                VectorSidecarHit(record_id=record_id, score=min(score, 1.0))
+                for record_id, score in ranked
+            ]
 
     def status(self, *, records: Iterable[MemoryRecord] | None = None) -> VectorSidecarStatus:
         with self._lock:
@@ -322,6 +654,11 @@ class VectorSidecar:
                 missing_count=missing_count,
                 dimension=dimension,
                 disabled_reason=self._requires_rebuild or self._last_error,
+                ann_lists=(
+                    self._matrix.partition.list_count
+                    if self._ann_active() and self._matrix.partition is not None
+                    else None
+                ),
             )
 
     def close(self) -> None:
@@ -329,7 +666,11 @@ class VectorSidecar:
             if self._conn is not None:
                 self._conn.close()
             self._conn = None
+            self._embedding_cache = None
+            self._matrix.close()
             harden_private_sqlite_files(self.path)
+            harden_private_file(self.matrix_path, missing_ok=True)
+            harden_private_file(self.ann_path, missing_ok=True)
 
     def record_error(self, error: BaseException) -> None:
         """Expose disposable-index degradation without failing canonical memory."""
@@ -415,9 +756,62 @@ class VectorSidecar:
         conn.commit()
         harden_private_sqlite_files(self.path)
 
-    def _embed_record(self, record: MemoryRecord) -> np.ndarray | None:
+    def _load_matrix(self) -> None:
+        """Rewrite the memory-mapped matrix from the vectors committed in SQLite."""
+
+        conn = self._require_conn()
+        self._matrix.open()
+        for record_id, active, dimension, blob in conn.execute(
+            "SELECT record_id, active, dimension, vector FROM vector_records ORDER BY rowid"
+        ):
+            vector = np.frombuffer(blob, dtype=np.float32)
+            if int(dimension) != int(vector.shape[0]):
+                self._matrix.mark_incompatible(str(record_id), active=bool(active))
+                continue
+            self._matrix.put(str(record_id), vector, active=bool(active))
+        if self.ann is None or self._matrix.dimension is None:
+            return
+        payload = read_private_bytes(self.ann_path, missing_ok=True)
+        if payload is not None and len(self._matrix) >= self.ann.min_rows:
+            try:
+                self._matrix.attach_partition(IVFPartition.from_bytes(payload))
+            except (ValueError, EOFError):
+                # Centroids only steer recall; a stale or damaged file is
+                # simply retrained below.
+                pass
+        self._maybe_train_partition()
+
+    def _ann_active(self) -> bool:
+        return self.ann is not None and len(self._matrix) >= self.ann.min_rows
+
+    def _maybe_train_partition(self) -> None:
+        """Train IVF centroids once ANN applies, and retrain after the layer doubles."""
+
+        if self.ann is None or not self._ann_active():
+            return
+        rows = len(self._matrix)
+        if self._matrix.partition is not None and rows < 2 * self._matrix.partition_rows:
+            return
+        partition = IVFPartition(train_centroids(self._matrix.rows(), self.ann.list_count(rows)))
+        self._matrix.attach_partition(partition)
+        write_private_bytes(self.ann_path, partition.to_bytes())
+
+    def _sync_matrix(self, update: Callable[[], None]) -> None:
+        try:
+            update()
+        except Exception:
+            # SQLite already committed; the in-memory mirror can no longer be
+            # trusted until a rebuild rewrites it from the database.
+            self._requires_rebuild = "vector matrix out of sync; rebuild required"
+            raise
+
+    def _embed_records(self, records: Sequence[MemoryRecord]) -> list[np.ndarray] | None:
         try:
-            return np.asarray(self.embedder.embed(_record_text(record)), dtype=np.float32)
+            return embed_texts(
+                self.embedder,
+                [_record_text(record) for record in records],
+                cache=self._embedding_cache,
+            )
         except VectorSidecarUnavailable as exc:
             self._last_error = str(exc)
             return None
@@ -435,6 +829,30 @@ class VectorSidecar:
         return self._conn
 
 
+_UPSERT_VECTOR_SQL = """
+INSERT INTO vector_records
+    (record_id, content_hash, active, dimension, vector, updated_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(record_id) DO UPDATE SET
+    content_hash=excluded.content_hash,
+    active=excluded.active,
+    dimension=excluded.dimension,
+    vector=excluded.vector,
+    updated_at=excluded.updated_at
+"""
+
+
+def _vector_row(record: MemoryRecord, normalized: np.ndarray) -> tuple[object, ...]:
+    return (
+        record.id,
+        record.content_hash,
+        1 if _record_active(record) else 0,
+        int(normalized.shape[0]),
+        normalized.astype(np.float32).tobytes(),
+        datetime.now(UTC).isoformat(),
+    )
+
+
 def _normalized(vector: np.ndarray) -> np.ndarray | None:
     flat = np.asarray(vector, dtype=np.float32).reshape(-1)
     if flat.size == 0:
@@ -72,7 +72,7 @@ def test_bootstrap_consumes_private_file_without_leaking_secrets(tmp_path: Path)
         "profile_id": "default",
         "launch_nonce_digest": sha256(b"launch-nonce").hexdigest(),
         "sidecar_version": _PACKAGE_VERSION,
-        "state_schema_version": 21,
+        "state_schema_version": 22,
         "routing_schema_version": 4,
         "memory_layers": list(_MEMORY_LAYERS),
     }
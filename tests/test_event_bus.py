@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from threading import Thread, get_ident
+
+import pytest
+
+from nested_memvid_agent.event_bus import RunEvent, RunEventBus
+from nested_memvid_agent.state_store import AgentStateStore
+
+
+def _state_with_run(tmp_path: Path, run_id: str = "run_stream") -> AgentStateStore:
+    state = AgentStateStore(tmp_path / "state.db")
+    state.create_run(
+        run_id=run_id,
+        message="stream",
+        session_id="session",
+        workspace=str(tmp_path),
+        model="mock",
+    )
+    return state
+
+
+def test_token_events_are_group_committed_and_delivered_in_commit_order(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state, flush_interval_seconds=60.0, flush_batch_size=10_000)
+    subscriber = bus.subscribe("run_stream")
+
+    queued = [bus.publish("run_stream", "assistant.token", {"content": str(i)}) for i in range(50)]
+
+    assert queued == [None] * 50
+    assert state.list_run_steps("run_stream") == []
+    with pytest.raises(queue.Empty):
+        subscriber.get_nowait()
+
+    completed = bus.publish("run_stream", "run.completed", {})
+
+    assert completed is not None
+    tokens = [subscriber.get_nowait() for _ in range(50)]
+    assert [event.id for event in tokens] == list(range(tokens[0].id, tokens[0].id + 50))
+    assert [event.payload["content"] for event in tokens] == [str(i) for i in range(50)]
+    assert subscriber.get_nowait() == completed
+    steps = state.list_run_steps("run_stream", limit=1_000)
+    assert [step["id"] for step in steps] == [tokens[-1].id, completed.id]
+    assert steps[0]["payload"]["content"] == "".join(str(i) for i in range(50))
+    assert steps[-1]["type"] == "run.completed"
+    assert bus.journal_snapshot()["commits"] == 1
+    assert bus.journal_snapshot()["committed_steps"] == 51
+
+
+def test_background_flush_and_close_drain_the_journal(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state, flush_interval_seconds=0.0, flush_batch_size=4)
+
+    for index in range(9):
+        bus.publish("run_stream", "assistant.token", {"content": str(index)})
+    assert bus.close(timeout_seconds=5.0) is True
+
+    assert len(state.list_run_steps("run_stream")) == 9
+    late = bus.publish("run_stream", "assistant.token", {"content": "late"})
+    assert late is not None
+    assert state.list_run_steps("run_stream", after_id=late.id - 1)[0]["id"] == late.id
+
+
+def test_step_ids_follow_commit_order_across_buses_and_direct_appends(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    first = RunEventBus(state, flush_interval_seconds=60.0, flush_batch_size=10_000)
+    second = RunEventBus(state, flush_interval_seconds=60.0, flush_batch_size=10_000)
+
+    first.publish("run_stream", "assistant.token", {"content": "a"})
+    second.publish("run_stream", "assistant.token", {"content": "b"})
+    direct = state.append_run_step("run_stream", "external", {})
+    second.flush()
+    first.flush()
+
+    steps = state.list_run_steps("run_stream")
+    assert [step["type"] for step in steps] == ["external", "assistant.token", "assistant.token"]
+    assert [step["payload"].get("content") for step in steps] == [None, "b", "a"]
+    assert steps[0]["id"] == direct
+    # A resume from any committed id sees every step committed after it.
+    assert [step["id"] for step in state.list_run_steps("run_stream", after_id=direct)] == [
+        step["id"] for step in steps[1:]
+    ]
+
+
+def test_completed_token_segment_is_persisted_as_one_message(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state)
+    subscriber = bus.subscribe("run_stream")
+
+    for part in "hello":
+        bus.publish("run_stream", "assistant.token", {"content": part})
+    bus.publish("run_stream", "assistant.tool_call", {"tool": "fs.read"})
+    bus.publish("run_stream", "assistant.token", {"content": "!"})
+    bus.publish("run_stream", "run.completed", {})
+
+    live = [subscriber.get_nowait() for _ in range(8)]
+    tokens = live[:5]
+    replay = state.list_run_steps("run_stream")
+
+    assert [event.type for event in live].count("assistant.token") == 6
+    assert [step["type"] for step in replay] == [
+        "assistant.message",
+        "assistant.tool_call",
+        "assistant.message",
+        "run.completed",
+    ]
+    assert replay[0]["id"] == tokens[-1].id
+    assert replay[0]["payload"] == {
+        "content": "hello",
+        "token_count": 5,
+        "first_step_id": tokens[0].id,
+        "last_step_id": tokens[-1].id,
+    }
+    replayed = bus.subscribe("run_stream", after_id=tokens[0].id - 1)
+    assert replayed.get_nowait().payload["content"] == "hello"
+    # A client that saw only part of the segment still receives the whole text;
+    # ``first_step_id``/``last_step_id`` let it drop the tokens it already has.
+    resumed = bus.subscribe("run_stream", after_id=tokens[1].id)
+    message = resumed.get_nowait()
+    assert message.type == "assistant.message"
+    assert message.payload["content"] == "hello"
+    assert resumed.get_nowait().type == "assistant.tool_call"
+
+
+def test_compaction_pass_coalesces_interrupted_runs_and_prunes_expired_history(
+    tmp_path: Path,
+) -> None:
+    state = _state_with_run(tmp_path, "run_interrupted")
+    state.create_run(
+        run_id="run_active",
+        message="active",
+        session_id="session",
+        workspace=str(tmp_path),
+        model="mock",
+    )
+    for run_id in ("run_interrupted", "run_active"):
+        for part in ("a", "b"):
+            state.append_run_step(run_id, "assistant.token", {"content": part})
+    state.update_run("run_interrupted", status="failed")
+
+    now = datetime.now(UTC) + timedelta(seconds=1)
+    compacted = state.compact_run_steps(finished_before=now)
+
+    assert compacted == {"runs_compacted": 1, "tokens_coalesced": 2, "steps_pruned": 0}
+    assert [step["type"] for step in state.list_run_steps("run_interrupted")] == [
+        "assistant.message"
+    ]
+    assert len(state.list_run_steps("run_active")) == 2
+    pruned = state.compact_run_steps(finished_before=now, prune_before=now)
+    assert pruned["steps_pruned"] == 1
+    assert state.list_run_steps("run_interrupted") == []
+    assert len(state.list_run_steps("run_active")) == 2
+
+
+def test_async_subscribers_share_one_loop_handoff_and_signal_lag(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state)
+    backlog = bus.publish("run_stream", "run.started", {})
+
+    async def scenario() -> None:
+        fast = await bus.subscribe_async("run_stream")
+        slow = await bus.subscribe_async("run_stream", after_id=backlog.id, max_buffer=2)
+        assert (await fast.get()) == backlog
+
+        publisher = Thread(
+            target=lambda: [
+                bus.publish("run_stream", "assistant.token", {"content": str(index)})
+                for index in range(3)
+            ]
+        )
+        publisher.start()
+        await asyncio.to_thread(publisher.join)
+
+        received = [await asyncio.wait_for(fast.get(), timeout=5) for _ in range(3)]
+        assert [event.payload["content"] for event in received] == ["0", "1", "2"]
+        assert await asyncio.wait_for(slow.get(), timeout=5) is None
+        assert slow.lagged is True
+        assert slow.last_id == backlog.id
+        bus.unsubscribe_async(fast)
+        bus.unsubscribe_async(slow)
+
+    asyncio.run(scenario())
+    bus.publish("run_stream", "run.completed", {})
+
+
+def test_async_get_timeout_keeps_the_backlog_page_being_fetched(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state, replay_page_size=2)
+    published = [bus.publish("run_stream", "tool.progress", {"index": i}) for i in range(3)]
+
+    async def scenario() -> None:
+        subscription = await bus.subscribe_async("run_stream")
+        cursor = subscription._cursor
+        assert cursor is not None
+        next_page = cursor.next_page
+
+        def slow_next_page() -> list[RunEvent]:
+            time.sleep(0.2)
+            return next_page()
+
+        cursor.next_page = slow_next_page  # type: ignore[method-assign]
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(subscription.get(), timeout=0.01)
+        received = [await asyncio.wait_for(subscription.get(), timeout=5) for _ in range(3)]
+        assert [event.id for event in received] == [event.id for event in published]
+        bus.unsubscribe_async(subscription)
+
+    asyncio.run(scenario())
+
+
+def test_subscribe_replays_full_backlog_in_pages_then_switches_to_live(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state, replay_page_size=64)
+    published = [bus.publish("run_stream", "tool.progress", {"index": i}) for i in range(500)]
+
+    subscriber = bus.subscribe("run_stream", after_id=published[9].id)
+    live = bus.publish("run_stream", "run.completed", {})
+    received = [subscriber.get(timeout=1).id for _ in range(491)]
+
+    assert received == [event.id for event in published[10:]] + [live.id]
+    assert subscriber.catching_up is False
+    assert len(subscriber._page) == 0
+
+
+def test_token_compaction_waits_for_catching_up_subscribers(tmp_path: Path) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state, replay_page_size=1)
+    started = bus.publish("run_stream", "run.started", {})
+    subscriber = bus.subscribe("run_stream")
+    for part in "ok":
+        bus.publish("run_stream", "assistant.token", {"content": part})
+    bus.publish("run_stream", "run.completed", {})
+
+    assert state.list_run_steps("run_stream")[1]["type"] == "assistant.token"
+    assert subscriber.get(timeout=1) == started
+    live = [subscriber.get(timeout=1) for _ in range(3)]
+    assert [event.type for event in live] == ["assistant.token"] * 2 + ["run.completed"]
+    assert [step["type"] for step in state.list_run_steps("run_stream")] == [
+        "run.started",
+        "assistant.message",
+        "run.completed",
+    ]
+
+
+def test_async_catch_up_compacts_tokens_off_the_event_loop(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state = _state_with_run(tmp_path)
+    bus = RunEventBus(state, replay_page_size=1)
+    bus.publish("run_stream", "run.started", {})
+    coalesce = state.coalesce_run_tokens
+    threads: list[int] = []
+
+    def slow_coalesce(run_id: str, **kwargs: int) -> int:
+        threads.append(get_ident())
+        time.sleep(0.3)
+        return coalesce(run_id, **kwargs)
+
+    monkeypatch.setattr(state, "coalesce_run_tokens", slow_coalesce)
+
+    async def scenario() -> None:
+        reader = await bus.subscribe_async("run_stream")
+        leaver = await bus.subscribe_async("run_stream")
+        for part in "ok":
+            bus.publish("run_stream", "assistant.token", {"content": part})
+        bus.publish("run_stream", "run.completed", {})
+        assert threads == []
+
+        started = time.monotonic()
+        bus.unsubscribe_async(leaver)
+        received = [await asyncio.wait_for(reader.get(), timeout=5) for _ in range(4)]
+        assert time.monotonic() - started < 0.2
+        assert [event.type for event in received][-1] == "run.completed"
+        bus.unsubscribe_async(reader)
+        assert get_ident() not in threads
+
+    asyncio.run(scenario())
+    assert len(threads) == 1
+    assert [step["type"] for step in state.list_run_steps("run_stream")] == [
+        "run.started",
+        "assistant.message",
+        "run.completed",
+    ]
@@ -6798,9 +6798,11 @@ def test_run_manager_publishes_stream_tokens(tmp_path: Path) -> None:
     assert final["status"] == "completed"
 
     events = manager.state.list_run_steps(run.run_id)
-    token_events = [event for event in events if event["type"] == "assistant.token"]
-    assert token_events
-    assert "Mock response: hello" in str(token_events[0]["payload"]["content"])
+    assert not [event for event in events if event["type"] == "assistant.token"]
+    messages = [event for event in events if event["type"] == "assistant.message"]
+    assert messages
+    assert "Mock response: hello" in str(messages[0]["payload"]["content"])
+    assert messages[0]["payload"]["token_count"] >= 1
 
 
 def test_run_manager_pauses_and_resumes_approved_tool(tmp_path: Path) -> None:
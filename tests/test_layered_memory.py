@@ -4,6 +4,7 @@ import json
 from collections.abc import Collection, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -598,3 +599,72 @@ class FailingSealBackend(InMemoryBackend):
     def close(self) -> None:
         type(self).closed_layers.append(self.layer)
         super().close()
+
+
+@pytest.mark.parametrize("backend_factory", [InMemoryBackend, PreReservationBackend])
+def test_session_records_range_query_tracks_puts_upserts_and_tombstones(
+    tmp_path: Path,
+    backend_factory: type[MemoryBackend],
+) -> None:
+    # The custom backend has no session index and exercises the scan fallback.
+    memory = LayeredMemorySystem.from_backend_factory(tmp_path, backend_factory)
+    base = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+
+    def turn(record_id: str, minute: int, session_id: str = "session-a") -> MemoryRecord:
+        return MemoryRecord(
+            id=record_id,
+            title=f"Turn {record_id}",
+            content=f"Transcript frame {record_id}.",
+            layer=MemoryLayer.WORKING,
+            confidence=0.5,
+            created_at=base + timedelta(minutes=minute),
+            metadata={
+                "session_id": session_id,
+                "transcript_scope": "primary",
+                "turn_origin": "primary_user",
+            },
+        )
+
+    for record in (turn("t3", 3), turn("t1", 1), turn("other", 2, "session-b"), turn("t2", 2)):
+        memory.put(record)
+
+    def session_ids(**kwargs: object) -> list[str]:
+        return [
+            record.id
+            for record in memory.iter_session_records(
+                MemoryLayer.WORKING,
+                "session-a",
+                transcript_scope="primary",
+                turn_origin="primary_user",
+                **kwargs,  # type: ignore[arg-type]
+            )
+        ]
+
+    assert session_ids() == ["t1", "t2", "t3"]
+    assert session_ids(since=base + timedelta(minutes=2)) == ["t2", "t3"]
+
+    moved = turn("t1", 1)
+    moved.metadata["session_id"] = "session-b"
+    memory.upsert(moved)
+    assert memory.tombstone(MemoryLayer.WORKING, "t3", reason="test")
+
+    assert session_ids() == ["t2"]
+    assert session_ids(include_inactive=True) == ["t2", "t3"]
+    assert [
+        record.id
+        for record in memory.iter_session_records(
+            MemoryLayer.WORKING,
+            "session-b",
+            transcript_scope="primary",
+            turn_origin="primary_user",
+        )
+    ] == ["t1", "other"]
+    assert (
+        memory.iter_session_records(
+            MemoryLayer.WORKING,
+            "session-a",
+            transcript_scope="channel",
+            turn_origin="channel_user",
+        )
+        == ()
+    )
@@ -316,8 +316,9 @@ def test_close_only_seals_layers_written_by_that_memory_system(tmp_path: Path) -
     assert not (memory_dir / "policy.memory.json").exists()
 
 
+@pytest.mark.parametrize("persistence", ["snapshot", "journal"])
 def test_cross_process_seals_merge_distinct_records_without_last_writer_loss(
-    tmp_path: Path,
+    tmp_path: Path, persistence: str
 ) -> None:
     path = tmp_path / "semantic.mv2"
     go = tmp_path / "go"
@@ -327,8 +328,8 @@ def test_cross_process_seals_merge_distinct_records_without_last_writer_loss(
         "from nested_memvid_agent.backends.in_memory import InMemoryBackend\n"
         "from nested_memvid_agent.models import MemoryKind, MemoryLayer, MemoryRecord\n"
         "path, ready, go = map(Path, sys.argv[1:4])\n"
-        "record_id, token = sys.argv[4:6]\n"
-        "backend = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)\n"
+        "record_id, token, persistence = sys.argv[4:7]\n"
+        "backend = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC, persistence=persistence)\n"
         "backend.open()\n"
         "ready.write_text('ready', encoding='utf-8')\n"
         "deadline = time.monotonic() + 10\n"
@@ -346,7 +347,17 @@ def test_cross_process_seals_merge_distinct_records_without_last_writer_loss(
         ready_paths.append(ready)
         processes.append(
             subprocess.Popen(  # noqa: S603 - fixed interpreter and deterministic test script
-                [sys.executable, "-c", script, str(path), str(ready), str(go), f"fact-{index}", token],
+                [
+                    sys.executable,
+                    "-c",
+                    script,
+                    str(path),
+                    str(ready),
+                    str(go),
+                    f"fact-{index}",
+                    token,
+                    persistence,
+                ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -371,3 +382,388 @@ def test_cross_process_seals_merge_distinct_records_without_last_writer_loss(
         assert backend.find("platypus", k=4)
     finally:
         backend.close()
+
+
+def test_lexical_index_scores_only_matching_postings_and_compacts_removals(
+    tmp_path: Path,
+) -> None:
+    backend = InMemoryBackend(path=tmp_path / "semantic.mv2", layer=MemoryLayer.SEMANTIC)
+    backend.open()
+    for index in range(40):
+        backend.put(
+            MemoryRecord(
+                id=f"filler-{index}",
+                title="Filler",
+                content=f"unrelated filler text number{index}",
+                layer=MemoryLayer.SEMANTIC,
+                kind=MemoryKind.FACT,
+            )
+        )
+    for revision in range(300):
+        backend.upsert(
+            MemoryRecord(
+                id="revised",
+                title="Revised",
+                content=f"quokka revision{revision} " + " ".join(f"pad{n}" for n in range(10)),
+                layer=MemoryLayer.SEMANTIC,
+                kind=MemoryKind.FACT,
+            )
+        )
+
+    index = backend._bm25
+    assert index._total_docs == 41
+    assert index._dead_postings <= max(index._live_postings, 1024)
+    assert [hit.record.id for hit in backend.find("quokka revision299", k=8)] == ["revised"]
+    assert backend.find("revision0", k=8) == []
+    assert [slot for slot, _ in index._postings["quokka"] if index._slot_ids[slot] is not None] == [
+        len(index._slot_ids) - 1
+    ]
+    tied = [doc_id for doc_id, _ in index.search(["filler"], k=3)]
+    assert tied == ["filler-0", "filler-1", "filler-2"]
+
+
+def test_lexical_index_reclaims_slots_of_removed_documents() -> None:
+    from nested_memvid_agent.backends.in_memory import _BM25Index
+
+    index = _BM25Index()
+    for doc in range(5):
+        index.add(f"stable-{doc}", ["stable", f"doc{doc}"])
+    for revision in range(10_000):
+        index.add("churn", [] if revision % 2 else ["churn"])
+        index.remove("churn")
+    index.add("churn", ["churn", "stable"])
+
+    assert len(index._slot_ids) <= 1024 + 6
+    assert len(index._slot_lens) == len(index._slot_terms) == len(index._slot_ids)
+    assert index._slots_by_id["churn"] == [len(index._slot_ids) - 1]
+    assert [doc_id for doc_id, _ in index.search(["churn"])] == ["churn"]
+    tied = [doc_id for doc_id, _ in index.search(["stable"], k=6)]
+    assert tied == [f"stable-{doc}" for doc in range(5)] + ["churn"]
+
+
+@pytest.mark.parametrize("quantization", ["float32", "float16", "int8"])
+def test_vector_index_swap_removes_and_batches_queries(quantization: str) -> None:
+    from nested_memvid_agent.backends.in_memory import _VectorIndex
+
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(150, 16)).astype(np.float32)
+    index = _VectorIndex(quantization=quantization, initial_capacity=4)
+    for position, vector in enumerate(vectors):
+        index.add(f"doc-{position}", vector)
+    for position in range(0, 150, 3):
+        index.remove(f"doc-{position}")
+
+    assert len(index) == 100
+    assert all(index._doc_ids[slot] == doc_id for doc_id, slot in index._id_to_idx.items())
+    queries = vectors[[1, 2, 4]]
+    batched = index.search_many(queries, k=5)
+    for query, expected_id, batch_hits in zip(queries, ("doc-1", "doc-2", "doc-4"), batched, strict=True):
+        single_hits = index.search(query, k=5)
+        assert single_hits[0][0] == expected_id
+        assert single_hits[0][1] == pytest.approx(1.0, abs=0.02)
+        assert [doc_id for doc_id, _ in batch_hits] == [doc_id for doc_id, _ in single_hits]
+    with pytest.raises(ValueError, match="dimension"):
+        index.add("wrong-dimension", np.ones(8, dtype=np.float32))
+
+
+def test_vector_rebuild_batches_and_persists_embeddings_across_restart(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    batches: list[int] = []
+
+    def encode_batch(_self: InMemoryBackend, texts: list[str]) -> np.ndarray:
+        batches.append(len(texts))
+        return np.asarray([[1.0, float(len(text))] for text in texts], dtype=np.float32)
+
+    monkeypatch.setattr(InMemoryBackend, "_encode_batch", encode_batch)
+    # Simulate process restarts: each open must load from the on-disk snapshot.
+    shared_records: dict[str, list[MemoryRecord]] = {}
+    monkeypatch.setattr(InMemoryBackend, "_global_records", shared_records)
+    path = tmp_path / "semantic.mv2"
+    cache_path = tmp_path / "semantic.embeddings.sqlite"
+    writer = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    writer.open()
+    for index in range(5):
+        writer.put(
+            MemoryRecord(
+                id=f"fact-{index}",
+                title=f"Fact {index}",
+                content="x" * (index + 1),
+                layer=MemoryLayer.SEMANTIC,
+                kind=MemoryKind.FACT,
+            )
+        )
+    writer.seal()
+    shared_records.clear()
+
+    for _ in range(2):
+        backend = InMemoryBackend(
+            path=path,
+            layer=MemoryLayer.SEMANTIC,
+            enable_vec=True,
+            embedding_cache_path=cache_path,
+        )
+        backend.open()
+        assert len(backend._vector_index or ()) == 5
+        backend.close()
+        shared_records.clear()
+
+    assert batches == [5]
+
+
+def test_in_memory_keyed_lookups_track_upserts_and_shared_path_writes(tmp_path: Path) -> None:
+    path = tmp_path / "semantic.mv2"
+    writer = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    reader = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    writer.open()
+    reader.open()
+    original = MemoryRecord(
+        id="keyed-record",
+        title="Keyed record",
+        content="Original keyed content.",
+        layer=MemoryLayer.SEMANTIC,
+        metadata={"frame_id": "keyed-frame"},
+    )
+    writer.put(original)
+    writer.put(
+        MemoryRecord(
+            id="keyed-other",
+            title="Keyed record",
+            content="Original keyed content.",
+            layer=MemoryLayer.SEMANTIC,
+        )
+    )
+
+    assert set(reader.get_by_ids(["keyed-record", "keyed-other", "missing"])) == {
+        "keyed-record",
+        "keyed-other",
+    }
+    assert reader.find_by_frame_id("keyed-frame").id == "keyed-record"  # type: ignore[union-attr]
+    assert reader.get_by_ids(["keyed-frame"]) == {}
+    assert [record.id for record in reader.get_by_content_hash(original.content_hash)] == [
+        "keyed-record",
+        "keyed-other",
+    ]
+
+    updated = MemoryRecord(
+        id="keyed-record",
+        title="Keyed record",
+        content="Updated keyed content.",
+        layer=MemoryLayer.SEMANTIC,
+        metadata={"frame_id": "keyed-frame-2"},
+    )
+    writer.upsert(updated)
+    writer.tombstone("keyed-other", reason="superseded")
+
+    assert reader.find_by_frame_id("keyed-frame") is None
+    assert reader.get_record("keyed-frame-2") is updated
+    assert reader.has_content_hash(updated.content_hash)
+    assert reader.has_content_hash(original.content_hash)
+    assert not reader.has_content_hash(original.content_hash, include_inactive=False)
+    assert reader.get_by_ids(["keyed-other"], include_inactive=False) == {}
+
+
+def test_content_hash_lookup_matches_the_hash_recorded_in_metadata(tmp_path: Path) -> None:
+    backend = InMemoryBackend(path=tmp_path / "episodic.mv2", layer=MemoryLayer.EPISODIC)
+    backend.open()
+    record = MemoryRecord(
+        id="frame-record",
+        title="Recorded frame",
+        content="Content re-rendered after the writer hashed it.",
+        layer=MemoryLayer.EPISODIC,
+        metadata={"content_hash": "writer-digest"},
+    )
+    backend.put(record)
+
+    assert [item.id for item in backend.get_by_content_hash("writer-digest")] == ["frame-record"]
+    assert backend.has_content_hash(record.content_hash)
+
+    backend.upsert(
+        MemoryRecord(
+            id="frame-record",
+            title="Recorded frame",
+            content="Rewritten content.",
+            layer=MemoryLayer.EPISODIC,
+        )
+    )
+
+    assert not backend.has_content_hash("writer-digest")
+    assert not backend.has_content_hash(record.content_hash)
+
+
+def test_journal_persistence_appends_only_changes_and_compacts_to_binary_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import nested_memvid_agent.backends.in_memory as in_memory_module
+
+    monkeypatch.setattr(in_memory_module, "_JOURNAL_MIN_COMPACTION_ENTRIES", 5)
+    path = tmp_path / "semantic.mv2"
+    journal = path.with_suffix(".memory.log")
+    snapshot = path.with_suffix(".memory.bin")
+
+    def _record(record_id: str, content: str) -> MemoryRecord:
+        return MemoryRecord(
+            id=record_id,
+            title=f"Journal {record_id}",
+            content=content,
+            layer=MemoryLayer.SEMANTIC,
+            kind=MemoryKind.FACT,
+        )
+
+    backend = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC, persistence="journal")
+    backend.open()
+    for index in range(3):
+        backend.put(_record(f"journal-{index}", f"journal_sentinel entry {index}"))
+    backend.seal()
+    assert len(journal.read_bytes().splitlines()) == 3
+    assert not path.with_suffix(".memory.json").exists()
+
+    backend.upsert(_record("journal-1", "journal_sentinel rewritten entry"))
+    backend.seal()
+    lines = journal.read_bytes().splitlines()
+    assert len(lines) == 4
+    assert b'"op":"upsert"' in lines[-1]
+    backend.seal()
+    assert len(journal.read_bytes().splitlines()) == 4
+
+    backend.tombstone("journal-2", reason="superseded")
+    backend.seal()
+    assert snapshot.exists()
+    assert not journal.exists()
+    backend.put(_record("journal-3", "journal_sentinel after compaction"))
+    backend.seal()
+    # A crash mid-append leaves a torn, unacknowledged line behind.
+    with journal.open("ab") as handle:
+        handle.write(b'{"op":"put","record":{"id":"torn"')
+    backend.close()
+
+    InMemoryBackend._global_records.pop(str(path), None)
+    reopened = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    reopened.open()
+    try:
+        assert [record.id for record in reopened.iter_records(include_inactive=True)] == [
+            "journal-0",
+            "journal-1",
+            "journal-2",
+            "journal-3",
+        ]
+        assert reopened.get_record("journal-1").content == "journal_sentinel rewritten entry"  # type: ignore[union-attr]
+        assert reopened.get_record("journal-2", include_inactive=False) is None
+        assert reopened.get_record("torn") is None
+        reopened.seal()
+        assert not journal.exists()
+    finally:
+        reopened.close()
+
+
+def test_journal_persistence_migrates_a_json_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "semantic.mv2"
+    legacy = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    legacy.open()
+    legacy.put(
+        MemoryRecord(
+            id="legacy-record",
+            title="Legacy record",
+            content="Stored in the JSON snapshot.",
+            layer=MemoryLayer.SEMANTIC,
+        )
+    )
+    legacy.seal()
+    legacy.close()
+    InMemoryBackend._global_records.pop(str(path), None)
+
+    journaled = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC, persistence="journal")
+    journaled.open()
+    journaled.put(
+        MemoryRecord(
+            id="journal-record",
+            title="Journal record",
+            content="Stored in the journal.",
+            layer=MemoryLayer.SEMANTIC,
+        )
+    )
+    journaled.seal()
+    journaled.close()
+    InMemoryBackend._global_records.pop(str(path), None)
+
+    reopened = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    reopened.open()
+    try:
+        assert {record.id for record in reopened.iter_records()} == {
+            "legacy-record",
+            "journal-record",
+        }
+    finally:
+        reopened.close()
+
+
+def test_in_memory_backend_rejects_unknown_persistence_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported memory persistence mode"):
+        InMemoryBackend(path=tmp_path / "semantic.mv2", layer=MemoryLayer.SEMANTIC, persistence="sqlite")
+
+
+def test_same_path_readers_replay_foreign_writes_without_rebuilding(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import nested_memvid_agent.backends.in_memory as in_memory_module
+
+    path = tmp_path / "semantic.mv2"
+    writer = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    reader = InMemoryBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    writer.open()
+    reader.open()
+    rebuilds: list[InMemoryBackend] = []
+    original_rebuild = InMemoryBackend._rebuild_indices
+
+    def counting_rebuild(self: InMemoryBackend) -> None:
+        rebuilds.append(self)
+        original_rebuild(self)
+
+    monkeypatch.setattr(InMemoryBackend, "_rebuild_indices", counting_rebuild)
+
+    for index, token in enumerate(("aardvark", "platypus", "quokka")):
+        writer.put(
+            MemoryRecord(
+                id=f"replay-{index}",
+                title=f"Replay {token}",
+                content=f"The replay token is {token}.",
+                layer=MemoryLayer.SEMANTIC,
+                metadata={"frame_id": f"replay-frame-{index}"},
+            )
+        )
+        writer.seal()
+        assert [hit.record.id for hit in reader.find(token, k=2)] == [f"replay-{index}"]
+    writer.upsert(
+        MemoryRecord(
+            id="replay-0",
+            title="Replay wombat",
+            content="The replay token is wombat.",
+            layer=MemoryLayer.SEMANTIC,
+        )
+    )
+    writer.tombstone("replay-1", reason="superseded")
+
+    assert reader.find("aardvark", k=2) == []
+    assert [hit.record.id for hit in reader.find("wombat", k=2)] == ["replay-0"]
+    assert reader.find("platypus", k=2) == []
+    assert reader.get_record("replay-frame-0") is None
+    assert not reader.has_any_record_identity(frozenset({"replay-frame-0"}))
+    assert rebuilds == []
+
+    monkeypatch.setattr(
+        InMemoryBackend,
+        "_global_mutations",
+        {str(path): in_memory_module.deque(maxlen=1)},
+    )
+    for index in range(2):
+        writer.put(
+            MemoryRecord(
+                id=f"overflow-{index}",
+                title="Overflow",
+                content=f"Overflow numbat {index}.",
+                layer=MemoryLayer.SEMANTIC,
+            )
+        )
+    assert len(reader.find("numbat", k=4)) == 2
+    assert rebuilds == [reader]
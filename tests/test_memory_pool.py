@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from threading import Event
+from time import monotonic, sleep
+
+import pytest
+
+from nested_memvid_agent.app_factory import build_agent_memory
+from nested_memvid_agent.config import AgentConfig
+from nested_memvid_agent.layers import LayeredMemorySystem, MemoryCleanupIncompleteError
+from nested_memvid_agent.memory_pool import MemorySystemPool
+from nested_memvid_agent.models import MemoryLayer, MemoryRecord
+from nested_memvid_agent.runtime_models import ToolCall, ToolExecution, ToolSpec
+from nested_memvid_agent.tools.base import AgentTool, ToolContext
+from nested_memvid_agent.tools.registry import ToolRegistry
+
+
+def _config(tmp_path, name: str = "memory", **overrides) -> AgentConfig:
+    return AgentConfig(
+        state_path=tmp_path / "state.db",
+        memory_dir=tmp_path / name,
+        workspace=tmp_path,
+        **overrides,
+    )
+
+
+def _counting_builder(built: list[LayeredMemorySystem]):
+    def build(config: AgentConfig) -> LayeredMemorySystem:
+        memory = build_agent_memory(config)
+        built.append(memory)
+        return memory
+
+    return build
+
+
+def test_pool_keeps_systems_warm_and_shares_concurrent_leases(tmp_path) -> None:
+    pool = MemorySystemPool(max_systems=2)
+    built: list[LayeredMemorySystem] = []
+    config = _config(tmp_path)
+
+    first = pool.acquire(config, _counting_builder(built))
+    second = pool.acquire(config, _counting_builder(built))
+    assert first.memory is second.memory
+
+    def write(index: int) -> None:
+        first.memory.put(
+            MemoryRecord(
+                content=f"pooled writer note {index}",
+                layer=MemoryLayer.WORKING,
+                title=f"note {index}",
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write, range(20)))
+    first.release()
+    first.release()
+    second.release()
+    third = pool.acquire(config, _counting_builder(built))
+    records = tuple(third.memory.iter_records(MemoryLayer.WORKING))
+    third.release()
+
+    assert len(built) == 1
+    assert len({record.id for record in records}) == 20
+    snapshot = pool.snapshot()
+    assert snapshot["acquisitions"] == 3
+    assert snapshot["misses"] == 1
+    assert snapshot["hits"] == 2
+    assert snapshot["active_leases"] == 0
+    assert snapshot["idle_systems"] == 1
+    assert pool.shutdown(timeout_seconds=1.0) is True
+    assert pool.snapshot()["warm_systems"] == 0
+
+
+def test_pool_reopens_a_reconfigured_directory_only_after_leases_drain(tmp_path) -> None:
+    pool = MemorySystemPool()
+    built: list[LayeredMemorySystem] = []
+    config = _config(tmp_path)
+    reconfigured = replace(config, memory_retrieval_deadline_seconds=5.0)
+    held = pool.acquire(config, _counting_builder(built))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(pool.acquire, reconfigured, _counting_builder(built))
+        sleep(0.05)
+        assert not pending.done()
+        held.release()
+        replacement = pending.result(timeout=2.0)
+
+    assert len(built) == 2
+    assert replacement.memory is built[1]
+    replacement.release()
+    snapshot = pool.snapshot()
+    assert snapshot["warm_systems"] == 1
+    assert snapshot["evictions"] == 1
+    assert snapshot["waits"] == 1
+    assert snapshot["wait_seconds_max"] > 0
+    assert pool.shutdown(timeout_seconds=1.0) is True
+
+
+def test_pool_retires_a_system_released_with_an_unsettled_tool_execution(tmp_path) -> None:
+    pool = MemorySystemPool()
+    built: list[LayeredMemorySystem] = []
+    config = _config(tmp_path)
+    lease = pool.acquire(config, _counting_builder(built))
+    lease.retain_for_unsettled_tool_execution("tool-execution-1")
+
+    with pytest.raises(MemoryCleanupIncompleteError) as raised:
+        lease.release()
+    assert lease.released is False
+    assert raised.value.phase == "unsettled_tool_execution"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(pool.acquire, config, _counting_builder(built))
+        sleep(0.05)
+        assert not pending.done()
+        lease.release_unsettled_tool_execution("tool-execution-1")
+        assert raised.value.retry_cleanup() is True
+        replacement = pending.result(timeout=2.0)
+
+    assert lease.released is True
+    assert len(built) == 2
+    assert replacement.memory is built[1]
+    replacement.release()
+    assert pool.snapshot()["evictions"] == 1
+    assert pool.shutdown(timeout_seconds=1.0) is True
+
+
+def test_hung_tool_holds_only_its_own_lease_on_a_shared_system(tmp_path) -> None:
+    pool = MemorySystemPool()
+    built: list[LayeredMemorySystem] = []
+    config = _config(tmp_path, tool_timeout_seconds=0.01)
+    stuck = pool.acquire(config, _counting_builder(built))
+    healthy = pool.acquire(config, _counting_builder(built))
+    release_worker = Event()
+
+    class HungTool(AgentTool):
+        spec = ToolSpec(
+            name="contract.hung",
+            description="Keeps running against memory after its deadline.",
+            parameters={"type": "object", "properties": {}},
+        )
+
+        def run(self, arguments: dict[str, object], context: ToolContext) -> ToolExecution:
+            del arguments, context
+            assert release_worker.wait(timeout=3.0)
+            return ToolExecution(
+                call=ToolCall(name=self.spec.name, arguments={}),
+                success=True,
+                content="settled late",
+            )
+
+    registry = ToolRegistry()
+    registry.register(HungTool())
+    execution = registry.execute(
+        ToolCall(name="contract.hung", arguments={}),
+        ToolContext(
+            memory=stuck.memory,
+            config=config,
+            workspace=tmp_path,
+            run_id="run-stuck",
+            memory_fence=stuck,
+        ),
+    )
+    assert execution.error == "tool_outcome_unresolved"
+    assert stuck.has_unsettled_tool_executions()
+    assert not healthy.has_unsettled_tool_executions()
+
+    with pytest.raises(MemoryCleanupIncompleteError) as raised:
+        stuck.release()
+    healthy.release()
+    assert healthy.released is True
+    assert stuck.released is False
+
+    # The healthy release left only the stuck lease, so the system is retired
+    # and the next run waits for a fresh build instead of sharing it.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(pool.acquire, config, _counting_builder(built))
+        sleep(0.05)
+        assert not pending.done()
+        release_worker.set()
+        deadline = monotonic() + 2.0
+        while stuck.has_unsettled_tool_executions() and monotonic() < deadline:
+            sleep(0.01)
+        assert raised.value.retry_cleanup() is True
+        replacement = pending.result(timeout=2.0)
+
+    assert len(built) == 2
+    assert replacement.memory is built[1]
+    replacement.release()
+    assert pool.shutdown(timeout_seconds=1.0) is True
+
+
+def test_stuck_lease_does_not_retire_a_system_other_runs_still_hold(tmp_path) -> None:
+    pool = MemorySystemPool()
+    built: list[LayeredMemorySystem] = []
+    config = _config(tmp_path)
+    stuck = pool.acquire(config, _counting_builder(built))
+    healthy = pool.acquire(config, _counting_builder(built))
+    stuck.retain_for_unsettled_tool_execution("tool-execution-1")
+
+    with pytest.raises(MemoryCleanupIncompleteError):
+        stuck.release()
+    joining = pool.acquire(config, _counting_builder(built))
+
+    assert joining.memory is healthy.memory
+    assert len(built) == 1
+    healthy.release()
+    joining.release()
+    stuck.release_unsettled_tool_execution("tool-execution-1")
+    stuck.release()
+    assert pool.snapshot()["active_leases"] == 0
+    assert pool.shutdown(timeout_seconds=1.0) is True
+
+
+def test_pool_evicts_least_recently_released_system_at_capacity(tmp_path) -> None:
+    pool = MemorySystemPool(max_systems=1)
+    built: list[LayeredMemorySystem] = []
+    pool.acquire(_config(tmp_path, "alpha"), _counting_builder(built)).release()
+    beta = pool.acquire(_config(tmp_path, "beta"), _counting_builder(built))
+
+    assert len(built) == 2
+    assert pool.snapshot()["evictions"] == 1
+    assert pool.shutdown(timeout_seconds=0.05) is False
+    with pytest.raises(RuntimeError, match="memory_pool_closed"):
+        pool.acquire(_config(tmp_path, "alpha"), _counting_builder(built))
+    beta.release()
+    assert pool.shutdown(timeout_seconds=1.0) is True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -10,7 +11,13 @@ import pytest
 from nested_memvid_agent.backends.in_memory import InMemoryBackend
 from nested_memvid_agent.config import AgentConfig
 from nested_memvid_agent.layers import DEFAULT_LAYER_SPECS, LayeredMemorySystem, load_layer_specs
-from nested_memvid_agent.models import MemoryKind, MemoryLayer, MemoryRecord, RetrievalQuery
+from nested_memvid_agent.models import (
+    MAX_RETRIEVAL_DEADLINE_SECONDS,
+    MemoryKind,
+    MemoryLayer,
+    MemoryRecord,
+    RetrievalQuery,
+)
 from nested_memvid_agent.runtime_models import ToolCall
 from nested_memvid_agent.tools.base import ToolContext
 from nested_memvid_agent.tools.builtin import build_default_tools
@@ -81,6 +88,44 @@ def test_load_layer_specs_falls_back_to_lexical_without_complete_local_vector_co
     assert specs[MemoryLayer.POLICY].vector_search_enabled is False
 
 
+def test_load_layer_specs_reads_vector_ann_knobs(tmp_path: Path) -> None:
+    config_path = tmp_path / "layers.json"
+    vector = {
+        "enabled": True,
+        "embedding_provider": "local",
+        "index_path": "semantic.mv2.vector.sqlite",
+        "ann": {"enabled": True, "lists": 64, "probes": 4, "min_rows": 10000},
+    }
+    config_path.write_text(json.dumps({"semantic": {"vector": vector}}), encoding="utf-8")
+
+    spec = load_layer_specs(config_path)[MemoryLayer.SEMANTIC]
+
+    assert spec.vector_ann_enabled is True
+    assert (spec.vector_ann_lists, spec.vector_ann_probes, spec.vector_ann_min_rows) == (
+        64,
+        4,
+        10000,
+    )
+
+    vector["ann"] = {"enabled": True, "probes": 0}
+    config_path.write_text(json.dumps({"semantic": {"vector": vector}}), encoding="utf-8")
+    with pytest.raises(ValueError, match="probes must be positive"):
+        load_layer_specs(config_path)
+
+    vector["ann"] = {"enabled": True}
+    config_path.write_text(
+        json.dumps(
+            {
+                "semantic": {"vector": {**vector, "index_path": "episodic.vec-ann"}},
+                "episodic": {"vector": {**vector, "index_path": "episodic.vec"}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match="conflicting memory artifact filename"):
+        load_layer_specs(config_path)
+
+
 def test_hybrid_retrieval_uses_rebuildable_sidecar_without_replacing_mv2(tmp_path: Path) -> None:
     config_path = tmp_path / "layers.json"
     config_path.write_text(
@@ -172,6 +217,101 @@ def test_hybrid_retrieval_uses_rebuildable_sidecar_without_replacing_mv2(tmp_pat
     ].path.name == "semantic.mv2"
 
 
+def test_sidecar_layer_paging_reuses_ranked_search_session(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config_path = tmp_path / "layers.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "semantic": {
+                    "search_mode": "hybrid",
+                    "vector": {
+                        "enabled": True,
+                        "embedding_provider": "local",
+                        "embedding_model": "concept-test",
+                        "index_path": "semantic.mv2.vector.sqlite",
+                    },
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    memory = LayeredMemorySystem.from_backend_factory(
+        tmp_path / "memory",
+        InMemoryBackend,
+        specs=load_layer_specs(config_path),
+        vector_embedder=ConceptEmbedder(),
+        enforce_stable_write_integrity=False,
+    )
+    for index in range(20):
+        memory.put(
+            MemoryRecord(
+                id=f"import-path-{index:02d}",
+                title=f"Import path note {index}",
+                content=f"Set PYTHONPATH before module discovery, variant {index}.",
+                layer=MemoryLayer.SEMANTIC,
+                kind=MemoryKind.FACT,
+                confidence=0.9,
+            )
+        )
+    window_sizes: list[int] = []
+    original_find_layer_hits = memory._find_layer_hits
+
+    def counting_find_layer_hits(**kwargs: object) -> object:
+        window_sizes.append(int(kwargs["k"]))  # type: ignore[call-overload]
+        return original_find_layer_hits(**kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(memory, "_find_layer_hits", counting_find_layer_hits)
+
+    def page(cursor: str | None) -> object:
+        return memory._find_layer_hit_page(
+            layer=MemoryLayer.SEMANTIC,
+            query="module path",
+            k=2,
+            mode="vector",
+            min_relevancy=0.0,
+            include_inactive=False,
+            cursor=cursor,
+        )
+
+    paged_ids: list[str] = []
+    cursor: str | None = None
+    while True:
+        result = page(cursor)
+        paged_ids.extend(hit.record.id for hit in result.hits)  # type: ignore[attr-defined]
+        cursor = result.next_cursor  # type: ignore[attr-defined]
+        if cursor is None:
+            break
+        assert cursor.startswith("layer-session:")
+
+    assert sorted(paged_ids) == [f"import-path-{index:02d}" for index in range(20)]
+    # Ten pages cost a geometric handful of searches instead of one each.
+    assert window_sizes == [3, 6, 12, 24]
+
+    window_sizes.clear()
+    first = page(None)
+    second = page(first.next_cursor)  # type: ignore[attr-defined]
+    replay = page(first.next_cursor)  # type: ignore[attr-defined]
+    assert window_sizes == [3, 6]
+    assert replay == second
+    window_sizes.clear()
+    memory.put(
+        MemoryRecord(
+            id="import-path-new",
+            title="Import path addendum",
+            content="PYTHONPATH module discovery addendum.",
+            layer=MemoryLayer.SEMANTIC,
+            kind=MemoryKind.FACT,
+            confidence=0.9,
+        )
+    )
+    page(first.next_cursor)  # type: ignore[attr-defined]
+    assert window_sizes == [5]
+    memory.close_all()
+
+
 def test_registry_tools_can_use_vector_sidecar_across_worker_threads(tmp_path: Path) -> None:
     config_path = tmp_path / "layers.json"
     config_path.write_text(
@@ -450,6 +590,257 @@ def test_retrieve_searches_requested_layers_and_respects_per_layer_k(tmp_path: P
     assert all(hit.record.metadata["last_retrieved_at"] for hit in hits)
 
 
+def test_retrieve_layers_reports_slow_layer_as_degraded_after_deadline(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memory = LayeredMemorySystem.from_backend_factory(
+        tmp_path / "memory",
+        InMemoryBackend,
+        enforce_stable_write_integrity=False,
+    )
+    sentinel = "sentinel_retrieval_deadline_7e1f"
+    layers = (MemoryLayer.SEMANTIC, MemoryLayer.EPISODIC, MemoryLayer.WORKING)
+    for layer in layers:
+        memory.put(
+            MemoryRecord(
+                id=f"{layer.value}-deadline",
+                title=f"{layer.value} deadline",
+                content=f"{sentinel} lives in {layer.value} memory.",
+                layer=layer,
+                kind=_kind_for_layer(layer),
+                confidence=0.9,
+                metadata={"frame_type": _frame_type_for_layer(layer)},
+            )
+        )
+    sequential = [
+        hit.record.id for hit in memory.retrieve(RetrievalQuery(query=sentinel, layers=layers))
+    ]
+    # Force the deadline query below to search every layer again.
+    memory._retrieval_cache.invalidate()
+
+    release = threading.Event()
+    slow_backend = memory.backends[MemoryLayer.EPISODIC]
+    original_find_page = slow_backend.find_page
+    finished: list[str] = []
+
+    def slow_find_page(**kwargs: object) -> object:
+        release.wait(timeout=10)
+        page = original_find_page(**kwargs)  # type: ignore[arg-type]
+        finished.append("episodic")
+        return page
+
+    monkeypatch.setattr(slow_backend, "find_page", slow_find_page)
+
+    result = memory.retrieve_layers(
+        RetrievalQuery(query=sentinel, layers=layers, deadline_seconds=0.2)
+    )
+
+    assert set(result.degraded_layers) == {MemoryLayer.EPISODIC}
+    assert "deadline" in result.degraded_layers[MemoryLayer.EPISODIC]
+    assert [hit.record.id for hit in result.hits] == [
+        record_id for record_id in sequential if record_id != "episodic-deadline"
+    ]
+
+    release.set()
+    memory.close_all()
+    assert finished == ["episodic"]
+
+
+def test_stuck_layer_does_not_degrade_the_next_query(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memory = LayeredMemorySystem.from_backend_factory(
+        tmp_path / "memory",
+        InMemoryBackend,
+        enforce_stable_write_integrity=False,
+    )
+    memory.retrieval_max_workers = 1
+    sentinel = "sentinel_retrieval_stuck_4c9d"
+    layers = (MemoryLayer.SEMANTIC, MemoryLayer.EPISODIC, MemoryLayer.WORKING)
+    for layer in layers:
+        memory.put(
+            MemoryRecord(
+                id=f"{layer.value}-stuck",
+                title=f"{layer.value} stuck",
+                content=f"{sentinel} lives in {layer.value} memory.",
+                layer=layer,
+                kind=_kind_for_layer(layer),
+                confidence=0.9,
+                metadata={"frame_type": _frame_type_for_layer(layer)},
+            )
+        )
+    release = threading.Event()
+    stuck_backend = memory.backends[MemoryLayer.EPISODIC]
+    original_find_page = stuck_backend.find_page
+    calls: list[str] = []
+
+    def stuck_find_page(**kwargs: object) -> object:
+        calls.append("episodic")
+        release.wait(timeout=10)
+        return original_find_page(**kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(stuck_backend, "find_page", stuck_find_page)
+
+    first = memory.retrieve_layers(
+        RetrievalQuery(query=sentinel, layers=layers, deadline_seconds=0.2)
+    )
+    second = memory.retrieve_layers(
+        RetrievalQuery(query=f"{sentinel} again", layers=layers, deadline_seconds=0.2)
+    )
+
+    assert set(first.degraded_layers) == {MemoryLayer.EPISODIC}
+    assert set(second.degraded_layers) == {MemoryLayer.EPISODIC}
+    assert "still running" in second.degraded_layers[MemoryLayer.EPISODIC]
+    assert {hit.record.id for hit in second.hits} == {"semantic-stuck", "working-stuck"}
+    assert calls == ["episodic"]
+
+    release.set()
+    memory.close_all()
+
+
+@pytest.mark.parametrize("deadline", [0.0, -1.0, float("nan"), float("inf"), True])
+def test_retrieval_deadline_rejects_non_finite_and_non_positive_values(
+    tmp_path: Path,
+    deadline: float,
+) -> None:
+    with pytest.raises(ValueError, match="must be a positive number"):
+        RetrievalQuery(query="probe", deadline_seconds=deadline)
+    with pytest.raises(ValueError, match="must be a positive number"):
+        AgentConfig(memory_retrieval_deadline_seconds=deadline)
+    with pytest.raises(ValueError, match="must be a positive number"):
+        LayeredMemorySystem.from_backend_factory(
+            tmp_path / "memory",
+            InMemoryBackend,
+            retrieval_deadline_seconds=deadline,
+        )
+
+
+def test_retrieval_deadline_is_clamped_to_the_maximum(tmp_path: Path) -> None:
+    memory = LayeredMemorySystem.from_backend_factory(
+        tmp_path / "memory",
+        InMemoryBackend,
+        retrieval_deadline_seconds=1e9,
+    )
+
+    assert memory.retrieval_deadline_seconds == MAX_RETRIEVAL_DEADLINE_SECONDS
+    assert (
+        RetrievalQuery(query="probe", deadline_seconds=1e9).deadline_seconds
+        == MAX_RETRIEVAL_DEADLINE_SECONDS
+    )
+    assert (
+        AgentConfig(memory_retrieval_deadline_seconds=1e9).memory_retrieval_deadline_seconds
+        == MAX_RETRIEVAL_DEADLINE_SECONDS
+    )
+    memory.close_all()
+
+
+def test_concurrent_retrieval_merges_in_query_layer_order(tmp_path: Path) -> None:
+    memory = LayeredMemorySystem.from_backend_factory(
+        tmp_path / "memory",
+        InMemoryBackend,
+        enforce_stable_write_integrity=False,
+    )
+    sentinel = "sentinel_retrieval_order_2b8c"
+    for layer in MemoryLayer:
+        memory.put(
+            MemoryRecord(
+                id=f"{layer.value}-order",
+                title="Identical order probe",
+                content=f"{sentinel} identical content.",
+                layer=layer,
+                kind=_kind_for_layer(layer),
+                confidence=max(DEFAULT_LAYER_SPECS[layer].min_write_confidence, 0.9),
+                importance=0.5,
+                metadata={"frame_type": _frame_type_for_layer(layer)},
+            )
+        )
+    forward = tuple(MemoryLayer)
+
+    orders = {
+        tuple(
+            hit.record.id
+            for hit in memory.retrieve_layers(
+                RetrievalQuery(query=sentinel, layers=forward, deadline_seconds=30.0)
+            ).hits
+        )
+        for _ in range(5)
+    }
+
+    assert len(orders) == 1
+    memory.close_all()
+
+
+def test_retrieval_cache_reuses_layer_results_until_that_layer_is_written(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memory = LayeredMemorySystem.from_backend_factory(
+        tmp_path / "memory",
+        InMemoryBackend,
+        enforce_stable_write_integrity=False,
+    )
+    sentinel = "sentinel_retrieval_cache_5a3e"
+    layers = (MemoryLayer.SEMANTIC, MemoryLayer.EPISODIC)
+    for layer in layers:
+        memory.put(
+            MemoryRecord(
+                id=f"{layer.value}-cache",
+                title=f"{layer.value} cache",
+                content=f"{sentinel} lives in {layer.value} memory.",
+                layer=layer,
+                kind=_kind_for_layer(layer),
+                confidence=0.9,
+                metadata={"frame_type": _frame_type_for_layer(layer)},
+            )
+        )
+    searched: list[MemoryLayer] = []
+    original_eligible = memory._eligible_layer_hits
+
+    def counting_eligible(**kwargs: object) -> object:
+        searched.append(kwargs["layer"])  # type: ignore[arg-type]
+        return original_eligible(**kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(memory, "_eligible_layer_hits", counting_eligible)
+    query = RetrievalQuery(query=sentinel, layers=layers)
+
+    first = memory.retrieve(query)
+    searched.clear()
+    # Stamping last_retrieved_at on the first retrieval keeps its cache entries.
+    cached = memory.retrieve(RetrievalQuery(query=f"  {sentinel} ", layers=layers))
+
+    assert searched == []
+    assert [hit.record.id for hit in cached] == [hit.record.id for hit in first]
+    assert all("last_retrieved_at" in hit.record.metadata for hit in cached)
+    cached[0].record.metadata["caller_scratch"] = True
+    assert all(
+        "caller_scratch" not in hit.record.metadata for hit in memory.retrieve(query)
+    )
+    assert searched == []
+
+    memory.put(
+        MemoryRecord(
+            id="episodic-cache-new",
+            title="episodic cache addition",
+            content=f"{sentinel} was appended to episodic memory.",
+            layer=MemoryLayer.EPISODIC,
+            kind=_kind_for_layer(MemoryLayer.EPISODIC),
+            confidence=0.9,
+            metadata={"frame_type": _frame_type_for_layer(MemoryLayer.EPISODIC)},
+        )
+    )
+    refreshed = memory.retrieve(query)
+
+    assert searched == [MemoryLayer.EPISODIC]
+    assert "episodic-cache-new" in {hit.record.id for hit in refreshed}
+    stats = memory.retrieval_cache_stats()
+    assert stats["hits"] >= 3
+    assert stats["invalidations"] >= 1
+    assert float(stats["saved_seconds"]) > 0.0
+    memory.close_all()
+
+
 def test_inactive_records_are_hidden_by_default_but_available_for_audit(tmp_path: Path) -> None:
     memory = LayeredMemorySystem.from_backend_factory(
         tmp_path / "memory",
@@ -503,9 +894,10 @@ def test_retrieval_writeback_throttles_last_retrieved_updates(
             id="retrieval-clock",
             title="Retrieval clock",
             content="sentinel_retrieval_clock_8d2a updates at most hourly.",
-            layer=MemoryLayer.SEMANTIC,
-            kind=MemoryKind.FACT,
+            layer=MemoryLayer.EPISODIC,
+            kind=MemoryKind.EVENT,
             confidence=0.9,
+            metadata={"frame_type": _frame_type_for_layer(MemoryLayer.EPISODIC)},
         )
     )
     base_time = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
@@ -520,23 +912,23 @@ def test_retrieval_writeback_throttles_last_retrieved_updates(
     monkeypatch.setattr("nested_memvid_agent.layers.datetime", FrozenDateTime)
 
     memory.retrieve(
-        RetrievalQuery(query="sentinel_retrieval_clock_8d2a", layers=(MemoryLayer.SEMANTIC,))
+        RetrievalQuery(query="sentinel_retrieval_clock_8d2a", layers=(MemoryLayer.EPISODIC,))
     )
-    first = memory.get_record(MemoryLayer.SEMANTIC, "retrieval-clock").metadata["last_retrieved_at"]  # type: ignore[union-attr]
+    first = memory.get_record(MemoryLayer.EPISODIC, "retrieval-clock").metadata["last_retrieved_at"]  # type: ignore[union-attr]
 
     FrozenDateTime.current = base_time + timedelta(minutes=10)
     memory.retrieve(
-        RetrievalQuery(query="sentinel_retrieval_clock_8d2a", layers=(MemoryLayer.SEMANTIC,))
+        RetrievalQuery(query="sentinel_retrieval_clock_8d2a", layers=(MemoryLayer.EPISODIC,))
     )
-    second = memory.get_record(MemoryLayer.SEMANTIC, "retrieval-clock").metadata[
+    second = memory.get_record(MemoryLayer.EPISODIC, "retrieval-clock").metadata[
         "last_retrieved_at"
     ]  # type: ignore[union-attr]
 
     FrozenDateTime.current = base_time + timedelta(hours=1, minutes=1)
     memory.retrieve(
-        RetrievalQuery(query="sentinel_retrieval_clock_8d2a", layers=(MemoryLayer.SEMANTIC,))
+        RetrievalQuery(query="sentinel_retrieval_clock_8d2a", layers=(MemoryLayer.EPISODIC,))
     )
-    third = memory.get_record(MemoryLayer.SEMANTIC, "retrieval-clock").metadata["last_retrieved_at"]  # type: ignore[union-attr]
+    third = memory.get_record(MemoryLayer.EPISODIC, "retrieval-clock").metadata["last_retrieved_at"]  # type: ignore[union-attr]
 
     assert first == base_time.isoformat()
     assert second == first
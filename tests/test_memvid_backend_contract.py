@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import subprocess
 import sys
+from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from pathlib import Path
 from threading import Lock, Thread
@@ -700,6 +701,73 @@ def test_memvid_backend_falls_back_to_exact_index_when_lex_index_disabled(
     assert hits[0].source_backend == "memvid_exact_fallback"
 
 
+def test_memvid_exact_fallback_pages_through_one_ranked_session(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class LexIndexDisabledError(Exception):
+        pass
+
+    class FakeMem:
+        def put(self, *args: object, **kwargs: object) -> str:
+            del args, kwargs
+            return "record_1"
+
+        def find(self, *args: object, **kwargs: object) -> object:
+            del args, kwargs
+            raise LexIndexDisabledError("MV004: Lexical index is not enabled")
+
+    def fake_create(filename: str, **kwargs: object) -> FakeMem:
+        del kwargs
+        Path(filename).write_bytes(b"fake mv2")
+        return FakeMem()
+
+    monkeypatch.setattr(
+        "nested_memvid_agent.backends.memvid_backend.import_module",
+        lambda name: SimpleNamespace(
+            LexIndexDisabledError=LexIndexDisabledError,
+            create=fake_create,
+            use=lambda *args, **kwargs: FakeMem(),
+        ),
+    )
+    backend = MemvidBackend(path=tmp_path / "semantic.mv2", layer=MemoryLayer.SEMANTIC)
+    backend.open()
+    for index in range(7):
+        backend.put(
+            MemoryRecord(
+                id=f"fact-{index}",
+                title=f"Durable fact {index}",
+                content="Exact fallback paging keeps one ranked list.",
+                layer=MemoryLayer.SEMANTIC,
+                kind=MemoryKind.FACT,
+                confidence=0.91,
+            )
+        )
+    scoring_passes: list[int | None] = []
+    original_fallback = backend._find_exact_index_fallback
+
+    def counting_fallback(**kwargs: object) -> object:
+        scoring_passes.append(kwargs["k"])  # type: ignore[arg-type]
+        return original_fallback(**kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(backend, "_find_exact_index_fallback", counting_fallback)
+
+    seen: list[str] = []
+    cursor: str | None = None
+    while True:
+        page = backend.find_page("exact fallback paging", k=3, cursor=cursor)
+        seen.extend(hit.record.id for hit in page.hits)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert sorted(seen) == [f"fact-{index}" for index in range(7)]
+    assert scoring_passes == [None]
+    with pytest.raises(ValueError, match="Invalid Memvid fallback search cursor"):
+        backend.find_page("exact fallback paging", k=3, cursor="layer-offset:3")
+    legacy = backend.find_page("exact fallback paging", k=3, cursor="exact-offset:6")
+    assert [hit.record.id for hit in legacy.hits] == [seen[6]]
+
+
 def test_memvid_backend_persists_exact_records_and_tombstones_across_reopen(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -775,6 +843,136 @@ def test_memvid_backend_persists_exact_records_and_tombstones_across_reopen(
         reopened.close()
 
 
+def test_memvid_backend_session_index_survives_reopen_and_tombstones(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "working.mv2"
+
+    class FakeMem:
+        def put(self, *args: object, **kwargs: object) -> str:
+            del args, kwargs
+            return "sdk_record"
+
+        def find(self, *args: object, **kwargs: object) -> dict[str, object]:
+            del args, kwargs
+            return {"hits": []}
+
+        def close(self) -> None:
+            return None
+
+    def fake_create(filename: str, **kwargs: object) -> FakeMem:
+        del kwargs
+        Path(filename).write_bytes(b"fake mv2")
+        return FakeMem()
+
+    monkeypatch.setattr(
+        "nested_memvid_agent.backends.memvid_backend.import_module",
+        lambda name: SimpleNamespace(create=fake_create, use=lambda *args, **kwargs: FakeMem()),
+    )
+    base = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+    first = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+    first.open()
+    for minute, record_id in ((2, "turn-2"), (1, "turn-1"), (3, "turn-3")):
+        first.put(
+            MemoryRecord(
+                id=record_id,
+                title=f"Turn {record_id}",
+                content=f"Transcript frame {record_id}.",
+                layer=MemoryLayer.WORKING,
+                confidence=0.5,
+                created_at=base + timedelta(minutes=minute),
+                metadata={
+                    "session_id": "session-a",
+                    "transcript_scope": "primary",
+                    "turn_origin": "primary_user",
+                },
+            )
+        )
+    first.tombstone("turn-2", reason="test")
+    first.close()
+
+    reopened = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+    reopened.open()
+    try:
+        turns = reopened.iter_session_records(
+            "session-a", transcript_scope="primary", turn_origin="primary_user"
+        )
+        assert [record.id for record in turns] == ["turn-1", "turn-3"]
+        assert [
+            record.id
+            for record in reopened.iter_session_records(
+                "session-a",
+                transcript_scope="primary",
+                turn_origin="primary_user",
+                include_inactive=True,
+            )
+        ] == ["turn-1", "turn-2", "turn-3"]
+    finally:
+        reopened.close()
+
+
+def test_memvid_backend_keyed_lookups_survive_reopen(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "semantic.mv2"
+
+    class FakeMem:
+        def put(self, *args: object, **kwargs: object) -> str:
+            del args, kwargs
+            return "sdk_record"
+
+        def find(self, *args: object, **kwargs: object) -> dict[str, object]:
+            del args, kwargs
+            return {"hits": []}
+
+        def close(self) -> None:
+            return None
+
+    def fake_create(filename: str, **kwargs: object) -> FakeMem:
+        del kwargs
+        Path(filename).write_bytes(b"fake mv2")
+        return FakeMem()
+
+    monkeypatch.setattr(
+        "nested_memvid_agent.backends.memvid_backend.import_module",
+        lambda name: SimpleNamespace(create=fake_create, use=lambda *args, **kwargs: FakeMem()),
+    )
+    record = MemoryRecord(
+        id="keyed-record",
+        title="Keyed record",
+        content="Keyed Memvid content.",
+        layer=MemoryLayer.SEMANTIC,
+        metadata={"frame_id": "keyed-frame"},
+    )
+    first = MemvidBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    first.open()
+    first.put(record)
+    first.put(
+        MemoryRecord(
+            id="keyed-inactive",
+            title="Inactive record",
+            content="Inactive Memvid content.",
+            layer=MemoryLayer.SEMANTIC,
+        )
+    )
+    first.tombstone("keyed-inactive", reason="test")
+    first.close()
+
+    reopened = MemvidBackend(path=path, layer=MemoryLayer.SEMANTIC)
+    reopened.open()
+    try:
+        assert set(reopened.get_by_ids(["keyed-record", "keyed-inactive", "keyed-frame"])) == {
+            "keyed-record",
+            "keyed-inactive",
+        }
+        assert reopened.get_by_ids(["keyed-inactive"], include_inactive=False) == {}
+        assert reopened.find_by_frame_id("keyed-frame").id == "keyed-record"  # type: ignore[union-attr]
+        assert reopened.get_record("keyed-frame").id == "keyed-record"  # type: ignore[union-attr]
+        assert reopened.has_content_hash(record.content_hash)
+        assert not reopened.has_content_hash("0" * 64)
+    finally:
+        reopened.close()
+
 def test_memvid_backend_serializes_shared_handle_operations_across_threads(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1122,3 +1320,202 @@ def test_memvid_backend_fails_closed_at_layer_capacity(tmp_path: Path) -> None:
                 kind=MemoryKind.OBSERVATION,
             )
         )
+
+
+def _install_stateless_fake_memvid(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeMem:
+        def put(self, *args: object, **kwargs: object) -> str:
+            del args, kwargs
+            return "sdk_record"
+
+        def close(self) -> None:
+            return None
+
+    def fake_create(filename: str, **kwargs: object) -> FakeMem:
+        del kwargs
+        Path(filename).write_bytes(b"fake mv2")
+        return FakeMem()
+
+    monkeypatch.setattr(
+        "nested_memvid_agent.backends.memvid_backend.import_module",
+        lambda name: SimpleNamespace(create=fake_create, use=lambda *args, **kwargs: FakeMem()),
+    )
+
+
+def test_memvid_backend_journals_exact_records_without_rewriting_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_stateless_fake_memvid(monkeypatch)
+    path = tmp_path / "working.mv2"
+    sidecar = path.with_suffix(f"{path.suffix}.records.json")
+    journal = path.with_suffix(f"{path.suffix}.records.log")
+
+    backend = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+    backend.open()
+    snapshot = sidecar.read_bytes()
+    for index in range(5):
+        backend.put(
+            MemoryRecord(
+                id=f"note-{index}",
+                title=f"Note {index}",
+                content=f"Journaled exact record {index}.",
+                layer=MemoryLayer.WORKING,
+            )
+        )
+    backend.tombstone("note-0", reason="superseded")
+
+    assert sidecar.read_bytes() == snapshot
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 6
+    crashed = {artifact: artifact.read_bytes() for artifact in (sidecar, journal)}
+    backend.close()
+    assert not journal.exists()
+    assert len(json.loads(sidecar.read_text(encoding="utf-8"))["records"]) == 6
+
+    # Replaying the uncompacted journal over its root snapshot restores the same state.
+    for artifact, content in crashed.items():
+        artifact.write_bytes(content)
+    reopened = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+    reopened.open()
+    try:
+        assert reopened.get_record("note-0", include_inactive=False) is None
+        assert {record.id for record in reopened.iter_records()} == {
+            "note-1",
+            "note-2",
+            "note-3",
+            "note-4",
+            "tombstone_note-0",
+        }
+    finally:
+        reopened.close()
+    assert not journal.exists()
+
+
+def test_memvid_backend_fails_closed_on_tampered_exact_record_journal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_stateless_fake_memvid(monkeypatch)
+    path = tmp_path / "working.mv2"
+    sidecar = path.with_suffix(f"{path.suffix}.records.json")
+    journal = path.with_suffix(f"{path.suffix}.records.log")
+
+    backend = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+    backend.open()
+    backend.put(
+        MemoryRecord(
+            id="journaled",
+            title="Journaled",
+            content="Original journaled content.",
+            layer=MemoryLayer.WORKING,
+        )
+    )
+    crashed = {artifact: artifact.read_bytes() for artifact in (sidecar, journal)}
+    backend.close()
+    for artifact, content in crashed.items():
+        artifact.write_bytes(content)
+    journal.write_text(
+        journal.read_text(encoding="utf-8").replace("Original", "Tampered"),
+        encoding="utf-8",
+    )
+
+    reopened = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+    with pytest.raises(RuntimeError, match="journal entry 1 digest does not match"):
+        reopened.open()
+
+
+class _FakeTimelineMem:
+    def __init__(self) -> None:
+        self.frames: list[dict[str, object]] = []
+        self.frame_reads = 0
+
+    def put(self, title: str, source: str, metadata: dict[str, object], **kwargs: object) -> str:
+        del title, source
+        self.frames.append({"uri": str(kwargs["uri"]), "extra_metadata": dict(metadata)})
+        return str(len(self.frames) - 1)
+
+    def stats(self) -> dict[str, int]:
+        return {"frame_count": len(self.frames), "seq_no": len(self.frames)}
+
+    def timeline(self, **kwargs: object) -> list[dict[str, object]]:
+        upper = int(kwargs.get("as_of_frame", len(self.frames) - 1))
+        limit = int(kwargs.get("limit", 100))
+        return [
+            {"frame_id": frame_id, "uri": self.frames[frame_id]["uri"]}
+            for frame_id in range(upper, -1, -1)[:limit]
+        ]
+
+    def frame(self, uri: str) -> dict[str, object]:
+        self.frame_reads += 1
+        return next(frame for frame in reversed(self.frames) if frame["uri"] == uri)
+
+    def close(self) -> None:
+        return None
+
+
+def test_memvid_backend_replays_only_frames_after_signed_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_mem = _FakeTimelineMem()
+
+    def fake_create(filename: str, **kwargs: object) -> _FakeTimelineMem:
+        del kwargs
+        Path(filename).write_bytes(b"fake mv2")
+        return fake_mem
+
+    monkeypatch.setattr(
+        "nested_memvid_agent.backends.memvid_backend.import_module",
+        lambda name: SimpleNamespace(create=fake_create, use=lambda *args, **kwargs: fake_mem),
+    )
+    path = tmp_path / "working.mv2"
+    sidecar = path.with_suffix(f"{path.suffix}.records.json")
+    key = b"k" * 32
+
+    def open_backend(checkpoint_key: bytes | None = key) -> MemvidBackend:
+        backend = MemvidBackend(path=path, layer=MemoryLayer.WORKING)
+        if checkpoint_key is not None:
+            backend.bind_replay_checkpoint_key(checkpoint_key)
+        fake_mem.frame_reads = 0
+        backend.open()
+        return backend
+
+    def record(index: int) -> MemoryRecord:
+        return MemoryRecord(
+            id=f"note-{index}",
+            title=f"Note {index}",
+            content=f"Checkpointed record {index}.",
+            layer=MemoryLayer.WORKING,
+        )
+
+    first = open_backend()
+    first.put(record(0))
+    first.put(record(1))
+    # Opens replay the .mv2 tail after the checkpoint, never a journal.
+    assert not path.with_suffix(f"{path.suffix}.records.log").exists()
+    first.close()
+    older_snapshot = sidecar.read_text(encoding="utf-8")
+    assert json.loads(older_snapshot)["replay_checkpoint"]["frame_id"] == 1
+
+    second = open_backend()
+    assert fake_mem.frame_reads == 0
+    second.put(record(2))
+    second.close()
+
+    sidecar.write_text(older_snapshot, encoding="utf-8")
+    resumed = open_backend()
+    try:
+        assert fake_mem.frame_reads == 1
+        assert {item.id for item in resumed.iter_records()} == {"note-0", "note-1", "note-2"}
+    finally:
+        resumed.close()
+
+    forged = json.loads(sidecar.read_text(encoding="utf-8"))
+    forged["replay_checkpoint"]["frame_id"] = 2
+    forged["replay_checkpoint"]["commit_sequence"] = 0
+    sidecar.write_text(json.dumps(forged), encoding="utf-8")
+    for checkpoint_key in (key, b"x" * 32, None):
+        replayed = open_backend(checkpoint_key)
+        try:
+            assert fake_mem.frame_reads == 3
+            assert {item.id for item in replayed.iter_records()} == {"note-0", "note-1", "note-2"}
+        finally:
+            replayed.close()
+        sidecar.write_text(json.dumps(forged), encoding="utf-8")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import asdict, replace
+
 import pytest
 
 from nested_memvid_agent.models import MemoryLayer, MemoryRecord
@@ -16,6 +18,18 @@ def test_memory_record_hash_is_stable_for_same_payload() -> None:
     assert a.content_hash == b.content_hash
 
 
+def test_memory_record_hash_follows_reassigned_payload() -> None:
+    record = MemoryRecord(title="T", content="hello", layer=MemoryLayer.SEMANTIC)
+    original = record.content_hash
+    record.content = "goodbye"
+    assert record.content_hash != original
+    assert record.content_hash == MemoryRecord(
+        title="T", content="goodbye", layer=MemoryLayer.SEMANTIC
+    ).content_hash
+    assert replace(record, content="hello").content_hash == original
+    assert "_content_hash_cache" not in asdict(record)
+
+
 def test_confidence_bounds() -> None:
     with pytest.raises(ValueError):
         MemoryRecord(title="x", content="y", layer=MemoryLayer.WORKING, confidence=1.1)
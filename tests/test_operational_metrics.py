@@ -303,6 +303,11 @@ def test_prometheus_snapshot_uses_operational_snapshot_field_contract(
             "max_rss_bytes": 4096,
         },
     )
+    monkeypatch.setattr(
+        operational_metrics_module,
+        "retrieval_cache_metrics",
+        lambda: {"hits": 7, "misses": 3, "hit_rate": 0.7, "saved_seconds": 0.25},
+    )
 
     snapshot = operational_snapshot(config=config, state=state, runs=_Runs())
     rendered = prometheus_snapshot(snapshot)
@@ -313,6 +318,11 @@ def test_prometheus_snapshot_uses_operational_snapshot_field_contract(
     assert 'kestrel_run_operations{operation="started"} 3' in rendered
     assert 'kestrel_run_operations{operation="completed"} 2' in rendered
     assert "kestrel_memory_total_bytes 6" in rendered
+    assert snapshot["memory_retrieval_cache"]["hit_rate"] == 0.7
+    assert 'kestrel_memory_retrieval_cache{kind="hits"} 7' in rendered
+    assert "kestrel_memory_retrieval_cache_saved_seconds 0.25" in rendered
+    assert snapshot["memory_pool"] == {"enabled": False}
+    assert 'kestrel_memory_pool{kind="warm_systems"} 0' in rendered
 
 
 def test_readiness_fails_for_saturated_queue_and_missing_memvid_layers(tmp_path) -> None:
@@ -735,7 +735,7 @@ def test_vector_sidecar_and_live_sqlite_files_are_owner_only(tmp_path: Path) ->
         sidecar.close()
 
 
-@pytest.mark.parametrize("artifact_suffix", ["", "-wal", "-shm"])
+@pytest.mark.parametrize("artifact_suffix", ["", "-wal", "-shm", "-matrix"])
 @pytest.mark.parametrize("link_kind", ["symlink", "hardlink"])
 def test_vector_sidecar_rejects_aliases_without_mutating_target(
     tmp_path: Path,
@@ -7,6 +7,7 @@ import sqlite3
 import stat
 import subprocess
 import sys
+import threading
 from contextlib import closing
 from pathlib import Path
 from types import SimpleNamespace
@@ -25,7 +26,9 @@ from nested_memvid_agent.repo_index import (
     Freshness,
     IndexLimits,
     RepositoryChangedDuringIndexingError,
+    RebuildProgress,
     RepositoryIndex,
+    RepositoryIndexCancelledError,
     RepositoryIndexError,
     RepositoryRootMismatchError,
 )
@@ -294,7 +297,7 @@ def test_build_records_identity_content_and_multilanguage_relationships(tmp_path
     assert status.project_id == "project-1"
     assert status.repository_root == repository.resolve()
     assert status.aggregate_digest == report.aggregate_digest
-    assert status.schema_version == 5
+    assert status.schema_version == 6
     assert status.parser_versions["python"] == "ast-v1"
     assert status.git_head is None
     assert status.git_tree is None
@@ -500,7 +503,7 @@ def test_schema_v1_sidecar_migrates_and_forces_digest_revalidation(tmp_path: Pat
     reopened = RepositoryIndex(project_id="project-1", repository_root=repository)
     rebuilt = reopened.rebuild()
 
-    assert reopened.status().schema_version == 5
+    assert reopened.status().schema_version == 6
     assert rebuilt.changed_files == 10
     assert rebuilt.reused_files == 0
 
@@ -686,7 +689,7 @@ def test_schema_v4_with_durable_generation_migrates_to_checkpoint(tmp_path: Path
 
     reopened = RepositoryIndex(project_id="project-1", repository_root=repository)
 
-    assert reopened.status().schema_version == 5
+    assert reopened.status().schema_version == 6
     with sqlite3.connect(reopened.index_path) as connection:
         checkpoint = connection.execute(
             """
@@ -1296,6 +1299,7 @@ def test_query_fingerprint_fence_rejects_repository_mutation_during_load(
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: tuple[str, ...] | None = None,
     ) -> Any:
         changed = repository / "src" / "widget.py"
@@ -1304,6 +1308,7 @@ def test_query_fingerprint_fence_rejects_repository_mutation_during_load(
             query,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             path_prefixes=path_prefixes,
         )
 
@@ -1452,6 +1457,7 @@ def test_wrapped_sqlite_connect_aba_is_rejected_before_returning_data(
         *,
         uri: bool = False,
         factory: type[sqlite3.Connection] = sqlite3.Connection,
+        check_same_thread: bool = True,
     ) -> sqlite3.Connection:
         assert uri is True
         assert "immutable=1" in str(database)
@@ -1462,6 +1468,7 @@ def test_wrapped_sqlite_connect_aba_is_rejected_before_returning_data(
             timeout=timeout,
             uri=uri,
             factory=factory,
+            check_same_thread=check_same_thread,
         )
         os.replace(index.index_path, decoy)
         os.replace(parked, index.index_path)
@@ -1492,9 +1499,16 @@ def test_bounded_query_opens_a_pinned_immutable_generation_without_copying(
         *,
         uri: bool = False,
         factory: type[sqlite3.Connection] = sqlite3.Connection,
+        check_same_thread: bool = True,
     ) -> sqlite3.Connection:
         opened.append((str(database), uri))
-        return real_connect(database, timeout=timeout, uri=uri, factory=factory)
+        return real_connect(
+            database,
+            timeout=timeout,
+            uri=uri,
+            factory=factory,
+            check_same_thread=check_same_thread,
+        )
 
     monkeypatch.setattr(
         "nested_memvid_agent.repo_index.store.sqlite3.connect",
@@ -1531,6 +1545,7 @@ def test_current_schema_construction_and_bounded_query_are_read_only_pinned_open
         *,
         uri: bool = False,
         factory: type[sqlite3.Connection] = sqlite3.Connection,
+        check_same_thread: bool = True,
     ) -> sqlite3.Connection:
         opened.append((str(database), uri))
         return real_connect(
@@ -1538,6 +1553,7 @@ def test_current_schema_construction_and_bounded_query_are_read_only_pinned_open
             timeout=timeout,
             uri=uri,
             factory=TrackingConnection,
+            check_same_thread=check_same_thread,
         )
 
     monkeypatch.setattr(
@@ -1570,6 +1586,7 @@ def test_query_metadata_and_rows_do_not_cross_a_publication_generation(
         *,
         limit: int,
         offset: int = 0,
+        cursor: str | None = None,
         path_prefixes: tuple[str, ...] | None = None,
     ) -> Any:
         changed = repository / "src" / "widget.py"
@@ -1585,6 +1602,7 @@ def test_query_metadata_and_rows_do_not_cross_a_publication_generation(
             query,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             path_prefixes=path_prefixes,
         )
 
@@ -1783,6 +1801,198 @@ def test_query_pages_report_truncation_and_continue_deterministically(
     assert third.next_offset is None
 
 
+def test_query_cursors_resume_by_rank_and_bind_to_their_query(tmp_path: Path) -> None:
+    """Offset-only continuation or a cursor accepted for another query must fail this test."""
+    repository = tmp_path / "repository"
+    repository.mkdir()
+    (repository / "symbols.py").write_text(
+        "".join(f"def item_{number:02d}(): ...\n" for number in range(8)),
+        encoding="utf-8",
+    )
+    (repository / "z.py").write_text(
+        "def ITEM(): ...\n\ndef list_items(): ...\n",
+        encoding="utf-8",
+    )
+    index = RepositoryIndex(project_id="project-1", repository_root=repository)
+    index.rebuild()
+
+    expected = [record.name for record in index.symbols("item").records]
+    pages = [index.symbols("item", limit=3)]
+    while pages[-1].next_cursor is not None:
+        pages.append(index.symbols("item", limit=3, cursor=pages[-1].next_cursor))
+
+    assert expected[0] == "ITEM"
+    assert expected[1:9] == [f"item_{number:02d}" for number in range(8)]
+    assert expected[-1] == "list_items"
+    assert [record.name for page in pages for record in page.records] == expected
+    assert [len(page.records) for page in pages] == [3, 3, 3, 1]
+    assert pages[0].next_offset == 3
+    assert all(page.next_offset is None for page in pages[1:])
+    assert pages[-1].truncated is False
+    with pytest.raises(ValueError, match="does not match"):
+        index.symbols("items", limit=3, cursor=pages[0].next_cursor)
+    with pytest.raises(ValueError, match="does not match"):
+        index.references("item", limit=3, cursor=pages[0].next_cursor)
+    with pytest.raises(ValueError, match="cannot be combined"):
+        index.symbols("item", limit=3, offset=3, cursor=pages[0].next_cursor)
+    with pytest.raises(ValueError, match="cursor is invalid"):
+        index.symbols("item", limit=3, cursor="not a cursor")
+
+
+def test_trigram_search_index_tracks_incremental_rebuilds(tmp_path: Path) -> None:
+    """A search index that drifts from the symbol rows it seeds must fail this test."""
+    if not repo_store._search_indexes_supported():
+        pytest.skip("SQLite lacks FTS5 trigram support")
+    repository = _copy_fixture(tmp_path)
+    index = RepositoryIndex(project_id="project-1", repository_root=repository)
+    index.rebuild()
+    source = repository / "src" / "widget.py"
+    source.write_text(
+        source.read_text(encoding="utf-8").replace("def helper", "def canonical"),
+        encoding="utf-8",
+    )
+    index.rebuild()
+
+    with closing(sqlite3.connect(":memory:")) as copy:
+        with closing(sqlite3.connect(index.index_path)) as connection:
+            connection.backup(copy)
+        copy.execute(
+            "INSERT INTO symbol_search (symbol_search, rank) VALUES ('integrity-check', 1)"
+        )
+        copy.execute(
+            "INSERT INTO import_search (import_search, rank) VALUES ('integrity-check', 1)"
+        )
+        indexed = copy.execute(
+            "SELECT rowid FROM symbol_search WHERE symbol_search MATCH '\"anonic\"'"
+        ).fetchall()
+        scanned = copy.execute(
+            "SELECT id FROM symbols WHERE instr(lower(qualified_name), 'anonic') > 0"
+        ).fetchall()
+        stale = copy.execute(
+            "SELECT count(*) FROM symbol_search WHERE symbol_search MATCH '\"helper\"'"
+        ).fetchone()[0]
+
+    assert sorted(indexed) == sorted(scanned) != []
+    assert stale == 0
+    assert [record.name for record in index.symbols("ANONIC").records] == ["canonical"]
+    assert [record.name for record in index.symbols("ca").records][0] == "canonical"
+    assert [record.module for record in index.imports("eque").records] == [
+        "collections.deque"
+    ]
+
+
+def _many_file_repository(tmp_path: Path, *, files: int) -> Path:
+    repository = _copy_fixture(tmp_path)
+    for number in range(files):
+        (repository / "pkg" / f"module_{number:03d}").mkdir(parents=True)
+        (repository / "pkg" / f"module_{number:03d}" / "core.py").write_text(
+            f"from widget import Widget\n\nclass Part{number}(Widget):\n"
+            f"    def render_{number}(self) -> str:\n        return helper('{number}')\n",
+            encoding="utf-8",
+        )
+        (repository / "pkg" / f"module_{number:03d}" / "view.ts").write_text(
+            f"import {{ Part{number} }} from './core';\nexport function show{number}() {{}}\n",
+            encoding="utf-8",
+        )
+    return repository
+
+
+def _index_rows(index_path: Path) -> dict[str, list[tuple[Any, ...]]]:
+    with closing(sqlite3.connect(index_path)) as connection:
+        return {
+            table: connection.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+            for table in (
+                "files",
+                "symbols",
+                "imports",
+                "lexical_references",
+                "test_relationships",
+            )
+        }
+
+
+def test_parallel_parse_publishes_the_sequential_index(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Completion-ordered or dropped parse results must fail this test."""
+    repository = _many_file_repository(tmp_path, files=12)
+    monkeypatch.setattr(repo_indexer, "_PARALLEL_PARSE_MIN_FILES", 1)
+    monkeypatch.setattr(repo_indexer, "_PARSE_CHUNK_FILES", 3)
+    sequential = RepositoryIndex(
+        project_id="project-1",
+        repository_root=repository,
+        index_path=tmp_path / "sequential.sqlite",
+        parse_workers=1,
+    )
+    parallel = RepositoryIndex(
+        project_id="project-1",
+        repository_root=repository,
+        index_path=tmp_path / "parallel.sqlite",
+        parse_workers=2,
+    )
+
+    expected = sequential.rebuild()
+    observed = parallel.rebuild()
+
+    assert observed == expected
+    assert expected.changed_files == 34
+    assert _index_rows(parallel.index_path) == _index_rows(sequential.index_path)
+    with pytest.raises(ValueError, match="parse_workers"):
+        RepositoryIndex(project_id="project-1", repository_root=repository, parse_workers=0)
+
+
+def test_cancelled_rebuild_leaves_checkpoints_readable_and_resumable(tmp_path: Path) -> None:
+    """Losing checkpointed work or serving a partial index as current must fail this test."""
+    repository = _many_file_repository(tmp_path, files=6)
+    index = RepositoryIndex(project_id="project-1", repository_root=repository)
+    cancel = threading.Event()
+    seen: list[RebuildProgress] = []
+
+    def observe(progress: RebuildProgress) -> None:
+        seen.append(progress)
+        if progress.parsed_files == 7:
+            cancel.set()
+
+    with pytest.raises(RepositoryIndexCancelledError):
+        index.rebuild(progress=observe, cancel=cancel, checkpoint_files=3)
+
+    assert [item.checkpoints for item in seen if item.parsed_files in {3, 6, 7}] == [1, 2, 2]
+    assert seen[-1].published_files == 6
+    assert seen[-1].parse_files == 22
+    assert not any(item.complete for item in seen)
+    assert index.status().freshness is Freshness.STALE
+    assert index.files().records == ()
+    assert len(index.files(include_stale_diagnostics=True).records) == 6
+
+    report = index.rebuild()
+    clean = RepositoryIndex(
+        project_id="project-1",
+        repository_root=repository,
+        index_path=tmp_path / "clean.sqlite",
+    ).rebuild()
+    assert report.reused_files == 6
+    assert report.changed_files == 16
+    assert report.aggregate_digest == clean.aggregate_digest
+    assert index.status().freshness is Freshness.CURRENT
+
+
+def test_background_rebuild_reports_progress_and_result(tmp_path: Path) -> None:
+    repository = _copy_fixture(tmp_path)
+    index = RepositoryIndex(project_id="project-1", repository_root=repository)
+
+    handle = index.start_rebuild(checkpoint_files=4)
+    report = handle.result(timeout=30)
+
+    assert handle.done()
+    assert handle.progress is not None
+    assert handle.progress.complete is True
+    assert handle.progress.checkpoints == 2
+    assert handle.progress.published_files == report.changed_files == 10
+    assert index.status().freshness is Freshness.CURRENT
+    handle.cancel()
+
+
 def test_reference_point_lookup_uses_nocase_index(tmp_path: Path) -> None:
     """Scanning the lexical-reference table for an exact lookup must fail this test."""
     repository = _copy_fixture(tmp_path)
@@ -1908,12 +2118,14 @@ def test_connection_closes_when_serialize_setup_fails(
         *,
         uri: bool = False,
         factory: type[sqlite3.Connection] = sqlite3.Connection,
+        check_same_thread: bool = True,
     ) -> sqlite3.Connection:
         connection = real_connect(
             database,
             timeout=timeout,
             factory=FailingSerializeConnection,
             uri=uri,
+            check_same_thread=check_same_thread,
         )
         opened.append(connection)
         return connection
@@ -1951,12 +2163,14 @@ def test_connection_closes_when_pragma_setup_fails(
         *,
         uri: bool = False,
         factory: type[sqlite3.Connection] = sqlite3.Connection,
+        check_same_thread: bool = True,
     ) -> sqlite3.Connection:
         connection = real_connect(
             database,
             timeout=timeout,
             factory=FailingPragmaConnection,
             uri=uri,
+            check_same_thread=check_same_thread,
         )
         opened.append(connection)
         return connection
@@ -1993,12 +2207,14 @@ def test_routine_queries_do_not_run_full_database_integrity_checks(
         *,
         uri: bool = False,
         factory: type[sqlite3.Connection] = sqlite3.Connection,
+        check_same_thread: bool = True,
     ) -> sqlite3.Connection:
         return real_connect(
             database,
             timeout=timeout,
             factory=TrackingConnection,
             uri=uri,
+            check_same_thread=check_same_thread,
         )
 
     monkeypatch.setattr(
@@ -2011,7 +2227,7 @@ def test_routine_queries_do_not_run_full_database_integrity_checks(
     assert "PRAGMA quick_check" not in statements
 
 
-def test_results_have_deterministic_tie_order(tmp_path: Path) -> None:
+def test_results_have_deterministic_rank_and_tie_order(tmp_path: Path) -> None:
     """Depending on traversal or SQLite insertion order must fail this test."""
     repository = _copy_fixture(tmp_path)
     (repository / "z.py").write_text("def duplicate(): ...\n", encoding="utf-8")
@@ -2027,6 +2243,77 @@ def test_results_have_deterministic_tie_order(tmp_path: Path) -> None:
         for record in index.symbols("duplicate").records
     ] == [
         ("a.py", 3, "duplicate"),
-        ("a.py", 5, "duplicate_again"),
         ("z.py", 1, "duplicate"),
+        ("a.py", 5, "duplicate_again"),
     ]
+
+
+def _rename_helper(repository: Path, name: str) -> None:
+    widget = repository / "src" / "widget.py"
+    source = widget.read_text(encoding="utf-8")
+    widget.write_text(source.replace("def helper", f"def {name}"), encoding="utf-8")
+
+
+def test_pinned_read_handle_serves_repeated_and_concurrent_queries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = _copy_fixture(tmp_path)
+    index = RepositoryIndex(project_id="project-1", repository_root=repository)
+    index.rebuild()
+    reader = RepositoryIndex(project_id="project-1", repository_root=repository, create=False)
+    original = repo_store.RepoIndexStore._validate_generation_content
+    validations: list[str] = []
+
+    def counting(self: repo_store.RepoIndexStore, *args: Any, **kwargs: Any) -> None:
+        validations.append(threading.current_thread().name)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(repo_store.RepoIndexStore, "_validate_generation_content", counting)
+    results: list[list[str]] = []
+    errors: list[BaseException] = []
+
+    def query() -> None:
+        try:
+            for _ in range(5):
+                results.append([record.name for record in reader.symbols("helper").records])
+        except BaseException as exc:  # noqa: BLE001 - reported by the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=query) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert not errors
+    assert results == [["helper"]] * 40
+    assert reader.status().freshness is Freshness.CURRENT
+    assert validations == []
+
+    _rename_helper(repository, "renamed")
+    index.rebuild()
+
+    assert [record.name for record in reader.symbols("renamed").records] == ["renamed"]
+    assert validations
+
+
+def test_pinned_read_handle_fails_closed_when_the_canonical_database_is_tampered(
+    tmp_path: Path,
+) -> None:
+    repository = _copy_fixture(tmp_path)
+    index = RepositoryIndex(project_id="project-1", repository_root=repository)
+    index.rebuild()
+    reader = RepositoryIndex(project_id="project-1", repository_root=repository, create=False)
+    assert [record.name for record in reader.symbols("helper").records] == ["helper"]
+
+    with index.index_path.open("r+b") as database:
+        database.seek(-64, os.SEEK_END)
+        tail = database.read(1)
+        database.seek(-64, os.SEEK_END)
+        database.write(bytes([tail[0] ^ 0xFF]))
+
+    with pytest.raises(RepositoryIndexError):
+        reader.symbols("helper")
+    with pytest.raises(RepositoryIndexError):
+        reader.symbols("helper")
@@ -295,3 +295,44 @@ def test_repo_tools_require_project_bound_baseline_digest(tmp_path: Path) -> Non
 
     assert missing.error == "repo_index_rebuild_required"
     assert mismatched.error == "repo_index_rebuild_required"
+
+
+def test_repo_symbols_continues_with_an_opaque_cursor(tmp_path: Path) -> None:
+    repository = _repository(tmp_path)
+    RepositoryIndex(project_id=PROJECT_ID, repository_root=repository).rebuild()
+    registry = build_default_tools(("repo.symbols",))
+    context = _context(tmp_path, repository)
+
+    first = registry.execute(
+        ToolCall(name="repo.symbols", arguments={"query": "e", "limit": 1}),
+        context,
+    )
+    second = registry.execute(
+        ToolCall(
+            name="repo.symbols",
+            arguments={"query": "e", "limit": 1, "cursor": first.data["next_cursor"]},
+        ),
+        context,
+    )
+    combined = registry.execute(
+        ToolCall(
+            name="repo.symbols",
+            arguments={
+                "query": "e",
+                "limit": 1,
+                "offset": 1,
+                "cursor": first.data["next_cursor"],
+            },
+        ),
+        context,
+    )
+
+    assert first.success and first.data["truncated"] is True
+    assert first.data["next_offset"] == 1
+    assert second.success and second.data["next_offset"] is None
+    assert second.data["records"] != first.data["records"]
+    assert second.data["records"] == registry.execute(
+        ToolCall(name="repo.symbols", arguments={"query": "e", "limit": 1, "offset": 1}),
+        context,
+    ).data["records"]
+    assert combined.error == "invalid_tool_arguments"
@@ -1434,3 +1434,45 @@ def _install_fake_memvid_sdk(monkeypatch) -> list[tuple[str, str]]:
         lambda _name: SimpleNamespace(create=create, use=use),
     )
     return calls
+
+
+def test_memory_pool_shares_one_warm_memvid_system_between_concurrent_agents(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    calls = _install_fake_memvid_sdk(monkeypatch)
+    manager = _manager(
+        tmp_path,
+        backend="memvid",
+        memory_pool=True,
+        max_concurrent_runs=3,
+    )
+    observed: list[str] = []
+    manager.configure_memory_close_observer(lambda: observed.append("observed"))
+    assert manager.capacity_snapshot()["max_active"] == 3
+
+    first = manager._build_agent(manager.config)
+    waiting = ThreadPoolExecutor(max_workers=1)
+    second = waiting.submit(manager._build_agent, manager.config).result(timeout=2.0)
+    waiting.shutdown()
+    opened = len(calls)
+
+    assert first.memory is second.memory
+    assert manager._memvid_agent_active is False
+    assert manager.memory_pool_snapshot()["active_leases"] == 2
+
+    first.close()
+    second.close()
+    third = manager._build_agent(manager.config)
+    third.close()
+
+    assert third.memory is first.memory
+    assert len(calls) == opened
+    assert observed == ["observed", "observed", "observed"]
+    snapshot = manager.memory_pool_snapshot()
+    assert snapshot["misses"] == 1
+    assert snapshot["hits"] == 2
+    assert snapshot["warm_systems"] == 1
+    assert snapshot["active_leases"] == 0
+    assert manager.shutdown(timeout_seconds=1.0) is True
+    assert manager.memory_pool_snapshot()["warm_systems"] == 0
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from nested_memvid_agent.models import MemoryHit, MemoryKind, MemoryLayer, MemoryRecord
+from nested_memvid_agent.search_sessions import (
+    SearchCursor,
+    SearchSessionCache,
+    format_search_cursor,
+    parse_search_cursor,
+)
+
+
+def _hits(count: int) -> list[MemoryHit]:
+    return [
+        MemoryHit(
+            record=MemoryRecord(
+                id=f"record-{index}",
+                title=f"Record {index}",
+                content="Session paging fixture.",
+                layer=MemoryLayer.SEMANTIC,
+                kind=MemoryKind.FACT,
+            ),
+            score=1.0 - index / 100,
+            source_backend="test",
+        )
+        for index in range(count)
+    ]
+
+
+def test_search_session_expires_after_ttl_and_rejects_foreign_queries() -> None:
+    now = [100.0]
+    cache = SearchSessionCache(ttl_seconds=5.0, clock=lambda: now[0])
+    token = cache.store(_hits(3), scope="semantic", signature=("q",), complete=True)
+    assert token is not None
+
+    found = cache.lookup(token, scope="semantic", signature=("q",))
+    assert found is not None and len(found[0]) == 3 and found[1] is True
+    assert cache.lookup(token, scope="semantic", signature=("other",)) is None
+    assert cache.lookup(token, scope="episodic", signature=("q",)) is None
+
+    now[0] += 4.0
+    assert cache.lookup(token, scope="semantic", signature=("q",)) is not None
+    now[0] += 5.5
+    assert cache.lookup(token, scope="semantic", signature=("q",)) is None
+    assert len(cache) == 0
+
+
+def test_search_sessions_are_bounded_by_hit_budget_and_invalidated_by_scope() -> None:
+    cache = SearchSessionCache(max_sessions=8, max_hits=10)
+    first = cache.store(_hits(4), scope="semantic", signature=1, complete=False)
+    second = cache.store(_hits(4), scope="episodic", signature=2, complete=False)
+    third = cache.store(_hits(4), scope="semantic", signature=3, complete=False)
+
+    assert cache.store(_hits(11), scope="semantic", signature=4, complete=True) is None
+    assert first is not None and second is not None and third is not None
+    assert cache.lookup(first, scope="semantic", signature=1) is None
+    assert cache.lookup(second, scope="episodic", signature=2) is not None
+
+    cache.invalidate("semantic")
+    assert cache.lookup(third, scope="semantic", signature=3) is None
+    assert cache.lookup(second, scope="episodic", signature=2) is not None
+
+
+def test_search_cursor_round_trip_accepts_legacy_offsets() -> None:
+    assert parse_search_cursor("layer", None, error="bad") == SearchCursor(offset=0)
+    assert parse_search_cursor("layer", "layer-offset:64", error="bad") == SearchCursor(64)
+    cursor = format_search_cursor("layer", 128, "tok:en")
+    assert parse_search_cursor("layer", cursor, error="bad") == SearchCursor(128, "tok:en")
+    assert format_search_cursor("layer", 8, None) == "layer-offset:8"
+    for invalid in ("exact-offset:1", "layer-offset:-1", "layer-session:abc", "layer-offset:x"):
+        with pytest.raises(ValueError, match="bad"):
+            parse_search_cursor("layer", invalid, error="bad")
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -29,12 +30,12 @@ class _FakeEvents:
     def __init__(self) -> None:
         self.subscribed: list[tuple[str, int]] = []
 
-    def subscribe(self, run_id: str, after_id: int = 0) -> Any:
+    async def subscribe_async(self, run_id: str, after_id: int = 0) -> Any:
         self.subscribed.append((run_id, after_id))
         raise AssertionError("stream should not subscribe until the response body is consumed")
 
-    def unsubscribe(self, run_id: str, subscriber: Any) -> None:
-        del run_id, subscriber
+    def unsubscribe_async(self, subscription: Any) -> None:
+        del subscription
 
 
 class _FakeSSEEvent:
@@ -42,27 +43,28 @@ class _FakeSSEEvent:
         return 'id: 1\nevent: run.step\ndata: {"ok": true}\n\n'
 
 
-class _FakeSubscriber:
+class _FakeSubscription:
     def __init__(self) -> None:
-        self.timeouts: list[int] = []
+        self.gets = 0
+        self.last_id = 0
 
-    def get(self, timeout: int) -> _FakeSSEEvent:
-        self.timeouts.append(timeout)
+    async def get(self) -> _FakeSSEEvent:
+        self.gets += 1
         return _FakeSSEEvent()
 
 
 class _FakeStreamingEvents:
     def __init__(self) -> None:
-        self.subscriber = _FakeSubscriber()
+        self.subscription = _FakeSubscription()
         self.subscribed: list[tuple[str, int]] = []
-        self.unsubscribed: list[tuple[str, _FakeSubscriber]] = []
+        self.unsubscribed: list[_FakeSubscription] = []
 
-    def subscribe(self, run_id: str, after_id: int = 0) -> _FakeSubscriber:
+    async def subscribe_async(self, run_id: str, after_id: int = 0) -> _FakeSubscription:
         self.subscribed.append((run_id, after_id))
-        return self.subscriber
+        return self.subscription
 
-    def unsubscribe(self, run_id: str, subscriber: _FakeSubscriber) -> None:
-        self.unsubscribed.append((run_id, subscriber))
+    def unsubscribe_async(self, subscription: _FakeSubscription) -> None:
+        self.unsubscribed.append(subscription)
 
 
 class _FakeRuns:
@@ -152,14 +154,55 @@ def test_observability_routes_expose_streaming_events_response(tmp_path: Path) -
     )
 
     route = next(route for route in app.routes if getattr(route, "path", "") == "/api/runs/{run_id}/events")
-    response = route.endpoint("run_ok", after_id=7)
-    stream = captured["body"]
-    first_chunk = next(stream)  # type: ignore[arg-type]
-    stream.close()  # type: ignore[attr-defined]
+
+    async def consume() -> tuple[Any, str]:
+        response = await route.endpoint("run_ok", after_id=7)
+        stream = captured["body"]
+        first_chunk = await stream.__anext__()  # type: ignore[attr-defined]
+        await stream.aclose()  # type: ignore[attr-defined]
+        return response, first_chunk
+
+    response, first_chunk = asyncio.run(consume())
 
     assert response is not None
     assert captured["media_type"] == "text/event-stream"
     assert first_chunk == 'id: 1\nevent: run.step\ndata: {"ok": true}\n\n'
     assert events.subscribed == [("run_ok", 7)]
-    assert events.subscriber.timeouts == [15]
-    assert events.unsubscribed == [("run_ok", events.subscriber)]
+    assert events.subscription.gets == 1
+    assert events.unsubscribed == [events.subscription]
+
+
+def test_run_events_resume_from_last_event_id_when_after_id_is_absent(tmp_path: Path) -> None:
+    app = FastAPI()
+    captured: dict[str, object] = {}
+    events = _FakeStreamingEvents()
+
+    class _StreamingResponse:
+        def __init__(self, body: Any, media_type: str) -> None:
+            captured["body"] = body
+
+    register_observability_routes(
+        app,
+        active_config=_FakeConfig(tmp_path / "logs"),
+        http_exception=HTTPException,
+        streaming_response=_StreamingResponse,
+        state=_FakeState(),
+        events=events,
+        runs=_FakeRuns(),
+    )
+    client = TestClient(app)
+
+    route = next(route for route in app.routes if getattr(route, "path", "") == "/api/runs/{run_id}/events")
+
+    async def subscribe(**kwargs: Any) -> None:
+        await route.endpoint("run_ok", **kwargs)
+        stream = captured["body"]
+        await stream.__anext__()  # type: ignore[attr-defined]
+        await stream.aclose()  # type: ignore[attr-defined]
+
+    asyncio.run(subscribe(last_event_id="12"))
+    asyncio.run(subscribe(after_id=3, last_event_id="12"))
+    invalid = client.get("/api/runs/run_ok/events", headers={"Last-Event-ID": "not-an-id"})
+
+    assert events.subscribed == [("run_ok", 12), ("run_ok", 3)]
+    assert invalid.status_code == 400
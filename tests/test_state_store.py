@@ -196,7 +196,7 @@ def test_multiprocess_fresh_database_initialization_is_serialized(tmp_path: Path
     assert all(payload["health"]["ok"] is True for payload in payloads)
     with sqlite3.connect(path) as conn:
         assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
-        assert conn.execute("SELECT version FROM schema_version WHERE id = 1").fetchone()[0] == 21
+        assert conn.execute("SELECT version FROM schema_version WHERE id = 1").fetchone()[0] == 22
 
 
 def test_schema_migration_rolls_back_all_ddl_on_failure(
@@ -509,7 +509,7 @@ def test_schema_17_migrates_existing_runs_to_primary_provenance_defaults(
     state = AgentStateStore(path)
     run = state.get_run("run_legacy")
 
-    assert state.schema_version() == SCHEMA_VERSION == 21
+    assert state.schema_version() == SCHEMA_VERSION == 22
     assert run.turn_source is None
     assert run.turn_origin == "primary_user"
     assert run.transcript_scope == "primary"
@@ -564,7 +564,7 @@ def test_schema_17_to_18_adds_approval_execution_claims_and_preserves_cas(
         }
     approval = migrated.get_approval("approval_v17", expire=False)
 
-    assert migrated.schema_version() == SCHEMA_VERSION == 21
+    assert migrated.schema_version() == SCHEMA_VERSION == 22
     assert set(claim_columns) <= columns
     assert approval["status"] == "approved"
     assert approval["result"] is None
@@ -1104,3 +1104,82 @@ def test_run_lease_schema_migration_preserves_existing_runs(tmp_path: Path) -> N
     assert run.message == "preserve me"
     assert run.lease_owner is None
     assert run.lease_generation == 0
+
+
+def test_connection_pool_reuses_handles_and_applies_pragmas_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state = AgentStateStore(tmp_path / "state.db", connection_pool=True)
+    real_apply_pragmas = state_store_module._apply_connection_pragmas
+    configured: list[sqlite3.Connection] = []
+
+    def counting_apply_pragmas(conn: sqlite3.Connection) -> None:
+        configured.append(conn)
+        real_apply_pragmas(conn)
+
+    monkeypatch.setattr(state_store_module, "_apply_connection_pragmas", counting_apply_pragmas)
+    state.create_run(
+        run_id="run_pooled",
+        message="pooled",
+        session_id="session",
+        workspace=str(tmp_path),
+        provider="mock",
+        model="mock",
+    )
+    for index in range(20):
+        state.append_run_step("run_pooled", "assistant.token", {"index": index})
+        assert state.get_run("run_pooled").run_id == "run_pooled"
+
+    steps = state.list_run_steps("run_pooled")
+    snapshot = state.connection_pool_snapshot()
+
+    assert [step["payload"]["index"] for step in steps] == list(range(20))
+    assert len(configured) == 2
+    assert snapshot["enabled"] is True
+    assert snapshot["writer_misses"] == 1
+    assert snapshot["writer_hits"] >= 20
+    assert snapshot["reader_misses"] == 1
+    assert snapshot["reader_hits"] >= 20
+    assert float(snapshot["writer_wait_seconds_total"]) >= 0.0
+    state.close()
+    assert state.connection_pool_snapshot() == {"enabled": False}
+    assert AgentStateStore(tmp_path / "state.db").get_run("run_pooled").message == "pooled"
+
+
+def test_connection_pool_serializes_writers_and_rolls_back_failed_blocks(
+    tmp_path: Path,
+) -> None:
+    state = AgentStateStore(tmp_path / "state.db", connection_pool=True)
+    state.create_run(
+        run_id="run_concurrent",
+        message="pooled",
+        session_id="session",
+        workspace=str(tmp_path),
+        provider="mock",
+        model="mock",
+    )
+
+    def append(index: int) -> int:
+        return state.append_run_step("run_concurrent", "step", {"index": index})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        step_ids = list(executor.map(append, range(64)))
+
+    with pytest.raises(RuntimeError, match="abandon"):
+        with state._connect() as conn:
+            conn.execute(
+                "INSERT INTO run_steps (run_id, type, payload_json, created_at) "
+                "VALUES ('run_concurrent', 'lost', '{}', 'now')"
+            )
+            raise RuntimeError("abandon")
+
+    steps = state.list_run_steps("run_concurrent", limit=1_000)
+    snapshot = state.connection_pool_snapshot()
+
+    assert len(set(step_ids)) == 64
+    assert len(steps) == 64
+    assert all(step["type"] == "step" for step in steps)
+    assert snapshot["writer_misses"] == 1
+    assert 1 <= int(snapshot["reader_connections"]) <= int(snapshot["max_readers"])
+    state.close()
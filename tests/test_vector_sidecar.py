@@ -5,6 +5,7 @@ from pathlib import Path
 import numpy as np
 
 from nested_memvid_agent.models import MemoryKind, MemoryLayer, MemoryRecord
+from nested_memvid_agent.vector_ann import VectorAnnSettings
 from nested_memvid_agent.vector_sidecar import VectorSidecar
 
 
@@ -103,3 +104,269 @@ def test_vector_sidecar_reports_stale_records_and_hides_tombstones(tmp_path: Pat
 
     assert sidecar.search("token credentials", k=3) == []
     assert sidecar.search("token credentials", k=3, include_inactive=True)[0].record_id == "auth-refresh"
+
+
+class _DimensionEmbedder:
+    model_name = "dimension-test"
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for token in text.split():
+            if token.startswith("axis"):
+                vector[int(token[4:]) % self.dimension] += 1.0
+        return vector
+
+
+def test_vector_sidecar_matrix_ranks_top_k_and_flags_dimension_changes(tmp_path: Path) -> None:
+    index_path = tmp_path / "semantic.mv2.vector.sqlite"
+    embedder = _DimensionEmbedder(4)
+    sidecar = VectorSidecar(
+        path=index_path,
+        layer=MemoryLayer.SEMANTIC,
+        embedder=embedder,
+        mv2_path=tmp_path / "semantic.mv2",
+    )
+    records = [
+        MemoryRecord(
+            id=f"record-{index}",
+            title="Vector",
+            content=" ".join(["axis0"] * (index + 1) + ["axis1"] * (100 - index)),
+            layer=MemoryLayer.SEMANTIC,
+            kind=MemoryKind.FACT,
+        )
+        for index in range(100)
+    ]
+
+    sidecar.open()
+    for record in records:
+        sidecar.upsert(record)
+    sidecar.tombstone("record-99")
+
+    assert sidecar.matrix_path.stat().st_size >= 100 * 4 * 4
+    hits = sidecar.search("axis0", k=3)
+    assert [hit.record_id for hit in hits] == ["record-98", "record-97", "record-96"]
+    assert hits[0].score > hits[1].score > hits[2].score
+    assert sidecar.search("axis0", k=1, include_inactive=True)[0].record_id == "record-99"
+    assert sidecar.search("axis2", k=3) == []
+    strong = sidecar.search("axis0", k=100, min_score=0.9)
+    assert 0 < len(strong) < 99
+    assert all(hit.score >= 0.9 for hit in strong)
+    sidecar.close()
+
+    sidecar.open()
+    assert [hit.record_id for hit in sidecar.search("axis0", k=2)] == ["record-98", "record-97"]
+
+    embedder.dimension = 6
+    assert sidecar.search("axis0", k=3) == []
+    assert sidecar.status().disabled_reason == "vector dimension changed; rebuild required"
+
+    sidecar.rebuild(records[:2])
+    assert [hit.record_id for hit in sidecar.search("axis0", k=5)] == ["record-1", "record-0"]
+    sidecar.close()
+
+
+class _LookupEmbedder:
+    model_name = "lookup-test"
+
+    def __init__(self, vectors: np.ndarray) -> None:
+        self.vectors = vectors
+
+    def embed(self, text: str) -> np.ndarray:
+        for token in text.split():
+            if token.startswith("vec"):
+                return self.vectors[int(token[3:])]
+        return np.zeros(self.vectors.shape[1], dtype=np.float32)
+
+
+def test_vector_sidecar_ann_partitions_large_layers_and_falls_back_when_small(
+    tmp_path: Path,
+) -> None:
+    generator = np.random.default_rng(7)
+    centers = generator.normal(size=(12, 16)).astype(np.float32)
+    vectors = centers[np.arange(400) % 12] + 0.2 * generator.normal(size=(400, 16)).astype(
+        np.float32
+    )
+    embedder = _LookupEmbedder(vectors)
+    settings = VectorAnnSettings(lists=12, probes=3, min_rows=200)
+    index_path = tmp_path / "episodic.mv2.vector.sqlite"
+    sidecar = VectorSidecar(
+        path=index_path,
+        layer=MemoryLayer.EPISODIC,
+        embedder=embedder,
+        mv2_path=tmp_path / "episodic.mv2",
+        ann=settings,
+    )
+    exact = VectorSidecar(
+        path=tmp_path / "exact.vector.sqlite",
+        layer=MemoryLayer.EPISODIC,
+        embedder=embedder,
+        mv2_path=tmp_path / "episodic.mv2",
+    )
+    records = [
+        MemoryRecord(
+            id=f"event-{index}",
+            title="Event",
+            content=f"vec{index}",
+            layer=MemoryLayer.EPISODIC,
+            kind=MemoryKind.EVENT,
+        )
+        for index in range(400)
+    ]
+
+    sidecar.open()
+    exact.open()
+    for record in records[:150]:
+        sidecar.upsert(record)
+    assert sidecar.status().ann_lists is None
+    assert not sidecar.ann_path.exists()
+    for record in records[150:]:
+        sidecar.upsert(record)
+    for record in records:
+        exact.upsert(record)
+
+    assert sidecar.status().ann_lists == 12
+    assert sidecar.ann_path.exists()
+    recalled = 0
+    for query in range(0, 400, 20):
+        approximate = {hit.record_id for hit in sidecar.search(f"vec{query}", k=5)}
+        truth = {hit.record_id for hit in exact.search(f"vec{query}", k=5)}
+        recalled += len(approximate & truth)
+    assert recalled / (20 * 5) >= 0.9
+
+    sidecar.tombstone("event-0")
+    assert "event-0" not in {hit.record_id for hit in sidecar.search("vec0", k=5)}
+    centroids = sidecar.ann_path.read_bytes()
+    sidecar.close()
+
+    sidecar.open()
+    assert sidecar.ann_path.read_bytes() == centroids
+    assert sidecar.status().ann_lists == 12
+    assert sidecar.search("vec12", k=1)[0].record_id == "event-12"
+
+    sidecar.rebuild(records[:50])
+    assert sidecar.status().ann_lists is None
+    assert sidecar.search("vec12", k=1)[0].record_id == "event-12"
+    sidecar.close()
+    exact.close()
+
+
+class _CountingBatchEmbedder(ConceptEmbedder):
+    def __init__(self, model_name: str = "concept-batch") -> None:
+        self.model_name = model_name
+        self.single_calls = 0
+        self.batches: list[int] = []
+
+    def embed(self, text: str) -> np.ndarray:
+        self.single_calls += 1
+        return super().embed(text)
+
+    def embed_many(self, texts: list[str]) -> np.ndarray:
+        self.batches.append(len(texts))
+        return np.stack([ConceptEmbedder.embed(self, text) for text in texts])
+
+
+def test_vector_sidecar_rebuild_batches_and_reuses_cached_embeddings(tmp_path: Path) -> None:
+    index_path = tmp_path / "semantic.mv2.vector.sqlite"
+    records = [
+        MemoryRecord(
+            id=f"fact-{index}",
+            title=f"Fact {index}",
+            content=f"token credentials retry {index}",
+            layer=MemoryLayer.SEMANTIC,
+            kind=MemoryKind.FACT,
+        )
+        for index in range(150)
+    ]
+    embedder = _CountingBatchEmbedder()
+    sidecar = VectorSidecar(
+        path=index_path,
+        layer=MemoryLayer.SEMANTIC,
+        embedder=embedder,
+        mv2_path=tmp_path / "semantic.mv2",
+    )
+    sidecar.open()
+    status = sidecar.rebuild(records)
+    sidecar.close()
+
+    assert status.indexed_count == 150
+    assert embedder.batches == [64, 64, 22]
+    assert embedder.single_calls == 0
+
+    restarted = _CountingBatchEmbedder()
+    sidecar = VectorSidecar(
+        path=index_path,
+        layer=MemoryLayer.SEMANTIC,
+        embedder=restarted,
+        mv2_path=tmp_path / "semantic.mv2",
+    )
+    sidecar.open()
+    changed = MemoryRecord(
+        id="fact-0",
+        title="Fact 0",
+        content="fetch http network",
+        layer=MemoryLayer.SEMANTIC,
+        kind=MemoryKind.FACT,
+    )
+    sidecar.rebuild([changed, *records[1:]])
+    sidecar.upsert(records[5])
+
+    assert restarted.batches == []
+    assert restarted.single_calls == 1
+    assert sidecar.search("http fetch", k=1)[0].record_id == "fact-0"
+    sidecar.close()
+
+    other_model = _CountingBatchEmbedder("concept-batch-v2")
+    sidecar = VectorSidecar(
+        path=index_path,
+        layer=MemoryLayer.SEMANTIC,
+        embedder=other_model,
+        mv2_path=tmp_path / "semantic.mv2",
+    )
+    sidecar.open()
+    sidecar.rebuild(records[:10])
+    sidecar.close()
+
+    assert other_model.batches == [10]
+
+
+def test_vector_sidecars_sharing_a_path_keep_their_own_matrix_rows(tmp_path: Path) -> None:
+    index_path = tmp_path / "semantic.mv2.vector.sqlite"
+    vectors = np.eye(4, dtype=np.float32)
+    embedder = _LookupEmbedder(vectors)
+    records = {
+        name: MemoryRecord(
+            id=f"{name}-rec",
+            title=name,
+            content=f"{name} vec{number}",
+            layer=MemoryLayer.SEMANTIC,
+            kind=MemoryKind.FACT,
+        )
+        for number, name in enumerate(("retry", "http"))
+    }
+
+    def sidecar() -> VectorSidecar:
+        return VectorSidecar(
+            path=index_path,
+            layer=MemoryLayer.SEMANTIC,
+            embedder=embedder,
+            mv2_path=tmp_path / "semantic.mv2",
+        )
+
+    first = sidecar()
+    second = sidecar()
+    first.open()
+    second.open()
+    first.upsert(records["retry"])
+    second.upsert(records["http"])
+
+    assert [hit.record_id for hit in first.search("vec0", k=3)] == ["retry-rec"]
+    assert first.search("vec1", k=3) == []
+    assert [hit.record_id for hit in second.search("vec1", k=3)] == ["http-rec"]
+    assert second.search("vec0", k=3) == []
+    assert first._matrix.file_backed  # noqa: SLF001 - owns the shared matrix file
+    assert not second._matrix.file_backed  # noqa: SLF001 - private anonymous mapping
+    first.close()
+    second.close()
@@ -66,7 +66,9 @@ import {
   eventKey,
   eventTimestamp,
   friendlyEventLabel,
-  riskLabel
+  isAssistantTextEvent,
+  riskLabel,
+  streamedAssistantText
 } from "./runActivity";
 import type {
   AgentLogEvent,
@@ -299,6 +301,7 @@ const runEventTypes = [
   "tool.request",
   "tool.executed",
   "assistant.token",
+  "assistant.message",
   "assistant.tool_call",
   "assistant.provider_error",
   "assistant.usage",
@@ -990,21 +993,14 @@ export function LegacyWorkbench({
     const rows = new Map<string, TraceEvent>();
     const traceEvents = runTrace && runTrace.run.run_id === activeRun?.run_id ? runTrace.timeline : [];
     traceEvents
-      .filter((event) => event.type !== "assistant.token")
+      .filter((event) => !isAssistantTextEvent(event.type))
       .forEach((event) => rows.set(eventKey(event), event));
     events
-      .filter((event) => eventBelongsToRun(event, activeRun?.run_id) && event.type !== "assistant.token")
+      .filter((event) => eventBelongsToRun(event, activeRun?.run_id) && !isAssistantTextEvent(event.type))
       .forEach((event) => rows.set(eventKey(event), event));
     return [...rows.values()].sort((left, right) => eventTimestamp(left).localeCompare(eventTimestamp(right)));
   }, [events, activeRun?.run_id, runTrace]);
-  const streamedAssistant = useMemo(
-    () =>
-      events
-        .filter((event) => event.type === "assistant.token")
-        .map((event) => String(event.payload.content ?? ""))
-        .join(""),
-    [events]
-  );
+  const streamedAssistant = useMemo(() => streamedAssistantText(events), [events]);
   const proofOfWork = useMemo(() => extractProofOfWork(runTrace), [runTrace]);
   const activeThread = useMemo(
     () => threadSummaries.find((thread) => thread.session_id === activeSessionId) ?? null,
@@ -1215,7 +1211,7 @@ export function LegacyWorkbench({
     };
     const appendEvent = (parsed: TraceEvent) => {
       setEvents((rows) => [...rows.slice(-120), parsed]);
-      if (parsed.type !== "assistant.token") {
+      if (!isAssistantTextEvent(parsed.type)) {
         scheduleAuthoritativeRefresh();
       }
     };
@@ -101,6 +101,8 @@ export function queryString(params: Record<string, string | number | boolean | n
   return rendered ? `?${rendered}` : "";
 }
 
+const LAGGED_STREAM_EVENT = "stream.lagged";
+
 export function subscribeJsonEvents<T>(
   path: string,
   eventTypes: string[],
@@ -117,6 +119,8 @@ export function subscribeJsonEvents<T>(
   ) {
     const source = new EventSource(eventSourceUrl);
     const handleEvent = (event: MessageEvent) => onEvent(JSON.parse(event.data) as T);
+    // "stream.lagged" is left unhandled: the server closes the stream and the
+    // EventSource reconnect resumes from its Last-Event-ID header.
     source.onmessage = handleEvent;
     eventTypes.forEach((type) => source.addEventListener(type, handleEvent));
     return () => source.close();
@@ -140,33 +144,62 @@ async function readEventStream<T>(
   signal: AbortSignal,
   onEvent: (event: T) => void
 ): Promise<void> {
+  // A lagged subscriber is cut loose by the server; resume from the persisted
+  // step log after the last event it delivered.
+  let streamPath = path;
+  for (;;) {
+    const resumeAfter = await readEventStreamOnce<T>(transport, streamPath, signal, onEvent);
+    if (resumeAfter === null || signal.aborted) return;
+    streamPath = `${path}${path.includes("?") ? "&" : "?"}after_id=${resumeAfter}`;
+  }
+}
+
+async function readEventStreamOnce<T>(
+  transport: RuntimeTransport,
+  path: string,
+  signal: AbortSignal,
+  onEvent: (event: T) => void
+): Promise<number | null> {
   const response = await transport.fetch(path, { signal });
   if (!response.ok) {
     await parseResponse<unknown>(response);
-    return;
+    return null;
   }
-  if (!response.body) return;
+  if (!response.body) return null;
 
   const reader = response.body.getReader();
   const decoder = new TextDecoder();
   let buffer = "";
+  let resumeAfter: number | null = null;
+  const emit = (part: string) => {
+    const lagged = emitSsePart(part, onEvent);
+    if (lagged !== null) resumeAfter = lagged;
+  };
   for (;;) {
     const { done, value } = await reader.read();
     if (done) break;
     buffer += decoder.decode(value, { stream: true });
     const parts = buffer.split(/\r?\n\r?\n/);
     buffer = parts.pop() ?? "";
-    parts.forEach((part) => emitSsePart(part, onEvent));
+    parts.forEach(emit);
   }
   buffer += decoder.decode();
-  if (buffer.trim()) emitSsePart(buffer, onEvent);
+  if (buffer.trim()) emit(buffer);
+  return resumeAfter;
 }
 
-function emitSsePart<T>(part: string, onEvent: (event: T) => void): void {
-  const data = part
-    .split(/\r?\n/)
+// Returns the resume cursor of a "stream.lagged" notice instead of emitting it.
+function emitSsePart<T>(part: string, onEvent: (event: T) => void): number | null {
+  const lines = part.split(/\r?\n/);
+  const data = lines
     .filter((line) => line.startsWith("data:"))
     .map((line) => line.slice(5).trimStart())
     .join("\n");
-  if (data) onEvent(JSON.parse(data) as T);
+  if (!data) return null;
+  if (lines.some((line) => line.startsWith("event:") && line.slice(6).trim() === LAGGED_STREAM_EVENT)) {
+    const afterId = Number((JSON.parse(data) as { after_id?: unknown }).after_id);
+    return Number.isFinite(afterId) ? afterId : 0;
+  }
+  onEvent(JSON.parse(data) as T);
+  return null;
 }
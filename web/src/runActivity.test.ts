@@ -4,6 +4,7 @@ import {
   assistantTextForRun,
   deriveThreadTitle,
   eventBelongsToRun,
+  streamedAssistantText,
   summarizeArguments
 } from "./runActivity";
 import type { Run, TraceEvent } from "./types";
@@ -38,6 +39,18 @@ describe("run activity helpers", () => {
     expect(assistantTextForRun({ ...baseRun, run_id: "run_2" }, "run_1", "streaming")).toBe("Kestrel is working...");
   });
 
+  it("replays coalesced assistant messages without duplicating their tokens", () => {
+    const events: TraceEvent[] = [
+      event(10, "assistant.token", { content: "hel" }),
+      event(11, "assistant.message", { content: "hello", first_step_id: 10, last_step_id: 11 }),
+      event(12, "assistant.tool_call", { tool_name: "shell.run" }),
+      event(13, "assistant.token", { content: " again" })
+    ];
+
+    expect(streamedAssistantText(events)).toBe("hello again");
+    expect(activityItemsForEvents(events).map((item) => item.id)).toEqual(["12"]);
+  });
+
   it("summarizes run activity events without assistant token noise", () => {
     const events: TraceEvent[] = [
       event(1, "assistant.token", { content: "hello" }),
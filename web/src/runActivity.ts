@@ -76,12 +76,30 @@ export function eventBelongsToRun(event: TraceEvent, runId: string | null | unde
   return event.run_id === runId || event.payload.run_id === runId;
 }
 
+export function isAssistantTextEvent(type: string): boolean {
+  return type === "assistant.token" || type === "assistant.message";
+}
+
+export function streamedAssistantText(events: TraceEvent[]): string {
+  const coalesced = events
+    .filter((event) => event.type === "assistant.message")
+    .map((event) => [Number(event.payload.first_step_id ?? event.id), Number(event.payload.last_step_id ?? event.id)]);
+  return events
+    .filter((event) => isAssistantTextEvent(event.type))
+    .filter(
+      (event) =>
+        event.type === "assistant.message" || !coalesced.some(([first, last]) => event.id >= first && event.id <= last)
+    )
+    .map((event) => String(event.payload.content ?? ""))
+    .join("");
+}
+
 export function eventTimestamp(event: TraceEvent): string {
   return typeof event.created_at === "string" ? event.created_at : "";
 }
 
 function activityItemForEvent(event: TraceEvent): LiveActivityItem | null {
-  if (event.type === "assistant.token") return null;
+  if (isAssistantTextEvent(event.type)) return null;
   if (!isVisibleActivityEvent(event.type)) return null;
   const toolName = toolNameForEvent(event);
   if (event.type === "assistant.tool_call") {